@@ -10,6 +10,7 @@ import json
 import logging
 import os
 import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -23,6 +24,7 @@ from linear_updater import (
 )
 from phase_config import (
     get_fast_mode,
+    get_max_parallel_subtasks,
     get_phase_client_thinking_kwargs,
     get_phase_model,
     get_phase_model_betas,
@@ -33,6 +35,7 @@ from progress import (
     count_subtasks_detailed,
     get_current_phase,
     get_next_subtask,
+    get_parallel_subtask_batch,
     is_build_complete,
     print_build_complete_banner,
     print_progress_summary,
@@ -360,6 +363,258 @@ def parse_rate_limit_reset_time(error_info: dict | None) -> int | None:
     return None
 
 
+# =============================================================================
+# PARALLEL SUBTASK SESSIONS
+# =============================================================================
+
+PARALLEL_SESSION_CONTEXT = (
+    "## PARALLEL SESSION\n\n"
+    "Other agents are implementing other subtasks in this same repository right now.\n"
+    "- Only edit the files listed for YOUR subtask\n"
+    "- Stage only your own files (`git add <paths>`), never `git add -A` or `git add .`\n"
+    "- If git reports that `index.lock` exists, wait a few seconds and retry\n"
+    "- Only update the status of YOUR subtask in implementation_plan.json"
+)
+
+# Error types that pause the whole build rather than a single subtask, most urgent first
+_BUILD_LEVEL_ERRORS = ("authentication", "rate_limit", "tool_concurrency")
+
+
+@dataclass
+class SubtaskSessionResult:
+    """Outcome of one subtask session in a parallel batch."""
+
+    subtask_id: str
+    status: str  # "continue", "complete" or "error"
+    success: bool = False
+    error_info: dict = field(default_factory=dict)
+
+
+async def build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+) -> str:
+    """
+    Build the coder prompt for a subtask, with file, recovery and memory context.
+
+    Args:
+        spec_dir: Spec directory
+        project_dir: Project root
+        subtask: Subtask dict from the implementation plan
+        recovery_manager: Recovery manager (for attempt counts and hints)
+
+    Returns:
+        The full prompt text
+    """
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status(f"Graphiti memory context loaded for {subtask_id}", "success")
+
+    return prompt
+
+
+async def run_parallel_subtasks(
+    subtasks: list[dict],
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    session_num: int,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager,
+    verbose: bool = False,
+    linear_enabled: bool = False,
+    source_spec_dir: Path | None = None,
+) -> list[SubtaskSessionResult]:
+    """
+    Run independent subtasks as concurrent coder sessions.
+
+    Each subtask gets its own client and prompt. A failing subtask is
+    recorded (and marked stuck after MAX_SUBTASK_RETRIES) without affecting
+    the others. Post-session processing, which syncs and reads the plan,
+    commits memory and notifies Linear, runs one subtask at a time.
+
+    Args:
+        subtasks: Ready subtasks from get_parallel_subtask_batch()
+        project_dir: Project root
+        spec_dir: Spec directory
+        model: Model from the CLI (phase configuration may override it)
+        session_num: Session number shared by the batch
+        recovery_manager: Recovery manager
+        status_manager: Status manager for ccstatusline
+        verbose: Whether to show detailed output
+        linear_enabled: Whether Linear integration is enabled
+        source_spec_dir: Original spec directory (for syncing back from worktree)
+
+    Returns:
+        One result per subtask, in input order
+    """
+    phase_model = get_phase_model(spec_dir, "coding", model)
+    phase_betas = get_phase_model_betas(spec_dir, "coding", model)
+    thinking_kwargs = get_phase_client_thinking_kwargs(spec_dir, "coding", phase_model)
+    fast_mode = get_fast_mode(spec_dir)
+    post_processing_lock = asyncio.Lock()
+
+    async def run_one(subtask: dict) -> SubtaskSessionResult:
+        subtask_id = subtask.get("id")
+
+        validation_result = validate_subtask_files(subtask, project_dir)
+        if not validation_result["success"]:
+            error_msg = validation_result["error"]
+            print_status(f"{subtask_id}: file validation failed: {error_msg}", "error")
+            recovery_manager.record_attempt(
+                subtask_id=subtask_id,
+                session=session_num,
+                success=False,
+                approach="File validation failed before execution",
+                error=error_msg,
+            )
+            _mark_stuck_if_exhausted(
+                recovery_manager, subtask_id, f"File validation failed: {error_msg}"
+            )
+            return SubtaskSessionResult(
+                subtask_id, "error", error_info={"type": "other", "message": error_msg}
+            )
+
+        commit_before = get_latest_commit(project_dir)
+        commit_count_before = get_commit_count(project_dir)
+        try:
+            client = create_client(
+                project_dir,
+                spec_dir,
+                phase_model,
+                agent_type="coder",
+                betas=phase_betas,
+                fast_mode=fast_mode,
+                **thinking_kwargs,
+            )
+            prompt = await build_subtask_prompt(
+                spec_dir, project_dir, subtask, recovery_manager
+            )
+            prompt += "\n\n" + PARALLEL_SESSION_CONTEXT
+
+            async with client:
+                status, _response, error_info = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+                )
+        except Exception as e:
+            logger.error(f"Parallel session for {subtask_id} failed: {e}")
+            status, error_info = (
+                "error",
+                {
+                    "type": "other",
+                    "message": str(e),
+                    "exception_type": type(e).__name__,
+                },
+            )
+
+        async with post_processing_lock:
+            success = await post_session_processing(
+                spec_dir=spec_dir,
+                project_dir=project_dir,
+                subtask_id=subtask_id,
+                session_num=session_num,
+                commit_before=commit_before,
+                commit_count_before=commit_count_before,
+                recovery_manager=recovery_manager,
+                linear_enabled=linear_enabled,
+                status_manager=status_manager,
+                source_spec_dir=source_spec_dir,
+                error_info=error_info,
+            )
+            if not success and _mark_stuck_if_exhausted(
+                recovery_manager, subtask_id, "Failed after repeated parallel attempts"
+            ):
+                if linear_enabled:
+                    await linear_task_stuck(
+                        spec_dir=spec_dir,
+                        subtask_id=subtask_id,
+                        attempt_count=recovery_manager.get_attempt_count(subtask_id),
+                    )
+
+        return SubtaskSessionResult(subtask_id, status, success, error_info or {})
+
+    print_status(
+        f"Running {len(subtasks)} independent subtasks in parallel: "
+        + ", ".join(s.get("id", "?") for s in subtasks),
+        "progress",
+    )
+    status_manager.update_subtasks(in_progress=len(subtasks))
+    return list(await asyncio.gather(*(run_one(s) for s in subtasks)))
+
+
+def _mark_stuck_if_exhausted(
+    recovery_manager: RecoveryManager, subtask_id: str, reason: str
+) -> bool:
+    """Mark a subtask stuck once it has used up its retries. Returns True if marked."""
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if attempt_count < MAX_SUBTASK_RETRIES:
+        return False
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"{reason} ({attempt_count} attempts)"
+    )
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts", "error"
+    )
+    return True
+
+
+def summarize_parallel_results(
+    results: list[SubtaskSessionResult], spec_dir: Path
+) -> tuple[str, dict]:
+    """
+    Reduce a batch's results to a single session status for the main loop.
+
+    Build-level errors (authentication, rate limits, tool concurrency) take
+    priority so the loop can pause or back off once for the whole batch.
+
+    Returns:
+        (status, error_info) in the same form as run_agent_session()
+    """
+    for error_type in _BUILD_LEVEL_ERRORS:
+        for result in results:
+            if result.error_info.get("type") == error_type:
+                return "error", result.error_info
+
+    if is_build_complete(spec_dir):
+        return "complete", {}
+
+    if results and all(r.status == "error" for r in results):
+        return "error", results[0].error_info
+
+    return "continue", {}
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -549,6 +804,7 @@ async def run_autonomous_agent(
 
         # Get the next subtask to work on (planner sessions shouldn't bind to a subtask)
         next_subtask = None if first_run else get_next_subtask(spec_dir)
+        batch_results: list[SubtaskSessionResult] | None = None
         subtask_id = next_subtask.get("id") if next_subtask else None
         phase_name = next_subtask.get("phase_name") if next_subtask else None
 
@@ -683,119 +939,118 @@ async def run_autonomous_agent(
                     print("No pending subtasks found - build may be complete!")
                     break
 
-            # Validate that all files_to_modify exist before attempting execution
-            # This prevents infinite retry loops when implementation plan references non-existent files
-            validation_result = validate_subtask_files(next_subtask, project_dir)
-            if not validation_result["success"]:
-                # File validation failed - record error and skip session
-                error_msg = validation_result["error"]
-                suggestion = validation_result.get("suggestion", "")
-
-                print()
-                print_status(f"File validation failed: {error_msg}", "error")
-                if suggestion:
-                    print(muted(f"Suggestion: {suggestion}"))
-                print()
-
-                # Record the validation failure in recovery manager
-                recovery_manager.record_attempt(
-                    subtask_id=subtask_id,
-                    session=iteration,
-                    success=False,
-                    approach="File validation failed before execution",
-                    error=error_msg,
+            # Run independent ready subtasks as concurrent sessions when allowed
+            max_parallel = get_max_parallel_subtasks(spec_dir)
+            batch = (
+                get_parallel_subtask_batch(spec_dir, max_parallel)
+                if max_parallel > 1 and not concurrency_error_context
+                else []
+            )
+            if len(batch) > 1:
+                batch_results = await run_parallel_subtasks(
+                    batch,
+                    project_dir=project_dir,
+                    spec_dir=spec_dir,
+                    model=model,
+                    session_num=iteration,
+                    recovery_manager=recovery_manager,
+                    status_manager=status_manager,
+                    verbose=verbose,
+                    linear_enabled=(
+                        linear_task is not None and linear_task.task_id is not None
+                    ),
+                    source_spec_dir=source_spec_dir,
                 )
+                status, error_info = summarize_parallel_results(batch_results, spec_dir)
+                # Post-session processing already ran for each subtask
+                subtask_id = None
+            else:
+                # Validate that all files_to_modify exist before attempting execution
+                # This prevents infinite retry loops when implementation plan references non-existent files
+                validation_result = validate_subtask_files(next_subtask, project_dir)
+                if not validation_result["success"]:
+                    # File validation failed - record error and skip session
+                    error_msg = validation_result["error"]
+                    suggestion = validation_result.get("suggestion", "")
 
-                # Log the validation failure
-                if task_logger:
-                    task_logger.log_error(
-                        f"File validation failed: {error_msg}", LogPhase.CODING
-                    )
+                    print()
+                    print_status(f"File validation failed: {error_msg}", "error")
+                    if suggestion:
+                        print(muted(f"Suggestion: {suggestion}"))
+                    print()
 
-                # Check if subtask has exceeded max retries
-                attempt_count = recovery_manager.get_attempt_count(subtask_id)
-                if attempt_count >= MAX_SUBTASK_RETRIES:
-                    recovery_manager.mark_subtask_stuck(
-                        subtask_id,
-                        f"File validation failed after {attempt_count} attempts: {error_msg}",
-                    )
-                    print_status(
-                        f"Subtask {subtask_id} marked as STUCK after {attempt_count} failed validation attempts",
-                        "error",
-                    )
-                    print(
-                        muted(
-                            "Consider: update implementation plan with correct filenames"
-                        )
+                    # Record the validation failure in recovery manager
+                    recovery_manager.record_attempt(
+                        subtask_id=subtask_id,
+                        session=iteration,
+                        success=False,
+                        approach="File validation failed before execution",
+                        error=error_msg,
                     )
 
-                # Update status
-                status_manager.update(state=BuildState.ERROR)
-
-                # Small delay before retry
-                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
-                continue  # Skip to next iteration
-
-            # Create client for coding phase (after file validation passes)
-            client = create_client(
-                project_dir,
-                spec_dir,
-                phase_model,
-                agent_type="coder",
-                betas=phase_betas,
-                fast_mode=fast_mode,
-                **thinking_kwargs,
-            )
+                    # Log the validation failure
+                    if task_logger:
+                        task_logger.log_error(
+                            f"File validation failed: {error_msg}", LogPhase.CODING
+                        )
 
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
-            )
+                    # Check if subtask has exceeded max retries
+                    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+                    if attempt_count >= MAX_SUBTASK_RETRIES:
+                        recovery_manager.mark_subtask_stuck(
+                            subtask_id,
+                            f"File validation failed after {attempt_count} attempts: {error_msg}",
+                        )
+                        print_status(
+                            f"Subtask {subtask_id} marked as STUCK after {attempt_count} failed validation attempts",
+                            "error",
+                        )
+                        print(
+                            muted(
+                                "Consider: update implementation plan with correct filenames"
+                            )
+                        )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+                    # Update status
+                    status_manager.update(state=BuildState.ERROR)
 
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
+                    # Small delay before retry
+                    await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                    continue  # Skip to next iteration
+
+                # Create client for coding phase (after file validation passes)
+                client = create_client(
+                    project_dir,
+                    spec_dir,
+                    phase_model,
+                    agent_type="coder",
+                    betas=phase_betas,
+                    fast_mode=fast_mode,
+                    **thinking_kwargs,
+                )
 
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
+                # Generate focused, minimal prompt with file, recovery and memory context
+                attempt_count = recovery_manager.get_attempt_count(subtask_id)
+                prompt = await build_subtask_prompt(
+                    spec_dir, project_dir, next_subtask, recovery_manager
+                )
 
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
+                # Add concurrency error context if recovering from 400 error
+                if concurrency_error_context:
+                    prompt += "\n\n" + concurrency_error_context
+                    print_status(
+                        f"Added tool concurrency error context (retry {consecutive_concurrency_errors}/{MAX_CONCURRENCY_RETRIES})",
+                        "warning",
+                    )
 
-            # Add concurrency error context if recovering from 400 error
-            if concurrency_error_context:
-                prompt += "\n\n" + concurrency_error_context
-                print_status(
-                    f"Added tool concurrency error context (retry {consecutive_concurrency_errors}/{MAX_CONCURRENCY_RETRIES})",
-                    "warning",
+                # Show what we're working on
+                print(f"Working on: {highlight(subtask_id)}")
+                print(
+                    f"Description: {next_subtask.get('description', 'No description')}"
                 )
-
-            # Show what we're working on
-            print(f"Working on: {highlight(subtask_id)}")
-            print(f"Description: {next_subtask.get('description', 'No description')}")
-            if attempt_count > 0:
-                print_status(f"Previous attempts: {attempt_count}", "warning")
-            print()
+                if attempt_count > 0:
+                    print_status(f"Previous attempts: {attempt_count}", "warning")
+                print()
 
         # Set subtask info in logger
         if task_logger and subtask_id:
@@ -803,10 +1058,11 @@ async def run_autonomous_agent(
             task_logger.set_session(iteration)
 
         # Run session with async context manager
-        async with client:
-            status, response, error_info = await run_agent_session(
-                client, prompt, spec_dir, verbose, phase=current_log_phase
-            )
+        if batch_results is None:
+            async with client:
+                status, response, error_info = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=current_log_phase
+                )
 
         plan_validated = False
         if is_planning_phase and status != "error":
@@ -7,6 +7,7 @@ Tools for managing subtask status in implementation_plan.json.
 
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -22,6 +23,10 @@ except ImportError:
     SDK_TOOLS_AVAILABLE = False
     tool = None
 
+# Serializes read-modify-write of implementation_plan.json when several coder
+# sessions run in parallel and update their subtasks at the same time
+_plan_write_lock = threading.Lock()
+
 
 def _update_subtask_in_plan(
     plan: dict[str, Any],
@@ -113,10 +118,15 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             }
 
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
+            with _plan_write_lock:
+                with open(plan_file, encoding="utf-8") as f:
+                    plan = json.load(f)
+
+                subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
 
-            subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
+                # Use atomic write to prevent file corruption
+                if subtask_found:
+                    write_json_atomic(plan_file, plan, indent=2)
 
             if not subtask_found:
                 return {
@@ -128,9 +138,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
-
             return {
                 "content": [
                     {
@@ -145,15 +152,18 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
+                    with _plan_write_lock:
+                        with open(plan_file, encoding="utf-8") as f:
+                            plan = json.load(f)
 
-                    subtask_found = _update_subtask_in_plan(
-                        plan, subtask_id, status, notes
-                    )
+                        subtask_found = _update_subtask_in_plan(
+                            plan, subtask_id, status, notes
+                        )
+
+                        if subtask_found:
+                            write_json_atomic(plan_file, plan, indent=2)
 
                     if subtask_found:
-                        write_json_atomic(plan_file, plan, indent=2)
                         return {
                             "content": [
                                 {
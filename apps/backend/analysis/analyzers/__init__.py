@@ -9,6 +9,7 @@ Main exports:
 - ProjectAnalyzer: Analyzes entire projects (single or monorepo)
 - analyze_project: Convenience function for project analysis
 - analyze_service: Convenience function for service analysis
+- FileInventory / inventory_scope: Shared single-pass file listing for analyzers
 """
 
 from __future__ import annotations
@@ -16,6 +17,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from .file_inventory import FileInventory, inventory_scope
+from .index_fingerprints import load_fingerprints, save_fingerprints
 from .project_analyzer_module import ProjectAnalyzer
 from .service_analyzer import ServiceAnalyzer
 
@@ -25,30 +28,58 @@ __all__ = [
     "ProjectAnalyzer",
     "analyze_project",
     "analyze_service",
+    "FileInventory",
+    "inventory_scope",
 ]
 
 
-def analyze_project(project_dir: Path, output_file: Path | None = None) -> dict:
+def analyze_project(
+    project_dir: Path, output_file: Path | None = None, incremental: bool = False
+) -> dict:
     """
     Analyze a project and optionally save results.
 
+    Per-service fingerprints are saved next to output_file. With
+    ``incremental=True`` they are used to re-analyze only the services whose
+    files changed since output_file was written.
+
     Args:
         project_dir: Path to the project root
         output_file: Optional path to save JSON output
+        incremental: Reuse unchanged services from an existing output_file
 
     Returns:
         Project index as a dictionary
     """
     import json
 
-    analyzer = ProjectAnalyzer(project_dir)
+    previous_index = None
+    previous_fingerprints = None
+    if incremental and output_file and output_file.exists():
+        previous_fingerprints = load_fingerprints(output_file)
+        if previous_fingerprints is not None:
+            try:
+                with open(output_file, encoding="utf-8") as f:
+                    previous_index = json.load(f)
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                previous_fingerprints = None
+
+    analyzer = ProjectAnalyzer(project_dir, previous_index, previous_fingerprints)
     results = analyzer.analyze()
 
     if output_file:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(results, f, indent=2)
-        print(f"Project index saved to: {output_file}")
+        unchanged = previous_index == results and previous_fingerprints is not None
+        if not unchanged:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+        if (
+            not unchanged
+            or previous_fingerprints.get("services") != analyzer.fingerprints
+        ):
+            save_fingerprints(output_file, analyzer.fingerprints)
+        if not incremental:
+            print(f"Project index saved to: {output_file}")
 
     return results
 
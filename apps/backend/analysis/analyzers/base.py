@@ -9,6 +9,10 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .file_inventory import FileInventory
 
 # Directories to skip during analysis
 SKIP_DIRS = {
@@ -91,6 +95,37 @@ class BaseAnalyzer:
 
     def __init__(self, path: Path):
         self.path = path.resolve()
+        self._inventory: FileInventory | None = None
+
+    @property
+    def inventory(self) -> FileInventory:
+        """
+        Shared file inventory covering this analyzer's path.
+
+        Uses the enclosing inventory_scope when there is one, otherwise walks
+        this analyzer's path once on first use.
+        """
+        if self._inventory is None:
+            from .file_inventory import FileInventory, current_inventory
+
+            active = current_inventory()
+            if active is not None and active.covers(self.path):
+                self._inventory = active
+            else:
+                self._inventory = FileInventory(self.path)
+        return self._inventory
+
+    def _find_files(self, *suffixes: str) -> list[Path]:
+        """Files under this analyzer's path with one of the given extensions."""
+        return self.inventory.files_with_suffix(*suffixes, under=self.path)
+
+    def _find_named(self, *names: str) -> list[Path]:
+        """Files under this analyzer's path with one of the given basenames."""
+        return self.inventory.files_named(*names, under=self.path)
+
+    def _read_source(self, file_path: Path) -> str | None:
+        """Read (and cache) a source file found via the inventory."""
+        return self.inventory.read_text(file_path)
 
     def _exists(self, path: str) -> bool:
         """Check if a file exists relative to the analyzer's path."""
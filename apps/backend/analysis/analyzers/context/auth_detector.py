@@ -121,21 +121,20 @@ class AuthDetector(BaseAnalyzer):
     def _find_auth_middleware(self) -> list[str]:
         """Detect auth middleware and decorators from Python files."""
         # Limit to first 20 files for performance
-        all_py_files = list(self.path.glob("**/*.py"))[:20]
+        all_py_files = self._find_files(".py")[:20]
         auth_decorators = set()
 
         for py_file in all_py_files:
-            try:
-                content = py_file.read_text(encoding="utf-8")
-                # Find custom decorators
-                if (
-                    "@require" in content
-                    or "@login_required" in content
-                    or "@authenticate" in content
-                ):
-                    decorators = re.findall(r"@(\w*(?:require|auth|login)\w*)", content)
-                    auth_decorators.update(decorators)
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(py_file)
+            if content is None:
                 continue
+            # Find custom decorators
+            if (
+                "@require" in content
+                or "@login_required" in content
+                or "@authenticate" in content
+            ):
+                decorators = re.findall(r"@(\w*(?:require|auth|login)\w*)", content)
+                auth_decorators.update(decorators)
 
         return list(auth_decorators) if auth_decorators else []
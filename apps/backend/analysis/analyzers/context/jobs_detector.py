@@ -43,31 +43,28 @@ class JobsDetector(BaseAnalyzer):
 
     def _detect_celery(self) -> dict[str, Any] | None:
         """Detect Celery (Python) task queue."""
-        celery_files = list(self.path.glob("**/celery.py")) + list(
-            self.path.glob("**/tasks.py")
-        )
+        celery_files = self._find_named("celery.py") + self._find_named("tasks.py")
         if not celery_files:
             return None
 
         tasks = []
         for task_file in celery_files:
-            try:
-                content = task_file.read_text(encoding="utf-8")
-                # Find @celery.task or @shared_task decorators
-                task_pattern = r"@(?:celery\.task|shared_task|app\.task)\s*(?:\([^)]*\))?\s*def\s+(\w+)"
-                task_matches = re.findall(task_pattern, content)
-
-                for task_name in task_matches:
-                    tasks.append(
-                        {
-                            "name": task_name,
-                            "file": str(task_file.relative_to(self.path)),
-                        }
-                    )
-
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(task_file)
+            if content is None:
                 continue
 
+            # Find @celery.task or @shared_task decorators
+            task_pattern = r"@(?:celery\.task|shared_task|app\.task)\s*(?:\([^)]*\))?\s*def\s+(\w+)"
+            task_matches = re.findall(task_pattern, content)
+
+            for task_name in task_matches:
+                tasks.append(
+                    {
+                        "name": task_name,
+                        "file": str(task_file.relative_to(self.path)),
+                    }
+                )
+
         if not tasks:
             return None
 
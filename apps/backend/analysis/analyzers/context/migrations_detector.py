@@ -68,7 +68,7 @@ class MigrationsDetector(BaseAnalyzer):
         if not self._exists("manage.py"):
             return None
 
-        migration_dirs = list(self.path.glob("**/migrations"))
+        migration_dirs = self.inventory.dirs_named("migrations", under=self.path)
         if not migration_dirs:
             return None
 
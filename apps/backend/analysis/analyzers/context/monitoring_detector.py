@@ -67,35 +67,33 @@ class MonitoringDetector(BaseAnalyzer):
     def _detect_prometheus(self) -> dict[str, str] | None:
         """Detect Prometheus metrics endpoint."""
         # Look for actual Prometheus imports/usage, not just keywords
-        all_files = (
-            list(self.path.glob("**/*.py"))[:30] + list(self.path.glob("**/*.js"))[:30]
-        )
+        all_files = self._find_files(".py")[:30] + self._find_files(".js")[:30]
 
         for file_path in all_files:
             # Skip analyzer files to avoid self-detection
             if "analyzers" in str(file_path) or "analyzer.py" in str(file_path):
                 continue
 
-            try:
-                content = file_path.read_text(encoding="utf-8")
-                # Look for actual Prometheus imports or usage patterns
-                prometheus_patterns = [
-                    "from prometheus_client import",
-                    "import prometheus_client",
-                    "prometheus_client.",
-                    "@app.route('/metrics')",  # Flask
-                    "app.get('/metrics'",  # Express/Fastify
-                    "router.get('/metrics'",  # Express Router
-                ]
-
-                if any(pattern in content for pattern in prometheus_patterns):
-                    return {
-                        "metrics_endpoint": "/metrics",
-                        "metrics_type": "prometheus",
-                    }
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
+            # Look for actual Prometheus imports or usage patterns
+            prometheus_patterns = [
+                "from prometheus_client import",
+                "import prometheus_client",
+                "prometheus_client.",
+                "@app.route('/metrics')",  # Flask
+                "app.get('/metrics'",  # Express/Fastify
+                "router.get('/metrics'",  # Express Router
+            ]
+
+            if any(pattern in content for pattern in prometheus_patterns):
+                return {
+                    "metrics_endpoint": "/metrics",
+                    "metrics_type": "prometheus",
+                }
+
         return None
 
     def _get_apm_tools(self) -> list[str] | None:
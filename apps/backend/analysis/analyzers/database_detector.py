@@ -48,12 +48,11 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_sqlalchemy_models(self) -> dict:
         """Detect SQLAlchemy models."""
         models = {}
-        py_files = list(self.path.glob("**/*.py"))
+        py_files = self._find_files(".py")
 
         for file_path in py_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Find class definitions that inherit from Base or db.Model
@@ -113,14 +112,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_django_models(self) -> dict:
         """Detect Django models."""
         models = {}
-        model_files = list(self.path.glob("**/models.py")) + list(
-            self.path.glob("**/models/*.py")
-        )
+        model_files = self._find_named("models.py") + [
+            f for f in self._find_files(".py") if f.parent.name == "models"
+        ]
 
         for file_path in model_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Find class definitions that inherit from models.Model
@@ -210,14 +208,15 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_typeorm_models(self) -> dict:
         """Detect TypeORM entities."""
         models = {}
-        ts_files = list(self.path.glob("**/*.entity.ts")) + list(
-            self.path.glob("**/entities/*.ts")
-        )
+        ts_files = [
+            f
+            for f in self._find_files(".ts")
+            if f.name.endswith(".entity.ts") or f.parent.name == "entities"
+        ]
 
         for file_path in ts_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Find @Entity() class declarations
@@ -259,14 +258,11 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_drizzle_models(self) -> dict:
         """Detect Drizzle ORM schemas."""
         models = {}
-        schema_files = list(self.path.glob("**/schema.ts")) + list(
-            self.path.glob("**/db/schema.ts")
-        )
+        schema_files = self._find_named("schema.ts")
 
         for file_path in schema_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Find table definitions: export const users = pgTable('users', {...})
@@ -289,14 +285,13 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_mongoose_models(self) -> dict:
         """Detect Mongoose models."""
         models = {}
-        model_files = list(self.path.glob("**/models/*.js")) + list(
-            self.path.glob("**/models/*.ts")
-        )
+        model_files = [
+            f for f in self._find_files(".js", ".ts") if f.parent.name == "models"
+        ]
 
         for file_path in model_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Find mongoose.model() or new Schema()
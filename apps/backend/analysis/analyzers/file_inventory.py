@@ -0,0 +1,218 @@
+"""
+File Inventory Module
+=====================
+
+Single-pass, shared file inventory for analyzers.
+
+Instead of every analyzer running its own ``glob("**/*.py")`` walks, the tree is
+walked once (pruning SKIP_DIRS and simple .gitignore patterns) and the results
+are bucketed by extension and basename. File contents are read lazily and
+cached, so several detectors scanning the same sources only hit the disk once.
+
+An inventory is shared for the duration of an ``inventory_scope`` block;
+ProjectAnalyzer and ServiceAnalyzer open one around their analysis so every
+BaseAnalyzer created inside reuses it.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import fnmatch
+import os
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from .base import SKIP_DIRS
+
+# SKIP_DIRS entries containing wildcards (e.g. "*.egg-info")
+_SKIP_DIR_PATTERNS = [d for d in SKIP_DIRS if any(c in d for c in "*?[")]
+_SKIP_DIR_NAMES = set(SKIP_DIRS) - set(_SKIP_DIR_PATTERNS)
+
+_active_inventory: contextvars.ContextVar[FileInventory | None] = (
+    contextvars.ContextVar("active_file_inventory", default=None)
+)
+
+
+class _GitIgnore:
+    """Minimal .gitignore matcher (no negation), good enough for pruning."""
+
+    def __init__(self, root: Path):
+        self.name_patterns: list[str] = []
+        self.dir_name_patterns: list[str] = []
+        self.path_patterns: list[str] = []
+        try:
+            lines = (root / ".gitignore").read_text(encoding="utf-8").splitlines()
+        except (OSError, UnicodeDecodeError):
+            return
+
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith(("#", "!")):
+                continue
+            dir_only = line.endswith("/")
+            anchored = line.startswith("/")
+            line = line.strip("/")
+            if not line:
+                continue
+            if anchored or "/" in line:
+                self.path_patterns.append(line)
+            elif dir_only:
+                self.dir_name_patterns.append(line)
+            else:
+                self.name_patterns.append(line)
+
+    def ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        if any(fnmatch.fnmatch(name, p) for p in self.name_patterns):
+            return True
+        if is_dir and any(fnmatch.fnmatch(name, p) for p in self.dir_name_patterns):
+            return True
+        return any(fnmatch.fnmatch(rel_path, p) for p in self.path_patterns)
+
+
+class FileInventory:
+    """Pruned, bucketed listing of every file under a root directory."""
+
+    # Contents larger than this are read on demand but never cached
+    MAX_CACHED_FILE_BYTES = 1024 * 1024
+    MAX_CACHED_TOTAL_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self._files: list[Path] = []
+        self._dirs: list[Path] = []
+        self._by_suffix: dict[str, list[Path]] = defaultdict(list)
+        self._by_name: dict[str, list[Path]] = defaultdict(list)
+        self._dirs_by_name: dict[str, list[Path]] = defaultdict(list)
+        self._contents: dict[Path, str | None] = {}
+        self._cached_bytes = 0
+        self._walk()
+
+    @staticmethod
+    def _skip_dir(name: str) -> bool:
+        return name in _SKIP_DIR_NAMES or any(
+            fnmatch.fnmatch(name, p) for p in _SKIP_DIR_PATTERNS
+        )
+
+    def _walk(self) -> None:
+        gitignore = _GitIgnore(self.root)
+        root_str = str(self.root)
+        prefix_len = len(root_str) + 1
+
+        for dirpath, dirnames, filenames in os.walk(root_str):
+            rel_dir = dirpath[prefix_len:].replace(os.sep, "/")
+            kept = []
+            for name in sorted(dirnames):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if self._skip_dir(name) or gitignore.ignored(rel, name, True):
+                    continue
+                kept.append(name)
+                path = Path(dirpath, name)
+                self._dirs.append(path)
+                self._dirs_by_name[name].append(path)
+            dirnames[:] = kept
+
+            for name in sorted(filenames):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if gitignore.ignored(rel, name, False):
+                    continue
+                path = Path(dirpath, name)
+                self._files.append(path)
+                self._by_name[name].append(path)
+                suffix = os.path.splitext(name)[1]
+                if suffix:
+                    self._by_suffix[suffix].append(path)
+
+    def covers(self, path: Path) -> bool:
+        """Whether ``path`` lies inside this inventory's root."""
+        path = Path(path).resolve()
+        return path == self.root or self.root in path.parents
+
+    @staticmethod
+    def _under(paths: list[Path], under: Path | None) -> list[Path]:
+        if under is None:
+            return list(paths)
+        prefix = str(Path(under).resolve()) + os.sep
+        return [p for p in paths if str(p).startswith(prefix)]
+
+    def files(self, under: Path | None = None) -> list[Path]:
+        """All files, optionally restricted to a subdirectory."""
+        return self._under(self._files, under)
+
+    def files_with_suffix(
+        self, *suffixes: str, under: Path | None = None
+    ) -> list[Path]:
+        """Files whose extension is one of ``suffixes`` (e.g. ".py")."""
+        found: list[Path] = []
+        for suffix in suffixes:
+            found.extend(self._by_suffix.get(suffix, ()))
+        return self._under(found, under)
+
+    def files_named(self, *names: str, under: Path | None = None) -> list[Path]:
+        """Files whose basename is one of ``names`` (e.g. "urls.py")."""
+        found: list[Path] = []
+        for name in names:
+            found.extend(self._by_name.get(name, ()))
+        return self._under(found, under)
+
+    def dirs_named(self, *names: str, under: Path | None = None) -> list[Path]:
+        """Directories whose basename is one of ``names``."""
+        found: list[Path] = []
+        for name in names:
+            found.extend(self._dirs_by_name.get(name, ()))
+        return self._under(found, under)
+
+    def read_text(self, path: Path, errors: str = "strict") -> str | None:
+        """
+        Read a file as UTF-8, caching the result.
+
+        Returns None if the file can't be read (or decoded, with errors="strict").
+        """
+        path = Path(path)
+        if path not in self._contents:
+            try:
+                content: str | None = path.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                content = None
+            size = len(content) if content else 0
+            if (
+                size <= self.MAX_CACHED_FILE_BYTES
+                and self._cached_bytes + size <= self.MAX_CACHED_TOTAL_BYTES
+            ):
+                self._contents[path] = content
+                self._cached_bytes += size
+        else:
+            content = self._contents[path]
+
+        if content is None and errors != "strict":
+            try:
+                return path.read_text(encoding="utf-8", errors=errors)
+            except OSError:
+                return None
+        return content
+
+
+def current_inventory() -> FileInventory | None:
+    """The inventory shared by the enclosing ``inventory_scope``, if any."""
+    return _active_inventory.get()
+
+
+@contextmanager
+def inventory_scope(root: Path) -> Iterator[FileInventory]:
+    """
+    Share one FileInventory for ``root`` with every analyzer in the block.
+
+    Re-uses the enclosing scope's inventory when it already covers ``root``.
+    """
+    active = _active_inventory.get()
+    if active is not None and active.covers(root):
+        yield active
+        return
+
+    inventory = FileInventory(root)
+    token = _active_inventory.set(inventory)
+    try:
+        yield inventory
+    finally:
+        _active_inventory.reset(token)
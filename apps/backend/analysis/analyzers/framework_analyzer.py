@@ -309,11 +309,11 @@ class FrameworkAnalyzer(BaseAnalyzer):
         try:
             # Scan Swift files for imports, excluding hidden/vendor dirs
             swift_files = []
-            for swift_file in self.path.rglob("*.swift"):
+            for swift_file in self._find_files(".swift"):
                 # Skip hidden directories, node_modules, .worktrees, etc.
                 if any(
                     part.startswith(".") or part in ("node_modules", "Pods", "Carthage")
-                    for part in swift_file.parts
+                    for part in swift_file.relative_to(self.path).parts
                 ):
                     continue
                 swift_files.append(swift_file)
@@ -322,15 +322,14 @@ class FrameworkAnalyzer(BaseAnalyzer):
 
             imports = set()
             for swift_file in swift_files:
-                try:
-                    content = swift_file.read_text(encoding="utf-8", errors="ignore")
-                    for line in content.split("\n"):
-                        line = line.strip()
-                        if line.startswith("import "):
-                            module = line.replace("import ", "").split()[0]
-                            imports.add(module)
-                except Exception:
+                content = self.inventory.read_text(swift_file, errors="ignore")
+                if not content:
                     continue
+                for line in content.split("\n"):
+                    line = line.strip()
+                    if line.startswith("import "):
+                        module = line.replace("import ", "").split()[0]
+                        imports.add(module)
 
             # Detect UI framework
             if "SwiftUI" in imports:
@@ -0,0 +1,124 @@
+"""
+Index Fingerprints Module
+=========================
+
+Per-service and per-file fingerprints stored next to project_index.json so the
+index can be regenerated incrementally.
+
+A file's fingerprint is its ``(mtime_ns, size)``; a service's fingerprint is a
+digest over the fingerprints of every file the inventory lists under it plus
+the names of its top-level entries (so creating e.g. ``.venv`` or
+``node_modules`` - which the inventory prunes - still invalidates the service)
+and the files detectors read that the inventory does not list: gitignored
+``.env`` variants and files in the parent directory (see UNLISTED_INPUTS).
+
+On re-index, services whose digest is unchanged reuse their previous analysis
+and only changed services are re-analyzed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .file_inventory import FileInventory
+
+FINGERPRINTS_VERSION = 2
+
+# Files read by the detectors (EnvDetector, PortDetector, ServiceAnalyzer) that
+# the inventory may not list because they are gitignored or outside the
+# service directory. Paths are relative to the service.
+UNLISTED_INPUTS = (
+    ".env",
+    ".env.local",
+    ".env.development",
+    ".env.production",
+    ".env.dev",
+    ".env.prod",
+    ".env.test",
+    ".env.staging",
+    "config/.env",
+    "config/.env.local",
+    "../.env",
+    "../docker-compose.yml",
+    "../docker-compose.yaml",
+    "../docker/Dockerfile.{name}",
+)
+
+
+def fingerprints_path(index_file: Path) -> Path:
+    """Sidecar file holding fingerprints for ``index_file``."""
+    return index_file.with_name(index_file.stem + ".fingerprints.json")
+
+
+def fingerprint_service(
+    inventory: FileInventory, service_path: Path, name: str | None = None
+) -> dict[str, Any]:
+    """
+    Fingerprint all inventoried files under a service, plus UNLISTED_INPUTS.
+
+    Args:
+        inventory: Project file inventory
+        service_path: Service directory
+        name: Service name (defaults to the directory name)
+
+    Returns:
+        {"digest": str, "files": {relative_path: [mtime_ns, size]}}
+    """
+    service_path = Path(service_path).resolve()
+    files: dict[str, list[int]] = {}
+    digest = hashlib.sha1()
+
+    try:
+        top_level = sorted(os.listdir(service_path))
+    except OSError:
+        top_level = []
+    digest.update("\0".join(top_level).encode("utf-8", "surrogateescape"))
+
+    inputs = {
+        file_path.relative_to(service_path).as_posix(): file_path
+        for file_path in inventory.files(under=service_path)
+    }
+    for pattern in UNLISTED_INPUTS:
+        rel = pattern.format(name=name or service_path.name)
+        inputs.setdefault(rel, service_path / rel)
+
+    for rel, file_path in sorted(inputs.items()):
+        try:
+            st = file_path.stat()
+        except OSError:
+            continue
+        files[rel] = [st.st_mtime_ns, st.st_size]
+        digest.update(
+            f"\n{rel}\0{st.st_mtime_ns}\0{st.st_size}".encode(
+                "utf-8", "surrogateescape"
+            )
+        )
+
+    return {"digest": digest.hexdigest(), "files": files}
+
+
+def load_fingerprints(index_file: Path) -> dict[str, Any] | None:
+    """Load the fingerprint sidecar for an index, or None if missing/invalid."""
+    path = fingerprints_path(index_file)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if data.get("version") != FINGERPRINTS_VERSION:
+        return None
+    return data
+
+
+def save_fingerprints(index_file: Path, services: dict[str, dict[str, Any]]) -> None:
+    """Write the fingerprint sidecar for an index."""
+    path = fingerprints_path(index_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"version": FINGERPRINTS_VERSION, "services": services}, f)
+    os.replace(tmp, path)
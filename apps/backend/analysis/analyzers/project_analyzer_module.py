@@ -11,13 +11,27 @@ from pathlib import Path
 from typing import Any
 
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
+from .file_inventory import FileInventory, inventory_scope
+from .index_fingerprints import fingerprint_service
 from .service_analyzer import ServiceAnalyzer
 
 
 class ProjectAnalyzer:
     """Analyzes an entire project, detecting monorepo structure and all services."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(
+        self,
+        project_dir: Path,
+        previous_index: dict[str, Any] | None = None,
+        previous_fingerprints: dict[str, Any] | None = None,
+    ):
+        """
+        Args:
+            project_dir: Path to the project root
+            previous_index: Index from a prior run; services whose fingerprint
+                is unchanged reuse their entry instead of being re-analyzed
+            previous_fingerprints: Fingerprints saved alongside previous_index
+        """
         self.project_dir = project_dir.resolve()
         self.index = {
             "project_root": str(self.project_dir),
@@ -26,15 +40,23 @@ class ProjectAnalyzer:
             "infrastructure": {},
             "conventions": {},
         }
+        self.previous_services = (previous_index or {}).get("services", {})
+        self.previous_fingerprints = (previous_fingerprints or {}).get("services", {})
+        # Fingerprints of this run, keyed by service name
+        self.fingerprints: dict[str, dict[str, Any]] = {}
+        self._inventory: FileInventory | None = None
 
     def analyze(self) -> dict[str, Any]:
         """Run full project analysis."""
-        self._detect_project_type()
-        self._find_and_analyze_services()
-        self._aggregate_dependency_locations()
-        self._analyze_infrastructure()
-        self._detect_conventions()
-        self._map_dependencies()
+        # Walk the tree once; every service analyzer queries the same inventory
+        with inventory_scope(self.project_dir) as inventory:
+            self._inventory = inventory
+            self._detect_project_type()
+            self._find_and_analyze_services()
+            self._aggregate_dependency_locations()
+            self._analyze_infrastructure()
+            self._detect_conventions()
+            self._map_dependencies()
         return self.index
 
     def _detect_project_type(self) -> None:
@@ -110,21 +132,47 @@ class ProjectAnalyzer:
                     if has_root_file or (
                         location == self.project_dir and is_service_name
                     ):
-                        analyzer = ServiceAnalyzer(item, item.name)
-                        service_info = analyzer.analyze()
+                        service_info = self._analyze_service(item, item.name)
                         if service_info.get(
                             "language"
                         ):  # Only include if we detected something
                             services[item.name] = service_info
         else:
             # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
-            service_info = analyzer.analyze()
+            service_info = self._analyze_service(self.project_dir, "main")
             if service_info.get("language"):
                 services["main"] = service_info
 
         self.index["services"] = services
 
+    def _analyze_service(self, service_path: Path, name: str) -> dict[str, Any]:
+        """Analyze a service, reusing the previous result if its files are unchanged."""
+        fingerprint = fingerprint_service(self._inventory, service_path, name)
+        fingerprint["path"] = str(service_path)
+
+        previous = self.previous_fingerprints.get(name)
+        if (
+            previous
+            and previous.get("digest") == fingerprint["digest"]
+            and previous.get("path") == fingerprint["path"]
+        ):
+            if name in self.previous_services:
+                fingerprint["detected"] = True
+                self.fingerprints[name] = fingerprint
+                service_info = dict(self.previous_services[name])
+                # Recomputed by _map_dependencies
+                service_info.pop("consumes", None)
+                return service_info
+            if previous.get("detected") is False:
+                fingerprint["detected"] = False
+                self.fingerprints[name] = fingerprint
+                return {"name": name, "path": str(service_path), "language": None}
+
+        service_info = ServiceAnalyzer(service_path, name).analyze()
+        fingerprint["detected"] = bool(service_info.get("language"))
+        self.fingerprints[name] = fingerprint
+        return service_info
+
     def _aggregate_dependency_locations(self) -> None:
         """Aggregate dependency location metadata from all services.
 
@@ -20,16 +20,9 @@ from .base import BaseAnalyzer
 class RouteDetector(BaseAnalyzer):
     """Detects API routes across multiple web frameworks."""
 
-    # Directories to exclude from route detection
-    EXCLUDED_DIRS = {"node_modules", ".venv", "venv", "__pycache__", ".git"}
-
     def __init__(self, path: Path):
         super().__init__(path)
 
-    def _should_include_file(self, file_path: Path) -> bool:
-        """Check if file should be included (not in excluded directories)."""
-        return not any(part in self.EXCLUDED_DIRS for part in file_path.parts)
-
     def detect_all_routes(self) -> list[dict]:
         """Detect all API routes across different frameworks."""
         routes = []
@@ -60,14 +53,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_fastapi_routes(self) -> list[dict]:
         """Detect FastAPI routes."""
         routes = []
-        files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
-        ]
+        files_to_check = self._find_files(".py")
 
         for file_path in files_to_check:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Pattern: @app.get("/path") or @router.post("/path", dependencies=[...])
@@ -124,14 +114,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_flask_routes(self) -> list[dict]:
         """Detect Flask routes."""
         routes = []
-        files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
-        ]
+        files_to_check = self._find_files(".py")
 
         for file_path in files_to_check:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Pattern: @app.route("/path", methods=["GET", "POST"])
@@ -173,14 +160,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_django_routes(self) -> list[dict]:
         """Detect Django routes from urls.py files."""
         routes = []
-        url_files = [
-            f for f in self.path.glob("**/urls.py") if self._should_include_file(f)
-        ]
+        url_files = self._find_named("urls.py")
 
         for file_path in url_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Pattern: path('users/<int:id>/', views.user_detail)
@@ -209,17 +193,10 @@ class RouteDetector(BaseAnalyzer):
     def _detect_express_routes(self) -> list[dict]:
         """Detect Express/Fastify/Koa routes."""
         routes = []
-        js_files = [
-            f for f in self.path.glob("**/*.js") if self._should_include_file(f)
-        ]
-        ts_files = [
-            f for f in self.path.glob("**/*.ts") if self._should_include_file(f)
-        ]
-        files_to_check = js_files + ts_files
+        files_to_check = self._find_files(".js", ".ts")
         for file_path in files_to_check:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Pattern: app.get('/path', handler) or router.post('/path', middleware, handler)
@@ -268,11 +245,9 @@ class RouteDetector(BaseAnalyzer):
         app_dir = self.path / "app"
         if app_dir.exists():
             # Find all route.ts/js files
-            route_files = [
-                f
-                for f in app_dir.glob("**/route.{ts,js,tsx,jsx}")
-                if self._should_include_file(f)
-            ]
+            route_files = self.inventory.files_named(
+                "route.ts", "route.js", "route.tsx", "route.jsx", under=app_dir
+            )
             for route_file in route_files:
                 # Convert file path to route path
                 # app/api/users/[id]/route.ts -> /api/users/:id
@@ -282,35 +257,33 @@ class RouteDetector(BaseAnalyzer):
                 # Convert [id] to :id
                 route_path = re.sub(r"\[([^\]]+)\]", r":\1", route_path)
 
-                try:
-                    content = route_file.read_text(encoding="utf-8")
-                    # Detect exported methods: export async function GET(request)
-                    methods = re.findall(
-                        r"export\s+(?:async\s+)?function\s+(GET|POST|PUT|DELETE|PATCH)",
-                        content,
-                    )
-
-                    if methods:
-                        routes.append(
-                            {
-                                "path": route_path,
-                                "methods": methods,
-                                "file": str(route_file.relative_to(self.path)),
-                                "framework": "Next.js",
-                                "requires_auth": "auth" in content.lower(),
-                            }
-                        )
-                except (OSError, UnicodeDecodeError):
+                content = self._read_source(route_file)
+                if content is None:
                     continue
 
+                # Detect exported methods: export async function GET(request)
+                methods = re.findall(
+                    r"export\s+(?:async\s+)?function\s+(GET|POST|PUT|DELETE|PATCH)",
+                    content,
+                )
+
+                if methods:
+                    routes.append(
+                        {
+                            "path": route_path,
+                            "methods": methods,
+                            "file": str(route_file.relative_to(self.path)),
+                            "framework": "Next.js",
+                            "requires_auth": "auth" in content.lower(),
+                        }
+                    )
+
         # Next.js Pages Router (pages/api directory)
         pages_api = self.path / "pages" / "api"
         if pages_api.exists():
-            api_files = [
-                f
-                for f in pages_api.glob("**/*.{ts,js,tsx,jsx}")
-                if self._should_include_file(f)
-            ]
+            api_files = self.inventory.files_with_suffix(
+                ".ts", ".js", ".tsx", ".jsx", under=pages_api
+            )
             for api_file in api_files:
                 if api_file.name.startswith("_"):
                     continue
@@ -342,14 +315,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_go_routes(self) -> list[dict]:
         """Detect Go framework routes (Gin, Echo, Chi, Fiber)."""
         routes = []
-        go_files = [
-            f for f in self.path.glob("**/*.go") if self._should_include_file(f)
-        ]
+        go_files = self._find_files(".go")
 
         for file_path in go_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Gin: r.GET("/path", handler)
@@ -378,14 +348,11 @@ class RouteDetector(BaseAnalyzer):
     def _detect_rust_routes(self) -> list[dict]:
         """Detect Rust framework routes (Axum, Actix)."""
         routes = []
-        rust_files = [
-            f for f in self.path.glob("**/*.rs") if self._should_include_file(f)
-        ]
+        rust_files = self._find_files(".rs")
 
         for file_path in rust_files:
-            try:
-                content = file_path.read_text(encoding="utf-8")
-            except (OSError, UnicodeDecodeError):
+            content = self._read_source(file_path)
+            if content is None:
                 continue
 
             # Axum: .route("/path", get(handler))
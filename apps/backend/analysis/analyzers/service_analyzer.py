@@ -15,6 +15,7 @@ from typing import Any
 from .base import BaseAnalyzer
 from .context_analyzer import ContextAnalyzer
 from .database_detector import DatabaseDetector
+from .file_inventory import inventory_scope
 from .framework_analyzer import FrameworkAnalyzer
 from .route_detector import RouteDetector
 
@@ -35,26 +36,28 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def analyze(self) -> dict[str, Any]:
         """Run full analysis on this service."""
-        self._detect_language_and_framework()
-        self._detect_service_type()
-        self._find_key_directories()
-        self._find_entry_points()
-        self._detect_dependencies()
-        self._detect_dependency_locations()
-        self._detect_package_manager()
-        self._detect_testing()
-        self._find_dockerfile()
-
-        # Comprehensive context extraction
-        self._detect_environment_variables()
-        self._detect_api_routes()
-        self._detect_database_models()
-        self._detect_external_services()
-        self._detect_auth_patterns()
-        self._detect_migrations()
-        self._detect_background_jobs()
-        self._detect_api_documentation()
-        self._detect_monitoring()
+        # Share one file inventory across all detectors (re-uses the project's)
+        with inventory_scope(self.path):
+            self._detect_language_and_framework()
+            self._detect_service_type()
+            self._find_key_directories()
+            self._find_entry_points()
+            self._detect_dependencies()
+            self._detect_dependency_locations()
+            self._detect_package_manager()
+            self._detect_testing()
+            self._find_dockerfile()
+
+            # Comprehensive context extraction
+            self._detect_environment_variables()
+            self._detect_api_routes()
+            self._detect_database_models()
+            self._detect_external_services()
+            self._detect_auth_patterns()
+            self._detect_migrations()
+            self._detect_background_jobs()
+            self._detect_api_documentation()
+            self._detect_monitoring()
 
         return self.analysis
 
@@ -0,0 +1,417 @@
+"""
+Code Search Index
+=================
+
+Persistent inverted index over a project's code files, used by CodeSearcher.
+
+Every code file is tokenized once into lowercase identifier runs
+(``[a-z0-9_]+``); for each token the index records how often it occurs in the
+file and the first few line numbers it appears on. The index lives in a SQLite
+database under ``.auto-claude/`` and is refreshed incrementally: files are
+re-tokenized only when their ``(mtime_ns, size)`` changes.
+
+Keyword lookups keep the semantics of a plain substring search over the
+lowercased file: an identifier-like keyword occurs in a file exactly when it
+occurs inside one of the file's tokens, so matching tokens are found by
+scanning the (much smaller) vocabulary instead of every file. Keywords with
+other characters are narrowed down through the index and verified by reading
+only the candidate files.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Line numbers stored per (token, file). Search reports at most this many
+# lines per keyword, and the first N lines containing a keyword are always
+# among the first N lines of the tokens it matches.
+MAX_LINES_PER_TOKEN = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_WORD_KEYWORD_RE = re.compile(r"[a-z0-9_]+\Z")
+
+# SQLite's default limit on bound parameters is 999
+_SQL_BATCH = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    lines TEXT NOT NULL,
+    PRIMARY KEY (token_id, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+"""
+
+# keyword -> {relative path: (occurrences, first line numbers)}
+KeywordHits = dict[str, dict[str, tuple[int, list[int]]]]
+
+
+def iter_code_files(directory: Path):
+    """
+    Iterate over code files in a directory, pruning SKIP_DIRS.
+
+    Args:
+        directory: Root directory to search
+
+    Yields:
+        Path objects for code files
+    """
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if os.path.splitext(name)[1] in CODE_EXTENSIONS:
+                yield Path(dirpath, name)
+
+
+def tokenize(content: str) -> dict[str, list]:
+    """
+    Build postings for one file.
+
+    Returns:
+        {token: [occurrences, [first line numbers]]}
+    """
+    postings: dict[str, list] = {}
+    for lineno, line in enumerate(content.lower().split("\n"), 1):
+        for token in _TOKEN_RE.findall(line):
+            entry = postings.get(token)
+            if entry is None:
+                postings[token] = [1, [lineno]]
+                continue
+            entry[0] += 1
+            lines = entry[1]
+            if len(lines) < MAX_LINES_PER_TOKEN and lines[-1] != lineno:
+                lines.append(lineno)
+    return postings
+
+
+class CodeIndex:
+    """Incrementally maintained token index over a project's code files."""
+
+    def __init__(self, project_dir: Path, db_path: Path | None = None):
+        """
+        Args:
+            project_dir: Project root; indexed paths are stored relative to it
+            db_path: SQLite database file (None = in-memory, rebuilt per process)
+        """
+        self.project_dir = Path(project_dir).resolve()
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> CodeIndex:
+        """Open the project's persistent index (in-memory if .auto-claude is absent)."""
+        project_dir = Path(project_dir).resolve()
+        data_dir = project_dir / ".auto-claude"
+        db_path = data_dir / "code_index.db" if data_dir.is_dir() else None
+        return cls(project_dir, db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        target = str(self.db_path) if self.db_path else ":memory:"
+        try:
+            conn = self._open(target)
+        except sqlite3.DatabaseError as e:
+            if not self.db_path:
+                raise
+            # Corrupt or foreign file - the index is only a cache, rebuild it
+            logger.warning(f"Rebuilding unreadable code index {self.db_path}: {e}")
+            self.db_path.unlink(missing_ok=True)
+            conn = self._open(target)
+        return conn
+
+    @staticmethod
+    def _open(target: str) -> sqlite3.Connection:
+        conn = sqlite3.connect(target, timeout=30, check_same_thread=False)
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS postings;"
+                    "DROP TABLE IF EXISTS tokens;"
+                    "DROP TABLE IF EXISTS files;"
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            conn.commit()
+        except sqlite3.DatabaseError:
+            conn.close()
+            raise
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    def relative(self, path: Path) -> str | None:
+        """Project-relative POSIX path, or None if ``path`` is outside the project."""
+        try:
+            rel = Path(path).resolve().relative_to(self.project_dir).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel
+
+    def _files_under(self, prefix: str) -> list[tuple[int, str, int, int]]:
+        if not prefix:
+            return self._conn.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            ).fetchall()
+        # "0" sorts right after "/", so this is exactly the "prefix/" range
+        return self._conn.execute(
+            "SELECT id, path, mtime_ns, size FROM files WHERE path >= ? AND path < ?",
+            (prefix + "/", prefix + "0"),
+        ).fetchall()
+
+    @staticmethod
+    def _in_scope(prefix: str, rel: str) -> bool:
+        """Whether a file under ``prefix`` would be walked from ``prefix``."""
+        inner = rel[len(prefix) + 1 :] if prefix else rel
+        return not any(part in SKIP_DIRS for part in inner.split("/")[:-1])
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def update(self, directory: Path) -> int:
+        """
+        Bring the index up to date for every code file under ``directory``.
+
+        Returns:
+            Number of files (re)indexed or removed
+        """
+        prefix = self.relative(directory)
+        if prefix is None:
+            raise ValueError(f"{directory} is outside {self.project_dir}")
+
+        with self._lock:
+            indexed = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in self._files_under(prefix)
+            }
+
+            seen: set[str] = set()
+            changed: list[tuple[Path, str, int, int]] = []
+            for file_path in iter_code_files(self.project_dir / prefix):
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                rel = file_path.relative_to(self.project_dir).as_posix()
+                seen.add(rel)
+                previous = indexed.get(rel)
+                if previous is None or previous[1:] != (st.st_mtime_ns, st.st_size):
+                    changed.append((file_path, rel, st.st_mtime_ns, st.st_size))
+
+            # Files in SKIP_DIRS relative to this directory may belong to a
+            # nested service walked from elsewhere - only drop them once gone
+            removed = [
+                indexed[rel][0]
+                for rel in indexed
+                if rel not in seen
+                and (
+                    self._in_scope(prefix, rel) or not (self.project_dir / rel).exists()
+                )
+            ]
+
+            if not changed and not removed:
+                return 0
+
+            with self._conn:
+                self._delete_files(removed)
+                for file_path, rel, mtime_ns, size in changed:
+                    previous = indexed.get(rel)
+                    self._index_file(
+                        file_path,
+                        rel,
+                        mtime_ns,
+                        size,
+                        previous[0] if previous else None,
+                    )
+            return len(changed) + len(removed)
+
+    def _delete_files(self, file_ids: list[int]) -> None:
+        for i in range(0, len(file_ids), _SQL_BATCH):
+            batch = file_ids[i : i + _SQL_BATCH]
+            marks = ",".join("?" * len(batch))
+            self._conn.execute(
+                f"DELETE FROM postings WHERE file_id IN ({marks})", batch
+            )
+            self._conn.execute(f"DELETE FROM files WHERE id IN ({marks})", batch)
+
+    def _token_ids(self, tokens: list[str]) -> dict[str, int]:
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO tokens (token) VALUES (?)",
+            ((token,) for token in tokens),
+        )
+        ids: dict[str, int] = {}
+        for i in range(0, len(tokens), _SQL_BATCH):
+            batch = tokens[i : i + _SQL_BATCH]
+            marks = ",".join("?" * len(batch))
+            ids.update(
+                self._conn.execute(
+                    f"SELECT token, id FROM tokens WHERE token IN ({marks})", batch
+                ).fetchall()
+            )
+        return ids
+
+    def _index_file(
+        self,
+        file_path: Path,
+        rel: str,
+        mtime_ns: int,
+        size: int,
+        file_id: int | None,
+    ) -> None:
+        try:
+            content = file_path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            if file_id is not None:
+                self._delete_files([file_id])
+            return
+
+        if file_id is None:
+            file_id = self._conn.execute(
+                "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (rel, mtime_ns, size),
+            ).lastrowid
+        else:
+            self._conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                (mtime_ns, size, file_id),
+            )
+            self._conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+
+        postings = tokenize(content)
+        token_ids = self._token_ids(list(postings))
+        self._conn.executemany(
+            "INSERT INTO postings (token_id, file_id, count, lines) VALUES (?, ?, ?, ?)",
+            (
+                (token_ids[token], file_id, count, ",".join(map(str, lines)))
+                for token, (count, lines) in postings.items()
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def keyword_hits(self, directory: Path, keywords: list[str]) -> KeywordHits:
+        """
+        Find occurrences of each keyword in the code files under ``directory``.
+
+        Matching is a substring search over the lowercased file, as before the
+        index existed. Call ``update`` first for fresh results.
+
+        Returns:
+            {keyword: {relative path: (occurrences, first matching line numbers)}}
+        """
+        prefix = self.relative(directory)
+        if prefix is None:
+            raise ValueError(f"{directory} is outside {self.project_dir}")
+
+        with self._lock:
+            scope = {
+                file_id: path
+                for file_id, path, _, _ in self._files_under(prefix)
+                if self._in_scope(prefix, path)
+            }
+            hits: KeywordHits = {}
+            for keyword in keywords:
+                if keyword in hits:
+                    continue
+                if _WORD_KEYWORD_RE.match(keyword):
+                    hits[keyword] = self._token_hits(keyword, scope)
+                else:
+                    hits[keyword] = self._verified_hits(keyword, scope)
+            return hits
+
+    def _postings_for(self, keyword: str, scope: dict[int, str]):
+        """Yield (path, token, count, lines) for tokens containing ``keyword``."""
+        tokens = dict(
+            self._conn.execute(
+                "SELECT id, token FROM tokens WHERE instr(token, ?) > 0", (keyword,)
+            ).fetchall()
+        )
+        token_ids = list(tokens)
+        for i in range(0, len(token_ids), _SQL_BATCH):
+            batch = token_ids[i : i + _SQL_BATCH]
+            marks = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                "SELECT token_id, file_id, count, lines FROM postings "
+                f"WHERE token_id IN ({marks})",
+                batch,
+            )
+            for token_id, file_id, count, lines in rows:
+                path = scope.get(file_id)
+                if path is not None:
+                    yield path, tokens[token_id], count, lines
+
+    def _token_hits(
+        self, keyword: str, scope: dict[int, str]
+    ) -> dict[str, tuple[int, list[int]]]:
+        counts: dict[str, int] = {}
+        lines: dict[str, set[int]] = {}
+        for path, token, count, token_lines in self._postings_for(keyword, scope):
+            counts[path] = counts.get(path, 0) + token.count(keyword) * count
+            lines.setdefault(path, set()).update(map(int, token_lines.split(",")))
+        return {
+            path: (counts[path], sorted(lines[path])[:MAX_LINES_PER_TOKEN])
+            for path in sorted(counts)
+        }
+
+    def _verified_hits(
+        self, keyword: str, scope: dict[int, str]
+    ) -> dict[str, tuple[int, list[int]]]:
+        # Every identifier run inside the keyword (minus possibly partial
+        # runs at either end) must occur in the file as a token substring
+        parts = _TOKEN_RE.findall(keyword)
+        candidates = set(scope.values())
+        for part in parts:
+            candidates &= {path for path, _, _, _ in self._postings_for(part, scope)}
+            if not candidates:
+                return {}
+
+        hits: dict[str, tuple[int, list[int]]] = {}
+        for path in sorted(candidates):
+            try:
+                content = (self.project_dir / path).read_text(
+                    encoding="utf-8", errors="ignore"
+                )
+            except OSError:
+                continue
+            content_lower = content.lower()
+            if keyword not in content_lower:
+                continue
+            found = [
+                i
+                for i, line in enumerate(content.split("\n"), 1)
+                if keyword in line.lower()
+            ][:MAX_LINES_PER_TOKEN]
+            hits[path] = (content_lower.count(keyword), found)
+        return hits
@@ -5,17 +5,29 @@ Code Search Functionality
 Search codebase for relevant files based on keywords.
 """
 
+import logging
+import sqlite3
 from pathlib import Path
 
-from .constants import CODE_EXTENSIONS, SKIP_DIRS
+from .code_index import CodeIndex, iter_code_files
 from .models import FileMatch
 
+logger = logging.getLogger(__name__)
+
 
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir.resolve()
+        self._index: CodeIndex | None = None
+
+    @property
+    def index(self) -> CodeIndex:
+        """The project's code index, opened on first use."""
+        if self._index is None:
+            self._index = CodeIndex.for_project(self.project_dir)
+        return self._index
 
     def search_service(
         self,
@@ -26,6 +38,10 @@ class CodeSearcher:
         """
         Search a service for files matching keywords.
 
+        Keyword hits, scores and line numbers come from the project's code
+        index, which is brought up to date for the service first; only the
+        files that end up in the results are read.
+
         Args:
             service_path: Path to the service directory
             service_name: Name of the service
@@ -34,10 +50,61 @@ class CodeSearcher:
         Returns:
             List of FileMatch objects sorted by relevance
         """
-        matches = []
-
         if not service_path.exists():
-            return matches
+            return []
+
+        try:
+            self.index.update(service_path)
+            hits = self.index.keyword_hits(service_path, keywords)
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug(f"Code index unavailable, scanning {service_path}: {e}")
+            return self._scan_service(service_path, service_name, keywords)
+
+        # path -> [score, matching keywords, matching line numbers]
+        scored: dict[str, list] = {}
+        for keyword in keywords:
+            for rel_path, (count, line_numbers) in hits[keyword].items():
+                entry = scored.setdefault(rel_path, [0, [], []])
+                entry[0] += min(count, 10)  # Cap at 10 per keyword
+                entry[1].append(keyword)
+                entry[2].extend(line_numbers)  # First 3 per keyword
+
+        ranked = sorted(scored.items(), key=lambda item: item[1][0], reverse=True)
+
+        matches = []
+        for rel_path, (score, matching_keywords, line_numbers) in ranked[:20]:
+            line_numbers = line_numbers[:5]  # Top 5 lines
+            try:
+                lines = (
+                    (self.project_dir / rel_path)
+                    .read_text(encoding="utf-8", errors="ignore")
+                    .split("\n")
+                )
+            except OSError:
+                continue
+            matches.append(
+                FileMatch(
+                    path=str(Path(rel_path)),
+                    service=service_name,
+                    reason=f"Contains: {', '.join(matching_keywords)}",
+                    relevance_score=score,
+                    matching_lines=[
+                        (i, lines[i - 1].strip()[:100])
+                        for i in line_numbers
+                        if i <= len(lines)
+                    ],
+                )
+            )
+        return matches  # Top 20 per service
+
+    def _scan_service(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Search a service by reading every code file (used without an index)."""
+        matches = []
 
         for file_path in self._iter_code_files(service_path):
             try:
@@ -93,9 +160,4 @@ class CodeSearcher:
         Yields:
             Path objects for code files
         """
-        for item in directory.rglob("*"):
-            if item.is_file() and item.suffix in CODE_EXTENSIONS:
-                # Check if in skip directory
-                parts = item.relative_to(directory).parts
-                if not any(part in SKIP_DIRS for part in parts):
-                    yield item
+        yield from iter_code_files(directory)
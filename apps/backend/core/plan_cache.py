@@ -0,0 +1,260 @@
+"""
+Implementation Plan Cache
+=========================
+
+Shared, read-only cache of parsed implementation_plan.json files (and the
+stuck-subtask list from memory/attempt_history.json) for progress queries.
+
+Progress helpers are called many times per session and by status polling for
+every spec, so each file is parsed once and re-read only when its stat
+signature (mtime, size, inode) changes. Writers that go through
+ImplementationPlan.save() also invalidate the entry explicitly.
+
+Cached objects are shared between callers and must not be mutated.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.plan_normalization import normalize_subtask_aliases
+
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# GLOBAL STATE
+# =============================================================================
+
+# Maximum number of files kept in memory (one plan and one attempt history
+# per spec, so this covers many concurrently polled specs)
+PLAN_CACHE_SIZE = 128
+
+PLAN_FILENAME = "implementation_plan.json"
+ATTEMPT_HISTORY_PATH = Path("memory") / "attempt_history.json"
+
+_READY_STATUSES = {"pending", "not_started", "not started"}
+
+# Keyed by resolved file path, ordered least- to most-recently used
+_plan_cache: OrderedDict[Path, "_CachedFile"] = OrderedDict()
+_plan_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
+
+
+@dataclass
+class PlanSnapshot:
+    """A parsed implementation plan plus counters computed once at load time."""
+
+    plan: dict
+    completed: int = 0
+    total: int = 0
+    # Subtask counts by status, as returned by count_subtasks_detailed()
+    status_counts: dict[str, int] = field(default_factory=dict)
+    # Pending subtasks of phases whose dependencies are met, in plan order,
+    # as (phase, normalized subtask annotated with phase id/name/num)
+    ready: list[tuple[dict, dict]] = field(default_factory=list)
+
+    @classmethod
+    def from_plan(cls, plan: dict) -> "PlanSnapshot":
+        """Build a snapshot, precomputing progress counters and the ready index."""
+        snapshot = cls(
+            plan=plan,
+            status_counts={
+                "completed": 0,
+                "in_progress": 0,
+                "pending": 0,
+                "failed": 0,
+                "total": 0,
+            },
+        )
+        phases = plan.get("phases", [])
+
+        for phase in phases:
+            for subtask in phase.get("subtasks", []):
+                status = subtask.get("status", "pending")
+                snapshot.total += 1
+                snapshot.status_counts["total"] += 1
+                if status == "completed":
+                    snapshot.completed += 1
+                if status in snapshot.status_counts:
+                    snapshot.status_counts[status] += 1
+                else:
+                    snapshot.status_counts["pending"] += 1
+
+        # Build a map of phase completion
+        phase_complete: dict[str, bool] = {}
+        for i, phase in enumerate(phases):
+            phase_id_value = phase.get("id")
+            phase_id_raw = (
+                phase_id_value if phase_id_value is not None else phase.get("phase")
+            )
+            phase_id_key = (
+                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
+            )
+            subtasks = phase.get("subtasks", phase.get("chunks", []))
+            phase_complete[phase_id_key] = all(
+                s.get("status") == "completed" for s in subtasks
+            )
+
+        for phase in phases:
+            phase_id_value = phase.get("id")
+            phase_id = (
+                phase_id_value if phase_id_value is not None else phase.get("phase")
+            )
+            depends_on_raw = phase.get("depends_on", [])
+            if isinstance(depends_on_raw, list):
+                depends_on = [str(d) for d in depends_on_raw if d is not None]
+            elif depends_on_raw is None:
+                depends_on = []
+            else:
+                depends_on = [str(depends_on_raw)]
+
+            # Skip phases whose dependencies are not satisfied
+            if not all(phase_complete.get(dep, False) for dep in depends_on):
+                continue
+
+            for subtask in phase.get("subtasks", phase.get("chunks", [])):
+                if subtask.get("status", "pending") not in _READY_STATUSES:
+                    continue
+                subtask_out, _changed = normalize_subtask_aliases(subtask)
+                subtask_out["status"] = "pending"
+                subtask_out.update(
+                    phase_id=phase_id,
+                    phase_name=phase.get("name"),
+                    phase_num=phase.get("phase"),
+                )
+                snapshot.ready.append((phase, subtask_out))
+
+        return snapshot
+
+
+@dataclass
+class _CachedFile:
+    """A cached parse result plus the stat signature it was read with."""
+
+    value: object
+    signature: tuple[int, int, int]
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    """Return (mtime_ns, size, inode) for a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    # Atomic writes replace the file, so the inode changes even when a rewrite
+    # lands within the filesystem's mtime resolution
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _get_cached(path: Path, parse):
+    """
+    Return parse(data) for a JSON file, reusing the cached result if unchanged.
+
+    Returns None if the file is missing or unreadable.
+    """
+    global _cache_hits, _cache_misses
+
+    key = path.resolve()
+    signature = _file_signature(key)
+    if signature is None:
+        invalidate_plan_cache(key)
+        return None
+
+    with _plan_cache_lock:
+        cached = _plan_cache.get(key)
+        if cached is not None and cached.signature == signature:
+            _plan_cache.move_to_end(key)
+            _cache_hits += 1
+            return cached.value
+        _cache_misses += 1
+
+    try:
+        with open(key, encoding="utf-8") as f:
+            value = parse(json.load(f))
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError, AttributeError) as e:
+        logger.debug(f"Failed to load {key}: {e}")
+        return None
+
+    # Only cache if the file didn't change while we were reading it
+    if _file_signature(key) == signature:
+        with _plan_cache_lock:
+            _plan_cache[key] = _CachedFile(value=value, signature=signature)
+            _plan_cache.move_to_end(key)
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+
+    return value
+
+
+def _parse_stuck_subtask_ids(attempt_history: dict) -> frozenset[str]:
+    return frozenset(
+        entry["subtask_id"]
+        for entry in attempt_history.get("stuck_subtasks", [])
+        if "subtask_id" in entry
+    )
+
+
+def get_plan_snapshot(spec_dir: Path) -> PlanSnapshot | None:
+    """
+    Get the parsed implementation plan of a spec, using cache when possible.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+
+    Returns:
+        PlanSnapshot (shared - do not mutate), or None if missing or unreadable
+    """
+    return _get_cached(Path(spec_dir) / PLAN_FILENAME, PlanSnapshot.from_plan)
+
+
+def get_stuck_subtask_ids(spec_dir: Path) -> frozenset[str]:
+    """
+    Get IDs of subtasks marked as stuck in the recovery manager's attempt history.
+
+    Args:
+        spec_dir: Spec directory (attempt history lives under memory/)
+
+    Returns:
+        Set of stuck subtask IDs (empty if there is no readable history)
+    """
+    stuck = _get_cached(Path(spec_dir) / ATTEMPT_HISTORY_PATH, _parse_stuck_subtask_ids)
+    return stuck if stuck is not None else frozenset()
+
+
+def invalidate_plan_cache(path: Path) -> None:
+    """
+    Drop a cached file so the next query re-reads it.
+
+    Args:
+        path: implementation_plan.json (or attempt history) path, or a spec
+            directory to drop both of its files
+    """
+    path = Path(path).resolve()
+    keys = [path, path / PLAN_FILENAME, path / ATTEMPT_HISTORY_PATH]
+    with _plan_cache_lock:
+        for key in keys:
+            _plan_cache.pop(key, None)
+
+
+def get_plan_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and current size of the plan cache."""
+    with _plan_cache_lock:
+        return {
+            "hits": _cache_hits,
+            "misses": _cache_misses,
+            "size": len(_plan_cache),
+            "max_size": PLAN_CACHE_SIZE,
+        }
+
+
+def reset_plan_cache() -> None:
+    """Reset the cached plans and counters (useful for testing)."""
+    global _cache_hits, _cache_misses
+    with _plan_cache_lock:
+        _plan_cache.clear()
+        _cache_hits = 0
+        _cache_misses = 0
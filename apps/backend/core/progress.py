@@ -8,13 +8,14 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
-import json
+import copy
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
-from core.plan_normalization import normalize_subtask_aliases
+from core.plan_cache import get_plan_snapshot, get_stuck_subtask_ids
 from ui import (
     Icons,
     bold,
@@ -40,27 +41,10 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return 0, 0
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    snapshot = get_plan_snapshot(spec_dir)
+    if snapshot is None:
         return 0, 0
+    return snapshot.completed, snapshot.total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -70,35 +54,16 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    result = {
-        "completed": 0,
-        "in_progress": 0,
-        "pending": 0,
-        "failed": 0,
-        "total": 0,
-    }
-
-    if not plan_file.exists():
-        return result
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
-        return result
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return result
+    snapshot = get_plan_snapshot(spec_dir)
+    if snapshot is None:
+        return {
+            "completed": 0,
+            "in_progress": 0,
+            "pending": 0,
+            "failed": 0,
+            "total": 0,
+        }
+    return dict(snapshot.status_counts)
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -184,9 +149,9 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
+        snapshot = get_plan_snapshot(spec_dir)
+        if snapshot is not None:
+            plan = snapshot.plan
 
             print("\nPhases:")
             for phase in plan.get("phases", []):
@@ -232,9 +197,6 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                     print(
                         f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                     )
-
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
-            logger.debug(f"Failed to load plan file for phase summary: {e}")
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -290,9 +252,8 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    snapshot = get_plan_snapshot(spec_dir)
+    if snapshot is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -304,103 +265,87 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
+    plan = snapshot.plan
+    summary = {
+        "workflow_type": plan.get("workflow_type"),
+        "total_phases": len(plan.get("phases", [])),
+        "total_subtasks": snapshot.total,
+        "completed_subtasks": snapshot.completed,
+        "pending_subtasks": snapshot.status_counts["pending"],
+        "in_progress_subtasks": snapshot.status_counts["in_progress"],
+        "failed_subtasks": snapshot.status_counts["failed"],
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.get("phases", []):
+        phase_info = {
+            "id": phase.get("id"),
+            "phase": phase.get("phase"),
+            "name": phase.get("name"),
+            "depends_on": list(phase.get("depends_on", [])),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
+        for subtask in phase.get("subtasks", []):
+            status = subtask.get("status", "pending")
+            phase_info["total"] += 1
+            if status == "completed":
+                phase_info["completed"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.get("id"),
+                    "description": subtask.get("description"),
+                    "status": status,
+                    "service": subtask.get("service"),
+                }
+            )
 
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
+        summary["phases"].append(phase_info)
 
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    snapshot = get_plan_snapshot(spec_dir)
+    if snapshot is None:
         return None
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
+    for phase in snapshot.plan.get("phases", []):
+        subtasks = phase.get("subtasks", phase.get("chunks", []))
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        has_incomplete = any(s.get("status") != "completed" for s in subtasks)
+        if has_incomplete:
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-        return None
+    return None
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+
+def _iter_ready_subtasks(spec_dir: Path):
+    """
+    Yield (phase, subtask) for pending subtasks whose phase dependencies are met.
+
+    Subtasks are yielded in plan order; stuck subtasks are skipped. Each
+    subtask is a fresh copy annotated with its phase id, name and number, so
+    callers may modify it; the phase dict is shared and must not be.
+    """
+    snapshot = get_plan_snapshot(spec_dir)
+    if snapshot is None:
+        return
+
+    stuck_subtask_ids = get_stuck_subtask_ids(spec_dir)
+    for phase, subtask in snapshot.ready:
+        if subtask.get("id") not in stuck_subtask_ids:
+            yield phase, copy.deepcopy(subtask)
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -415,91 +360,53 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    for _phase, subtask in _iter_ready_subtasks(spec_dir):
+        return subtask
+    return None
 
-    if not plan_file.exists():
-        return None
 
-    # Load stuck subtasks from recovery manager's attempt history
-    stuck_subtask_ids = set()
-    attempt_history_file = spec_dir / "memory" / "attempt_history.json"
-    if attempt_history_file.exists():
-        try:
-            with open(attempt_history_file, encoding="utf-8") as f:
-                attempt_history = json.load(f)
-            # Collect IDs of subtasks marked as stuck
-            stuck_subtask_ids = {
-                entry["subtask_id"]
-                for entry in attempt_history.get("stuck_subtasks", [])
-                if "subtask_id" in entry
-            }
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            # If we can't read the file, continue without stuck checking
-            pass
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete: dict[str, bool] = {}
-        for i, phase in enumerate(phases):
-            phase_id_value = phase.get("id")
-            phase_id_raw = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            phase_id_key = (
-                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
-            )
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            phase_complete[phase_id_key] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
+def _subtask_footprint(subtask: dict) -> set[str]:
+    """Normalized paths a subtask plans to modify or create."""
+    paths = [*subtask.get("files_to_modify", []), *subtask.get("files_to_create", [])]
+    return {os.path.normpath(p).replace("\\", "/") for p in paths if p}
 
-        # Find next available subtask
-        for phase in phases:
-            phase_id_value = phase.get("id")
-            phase_id = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
-                depends_on = [str(d) for d in depends_on_raw if d is not None]
-            elif depends_on_raw is None:
-                depends_on = []
-            else:
-                depends_on = [str(depends_on_raw)]
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase (skip stuck subtasks)
-            for subtask in phase.get("subtasks", phase.get("chunks", [])):
-                status = subtask.get("status", "pending")
-                subtask_id = subtask.get("id")
-
-                # Skip stuck subtasks
-                if subtask_id in stuck_subtask_ids:
-                    continue
-
-                if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
-                    subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
 
-        return None
+def get_parallel_subtask_batch(spec_dir: Path, max_subtasks: int) -> list[dict]:
+    """
+    Find ready subtasks that can be worked on concurrently.
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    The first subtask is always the one get_next_subtask() returns. Further
+    subtasks are only added when both they and every subtask already chosen
+    belong to parallel_safe phases and declare files that don't overlap, so
+    concurrent agents never edit the same file. A subtask without declared
+    files always runs alone.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        max_subtasks: Maximum batch size (1 disables batching)
+
+    Returns:
+        Subtask dicts in plan order (empty if nothing is ready)
+    """
+    batch: list[dict] = []
+    claimed: set[str] = set()
+    for phase, subtask in _iter_ready_subtasks(spec_dir):
+        footprint = _subtask_footprint(subtask)
+        batchable = bool(phase.get("parallel_safe")) and bool(footprint)
+
+        if not batch:
+            batch.append(subtask)
+            claimed = footprint
+            if not batchable:
+                break
+        elif batchable and not (footprint & claimed):
+            batch.append(subtask)
+            claimed |= footprint
+
+        if len(batch) >= max_subtasks:
+            break
+
+    return batch
 
 
 def format_duration(seconds: float) -> str:
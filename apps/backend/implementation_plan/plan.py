@@ -15,6 +15,7 @@ from datetime import datetime
 from pathlib import Path
 
 from core.file_utils import write_json_atomic
+from core.plan_cache import invalidate_plan_cache
 
 from .enums import PhaseType, SubtaskStatus, WorkflowType
 from .phase import Phase
@@ -118,6 +119,7 @@ class ImplementationPlan:
         self._update_timestamps_and_status()
         # Use atomic write to prevent corruption on crash/interrupt
         write_json_atomic(path, self.to_dict(), indent=2, ensure_ascii=False)
+        invalidate_plan_cache(path)
 
     async def async_save(self, path: Path) -> None:
         """
@@ -145,6 +147,7 @@ class ImplementationPlan:
 
         try:
             await loop.run_in_executor(None, partial_write)
+            invalidate_plan_cache(path)
         except Exception:
             # Restore full state from captured dict on write failure
             # This reverts all fields modified by _update_timestamps_and_status()
@@ -0,0 +1,309 @@
+"""
+Episode Full-Text Index
+=======================
+
+Keyword index over Graphiti episodes (name, content and source description)
+for memory search.
+
+The graph database has no text index, so keyword search used to lowercase
+and substring-match every Episodic node. This module keeps an SQLite FTS5
+index next to the database (<db_path>/.<database>_episodes_fts.sqlite) that
+answers keyword queries with BM25 scores and pagination.
+
+Episodes are indexed when they are saved (GraphitiQueries and the UI's
+add-episode command). Episodes written any other way are picked up by
+EpisodeIndex.sync(), which diffs the indexed UUIDs against the graph.
+
+Usage:
+    from integrations.graphiti.episode_index import EpisodeIndex
+
+    with EpisodeIndex.for_database(db_path / database) as index:
+        page = index.search("auth token", limit=20, offset=0)
+"""
+
+import logging
+import re
+import sqlite3
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".{database}_episodes_fts.sqlite"
+
+# Column weights for BM25 ranking: name, content, source_description
+BM25_WEIGHTS = (4.0, 1.0, 2.0)
+
+# Seconds to wait for another process holding the index's write lock
+BUSY_TIMEOUT = 5.0
+
+EPISODE_FIELDS = (
+    "uuid",
+    "name",
+    "content",
+    "source_description",
+    "group_id",
+    "created_at",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    uuid TEXT NOT NULL UNIQUE,
+    name TEXT,
+    content TEXT,
+    source_description TEXT,
+    group_id TEXT,
+    created_at TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5(
+    name,
+    content,
+    source_description,
+    content='episodes',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS episodes_ai AFTER INSERT ON episodes BEGIN
+    INSERT INTO episodes_fts(rowid, name, content, source_description)
+    VALUES (new.id, new.name, new.content, new.source_description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_ad AFTER DELETE ON episodes BEGIN
+    INSERT INTO episodes_fts(episodes_fts, rowid, name, content, source_description)
+    VALUES ('delete', old.id, old.name, old.content, old.source_description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_au AFTER UPDATE ON episodes BEGIN
+    INSERT INTO episodes_fts(episodes_fts, rowid, name, content, source_description)
+    VALUES ('delete', old.id, old.name, old.content, old.source_description);
+    INSERT INTO episodes_fts(rowid, name, content, source_description)
+    VALUES (new.id, new.name, new.content, new.source_description);
+END;
+"""
+
+_TERM_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def episode_index_path(db_full_path: Path) -> Path:
+    """Return the index file for a database at <db_path>/<database>."""
+    db_full_path = Path(db_full_path)
+    return db_full_path.parent / INDEX_FILENAME.format(database=db_full_path.name)
+
+
+def build_match_query(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 query.
+
+    Every word must match as a prefix ("auth tok" finds "authentication
+    token"), which approximates the substring search it replaces. Words are
+    quoted, so FTS5 operators in user input are treated as text.
+
+    Returns:
+        FTS5 MATCH expression, or None if the query has no searchable words
+    """
+    terms = _TERM_PATTERN.findall(query or "")
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def episode_record(episode) -> dict:
+    """Build an index record from a Graphiti EpisodicNode (or similar object)."""
+    created_at = getattr(episode, "created_at", None)
+    return {
+        "uuid": str(episode.uuid),
+        "name": getattr(episode, "name", "") or "",
+        "content": getattr(episode, "content", "") or "",
+        "source_description": getattr(episode, "source_description", "") or "",
+        "group_id": getattr(episode, "group_id", "") or "",
+        "created_at": created_at.isoformat()
+        if hasattr(created_at, "isoformat")
+        else created_at,
+    }
+
+
+@dataclass
+class SearchPage:
+    """One page of keyword search results."""
+
+    # Episode records (see EPISODE_FIELDS) plus a "score" (higher is better)
+    episodes: list[dict] = field(default_factory=list)
+    # Number of matching episodes across all pages
+    total: int = 0
+
+
+class EpisodeIndex:
+    """
+    SQLite FTS5 index of episodes, ranked by BM25.
+
+    Safe to share between processes (WAL mode); a single instance must not
+    be used from several threads at once.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT)
+        self._conn.row_factory = sqlite3.Row
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    @classmethod
+    def for_database(cls, db_full_path: Path) -> "EpisodeIndex":
+        """Open (creating if needed) the index for a database."""
+        return cls(episode_index_path(db_full_path))
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "EpisodeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, episodes: Iterable[dict]) -> int:
+        """
+        Index episodes, replacing any already indexed with the same UUID.
+
+        Args:
+            episodes: Dicts with the keys in EPISODE_FIELDS (uuid required)
+
+        Returns:
+            Number of episodes written
+        """
+        rows = [
+            tuple(episode.get(name) for name in EPISODE_FIELDS)
+            for episode in episodes
+            if episode.get("uuid")
+        ]
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO episodes (uuid, name, content, source_description,
+                                      group_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(uuid) DO UPDATE SET
+                    name = excluded.name,
+                    content = excluded.content,
+                    source_description = excluded.source_description,
+                    group_id = excluded.group_id,
+                    created_at = excluded.created_at
+                """,
+                rows,
+            )
+        return len(rows)
+
+    def remove(self, uuids: Iterable[str]) -> int:
+        """Remove episodes from the index. Returns how many were removed."""
+        with self._conn:
+            cursor = self._conn.executemany(
+                "DELETE FROM episodes WHERE uuid = ?", [(u,) for u in uuids]
+            )
+        return cursor.rowcount
+
+    def uuids(self) -> set[str]:
+        """Return the UUIDs of all indexed episodes."""
+        return {row[0] for row in self._conn.execute("SELECT uuid FROM episodes")}
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM episodes").fetchone()[0]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        group_id: str | None = None,
+    ) -> SearchPage:
+        """
+        Find episodes matching every word of query, best matches first.
+
+        Args:
+            query: Free-text keywords
+            limit: Page size
+            offset: Number of results to skip
+            group_id: Only return episodes of this group
+
+        Returns:
+            SearchPage (empty if query has no searchable words)
+        """
+        match = build_match_query(query)
+        if match is None:
+            return SearchPage()
+
+        where = "episodes_fts MATCH ?"
+        params: list = [match]
+        if group_id is not None:
+            where += " AND e.group_id = ?"
+            params.append(group_id)
+
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        rows = self._conn.execute(
+            f"""
+            SELECT e.uuid, e.name, e.content, e.source_description, e.group_id,
+                   e.created_at, -bm25(episodes_fts, {weights}) AS score
+            FROM episodes_fts JOIN episodes e ON e.id = episodes_fts.rowid
+            WHERE {where}
+            ORDER BY score DESC, e.created_at DESC
+            LIMIT ? OFFSET ?
+            """,
+            [*params, limit, offset],
+        ).fetchall()
+        total = self._conn.execute(
+            f"""
+            SELECT count(*)
+            FROM episodes_fts JOIN episodes e ON e.id = episodes_fts.rowid
+            WHERE {where}
+            """,
+            params,
+        ).fetchone()[0]
+
+        return SearchPage(episodes=[dict(row) for row in rows], total=total)
+
+    def sync(
+        self,
+        graph_uuids: set[str],
+        fetch_episodes: Callable[[list[str]], Iterable[dict]],
+    ) -> tuple[int, int]:
+        """
+        Bring the index in line with the episodes stored in the graph.
+
+        Args:
+            graph_uuids: UUIDs of all episodes in the graph
+            fetch_episodes: Returns episode records for a list of UUIDs
+
+        Returns:
+            (added, removed) counts
+        """
+        indexed = self.uuids()
+        missing = sorted(graph_uuids - indexed)
+        stale = indexed - graph_uuids
+
+        added = self.add(fetch_episodes(missing)) if missing else 0
+        removed = self.remove(stale) if stale else 0
+        if added or removed:
+            logger.debug(f"Synced episode index {self.path}: +{added} -{removed}")
+        return added, removed
+
+
+def index_episodes(db_full_path: Path, episodes: Iterable[dict]) -> bool:
+    """
+    Add episodes to a database's keyword index.
+
+    Indexing is best effort: a failure is logged and the episodes are picked
+    up by the next EpisodeIndex.sync().
+
+    Returns:
+        True if the episodes were indexed
+    """
+    try:
+        with EpisodeIndex.for_database(db_full_path) as index:
+            index.add(episodes)
+        return True
+    except (sqlite3.Error, OSError) as e:
+        logger.debug(f"Failed to index episodes for {db_full_path}: {e}")
+        return False
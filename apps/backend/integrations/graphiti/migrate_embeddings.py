@@ -4,9 +4,12 @@ Embedding Provider Migration Utility
 =====================================
 
 Migrates Graphiti memory data from one embedding provider to another by:
-1. Reading all episodes from the source database
-2. Re-embedding content with the new provider
-3. Storing in a provider-specific target database
+1. Streaming episodes from the source database page by page
+2. Re-embedding content with the new provider, in batches
+3. Storing in a provider-specific target database with bounded concurrency
+
+Progress is checkpointed after every page, so an interrupted migration
+resumes where it stopped (use --restart to start over).
 
 This handles the dimension mismatch issue when switching between providers
 (e.g., OpenAI 1536D → Ollama embeddinggemma 768D).
@@ -23,18 +26,24 @@ Usage:
 
     # Dry run to see what would be migrated
     python integrations/graphiti/migrate_embeddings.py --dry-run
+
+    # Larger batches, more concurrent writes
+    python integrations/graphiti/migrate_embeddings.py \
+        --from-provider openai --to-provider ollama --batch-size 50 --concurrency 8
 """
 
 import argparse
 import asyncio
+import json
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 # Add auto-claude to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from core.file_utils import write_json_atomic
 from integrations.graphiti.config import GraphitiConfig
 
 logging.basicConfig(
@@ -42,6 +51,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Episodes read from the source per query
+DEFAULT_PAGE_SIZE = 100
+# Episodes written to the target per bulk call (embeddings are requested in
+# batches through the embedder's create_batch API)
+DEFAULT_BATCH_SIZE = 10
+# Bulk calls in flight against the target at once
+DEFAULT_CONCURRENCY = 4
+
+CHECKPOINT_VERSION = 1
+
+EPISODE_FIELDS = (
+    "uuid",
+    "name",
+    "content",
+    "created_at",
+    "valid_at",
+    "group_id",
+    "source",
+    "source_description",
+)
+
+
+def default_checkpoint_path(
+    source_config: GraphitiConfig, target_config: GraphitiConfig
+) -> Path:
+    """Checkpoint file for a source -> target migration, next to the databases."""
+    return (
+        target_config.get_db_path().parent
+        / f".migration_{source_config.database}_to_{target_config.database}.json"
+    )
+
+
+def _parse_timestamp(value):
+    """Parse an ISO timestamp string (other values are returned unchanged)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return value
+
+
+def _episode_type(source: str | None):
+    from graphiti_core.nodes import EpisodeType
+
+    if source == "message":
+        return EpisodeType.message
+    elif source == "json":
+        return EpisodeType.json
+    return EpisodeType.text
+
+
+class MigrationCheckpoint:
+    """
+    Resumable migration progress, saved after every completed page.
+
+    The cursor is the (created_at, uuid) of the last episode of the last
+    completed page; source pages are ordered by that key.
+    """
+
+    def __init__(self, path: Path, source_database: str, target_database: str):
+        self.path = path
+        self.source_database = source_database
+        self.target_database = target_database
+        self.cursor: tuple[str | None, str] | None = None
+        self.succeeded = 0
+        self.failed = 0
+        self.failed_uuids: list[str] = []
+        self.completed = False
+
+    @classmethod
+    def load(
+        cls, path: Path, source_database: str, target_database: str
+    ) -> "MigrationCheckpoint":
+        """Load a checkpoint, or start a new one if missing or for other databases."""
+        checkpoint = cls(path, source_database, target_database)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return checkpoint
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable migration checkpoint {path}: {e}")
+            return checkpoint
+
+        if (
+            data.get("version") != CHECKPOINT_VERSION
+            or data.get("source_database") != source_database
+            or data.get("target_database") != target_database
+        ):
+            logger.warning(f"Ignoring checkpoint {path} from a different migration")
+            return checkpoint
+
+        cursor = data.get("cursor")
+        checkpoint.cursor = tuple(cursor) if cursor else None
+        checkpoint.succeeded = data.get("succeeded", 0)
+        checkpoint.failed = data.get("failed", 0)
+        checkpoint.failed_uuids = data.get("failed_uuids", [])
+        checkpoint.completed = data.get("completed", False)
+        return checkpoint
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(
+            self.path,
+            {
+                "version": CHECKPOINT_VERSION,
+                "source_database": self.source_database,
+                "target_database": self.target_database,
+                "cursor": list(self.cursor) if self.cursor else None,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "failed_uuids": self.failed_uuids,
+                "completed": self.completed,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            },
+            indent=2,
+        )
+
 
 class EmbeddingMigrator:
     """Handles migration of embeddings between providers."""
@@ -51,6 +176,10 @@ class EmbeddingMigrator:
         source_config: GraphitiConfig,
         target_config: GraphitiConfig,
         dry_run: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        checkpoint_path: Path | None = None,
     ):
         """
         Initialize the migrator.
@@ -59,10 +188,18 @@ class EmbeddingMigrator:
             source_config: Config for source database
             target_config: Config for target database
             dry_run: If True, don't actually perform migration
+            batch_size: Episodes per bulk write to the target
+            concurrency: Maximum bulk writes in flight at once
+            page_size: Episodes read from the source per query
+            checkpoint_path: File to record progress in (None disables resuming)
         """
         self.source_config = source_config
         self.target_config = target_config
         self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.page_size = max(1, page_size)
+        self.checkpoint_path = checkpoint_path
         self.source_client = None
         self.target_client = None
 
@@ -99,19 +236,46 @@ class EmbeddingMigrator:
 
         return True
 
-    async def get_source_episodes(self) -> list[dict]:
+    async def get_source_episodes(
+        self,
+        after: tuple | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
         """
-        Retrieve all episodes from source database.
+        Retrieve episodes from source database.
+
+        Without arguments, returns every episode. With ``limit``, returns one
+        page ordered by (created_at, uuid), starting after the ``after`` key.
+
+        Args:
+            after: (created_at, uuid) of the last episode of the previous page
+            limit: Maximum episodes to return
 
         Returns:
-            List of episode data dictionaries
+            List of episode data dictionaries (empty on error for a full
+            fetch; paged fetches raise, so a failed page isn't mistaken for
+            the end of the data)
         """
-        logger.info("Fetching episodes from source database...")
+        if limit is None:
+            logger.info("Fetching episodes from source database...")
 
         try:
-            # Query all episodic nodes
-            query = """
-                MATCH (e:Episodic)
+            params = {}
+            where = ""
+            order_by = "e.created_at"
+            if limit is not None:
+                order_by = "e.created_at, e.uuid"
+                params["limit"] = limit
+                if after is not None:
+                    where = """
+                WHERE e.created_at > $after_created_at
+                    OR (e.created_at = $after_created_at AND e.uuid > $after_uuid)"""
+                    params["after_created_at"] = _parse_timestamp(after[0])
+                    params["after_uuid"] = after[1]
+
+            # Query episodic nodes
+            query = f"""
+                MATCH (e:Episodic){where}
                 RETURN
                     e.uuid AS uuid,
                     e.name AS name,
@@ -121,33 +285,64 @@ class EmbeddingMigrator:
                     e.group_id AS group_id,
                     e.source AS source,
                     e.source_description AS source_description
-                ORDER BY e.created_at
+                ORDER BY {order_by}
             """
+            if limit is not None:
+                query += "LIMIT $limit\n"
 
-            records, _, _ = await self.source_client._driver.execute_query(query)
-
-            episodes = []
-            for record in records:
-                episodes.append(
-                    {
-                        "uuid": record.get("uuid"),
-                        "name": record.get("name"),
-                        "content": record.get("content"),
-                        "created_at": record.get("created_at"),
-                        "valid_at": record.get("valid_at"),
-                        "group_id": record.get("group_id"),
-                        "source": record.get("source"),
-                        "source_description": record.get("source_description"),
-                    }
-                )
+            records, _, _ = await self.source_client._driver.execute_query(
+                query, **params
+            )
+
+            episodes = [
+                {key: record.get(key) for key in EPISODE_FIELDS} for record in records
+            ]
 
-            logger.info(f"Found {len(episodes)} episodes to migrate")
+            if limit is None:
+                logger.info(f"Found {len(episodes)} episodes to migrate")
             return episodes
 
         except Exception as e:
             logger.error(f"Failed to fetch episodes: {e}")
+            if limit is not None:
+                raise
             return []
 
+    async def iter_source_pages(self, after: tuple | None = None):
+        """
+        Stream episodes from the source database one page at a time.
+
+        The next page is fetched while the caller processes the current one.
+
+        Args:
+            after: Resume after this (created_at, uuid) key
+
+        Yields:
+            Lists of at most page_size episode dicts
+        """
+        next_page = asyncio.ensure_future(
+            self.get_source_episodes(after=after, limit=self.page_size)
+        )
+        while True:
+            page = await next_page
+            if not page:
+                return
+            if len(page) < self.page_size:
+                yield page
+                return
+
+            last = page[-1]
+            next_page = asyncio.ensure_future(
+                self.get_source_episodes(
+                    after=(last["created_at"], last["uuid"]), limit=self.page_size
+                )
+            )
+            try:
+                yield page
+            except BaseException:
+                next_page.cancel()
+                raise
+
     async def migrate_episode(self, episode: dict) -> bool:
         """
         Migrate a single episode to the target database.
@@ -163,21 +358,8 @@ class EmbeddingMigrator:
             return True
 
         try:
-            from graphiti_core.nodes import EpisodeType
-
-            # Determine episode type
-            source = episode.get("source", "text")
-            if source == "message":
-                episode_type = EpisodeType.message
-            elif source == "json":
-                episode_type = EpisodeType.json
-            else:
-                episode_type = EpisodeType.text
-
-            # Parse timestamps
-            valid_at = episode.get("valid_at")
-            if isinstance(valid_at, str):
-                valid_at = datetime.fromisoformat(valid_at.replace("Z", "+00:00"))
+            episode_type = _episode_type(episode.get("source", "text"))
+            valid_at = _parse_timestamp(episode.get("valid_at"))
 
             # Re-embed and save with new provider
             await self.target_client.graphiti.add_episode(
@@ -198,28 +380,185 @@ class EmbeddingMigrator:
             logger.error(f"Failed to migrate episode {episode['name']}: {e}")
             return False
 
+    async def migrate_batch(self, episodes: list[dict]) -> list[str]:
+        """
+        Migrate a batch of episodes sharing a group_id in one bulk call.
+
+        Graphiti's bulk ingestion requests embeddings for the whole batch
+        through the embedder's batch API. If the bulk call fails partway,
+        the episodes it didn't write are migrated one at a time, so a single
+        bad episode doesn't fail the batch and none is written twice.
+
+        Args:
+            episodes: Episode data dictionaries (same group_id)
+
+        Returns:
+            UUIDs of the episodes that failed to migrate
+        """
+        if self.dry_run or self.target_client is None or len(episodes) == 1:
+            return [ep["uuid"] for ep in episodes if not await self.migrate_episode(ep)]
+
+        try:
+            from graphiti_core.utils.bulk_utils import RawEpisode
+
+            raw_episodes = [
+                RawEpisode(
+                    name=ep["name"],
+                    content=ep["content"] or "",
+                    source=_episode_type(ep.get("source", "text")),
+                    source_description=ep.get("source_description")
+                    or "Migrated episode",
+                    reference_time=_parse_timestamp(ep.get("valid_at"))
+                    or _parse_timestamp(ep.get("created_at"))
+                    or datetime.now(timezone.utc),
+                )
+                for ep in episodes
+            ]
+            await self.target_client.graphiti.add_episode_bulk(
+                raw_episodes, group_id=episodes[0].get("group_id") or "default"
+            )
+            logger.info(f"Migrated batch of {len(episodes)} episodes")
+            return []
+        except Exception as e:
+            logger.warning(f"Bulk migration of {len(episodes)} episodes failed: {e}")
+
+        try:
+            written = await self._episodes_in_target(episodes)
+        except Exception as e:
+            # Without knowing what the bulk call wrote, retrying could
+            # duplicate episodes, so report the whole batch as failed
+            logger.error(f"Failed to check which episodes were migrated: {e}")
+            return [ep["uuid"] for ep in episodes]
+
+        missing = [
+            ep for ep in episodes if (ep["name"], ep["content"] or "") not in written
+        ]
+        if missing:
+            logger.info(f"Retrying {len(missing)} episodes one at a time")
+        return [ep["uuid"] for ep in missing if not await self.migrate_episode(ep)]
+
+    async def _episodes_in_target(self, episodes: list[dict]) -> set[tuple[str, str]]:
+        """
+        Find which of a batch's episodes already exist in the target database.
+
+        Migrated episodes get new UUIDs, so they are matched on name and
+        content within the batch's group.
+
+        Returns:
+            (name, content) of the episodes found
+        """
+        records, _, _ = await self.target_client._driver.execute_query(
+            """
+                MATCH (e:Episodic)
+                WHERE e.group_id = $group_id AND e.name IN $names
+                RETURN e.name AS name, e.content AS content
+            """,
+            group_id=episodes[0].get("group_id") or "default",
+            names=[ep["name"] for ep in episodes],
+        )
+        return {(record.get("name"), record.get("content") or "") for record in records}
+
+    def _split_batches(self, page: list[dict]) -> list[list[list[dict]]]:
+        """Group a page by group_id and split each group into ordered batches."""
+        groups: dict[str | None, list[dict]] = {}
+        for episode in page:
+            groups.setdefault(episode.get("group_id"), []).append(episode)
+        return [
+            [
+                group[i : i + self.batch_size]
+                for i in range(0, len(group), self.batch_size)
+            ]
+            for group in groups.values()
+        ]
+
     async def migrate_all(self) -> dict:
         """
         Migrate all episodes from source to target.
 
+        Episodes are streamed page by page. Within a page, different
+        group_ids are written concurrently (at most ``concurrency`` batches
+        at once), while each group's batches are written in source order so
+        episodes still see their predecessors as context. With a
+        checkpoint path, progress is saved after each page and a previous
+        interrupted run is resumed.
+
         Returns:
             Migration statistics dictionary
         """
-        episodes = await self.get_source_episodes()
+        checkpoint = None
+        if self.checkpoint_path is not None and not self.dry_run:
+            checkpoint = MigrationCheckpoint.load(
+                self.checkpoint_path,
+                self.source_config.database,
+                self.target_config.database,
+            )
 
         stats = {
-            "total": len(episodes),
+            "total": 0,
             "succeeded": 0,
             "failed": 0,
             "dry_run": self.dry_run,
+            "resumed": False,
         }
+        if checkpoint is not None:
+            stats["succeeded"] = checkpoint.succeeded
+            stats["failed"] = checkpoint.failed
+            stats["total"] = checkpoint.succeeded + checkpoint.failed
+            stats["resumed"] = checkpoint.cursor is not None
+            if checkpoint.completed:
+                logger.info(
+                    f"Migration already completed (checkpoint {checkpoint.path}); "
+                    "use --restart to migrate again"
+                )
+                return stats
+            if checkpoint.cursor is not None:
+                logger.info(
+                    f"Resuming migration after {stats['total']} episodes "
+                    f"(checkpoint {checkpoint.path})"
+                )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def migrate_group(batches: list[list[dict]]) -> list[str]:
+            failed = []
+            for batch in batches:
+                async with semaphore:
+                    failed.extend(await self.migrate_batch(batch))
+            return failed
 
-        for i, episode in enumerate(episodes, 1):
-            logger.info(f"Processing episode {i}/{len(episodes)}")
-            if await self.migrate_episode(episode):
-                stats["succeeded"] += 1
-            else:
-                stats["failed"] += 1
+        after = checkpoint.cursor if checkpoint is not None else None
+        async for page in self.iter_source_pages(after=after):
+            logger.info(
+                f"Processing episodes {stats['total'] + 1}-{stats['total'] + len(page)}"
+            )
+            results = await asyncio.gather(
+                *(migrate_group(batches) for batches in self._split_batches(page))
+            )
+            failed_uuids = [uuid for failed in results for uuid in failed]
+
+            stats["total"] += len(page)
+            stats["failed"] += len(failed_uuids)
+            stats["succeeded"] += len(page) - len(failed_uuids)
+
+            if checkpoint is not None:
+                last = page[-1]
+                created_at = last["created_at"]
+                if isinstance(created_at, datetime):
+                    created_at = created_at.isoformat()
+                checkpoint.cursor = (created_at, last["uuid"])
+                checkpoint.succeeded = stats["succeeded"]
+                checkpoint.failed = stats["failed"]
+                checkpoint.failed_uuids.extend(failed_uuids)
+                checkpoint.save()
+
+        if checkpoint is not None:
+            checkpoint.completed = True
+            checkpoint.save()
+            if checkpoint.failed_uuids:
+                logger.warning(
+                    f"{len(checkpoint.failed_uuids)} episodes failed to migrate; "
+                    f"their UUIDs are listed in {checkpoint.path}"
+                )
 
         return stats
 
@@ -303,6 +642,7 @@ async def interactive_migration():
         source_config=source_config,
         target_config=current_config,
         dry_run=False,
+        checkpoint_path=default_checkpoint_path(source_config, current_config),
     )
 
     if not await migrator.initialize():
@@ -310,9 +650,10 @@ async def interactive_migration():
         return
 
     print("\nMigrating episodes...")
-    stats = await migrator.migrate_all()
-
-    await migrator.close()
+    try:
+        stats = await migrator.migrate_all()
+    finally:
+        await migrator.close()
 
     print("\n" + "=" * 70)
     print("  MIGRATION COMPLETE")
@@ -356,18 +697,27 @@ async def automatic_migration(args):
         )
         return
 
+    checkpoint_path = default_checkpoint_path(source_config, target_config)
+    if args.restart and not args.dry_run:
+        checkpoint_path.unlink(missing_ok=True)
+
     migrator = EmbeddingMigrator(
         source_config=source_config,
         target_config=target_config,
         dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        checkpoint_path=checkpoint_path,
     )
 
     if not await migrator.initialize():
         logger.error("Failed to initialize migration")
         return
 
-    stats = await migrator.migrate_all()
-    await migrator.close()
+    try:
+        stats = await migrator.migrate_all()
+    finally:
+        await migrator.close()
 
     logger.info(f"Migration complete: {stats}")
 
@@ -395,6 +745,23 @@ def main():
     parser.add_argument(
         "--auto-confirm", action="store_true", help="Skip confirmation prompts"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Episodes re-embedded and written per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Batches written concurrently (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the checkpoint of a previous run and migrate from the start",
+    )
 
     args = parser.parse_args()
 
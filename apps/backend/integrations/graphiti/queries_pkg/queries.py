@@ -9,6 +9,7 @@ import logging
 from datetime import datetime, timezone
 
 from core.sentry import capture_exception
+from integrations.graphiti.episode_index import episode_record, index_episodes
 
 from .schema import (
     EPISODE_TYPE_CODEBASE_DISCOVERY,
@@ -42,6 +43,26 @@ class GraphitiQueries:
         self.group_id = group_id
         self.spec_context_id = spec_context_id
 
+    async def _add_episode(self, **kwargs):
+        """
+        Add an episode to Graphiti and to the keyword search index.
+
+        Indexing never fails the save; missed episodes are indexed on the
+        next keyword search.
+        """
+        result = await self.client.graphiti.add_episode(**kwargs)
+
+        episode = getattr(result, "episode", None)
+        if episode is not None:
+            try:
+                index_episodes(
+                    self.client.config.get_db_path(), [episode_record(episode)]
+                )
+            except Exception as e:
+                logger.debug(f"Failed to index episode: {e}")
+
+        return result
+
     async def add_session_insight(
         self,
         session_num: int,
@@ -68,7 +89,7 @@ class GraphitiQueries:
                 **insights,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"session_{session_num:03d}_{self.spec_context_id}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -119,7 +140,7 @@ class GraphitiQueries:
                 "files": discoveries,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"codebase_discovery_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -162,7 +183,7 @@ class GraphitiQueries:
                 "pattern": pattern,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -205,7 +226,7 @@ class GraphitiQueries:
                 "gotcha": gotcha,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -260,7 +281,7 @@ class GraphitiQueries:
                 **(metadata or {}),
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"task_outcome_{task_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -320,7 +341,7 @@ class GraphitiQueries:
                         "gotchas": file_insight.get("gotchas", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"file_insight_{file_insight.get('path', 'unknown').replace('/', '_')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -363,7 +384,7 @@ class GraphitiQueries:
                         "example": example,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -404,7 +425,7 @@ class GraphitiQueries:
                         "solution": solution,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -441,7 +462,7 @@ class GraphitiQueries:
                         "changed_files": insights.get("changed_files", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -474,7 +495,7 @@ class GraphitiQueries:
                         "success": insights.get("success", False),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"recommendations_{insights.get('subtask_id', 'unknown')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -0,0 +1,185 @@
+"""
+Tests for the episode full-text index.
+
+Tests cover:
+- Query building and escaping
+- BM25 ranking, pagination and group filtering
+- Upserts, removal and sync against the graph's episode UUIDs
+- Indexing episodes saved through GraphitiQueries
+"""
+
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from integrations.graphiti.episode_index import (
+    EpisodeIndex,
+    build_match_query,
+    episode_index_path,
+    episode_record,
+    index_episodes,
+)
+
+
+def make_episode(uuid, name="", content="", description="", group_id="g1"):
+    return {
+        "uuid": uuid,
+        "name": name,
+        "content": content,
+        "source_description": description,
+        "group_id": group_id,
+        "created_at": f"2024-01-01T00:00:{int(uuid[-1]):02d}",
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    with EpisodeIndex.for_database(tmp_path / "memories") as index:
+        yield index
+
+
+class TestBuildMatchQuery:
+    """Tests for build_match_query()."""
+
+    def test_words_become_quoted_prefixes(self):
+        assert build_match_query("Auth token") == '"Auth"* "token"*'
+
+    def test_operators_are_not_interpreted(self):
+        assert build_match_query('a OR "b" NEAR(c)') == '"a"* "OR"* "b"* "NEAR"* "c"*'
+
+    def test_no_words(self):
+        assert build_match_query("  ++ ") is None
+        assert build_match_query("") is None
+
+
+class TestEpisodeIndex:
+    """Tests for EpisodeIndex."""
+
+    def test_index_file_next_to_database(self, tmp_path):
+        assert episode_index_path(tmp_path / "memories") == (
+            tmp_path / ".memories_episodes_fts.sqlite"
+        )
+
+    def test_ranks_by_relevance(self, index):
+        index.add(
+            [
+                make_episode("e1", content="token refresh fixed in auth middleware"),
+                make_episode("e2", name="auth token gotcha", content="token token"),
+                make_episode("e3", content="unrelated database migration"),
+            ]
+        )
+
+        page = index.search("token")
+
+        assert [e["uuid"] for e in page.episodes] == ["e2", "e1"]
+        assert page.total == 2
+        assert page.episodes[0]["score"] > page.episodes[1]["score"] > 0
+
+    def test_prefix_and_all_words_match(self, index):
+        index.add(
+            [
+                make_episode("e1", content="authentication token"),
+                make_episode("e2", content="authentication only"),
+            ]
+        )
+
+        assert [e["uuid"] for e in index.search("auth tok").episodes] == ["e1"]
+        assert index.search("AUTHENTICATION").total == 2
+
+    def test_pagination_and_group_filter(self, index):
+        index.add(
+            make_episode(f"e{i}", content="pattern", group_id="a" if i % 2 else "b")
+            for i in range(1, 8)
+        )
+
+        first = index.search("pattern", limit=3)
+        second = index.search("pattern", limit=3, offset=3)
+
+        assert first.total == second.total == 7
+        assert len(first.episodes) == 3
+        assert not {e["uuid"] for e in first.episodes} & {
+            e["uuid"] for e in second.episodes
+        }
+        assert index.search("pattern", group_id="b").total == 3
+
+    def test_upsert_replaces_indexed_text(self, index):
+        index.add([make_episode("e1", content="old words")])
+        index.add([make_episode("e1", content="new words")])
+
+        assert index.count() == 1
+        assert index.search("old").total == 0
+        assert index.search("new").total == 1
+
+    def test_sync_adds_missing_and_removes_stale(self, index):
+        index.add(
+            [make_episode("e1", content="kept"), make_episode("e2", content="gone")]
+        )
+        graph = {
+            "e1": make_episode("e1", content="kept"),
+            "e3": make_episode("e3", content="written elsewhere"),
+        }
+        fetch = MagicMock(side_effect=lambda uuids: [graph[u] for u in uuids])
+
+        assert index.sync(set(graph), fetch) == (1, 1)
+
+        fetch.assert_called_once_with(["e3"])
+        assert index.uuids() == {"e1", "e3"}
+        assert index.search("gone").total == 0
+        assert index.search("elsewhere").total == 1
+
+
+class TestIndexEpisodes:
+    """Tests for the best-effort helpers used by writers."""
+
+    def test_episode_record_from_node(self):
+        node = SimpleNamespace(
+            uuid="u1",
+            name="session_001",
+            content="body",
+            source_description=None,
+            group_id="g",
+            created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        )
+
+        record = episode_record(node)
+
+        assert record["source_description"] == ""
+        assert record["created_at"] == "2024-01-01T00:00:00+00:00"
+
+    def test_failure_is_not_raised(self, tmp_path):
+        missing_dir = tmp_path / "missing" / "memories"
+
+        assert index_episodes(missing_dir, [make_episode("e1")]) is False
+
+    @pytest.mark.asyncio
+    async def test_graphiti_saves_are_indexed(self, tmp_path):
+        mock_nodes = MagicMock()
+        sys.modules["graphiti_core"] = MagicMock(nodes=mock_nodes)
+        sys.modules["graphiti_core.nodes"] = mock_nodes
+        try:
+            from integrations.graphiti.queries_pkg.queries import GraphitiQueries
+
+            node = SimpleNamespace(
+                uuid="u1",
+                name="pattern_x",
+                content="always debounce resize handlers",
+                source_description="Pattern",
+                group_id="g",
+                created_at=datetime.now(timezone.utc),
+            )
+            client = MagicMock()
+            client.config.get_db_path.return_value = tmp_path / "memories"
+            client.graphiti.add_episode = AsyncMock(
+                return_value=SimpleNamespace(episode=node)
+            )
+
+            saved = await GraphitiQueries(client, "g", "spec").add_pattern("debounce")
+        finally:
+            sys.modules.pop("graphiti_core", None)
+            sys.modules.pop("graphiti_core.nodes", None)
+
+        assert saved is True
+        with EpisodeIndex.for_database(tmp_path / "memories") as index:
+            assert [e["uuid"] for e in index.search("debounce").episodes] == ["u1"]
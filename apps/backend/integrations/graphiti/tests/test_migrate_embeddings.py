@@ -13,6 +13,7 @@ Tests cover:
 - main() function
 """
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -2372,3 +2373,238 @@ class TestMigrateAllEdgeCases:
         assert stats["total"] == 5
         assert stats["succeeded"] == 3
         assert stats["failed"] == 2
+
+
+# =============================================================================
+# Tests for streaming, batched and resumable migration
+# =============================================================================
+
+
+def _make_episodes(count, group_id="test_group"):
+    return [
+        {
+            "uuid": f"ep{i:02d}",
+            "name": f"episode_{i}",
+            "content": f"content{i}",
+            "created_at": f"2024-01-01T00:00:{i:02d}+00:00",
+            "valid_at": f"2024-01-01T00:00:{i:02d}+00:00",
+            "group_id": group_id,
+            "source": "text",
+            "source_description": f"Test {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def _paged_source(episodes, fail_on_call=None):
+    """Fake get_source_episodes serving keyset pages of ``episodes``."""
+    calls = []
+
+    async def get_source_episodes(after=None, limit=None):
+        calls.append(after)
+        if fail_on_call is not None and len(calls) == fail_on_call:
+            raise ConnectionError("source went away")
+        start = 0
+        if after is not None:
+            start = (
+                next(i for i, ep in enumerate(episodes) if ep["uuid"] == after[1]) + 1
+            )
+        return episodes[start : start + limit]
+
+    return get_source_episodes, calls
+
+
+class TestStreamingMigration:
+    """Tests for paged reads, bulk writes and checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_paged_query_uses_keyset_params(self, mock_source_client):
+        """Paged fetches pass the cursor and limit as query parameters."""
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        migrator = EmbeddingMigrator(MagicMock(), MagicMock())
+        migrator.source_client = mock_source_client
+
+        await migrator.get_source_episodes(
+            after=("2024-01-01T00:00:00+00:00", "ep1"), limit=50
+        )
+
+        query = mock_source_client._driver.execute_query.call_args.args[0]
+        params = mock_source_client._driver.execute_query.call_args.kwargs
+        assert "LIMIT $limit" in query
+        assert "e.uuid > $after_uuid" in query
+        assert params["limit"] == 50
+        assert params["after_uuid"] == "ep1"
+        assert params["after_created_at"] == datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_paged_fetch_raises_on_error(self, mock_source_client):
+        """A failed page must not look like the end of the data."""
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        mock_source_client._driver.execute_query = AsyncMock(
+            side_effect=RuntimeError("boom")
+        )
+        migrator = EmbeddingMigrator(MagicMock(), MagicMock())
+        migrator.source_client = mock_source_client
+
+        assert await migrator.get_source_episodes() == []
+        with pytest.raises(RuntimeError):
+            await migrator.get_source_episodes(limit=10)
+
+    @pytest.mark.asyncio
+    async def test_interrupted_migration_resumes(self, tmp_path):
+        """Completed pages are checkpointed and skipped on the next run."""
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        episodes = _make_episodes(7)
+        checkpoint = tmp_path / "checkpoint.json"
+        config = MagicMock(database="db")
+
+        first = EmbeddingMigrator(
+            config, config, page_size=3, checkpoint_path=checkpoint
+        )
+        first.get_source_episodes, _calls = _paged_source(episodes, fail_on_call=3)
+        first.migrate_episode = AsyncMock(
+            side_effect=[True, False, True, True, True, True]
+        )
+
+        with pytest.raises(ConnectionError):
+            await first.migrate_all()
+
+        second = EmbeddingMigrator(
+            config, config, page_size=3, checkpoint_path=checkpoint
+        )
+        second.get_source_episodes, calls = _paged_source(episodes)
+        second.migrate_episode = AsyncMock(return_value=True)
+
+        stats = await second.migrate_all()
+
+        assert calls[0] == ("2024-01-01T00:00:05+00:00", "ep05")
+        migrated = [c.args[0]["uuid"] for c in second.migrate_episode.call_args_list]
+        assert migrated == ["ep06"]
+        assert stats["resumed"] is True
+        assert (stats["total"], stats["succeeded"], stats["failed"]) == (7, 6, 1)
+        saved = json.loads(checkpoint.read_text())
+        assert saved["completed"] is True
+        assert saved["failed_uuids"] == ["ep01"]
+
+        # A completed migration isn't repeated
+        third = EmbeddingMigrator(config, config, checkpoint_path=checkpoint)
+        third.get_source_episodes = AsyncMock()
+        assert (await third.migrate_all())["total"] == 7
+        third.get_source_episodes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batches_written_with_bounded_concurrency(self):
+        """Groups are written concurrently; each group's batches in order."""
+        import asyncio
+
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        episodes = _make_episodes(9, "a") + _make_episodes(3, "b")
+        migrator = EmbeddingMigrator(
+            MagicMock(), MagicMock(), batch_size=2, concurrency=2, page_size=100
+        )
+        migrator.get_source_episodes, _calls = _paged_source(episodes)
+
+        in_flight = {}
+        peak = 0
+        batches = []
+
+        async def migrate_batch(batch):
+            nonlocal peak
+            group_id = batch[0]["group_id"]
+            assert not in_flight.get(group_id), "a group's batches must not overlap"
+            in_flight[group_id] = True
+            peak = max(peak, sum(in_flight.values()))
+            await asyncio.sleep(0.01)
+            in_flight[group_id] = False
+            batches.append([(ep["group_id"], ep["uuid"]) for ep in batch])
+            return [batch[0]["uuid"]] if batch[0]["uuid"] == "ep00" else []
+
+        migrator.migrate_batch = migrate_batch
+
+        stats = await migrator.migrate_all()
+
+        assert peak == 2
+        assert sorted(len(b) for b in batches) == [1, 1, 2, 2, 2, 2, 2]
+        assert all(len({group for group, _ in b}) == 1 for b in batches)
+        for group_id, count in (("a", 9), ("b", 3)):
+            written = [uuid for b in batches for g, uuid in b if g == group_id]
+            assert written == [f"ep{i:02d}" for i in range(count)]
+        assert (stats["total"], stats["succeeded"], stats["failed"]) == (12, 10, 2)
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_falls_back_per_episode(self, mock_target_client):
+        """A failed bulk call retries only the episodes it didn't write."""
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        bulk_utils = MagicMock()
+        nodes = MagicMock()
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock(
+            side_effect=[None, RuntimeError("bulk failed")]
+        )
+        # The failed bulk call had already written episode_0
+        mock_target_client._driver = MagicMock()
+        mock_target_client._driver.execute_query = AsyncMock(
+            return_value=([{"name": "episode_0", "content": "content0"}], None, None)
+        )
+        migrator = EmbeddingMigrator(MagicMock(), MagicMock())
+        migrator.target_client = mock_target_client
+        migrator.migrate_episode = AsyncMock(side_effect=[True, False])
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "graphiti_core": MagicMock(),
+                "graphiti_core.nodes": nodes,
+                "graphiti_core.utils": MagicMock(),
+                "graphiti_core.utils.bulk_utils": bulk_utils,
+            },
+        ):
+            assert await migrator.migrate_batch(_make_episodes(2)) == []
+            failed = await migrator.migrate_batch(_make_episodes(3))
+
+        first_call = mock_target_client.graphiti.add_episode_bulk.call_args_list[0]
+        assert len(first_call.args[0]) == 2
+        assert first_call.kwargs["group_id"] == "test_group"
+        assert bulk_utils.RawEpisode.call_count == 5
+        lookup = mock_target_client._driver.execute_query.call_args.kwargs
+        assert lookup["group_id"] == "test_group"
+        assert lookup["names"] == ["episode_0", "episode_1", "episode_2"]
+        retried = [c.args[0]["uuid"] for c in migrator.migrate_episode.call_args_list]
+        assert retried == ["ep01", "ep02"]
+        assert failed == ["ep02"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_not_retried_when_target_unreadable(
+        self, mock_target_client
+    ):
+        """If the written episodes can't be determined, nothing is retried."""
+        from integrations.graphiti.migrate_embeddings import EmbeddingMigrator
+
+        mock_target_client.graphiti.add_episode_bulk = AsyncMock(
+            side_effect=RuntimeError("bulk failed")
+        )
+        mock_target_client._driver = MagicMock()
+        mock_target_client._driver.execute_query = AsyncMock(
+            side_effect=ConnectionError("target went away")
+        )
+        migrator = EmbeddingMigrator(MagicMock(), MagicMock())
+        migrator.target_client = mock_target_client
+        migrator.migrate_episode = AsyncMock(return_value=True)
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "graphiti_core": MagicMock(),
+                "graphiti_core.nodes": MagicMock(),
+                "graphiti_core.utils": MagicMock(),
+                "graphiti_core.utils.bulk_utils": MagicMock(),
+            },
+        ):
+            failed = await migrator.migrate_batch(_make_episodes(2))
+
+        assert failed == ["ep00", "ep01"]
+        migrator.migrate_episode.assert_not_called()
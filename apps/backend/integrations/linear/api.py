@@ -0,0 +1,232 @@
+"""
+Linear GraphQL API Client
+=========================
+
+Direct client for Linear's GraphQL API. The updater uses it for status
+changes, comments and task creation instead of prompting an MCP mini-agent,
+which took seconds and model tokens per update.
+
+Requests are blocking; the updater runs them on its background queue
+thread (see update_queue.py) so they never hold up the coding loop.
+"""
+
+import json
+import logging
+import os
+import time
+import urllib.error
+import urllib.request
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Seconds to wait for a response
+DEFAULT_TIMEOUT = 15.0
+
+# Retries for transient failures (network errors, 5xx, rate limits)
+DEFAULT_MAX_RETRIES = 4
+
+# Backoff before retry n is BACKOFF_BASE * 2**n seconds, capped at MAX_BACKOFF
+BACKOFF_BASE = 1.0
+MAX_BACKOFF = 30.0
+
+ISSUE_STATES_QUERY = """
+query IssueStates($id: String!) {
+  issue(id: $id) {
+    team { id states { nodes { id name } } }
+  }
+}
+"""
+
+TEAMS_QUERY = """
+query Teams {
+  teams(first: 1) { nodes { id } }
+}
+"""
+
+CREATE_ISSUE_MUTATION = """
+mutation CreateIssue($input: IssueCreateInput!) {
+  issueCreate(input: $input) {
+    success
+    issue { identifier team { id } }
+  }
+}
+"""
+
+
+class LinearAPIError(Exception):
+    """Raised when a Linear API request fails."""
+
+    def __init__(
+        self,
+        message: str,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def get_linear_api_url() -> str:
+    """Get the GraphQL endpoint (LINEAR_API_URL overrides the default)."""
+    return os.environ.get("LINEAR_API_URL") or LINEAR_API_URL
+
+
+def error_codes(body: dict) -> set[str]:
+    """Return the extension codes of a GraphQL response's errors."""
+    return {
+        (error.get("extensions") or {}).get("code", "")
+        for error in body.get("errors") or []
+    }
+
+
+def _retry_after(headers) -> float | None:
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class LinearAPIClient:
+    """
+    Blocking client for Linear's GraphQL API.
+
+    Transient failures are retried with exponential backoff. Workflow
+    states are cached per issue, so repeated status changes cost a single
+    mutation.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = BACKOFF_BASE,
+    ):
+        self.api_key = api_key
+        self.url = url or get_linear_api_url()
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        # issue ID -> {lowercased state name: state ID}
+        self._states: dict[str, dict[str, str]] = {}
+
+    def _post(self, query: str, variables: dict | None) -> dict:
+        payload = json.dumps({"query": query, "variables": variables or {}})
+        request = urllib.request.Request(
+            self.url,
+            data=payload.encode("utf-8"),
+            headers={
+                "Authorization": self.api_key,
+                "Content-Type": "application/json",
+            },
+            method="POST",
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                body = json.loads(e.read().decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                body = {}
+            retryable = (
+                e.code == 429 or e.code >= 500 or "RATELIMITED" in error_codes(body)
+            )
+            raise LinearAPIError(
+                f"Linear API error {e.code}: {body.get('errors') or e.reason}",
+                retryable=retryable,
+                retry_after=_retry_after(e.headers),
+            ) from e
+        except (urllib.error.URLError, TimeoutError, OSError) as e:
+            raise LinearAPIError(f"Linear API unreachable: {e}", retryable=True) from e
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise LinearAPIError(f"Invalid JSON response from Linear: {e}") from e
+
+        if "RATELIMITED" in error_codes(body):
+            raise LinearAPIError("Linear API rate limited", retryable=True)
+        return body
+
+    def execute(self, query: str, variables: dict | None = None) -> dict:
+        """
+        Run a GraphQL document, retrying transient failures.
+
+        Returns:
+            The response body. It may hold "errors" next to "data" when
+            part of a batched mutation failed.
+
+        Raises:
+            LinearAPIError: If the request failed and retries are exhausted
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._post(query, variables)
+            except LinearAPIError as e:
+                if not e.retryable or attempt == self.max_retries:
+                    raise
+                delay = e.retry_after
+                if delay is None:
+                    delay = min(self.backoff_base * 2**attempt, MAX_BACKOFF)
+                logger.debug(f"{e}; retrying in {delay}s")
+                time.sleep(delay)
+
+        # Should not reach here, but just in case
+        raise LinearAPIError("Linear API request failed")
+
+    def query(self, query: str, variables: dict | None = None) -> dict[str, Any]:
+        """Run a GraphQL document and return its data; any error raises."""
+        body = self.execute(query, variables)
+        if body.get("errors"):
+            raise LinearAPIError(f"Linear API error: {body['errors']}")
+        return body.get("data") or {}
+
+    def workflow_state_id(self, issue_id: str, status: str) -> str | None:
+        """
+        Find the ID of the workflow state named status in the issue's team.
+
+        Returns:
+            State ID, or None if the team has no state with that name
+        """
+        states = self._states.get(issue_id)
+        if states is None:
+            data = self.query(ISSUE_STATES_QUERY, {"id": issue_id})
+            nodes = (
+                ((data.get("issue") or {}).get("team") or {}).get("states") or {}
+            ).get("nodes") or []
+            states = {node["name"].lower(): node["id"] for node in nodes}
+            self._states[issue_id] = states
+        return states.get(status.lower())
+
+    def create_issue(
+        self,
+        title: str,
+        description: str | None = None,
+        team_id: str | None = None,
+    ) -> tuple[str, str]:
+        """
+        Create an issue, in the first team of the workspace if team_id is None.
+
+        Returns:
+            (issue identifier like "VAL-123", team ID)
+        """
+        if not team_id:
+            teams = self.query(TEAMS_QUERY).get("teams", {}).get("nodes") or []
+            if not teams:
+                raise LinearAPIError("No Linear teams found")
+            team_id = teams[0]["id"]
+
+        issue_input = {"teamId": team_id, "title": title}
+        if description:
+            issue_input["description"] = description
+
+        result = self.query(CREATE_ISSUE_MUTATION, {"input": issue_input})
+        created = result.get("issueCreate") or {}
+        issue = created.get("issue")
+        if not created.get("success") or not issue:
+            raise LinearAPIError("Linear did not create the issue")
+        return issue["identifier"], issue["team"]["id"]
@@ -0,0 +1,325 @@
+"""
+Linear Update Queue
+===================
+
+Background queue that sends Linear status changes and comments without
+blocking the coding loop.
+
+Updates are collected for COALESCE_DELAY seconds before sending:
+- successive status changes of an issue collapse into the latest one
+- comments on an issue are merged into a single comment
+- the resulting mutations go out in one GraphQL request per
+  MAX_BATCH_MUTATIONS
+
+An update the API could not apply (after the client's retries) is handed to
+the fallback, which the updater points at the MCP mini-agent.
+
+The worker is a daemon thread rather than an asyncio task because the
+coder and QA loops each run in their own asyncio.run(); pending updates are
+flushed at interpreter exit.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .api import LinearAPIClient, LinearAPIError
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for more updates before sending a batch
+COALESCE_DELAY = 0.5
+
+# Mutations per GraphQL request
+MAX_BATCH_MUTATIONS = 20
+
+# Separator between comments merged into one
+COMMENT_SEPARATOR = "\n\n"
+
+
+@dataclass
+class LinearUpdate:
+    """A change to one Linear issue: a status, a comment, or both."""
+
+    issue_id: str
+    team_id: str | None = None
+    status: str | None = None
+    comments: list[str] = field(default_factory=list)
+    # Called once the status change has been applied
+    on_applied: Callable[[], None] | None = field(default=None, repr=False)
+
+    @property
+    def comment(self) -> str | None:
+        """All pending comments merged into one body."""
+        return COMMENT_SEPARATOR.join(self.comments) if self.comments else None
+
+
+def build_batch_mutation(
+    mutations: list[tuple[str, str, str]],
+) -> tuple[str, dict]:
+    """
+    Build one GraphQL document running several mutations in order.
+
+    Args:
+        mutations: (kind, issue_id, value) tuples, where kind is "status"
+            (value is a workflow state ID) or "comment" (value is the body)
+
+    Returns:
+        (document, variables); mutation i is aliased "m{i}"
+    """
+    params = []
+    fields = []
+    variables: dict = {}
+    for i, (kind, issue_id, value) in enumerate(mutations):
+        if kind == "status":
+            params += [f"$i{i}: String!", f"$v{i}: IssueUpdateInput!"]
+            fields.append(f"m{i}: issueUpdate(id: $i{i}, input: $v{i}) {{ success }}")
+            variables[f"i{i}"] = issue_id
+            variables[f"v{i}"] = {"stateId": value}
+        else:
+            params.append(f"$v{i}: CommentCreateInput!")
+            fields.append(f"m{i}: commentCreate(input: $v{i}) {{ success }}")
+            variables[f"v{i}"] = {"issueId": issue_id, "body": value}
+
+    document = "mutation LinearBatch({}) {{\n  {}\n}}".format(
+        ", ".join(params), "\n  ".join(fields)
+    )
+    return document, variables
+
+
+def _failed_aliases(body: dict, aliases: list[str]) -> set[str]:
+    """
+    Aliases of the mutations a batch response does not confirm.
+
+    A mutation missing from ``data`` counts as failed, so a response whose
+    data is null (e.g. only request-level errors without a path) fails the
+    whole batch.
+    """
+    data = body.get("data") or {}
+    failed = {alias for alias in aliases if not (data.get(alias) or {}).get("success")}
+    for error in body.get("errors") or []:
+        path = error.get("path") or []
+        if path:
+            failed.add(str(path[0]))
+    return failed
+
+
+class LinearUpdateQueue:
+    """
+    Coalescing, batching queue of Linear updates sent from a worker thread.
+
+    Thread-safe; enqueueing never blocks on the network.
+    """
+
+    def __init__(
+        self,
+        client: LinearAPIClient,
+        fallback: Callable[[LinearUpdate], bool] | None = None,
+        coalesce_delay: float = COALESCE_DELAY,
+        max_batch: int = MAX_BATCH_MUTATIONS,
+    ):
+        self.client = client
+        self.fallback = fallback
+        self.coalesce_delay = coalesce_delay
+        self.max_batch = max_batch
+
+        self._cond = threading.Condition()
+        # issue ID -> pending update, in arrival order
+        self._pending: dict[str, LinearUpdate] = {}
+        self._in_flight = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "requests": 0,
+            "mutations": 0,
+            "fallbacks": 0,
+            "failed": 0,
+        }
+
+    def update_status(
+        self,
+        issue_id: str,
+        status: str,
+        team_id: str | None = None,
+        on_applied: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Queue a status change; a later one for the issue replaces it.
+
+        ``on_applied`` is called from the worker thread once the change has
+        been applied (directly or by the fallback). It is not called if the
+        change fails or is replaced by a later one.
+        """
+        self._enqueue(issue_id, team_id, status=status, on_applied=on_applied)
+
+    def add_comment(self, issue_id: str, body: str, team_id: str | None = None) -> None:
+        """Queue a comment; comments sent together are merged."""
+        self._enqueue(issue_id, team_id, comment=body)
+
+    def _enqueue(
+        self,
+        issue_id: str,
+        team_id: str | None,
+        status: str | None = None,
+        comment: str | None = None,
+        on_applied: Callable[[], None] | None = None,
+    ) -> None:
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Linear update queue is closed")
+            self.stats["enqueued"] += 1
+
+            update = self._pending.get(issue_id)
+            if update is None:
+                update = self._pending[issue_id] = LinearUpdate(issue_id, team_id)
+            elif (status and update.status) or (comment and update.comments):
+                self.stats["coalesced"] += 1
+            update.team_id = update.team_id or team_id
+            if status:
+                update.status = status
+                update.on_applied = on_applied
+            if comment:
+                update.comments.append(comment)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="linear-updates", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Send pending updates now and wait for them.
+
+        Returns:
+            True if everything queued was sent (or handed to the fallback)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._flush_requested = False
+            return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Flush pending updates and stop the worker."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return flushed
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                # Give rapid successive updates a chance to coalesce
+                deadline = time.monotonic() + self.coalesce_delay
+                while not self._flush_requested and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = list(self._pending.values())
+                self._pending.clear()
+                self._flush_requested = False
+                self._in_flight = True
+
+            try:
+                self._send(batch)
+            except Exception as e:
+                # Never let one bad batch kill the worker
+                logger.warning(f"Linear update batch failed: {e}")
+                self.stats["failed"] += len(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = False
+                    self._cond.notify_all()
+
+    def _send(self, batch: list[LinearUpdate]) -> None:
+        mutations: list[tuple[str, str, str]] = []
+        # Per mutation, the update to hand to the fallback if it fails
+        owners: list[LinearUpdate] = []
+
+        for update in batch:
+            if update.status:
+                try:
+                    state_id = self.client.workflow_state_id(
+                        update.issue_id, update.status
+                    )
+                except LinearAPIError as e:
+                    logger.debug(f"Could not look up Linear states: {e}")
+                    state_id = None
+                status_update = LinearUpdate(
+                    update.issue_id,
+                    update.team_id,
+                    status=update.status,
+                    on_applied=update.on_applied,
+                )
+                if state_id:
+                    mutations.append(("status", update.issue_id, state_id))
+                    owners.append(status_update)
+                else:
+                    self._fall_back(status_update)
+            if update.comments:
+                mutations.append(("comment", update.issue_id, update.comment))
+                owners.append(
+                    LinearUpdate(
+                        update.issue_id, update.team_id, comments=list(update.comments)
+                    )
+                )
+
+        for start in range(0, len(mutations), self.max_batch):
+            chunk = mutations[start : start + self.max_batch]
+            chunk_owners = owners[start : start + self.max_batch]
+            document, variables = build_batch_mutation(chunk)
+
+            self.stats["requests"] += 1
+            try:
+                body = self.client.execute(document, variables)
+            except LinearAPIError as e:
+                logger.debug(f"Linear batch request failed: {e}")
+                failed = {f"m{i}" for i in range(len(chunk))}
+            else:
+                failed = _failed_aliases(body, [f"m{i}" for i in range(len(chunk))])
+
+            for i, owner in enumerate(chunk_owners):
+                if f"m{i}" in failed:
+                    self._fall_back(owner)
+                else:
+                    self.stats["mutations"] += 1
+                    self._applied(owner)
+
+    def _fall_back(self, update: LinearUpdate) -> None:
+        if self.fallback is not None:
+            self.stats["fallbacks"] += 1
+            try:
+                if self.fallback(update):
+                    self._applied(update)
+                    return
+            except Exception as e:
+                logger.debug(f"Linear fallback failed: {e}")
+        self.stats["failed"] += 1
+        logger.warning(f"Linear update for {update.issue_id} was not applied")
+
+    def _applied(self, update: LinearUpdate) -> None:
+        if update.on_applied is None:
+            return
+        try:
+            update.on_applied()
+        except Exception as e:
+            logger.warning(f"Linear update callback for {update.issue_id} failed: {e}")
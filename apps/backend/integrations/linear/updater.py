@@ -2,9 +2,14 @@
 Linear Updater - Python-Orchestrated Linear Updates
 ====================================================
 
-Provides reliable Linear updates via focused mini-agent calls.
+Provides reliable Linear updates at key transitions.
 Instead of relying on agents to remember Linear updates in long prompts,
-the Python orchestrator triggers small, focused agents at key transitions.
+the Python orchestrator triggers them itself.
+
+Updates go straight to Linear's GraphQL API (api.py). Status changes and
+comments are queued (update_queue.py) and sent in coalesced batches from a
+background thread, so they never block the coding loop. A focused MCP
+mini-agent is kept as the fallback when the API path fails.
 
 Design Principles:
 - ONE task per spec (not one issue per subtask)
@@ -20,8 +25,12 @@ Status Flow:
     +-- Task created from spec
 """
 
+import asyncio
+import atexit
+import functools
 import json
 import os
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -29,6 +38,9 @@ from typing import Optional
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
+from .api import LinearAPIClient, LinearAPIError
+from .update_queue import LinearUpdate, LinearUpdateQueue
+
 # Linear status constants (matching Valma AI team setup)
 STATUS_TODO = "Todo"
 STATUS_IN_PROGRESS = "In Progress"
@@ -48,6 +60,9 @@ LINEAR_TOOLS = [
     "mcp__linear-server__list_issue_statuses",
 ]
 
+# Seconds to wait for queued updates at interpreter exit
+FLUSH_TIMEOUT = 30.0
+
 
 @dataclass
 class LinearTaskState:
@@ -179,33 +194,83 @@ async def _run_linear_agent(prompt: str) -> str | None:
         return None
 
 
-async def create_linear_task(
-    spec_dir: Path,
-    title: str,
-    description: str | None = None,
-) -> LinearTaskState | None:
+def _status_prompt(task_id: str, team_id: str | None, new_status: str) -> str:
+    return f"""Update Linear issue status:
+
+1. First, use mcp__linear-server__list_issue_statuses with teamId: "{team_id}" to find the state ID for "{new_status}"
+2. Then, use mcp__linear-server__update_issue with:
+   - issueId: "{task_id}"
+   - stateId: [the state ID for "{new_status}" from step 1]
+
+Confirm when done.
+"""
+
+
+def _comment_prompt(task_id: str, comment: str) -> str:
+    # Escape any quotes in the comment
+    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
+
+    return f"""Add a comment to Linear issue:
+
+Use mcp__linear-server__create_comment with:
+- issueId: "{task_id}"
+- body: "{safe_comment}"
+
+Confirm when done.
+"""
+
+
+def _agent_fallback(update: LinearUpdate) -> bool:
     """
-    Create a new Linear task for a spec.
+    Apply an update the API path could not, using the mini-agent.
 
-    Called by spec_runner.py after requirements gathering.
+    Runs on the update queue's worker thread, which has no event loop.
+    """
+    prompts = []
+    if update.status:
+        prompts.append(_status_prompt(update.issue_id, update.team_id, update.status))
+    if update.comment:
+        prompts.append(_comment_prompt(update.issue_id, update.comment))
+
+    return all(asyncio.run(_run_linear_agent(prompt)) for prompt in prompts)
+
+
+_update_queue: LinearUpdateQueue | None = None
+_update_queue_lock = threading.Lock()
 
-    Args:
-        spec_dir: Spec directory to save state
-        title: Task title (the task name from user)
-        description: Optional task description
+
+def get_update_queue() -> LinearUpdateQueue:
+    """Get the process-wide queue of Linear updates, creating it on first use."""
+    global _update_queue
+    with _update_queue_lock:
+        if _update_queue is None:
+            _update_queue = LinearUpdateQueue(
+                LinearAPIClient(get_linear_api_key()),
+                fallback=_agent_fallback,
+            )
+            atexit.register(flush_linear_updates)
+        return _update_queue
+
+
+def flush_linear_updates(timeout: float = FLUSH_TIMEOUT) -> bool:
+    """
+    Wait for queued Linear updates to be sent.
+
+    Called automatically at interpreter exit.
 
     Returns:
-        LinearTaskState if successful, None if failed
+        True if nothing is left pending
     """
-    if not is_linear_enabled():
-        return None
+    if _update_queue is None:
+        return True
+    return _update_queue.flush(timeout)
 
-    # Check if task already exists
-    existing = LinearTaskState.load(spec_dir)
-    if existing and existing.task_id:
-        print(f"Linear task already exists: {existing.task_id}")
-        return existing
 
+async def _create_task_with_agent(
+    title: str,
+    description: str | None,
+) -> tuple[str, str | None] | None:
+    """Create a Linear task via the mini-agent. Returns (task_id, team_id)."""
     desc_part = f'\n   - description: "{description}"' if description else ""
 
     prompt = f"""Create a Linear task with these details:
@@ -243,6 +308,50 @@ TEAM_ID: [the team ID]
         print(f"Failed to parse task ID from response: {response[:200]}")
         return None
 
+    return task_id, team_id
+
+
+async def create_linear_task(
+    spec_dir: Path,
+    title: str,
+    description: str | None = None,
+) -> LinearTaskState | None:
+    """
+    Create a new Linear task for a spec.
+
+    Called by spec_runner.py after requirements gathering.
+
+    Args:
+        spec_dir: Spec directory to save state
+        title: Task title (the task name from user)
+        description: Optional task description
+
+    Returns:
+        LinearTaskState if successful, None if failed
+    """
+    if not is_linear_enabled():
+        return None
+
+    # Check if task already exists
+    existing = LinearTaskState.load(spec_dir)
+    if existing and existing.task_id:
+        print(f"Linear task already exists: {existing.task_id}")
+        return existing
+
+    try:
+        task_id, team_id = await asyncio.to_thread(
+            LinearAPIClient(get_linear_api_key()).create_issue,
+            title,
+            description,
+            os.environ.get("LINEAR_TEAM_ID"),
+        )
+    except LinearAPIError as e:
+        print(f"Linear API unavailable ({e}), falling back to agent")
+        created = await _create_task_with_agent(title, description)
+        if not created:
+            return None
+        task_id, team_id = created
+
     # Create and save state
     state = LinearTaskState(
         task_id=task_id,
@@ -257,6 +366,14 @@ TEAM_ID: [the team ID]
     return state
 
 
+def _save_status(spec_dir: Path, task_id: str, status: str) -> None:
+    """Record a status Linear has applied (called from the update queue)."""
+    state = LinearTaskState.load(spec_dir)
+    if state and state.task_id == task_id:
+        state.status = status
+        state.save(spec_dir)
+
+
 async def update_linear_status(
     spec_dir: Path,
     new_status: str,
@@ -264,12 +381,15 @@ async def update_linear_status(
     """
     Update the Linear task status.
 
+    The change is queued and sent in the background; the saved state is
+    updated once Linear has applied it.
+
     Args:
         spec_dir: Spec directory with .linear_task.json
         new_status: New status (STATUS_TODO, STATUS_IN_PROGRESS, STATUS_IN_REVIEW, STATUS_DONE)
 
     Returns:
-        True if successful, False otherwise
+        True if the update was queued, False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -283,24 +403,14 @@ async def update_linear_status(
     if state.status == new_status:
         return True
 
-    prompt = f"""Update Linear issue status:
-
-1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
-2. Then, use mcp__linear-server__update_issue with:
-   - issueId: "{state.task_id}"
-   - stateId: [the state ID for "{new_status}" from step 1]
-
-Confirm when done.
-"""
-
-    response = await _run_linear_agent(prompt)
-    if response:
-        state.status = new_status
-        state.save(spec_dir)
-        print(f"Updated Linear task {state.task_id} to: {new_status}")
-        return True
-
-    return False
+    get_update_queue().update_status(
+        state.task_id,
+        new_status,
+        state.team_id,
+        on_applied=functools.partial(_save_status, spec_dir, state.task_id, new_status),
+    )
+    print(f"Queued Linear task {state.task_id} update to: {new_status}")
+    return True
 
 
 async def add_linear_comment(
@@ -310,12 +420,15 @@ async def add_linear_comment(
     """
     Add a comment to the Linear task.
 
+    The comment is queued and sent in the background, merged with other
+    comments made in quick succession.
+
     Args:
         spec_dir: Spec directory with .linear_task.json
         comment: Comment text to add
 
     Returns:
-        True if successful, False otherwise
+        True if the comment was queued, False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -325,24 +438,8 @@ async def add_linear_comment(
         print("No Linear task found for this spec")
         return False
 
-    # Escape any quotes in the comment
-    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
-
-    prompt = f"""Add a comment to Linear issue:
-
-Use mcp__linear-server__create_comment with:
-- issueId: "{state.task_id}"
-- body: "{safe_comment}"
-
-Confirm when done.
-"""
-
-    response = await _run_linear_agent(prompt)
-    if response:
-        print(f"Added comment to Linear task {state.task_id}")
-        return True
-
-    return False
+    get_update_queue().add_comment(state.task_id, comment, state.team_id)
+    return True
 
 
 # === Convenience functions for specific transitions ===
@@ -4,7 +4,7 @@ Modification Tracking Module
 
 Handles recording and analyzing file modifications:
 - Recording task modifications with semantic analysis
-- Refreshing modifications from git worktrees
+- Refreshing modifications from git worktrees (batched, multi-task)
 - Managing task completion status
 """
 
@@ -12,9 +12,12 @@ from __future__ import annotations
 
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from ..git_utils import get_file_diffs, get_files_at_ref, list_changed_files
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
@@ -34,6 +37,29 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.file_evolution.modification_tracker"
 
+# Worktrees read concurrently by refresh_many_from_git()
+MAX_REFRESH_WORKERS = 4
+
+
+@dataclass
+class GitFileChange:
+    """One file's before/after state as read from a task's worktree."""
+
+    file_path: str
+    old_content: str
+    new_content: str
+    raw_diff: str
+
+
+@dataclass
+class TaskGitChanges:
+    """Everything a task changed since its merge-base, ready to record."""
+
+    task_id: str
+    merge_base: str
+    changed_files: list[str]
+    files: list[GitFileChange] = field(default_factory=list)
+
 
 class ModificationTracker:
     """
@@ -163,6 +189,71 @@ class ModificationTracker:
                 (no semantic analysis). This optimizes performance by only
                 analyzing files that have actual conflicts.
         """
+        changes = self.collect_git_changes(task_id, worktree_path, target_branch)
+        if changes is not None:
+            self.apply_git_changes(changes, evolutions, analyze_only_files)
+
+    def refresh_many_from_git(
+        self,
+        tasks: list[tuple[str, Path]],
+        evolutions: dict[str, FileEvolution],
+        target_branch: str | None = None,
+        analyze_only_files: set[str] | None = None,
+        max_workers: int = MAX_REFRESH_WORKERS,
+    ) -> None:
+        """
+        Refresh snapshots for several tasks, reading their worktrees concurrently.
+
+        Git reads for each task run on a bounded thread pool; the results are
+        then recorded one task at a time in the given order, so evolution
+        data and semantic analysis are never touched from two threads.
+
+        Args:
+            tasks: (task_id, worktree_path) pairs
+            evolutions: Current evolution data (will be updated)
+            target_branch: Branch to compare against (default: detect per worktree)
+            analyze_only_files: See refresh_from_git()
+            max_workers: Upper bound on concurrent worktree reads
+        """
+        if not tasks:
+            return
+
+        workers = max(1, min(max_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            collected = list(
+                pool.map(
+                    lambda task: self.collect_git_changes(
+                        task[0], task[1], target_branch
+                    ),
+                    tasks,
+                )
+            )
+
+        for changes in collected:
+            if changes is not None:
+                self.apply_git_changes(changes, evolutions, analyze_only_files)
+
+    def collect_git_changes(
+        self,
+        task_id: str,
+        worktree_path: Path,
+        target_branch: str | None = None,
+    ) -> TaskGitChanges | None:
+        """
+        Read everything a task changed since it branched, without recording it.
+
+        All per-file diffs come from one ``git diff`` stream and all
+        merge-base contents from one ``git cat-file --batch`` process, so the
+        number of git processes doesn't grow with the number of files.
+
+        Args:
+            task_id: The task identifier
+            worktree_path: Path to the task's worktree
+            target_branch: Branch to compare against (default: detect from worktree)
+
+        Returns:
+            The collected changes, or None if git failed
+        """
         # Determine the target branch to compare against
         if not target_branch:
             # Try to detect the base branch from the worktree's upstream
@@ -170,13 +261,10 @@ class ModificationTracker:
 
         debug(
             MODULE,
-            f"refresh_from_git() for task {task_id}",
+            f"collect_git_changes() for task {task_id}",
             task_id=task_id,
             worktree_path=str(worktree_path),
             target_branch=target_branch,
-            analyze_only_files=list(analyze_only_files)[:10]
-            if analyze_only_files
-            else "all",
         )
 
         try:
@@ -191,16 +279,10 @@ class ModificationTracker:
                 check=True,
             )
             merge_base = merge_base_result.stdout.strip()
+            diff_spec = f"{merge_base}..HEAD"
 
             # Get list of files changed in the worktree since the merge-base
-            result = subprocess.run(
-                ["git", "diff", "--name-only", f"{merge_base}..HEAD"],
-                cwd=worktree_path,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            changed_files = [f for f in result.stdout.strip().split("\n") if f]
+            changed_files = list_changed_files(worktree_path, diff_spec)
 
             debug(
                 MODULE,
@@ -210,106 +292,109 @@ class ModificationTracker:
                 else changed_files,
             )
 
-            processed_count = 0
-            for file_path in changed_files:
-                try:
-                    # Get the diff for this file (using merge-base for accurate task-only diff)
-                    diff_result = subprocess.run(
-                        ["git", "diff", f"{merge_base}..HEAD", "--", file_path],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
+            # Diffs and content before (from merge-base - the point where task branched)
+            diffs = get_file_diffs(worktree_path, diff_spec, changed_files)
+            old_contents = get_files_at_ref(worktree_path, merge_base, changed_files)
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to refresh from git: {e}")
+            return None
 
-                    # Get content before (from merge-base - the point where task branched)
-                    try:
-                        show_result = subprocess.run(
-                            ["git", "show", f"{merge_base}:{file_path}"],
-                            cwd=worktree_path,
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                        )
-                        old_content = show_result.stdout
-                    except subprocess.CalledProcessError:
-                        # File is new
-                        old_content = ""
-
-                    current_file = worktree_path / file_path
-                    if current_file.exists():
-                        try:
-                            new_content = current_file.read_text(encoding="utf-8")
-                        except UnicodeDecodeError:
-                            new_content = current_file.read_text(
-                                encoding="utf-8", errors="replace"
-                            )
-                    else:
-                        # File was deleted
-                        new_content = ""
-
-                    # Auto-create FileEvolution entry if not already tracked
-                    # This handles retroactive tracking when capture_baselines wasn't called
-                    rel_path = self.storage.get_relative_path(file_path)
-                    if rel_path not in evolutions:
-                        evolutions[rel_path] = FileEvolution(
-                            file_path=rel_path,
-                            baseline_commit=merge_base,
-                            baseline_captured_at=datetime.now(),
-                            baseline_content_hash=compute_content_hash(old_content),
-                            baseline_snapshot_path="",  # Not storing baseline file
-                            task_snapshots=[],
-                        )
-                        debug(
-                            MODULE,
-                            f"Auto-created evolution entry for {rel_path}",
-                            baseline_commit=merge_base[:8],
-                        )
-
-                    # Determine if this file needs full semantic analysis
-                    # If analyze_only_files is provided, only analyze files in that set
-                    # Otherwise, analyze all files (backward compatible)
-                    skip_analysis = False
-                    if analyze_only_files is not None:
-                        skip_analysis = rel_path not in analyze_only_files
-
-                    # Record the modification
-                    self.record_modification(
-                        task_id=task_id,
-                        file_path=file_path,
-                        old_content=old_content,
-                        new_content=new_content,
-                        evolutions=evolutions,
-                        raw_diff=diff_result.stdout,
-                        skip_semantic_analysis=skip_analysis,
+        changes = TaskGitChanges(
+            task_id=task_id, merge_base=merge_base, changed_files=changed_files
+        )
+        for file_path in changed_files:
+            current_file = worktree_path / file_path
+            if current_file.exists():
+                try:
+                    new_content = current_file.read_text(encoding="utf-8")
+                except UnicodeDecodeError:
+                    new_content = current_file.read_text(
+                        encoding="utf-8", errors="replace"
                     )
-                    processed_count += 1
+            else:
+                # File was deleted
+                new_content = ""
+
+            changes.files.append(
+                GitFileChange(
+                    file_path=file_path,
+                    # None means the file is new
+                    old_content=old_contents.get(file_path) or "",
+                    new_content=new_content,
+                    raw_diff=diffs.get(file_path, ""),
+                )
+            )
+        return changes
 
-                except subprocess.CalledProcessError as e:
-                    # Log error but continue with remaining files
-                    logger.warning(
-                        f"Failed to process {file_path} in refresh_from_git: {e}"
-                    )
-                    continue
+    def apply_git_changes(
+        self,
+        changes: TaskGitChanges,
+        evolutions: dict[str, FileEvolution],
+        analyze_only_files: set[str] | None = None,
+    ) -> None:
+        """
+        Record changes gathered by collect_git_changes() as task snapshots.
 
-            # Calculate how many files were fully analyzed vs just tracked
-            if analyze_only_files is not None:
-                analyzed_count = len(
-                    [f for f in changed_files if f in analyze_only_files]
-                )
-                tracked_only_count = processed_count - analyzed_count
-                logger.info(
-                    f"Refreshed {processed_count}/{len(changed_files)} files from worktree for task {task_id} "
-                    f"(analyzed: {analyzed_count}, tracked only: {tracked_only_count})"
+        Args:
+            changes: Changes collected from the task's worktree
+            evolutions: Current evolution data (will be updated)
+            analyze_only_files: See refresh_from_git()
+        """
+        task_id = changes.task_id
+        merge_base = changes.merge_base
+
+        for change in changes.files:
+            # Auto-create FileEvolution entry if not already tracked
+            # This handles retroactive tracking when capture_baselines wasn't called
+            rel_path = self.storage.get_relative_path(change.file_path)
+            if rel_path not in evolutions:
+                evolutions[rel_path] = FileEvolution(
+                    file_path=rel_path,
+                    baseline_commit=merge_base,
+                    baseline_captured_at=datetime.now(),
+                    baseline_content_hash=compute_content_hash(change.old_content),
+                    baseline_snapshot_path="",  # Not storing baseline file
+                    task_snapshots=[],
                 )
-            else:
-                logger.info(
-                    f"Refreshed {processed_count}/{len(changed_files)} files from worktree for task {task_id} "
-                    "(full analysis on all files)"
+                debug(
+                    MODULE,
+                    f"Auto-created evolution entry for {rel_path}",
+                    baseline_commit=merge_base[:8],
                 )
 
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to refresh from git: {e}")
+            # Determine if this file needs full semantic analysis
+            # If analyze_only_files is provided, only analyze files in that set
+            # Otherwise, analyze all files (backward compatible)
+            skip_analysis = False
+            if analyze_only_files is not None:
+                skip_analysis = rel_path not in analyze_only_files
+
+            # Record the modification
+            self.record_modification(
+                task_id=task_id,
+                file_path=change.file_path,
+                old_content=change.old_content,
+                new_content=change.new_content,
+                evolutions=evolutions,
+                raw_diff=change.raw_diff,
+                skip_semantic_analysis=skip_analysis,
+            )
+
+        processed_count = len(changes.files)
+        changed_files = changes.changed_files
+        # Calculate how many files were fully analyzed vs just tracked
+        if analyze_only_files is not None:
+            analyzed_count = len([f for f in changed_files if f in analyze_only_files])
+            tracked_only_count = processed_count - analyzed_count
+            logger.info(
+                f"Refreshed {processed_count}/{len(changed_files)} files from worktree for task {task_id} "
+                f"(analyzed: {analyzed_count}, tracked only: {tracked_only_count})"
+            )
+        else:
+            logger.info(
+                f"Refreshed {processed_count}/{len(changed_files)} files from worktree for task {task_id} "
+                "(full analysis on all files)"
+            )
 
     def mark_task_completed(
         self,
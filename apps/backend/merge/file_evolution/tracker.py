@@ -352,3 +352,28 @@ class FileEvolutionTracker:
             analyze_only_files=analyze_only_files,
         )
         self._save_evolutions()
+
+    def refresh_many_from_git(
+        self,
+        tasks: list[tuple[str, Path]],
+        target_branch: str | None = None,
+        analyze_only_files: set[str] | None = None,
+    ) -> None:
+        """
+        Refresh snapshots for several tasks at once.
+
+        Worktrees are read concurrently and evolution data is saved once
+        at the end instead of after every task.
+
+        Args:
+            tasks: (task_id, worktree_path) pairs
+            target_branch: Branch to compare against (default: auto-detect)
+            analyze_only_files: See refresh_from_git()
+        """
+        self.modification_tracker.refresh_many_from_git(
+            tasks=tasks,
+            evolutions=self._evolutions,
+            target_branch=target_branch,
+            analyze_only_files=analyze_only_files,
+        )
+        self._save_evolutions()
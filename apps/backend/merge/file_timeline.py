@@ -37,7 +37,8 @@ Architecture:
 
     - timeline_models.py: Data classes for timeline representation
     - timeline_git.py: Git operations and queries
-    - timeline_persistence.py: Storage and loading of timelines
+    - timeline_persistence.py: Storage and on-demand loading of timelines,
+      with file contents kept in a content-addressed blob store
     - timeline_tracker.py: Main service coordinating all components
 
     This file serves as the main entry point and re-exports all public APIs
@@ -59,7 +60,7 @@ from .timeline_models import (
     TaskIntent,
     WorktreeState,
 )
-from .timeline_persistence import TimelinePersistence
+from .timeline_persistence import TimelineBlobStore, TimelinePersistence
 
 # Re-export the main tracker service
 from .timeline_tracker import FileTimelineTracker
@@ -78,4 +79,5 @@ __all__ = [
     # Helper components (advanced usage)
     "TimelineGitHelper",
     "TimelinePersistence",
+    "TimelineBlobStore",
 ]
@@ -7,14 +7,23 @@ Helper functions for git operations used in merge orchestration.
 This module provides utilities for:
 - Finding git worktrees
 - Getting file content from branches
+- Batched reads of many files and per-file diffs at once
 - Working with git repositories
 """
 
 from __future__ import annotations
 
+import re
 import subprocess
 from pathlib import Path
 
+# Matches every per-file header; quoted headers (unusual path characters)
+# still delimit patches even though their path isn't parsed
+_DIFF_HEADER_RE = re.compile(r"^diff --git (.*)$", re.MULTILINE)
+
+# Paths per `git diff` invocation (keeps argv well under OS limits)
+DIFF_CHUNK_SIZE = 200
+
 
 def find_worktree(project_dir: Path, task_id: str) -> Path | None:
     """
@@ -67,3 +76,150 @@ def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> str
         return result.stdout
     except subprocess.CalledProcessError:
         return None
+
+
+def list_changed_files(cwd: Path, diff_spec: str) -> list[str]:
+    """
+    List the paths changed in ``diff_spec`` (e.g. ``base..HEAD``).
+
+    Uses NUL-separated output so paths with spaces or unusual characters
+    come back verbatim.
+
+    Raises:
+        subprocess.CalledProcessError: If git fails
+    """
+    result = subprocess.run(
+        ["git", "diff", "-z", "--name-only", diff_spec],
+        cwd=cwd,
+        capture_output=True,
+        check=True,
+    )
+    return [
+        path.decode("utf-8", "replace") for path in result.stdout.split(b"\0") if path
+    ]
+
+
+def get_files_at_ref(cwd: Path, ref: str, paths: list[str]) -> dict[str, str | None]:
+    """
+    Read many files at one ref through a single ``git cat-file --batch``.
+
+    Args:
+        cwd: Repository (or worktree) directory
+        ref: Commit-ish to read from
+        paths: Paths relative to the repository root
+
+    Returns:
+        {path: content}, with None for paths that don't exist at ``ref``
+        or aren't regular files
+
+    Raises:
+        subprocess.CalledProcessError: If git fails
+    """
+    unique = list(dict.fromkeys(paths))
+    contents: dict[str, str | None] = dict.fromkeys(unique)
+    # Newlines would desynchronize the line-based protocol
+    batchable = [path for path in unique if "\n" not in path]
+
+    if batchable:
+        request = "".join(f"{ref}:{path}\n" for path in batchable).encode("utf-8")
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            cwd=cwd,
+            input=request,
+            capture_output=True,
+            check=True,
+        )
+        output = result.stdout
+        pos = 0
+        for path in batchable:
+            eol = output.find(b"\n", pos)
+            if eol == -1:
+                break
+            parts = output[pos:eol].split()
+            pos = eol + 1
+            # "<request> missing" / "<request> ambiguous" carry no payload
+            if len(parts) != 3 or not parts[2].isdigit():
+                continue
+            size = int(parts[2])
+            if parts[1] == b"blob":
+                contents[path] = output[pos : pos + size].decode("utf-8", "replace")
+            pos += size + 1
+
+    for path in unique:
+        if "\n" in path:
+            contents[path] = get_file_from_branch(cwd, path, ref)
+    return contents
+
+
+def get_file_diffs(cwd: Path, diff_spec: str, paths: list[str]) -> dict[str, str]:
+    """
+    Get per-file unified diffs for many paths from one ``git diff`` stream.
+
+    Each patch matches ``git diff <diff_spec> -- <path>`` run for that path
+    alone: rename detection is disabled so every path is diffed on its own.
+    Paths whose header git had to quote are diffed individually.
+
+    Args:
+        cwd: Repository (or worktree) directory
+        diff_spec: Revision range, e.g. ``base..HEAD``
+        paths: Paths relative to the repository root
+
+    Returns:
+        {path: patch} ("" for unchanged paths)
+
+    Raises:
+        subprocess.CalledProcessError: If git fails
+    """
+    unique = list(dict.fromkeys(paths))
+    patches: dict[str, str] = {}
+
+    for start in range(0, len(unique), DIFF_CHUNK_SIZE):
+        chunk = unique[start : start + DIFF_CHUNK_SIZE]
+        result = subprocess.run(
+            [
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "diff",
+                "--no-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                diff_spec,
+                "--",
+                *chunk,
+            ],
+            cwd=cwd,
+            capture_output=True,
+            check=True,
+        )
+        patches.update(_split_diff(result.stdout.decode("utf-8", "replace")))
+
+    for path in unique:
+        if path not in patches:
+            result = subprocess.run(
+                ["git", "diff", diff_spec, "--", path],
+                cwd=cwd,
+                capture_output=True,
+                check=True,
+            )
+            patches[path] = result.stdout.decode("utf-8", "replace")
+    return patches
+
+
+def _split_diff(output: str) -> dict[str, str]:
+    """Split multi-file diff output into {path: patch}."""
+    headers = list(_DIFF_HEADER_RE.finditer(output))
+    patches: dict[str, str] = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(output)
+        # "a/<path> b/<path>" - both sides are equal without renames
+        rest = header.group(1)
+        if not rest.startswith("a/"):
+            continue
+        path = rest[2 : 2 + (len(rest) - 5) // 2]
+        if rest != f"a/{path} b/{path}":
+            continue
+        patches[path] = output[header.start() : end]
+    return patches
@@ -21,6 +21,7 @@ from .file_merger import apply_single_task_changes, combine_non_conflicting_chan
 from .progress import MergeProgressCallback, MergeProgressStage
 from .types import (
     ChangeType,
+    ConflictSeverity,
     FileAnalysis,
     MergeDecision,
     MergeResult,
@@ -134,6 +135,20 @@ class MergePipeline:
             progress_callback=progress_callback,
         )
 
+    def may_need_ai(self, file_path: str, task_snapshots: list[TaskSnapshot]) -> bool:
+        """
+        Whether merging these snapshots could hand a conflict to the AI resolver.
+
+        Only runs conflict detection, which needs no file content.
+        """
+        if len(task_snapshots) < 2:
+            return False
+        task_analyses = self._build_task_analyses(file_path, task_snapshots)
+        return any(
+            conflict.severity in {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+            for conflict in self.conflict_detector.detect_conflicts(task_analyses)
+        )
+
     def _build_task_analyses(
         self,
         file_path: str,
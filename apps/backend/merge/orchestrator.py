@@ -19,6 +19,8 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -39,6 +41,8 @@ from .types import (
     ConflictRegion,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -83,6 +87,9 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.orchestrator"
 
+# Files merged concurrently by merge_tasks() (1 = one file at a time)
+MAX_PARALLEL_FILE_MERGES = 4
+
 # Export all public classes for backwards compatibility
 __all__ = [
     "MergeOrchestrator",
@@ -160,9 +167,10 @@ class MergeOrchestrator:
         self._ai_resolver = ai_resolver
         self._ai_resolver_initialized = ai_resolver is not None
 
-        # Initialize conflict resolver and merge pipeline
+        # Initialize conflict resolver and merge pipelines
         self._conflict_resolver: ConflictResolver | None = None
         self._merge_pipeline: MergePipeline | None = None
+        self._deterministic_pipeline: MergePipeline | None = None
 
         # Merge output directory
         self.merge_output_dir = self.storage_dir / "merge_output"
@@ -204,6 +212,20 @@ class MergeOrchestrator:
             )
         return self._merge_pipeline
 
+    @property
+    def deterministic_pipeline(self) -> MergePipeline:
+        """Get a merge pipeline that never calls AI, initializing if needed."""
+        if self._deterministic_pipeline is None:
+            self._deterministic_pipeline = MergePipeline(
+                conflict_detector=self.conflict_detector,
+                conflict_resolver=ConflictResolver(
+                    auto_merger=self.auto_merger,
+                    ai_resolver=None,
+                    enable_ai=False,
+                ),
+            )
+        return self._deterministic_pipeline
+
     def _read_worktree_file_for_direct_copy(
         self,
         file_path: str,
@@ -465,6 +487,7 @@ class MergeOrchestrator:
         requests: list[TaskMergeRequest],
         target_branch: str = "main",
         progress_callback: MergeProgressCallback | None = None,
+        max_workers: int = MAX_PARALLEL_FILE_MERGES,
     ) -> MergeReport:
         """
         Merge multiple tasks' changes.
@@ -472,11 +495,17 @@ class MergeOrchestrator:
         This is the main entry point for merging multiple parallel tasks.
         It handles conflicts between tasks and produces a combined result.
 
+        Files are independent, so with max_workers > 1 they are merged
+        concurrently (see _merge_files_concurrently). Progress callbacks and
+        report entries still follow file order, so the report is the same
+        as a one-at-a-time merge.
+
         Args:
             requests: List of merge requests (one per task)
             target_branch: Branch to merge into
             progress_callback: Optional callback for progress updates.
                 Called with (stage, percent, message, details) at key pipeline stages.
+            max_workers: Files merged at the same time (1 = one at a time)
 
         Returns:
             MergeReport with combined results
@@ -514,13 +543,14 @@ class MergeOrchestrator:
                 5,
                 "Loading file evolution data",
             )
-            for request in requests:
-                if request.worktree_path and request.worktree_path.exists():
-                    self.evolution_tracker.refresh_from_git(
-                        request.task_id,
-                        request.worktree_path,
-                        target_branch=target_branch,
-                    )
+            self.evolution_tracker.refresh_many_from_git(
+                [
+                    (request.task_id, request.worktree_path)
+                    for request in requests
+                    if request.worktree_path and request.worktree_path.exists()
+                ],
+                target_branch=target_branch,
+            )
 
             # Find all files modified by any task
             _emit(
@@ -546,7 +576,16 @@ class MergeOrchestrator:
 
             # --- RESOLVING stage (50-75%) ---
             total_files = len(file_tasks)
-            for idx, (file_path, modifying_tasks) in enumerate(file_tasks.items()):
+            jobs = [
+                (
+                    file_path,
+                    modifying_tasks,
+                    self._get_task_snapshots(file_path, modifying_tasks),
+                )
+                for file_path, modifying_tasks in file_tasks.items()
+            ]
+
+            def _emit_file_started(idx: int, file_path: str) -> None:
                 file_percent = 50 + int((idx / max(total_files, 1)) * 25)
                 _emit(
                     MergeProgressStage.RESOLVING,
@@ -555,26 +594,9 @@ class MergeOrchestrator:
                     {"current_file": file_path},
                 )
 
-                # Get snapshots from all tasks that modified this file
-                evolution = self.evolution_tracker.get_file_evolution(file_path)
-                if not evolution:
-                    continue
-
-                snapshots = [
-                    evolution.get_task_snapshot(tid)
-                    for tid in modifying_tasks
-                    if evolution.get_task_snapshot(tid)
-                ]
-
-                if not snapshots:
-                    continue
-
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
-                )
-
+            def _record_file_result(
+                file_path: str, modifying_tasks: list[str], result: MergeResult
+            ) -> None:
                 # Handle DIRECT_COPY: read file directly from worktree
                 # For multi-task merges, use the first task's worktree that modified this file
                 if result.decision == MergeDecision.DIRECT_COPY:
@@ -600,6 +622,26 @@ class MergeOrchestrator:
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
 
+            if max_workers > 1 and len(jobs) > 1:
+                self._merge_files_concurrently(
+                    jobs,
+                    target_branch,
+                    max_workers,
+                    on_file_started=_emit_file_started,
+                    on_file_merged=_record_file_result,
+                )
+            else:
+                for idx, (file_path, modifying_tasks, snapshots) in enumerate(jobs):
+                    _emit_file_started(idx, file_path)
+                    if not snapshots:
+                        continue
+                    result = self._merge_file(
+                        file_path=file_path,
+                        task_snapshots=snapshots,
+                        target_branch=target_branch,
+                    )
+                    _record_file_result(file_path, modifying_tasks, result)
+
             # --- VALIDATING stage (75-100%) ---
             _emit(
                 MergeProgressStage.VALIDATING,
@@ -655,11 +697,96 @@ class MergeOrchestrator:
 
         return report
 
+    def _get_task_snapshots(
+        self,
+        file_path: str,
+        task_ids: list[str],
+    ) -> list[TaskSnapshot]:
+        """Get the snapshots of the given tasks for a file, in task order."""
+        evolution = self.evolution_tracker.get_file_evolution(file_path)
+        if not evolution:
+            return []
+
+        return [
+            evolution.get_task_snapshot(tid)
+            for tid in task_ids
+            if evolution.get_task_snapshot(tid)
+        ]
+
+    def _merge_files_concurrently(
+        self,
+        jobs: list[tuple[str, list[str], list[TaskSnapshot]]],
+        target_branch: str,
+        max_workers: int,
+        on_file_started: Callable[[int, str], None],
+        on_file_merged: Callable[[str, list[str], MergeResult], None],
+    ) -> None:
+        """
+        Merge many files on a thread pool, reporting results in job order.
+
+        Files whose conflicts could reach the AI resolver are merged with the
+        full pipeline on the calling thread, one at a time and in order, as
+        the serial path does. All other files go through the deterministic
+        pipeline on the pool, so no AI call is made from a worker and every
+        result matches a one-at-a-time merge.
+
+        Args:
+            jobs: (file_path, modifying task ids, snapshots) per file; files
+                with no snapshots are reported as started but not merged
+            target_branch: Branch to merge into
+            max_workers: Size of the deterministic merge thread pool
+            on_file_started: Called with (index, file_path) in job order
+            on_file_merged: Called with (file_path, task ids, result) in job order
+        """
+        needs_ai = [
+            self.enable_ai
+            and self.deterministic_pipeline.may_need_ai(file_path, snapshots)
+            for file_path, _, snapshots in jobs
+        ]
+        debug(
+            MODULE,
+            f"Merging {len(jobs)} files concurrently",
+            max_workers=max_workers,
+            ai_candidates=sum(needs_ai),
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self._merge_file,
+                    file_path,
+                    snapshots,
+                    target_branch,
+                    pipeline=self.deterministic_pipeline,
+                )
+                if snapshots and not ai
+                else None
+                for (file_path, _, snapshots), ai in zip(jobs, needs_ai)
+            ]
+            try:
+                for idx, ((file_path, modifying_tasks, snapshots), future) in enumerate(
+                    zip(jobs, futures)
+                ):
+                    on_file_started(idx, file_path)
+                    if not snapshots:
+                        continue
+                    if future is None:
+                        debug(MODULE, f"Merging {file_path} with AI resolution")
+                        result = self._merge_file(file_path, snapshots, target_branch)
+                    else:
+                        result = future.result()
+                    on_file_merged(file_path, modifying_tasks, result)
+            finally:
+                for future in futures:
+                    if future is not None:
+                        future.cancel()
+
     def _merge_file(
         self,
         file_path: str,
         task_snapshots: list,
         target_branch: str,
+        pipeline: MergePipeline | None = None,
     ):
         """
         Merge changes from multiple tasks for a single file.
@@ -668,6 +795,7 @@ class MergeOrchestrator:
             file_path: Path to the file
             task_snapshots: Snapshots from tasks that modified this file
             target_branch: Branch to merge into
+            pipeline: Pipeline to use (default: the AI-enabled merge pipeline)
 
         Returns:
             MergeResult with merged content or conflict info
@@ -693,7 +821,7 @@ class MergeOrchestrator:
             baseline_content = ""
 
         # Delegate to merge pipeline
-        return self.merge_pipeline.merge_file(
+        return (pipeline or self.merge_pipeline).merge_file(
             file_path=file_path,
             baseline_content=baseline_content,
             task_snapshots=task_snapshots,
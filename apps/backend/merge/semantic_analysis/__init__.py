@@ -5,6 +5,7 @@ This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
 - comparison.py: Element comparison and change classification
 - regex_analyzer.py: Regex-based analysis for code changes
+- tree_sitter_analyzer.py: Optional tree-sitter analysis with parse caching
 """
 
 from .models import ExtractedElement
@@ -0,0 +1,448 @@
+"""
+Tree-sitter-based structural analysis for code changes.
+
+Parses both versions of a file with tree-sitter, extracts top-level symbols
+(imports, functions, classes, methods, types) with their exact spans, and
+compares them element by element. Extraction results are cached by content
+hash, so the same baseline analyzed for several tasks is only parsed once.
+
+tree-sitter and the per-language grammar packages are optional; when they
+are missing, analyze_with_tree_sitter() returns None and callers fall back
+to the regex analyzer.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import importlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from ..types import ChangeType, FileAnalysis
+from .comparison import compare_elements
+from .models import ExtractedElement
+
+logger = logging.getLogger(__name__)
+
+try:
+    from tree_sitter import Language, Parser
+
+    TREE_SITTER_AVAILABLE = True
+except ImportError:
+    TREE_SITTER_AVAILABLE = False
+
+# Extension -> (grammar module, language function)
+GRAMMARS: dict[str, tuple[str, str]] = {
+    ".py": ("tree_sitter_python", "language"),
+    ".js": ("tree_sitter_javascript", "language"),
+    ".jsx": ("tree_sitter_javascript", "language"),
+    ".mjs": ("tree_sitter_javascript", "language"),
+    ".cjs": ("tree_sitter_javascript", "language"),
+    ".ts": ("tree_sitter_typescript", "language_typescript"),
+    ".tsx": ("tree_sitter_typescript", "language_tsx"),
+    ".go": ("tree_sitter_go", "language"),
+    ".rs": ("tree_sitter_rust", "language"),
+}
+
+# Node type -> element type, per language family
+_PYTHON_NODES = {
+    "import_statement": "import",
+    "import_from_statement": "import",
+    "future_import_statement": "import",
+    "function_definition": "function",
+    "class_definition": "class",
+}
+_JS_NODES = {
+    "import_statement": "import",
+    "function_declaration": "function",
+    "generator_function_declaration": "function",
+    "class_declaration": "class",
+    "abstract_class_declaration": "class",
+    "method_definition": "method",
+    "interface_declaration": "interface",
+    "type_alias_declaration": "type",
+    "enum_declaration": "type",
+}
+_GO_NODES = {
+    "import_declaration": "import",
+    "function_declaration": "function",
+    "method_declaration": "method",
+}
+_RUST_NODES = {
+    "use_declaration": "import",
+    "function_item": "function",
+    "function_signature_item": "function",
+    "struct_item": "class",
+    "enum_item": "class",
+    "union_item": "class",
+    "trait_item": "interface",
+    "type_item": "type",
+}
+_NODE_TABLES: dict[str, dict[str, str]] = {
+    "tree_sitter_python": _PYTHON_NODES,
+    "tree_sitter_javascript": _JS_NODES,
+    "tree_sitter_typescript": _JS_NODES,
+    "tree_sitter_go": _GO_NODES,
+    "tree_sitter_rust": _RUST_NODES,
+}
+
+# Nodes that wrap a declaration (the element spans the wrapper)
+_WRAPPERS = {"decorated_definition", "export_statement"}
+# Class-like bodies whose members become methods
+_CLASS_BODIES = {"block", "class_body", "declaration_list"}
+# Values that make a JS/TS variable a function
+_FUNCTION_VALUES = {"arrow_function", "function_expression", "function"}
+
+_parsers: dict[str, Any] = {}
+_parsers_lock = threading.Lock()
+
+
+def is_language_supported(ext: str) -> bool:
+    """Check whether tree-sitter and a grammar for this extension are installed."""
+    return _get_parser(ext) is not None
+
+
+def _get_parser(ext: str) -> Any | None:
+    if not TREE_SITTER_AVAILABLE or ext not in GRAMMARS:
+        return None
+    with _parsers_lock:
+        if ext not in _parsers:
+            module_name, function_name = GRAMMARS[ext]
+            try:
+                module = importlib.import_module(module_name)
+                language = Language(getattr(module, function_name)())
+                _parsers[ext] = Parser(language)
+            except (ImportError, AttributeError, ValueError, TypeError) as e:
+                logger.debug(f"No tree-sitter grammar for {ext}: {e}")
+                _parsers[ext] = None
+        return _parsers[ext]
+
+
+class ParseCache:
+    """Thread-safe LRU of extracted elements keyed by (extension, content hash)."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], dict[str, ExtractedElement]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> dict[str, ExtractedElement] | None:
+        with self._lock:
+            elements = self._entries.get(key)
+            if elements is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return elements
+
+    def put(self, key: tuple[str, str], elements: dict[str, ExtractedElement]) -> None:
+        with self._lock:
+            self._entries[key] = elements
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by all analyzers, so baselines are parsed once per process
+parse_cache = ParseCache()
+
+
+def extract_elements(content: str, ext: str) -> dict[str, ExtractedElement] | None:
+    """
+    Extract structural elements from source code.
+
+    Args:
+        content: Source code (LF line endings)
+        ext: File extension
+
+    Returns:
+        {element key: ExtractedElement}, or None if the language isn't supported.
+        The returned mapping is shared through the cache and must not be mutated.
+    """
+    parser = _get_parser(ext)
+    if parser is None:
+        return None
+
+    key = (ext, hashlib.sha256(content.encode("utf-8")).hexdigest())
+    cached = parse_cache.get(key)
+    if cached is not None:
+        return cached
+
+    source = content.encode("utf-8")
+    tree = parser.parse(source)
+    elements: dict[str, ExtractedElement] = {}
+    _collect(tree.root_node, source, None, _NODE_TABLES[GRAMMARS[ext][0]], elements)
+    _add_class_shells(elements, source)
+
+    parse_cache.put(key, elements)
+    return elements
+
+
+def _collect(
+    node: Any,
+    source: bytes,
+    parent: str | None,
+    table: dict[str, str],
+    elements: dict[str, ExtractedElement],
+) -> None:
+    """Walk declarations (not function bodies) and record elements."""
+    for child in node.named_children:
+        outer = child
+        while child.type in _WRAPPERS:
+            inner = child.child_by_field_name(
+                "definition"
+            ) or child.child_by_field_name("declaration")
+            if inner is None:
+                break
+            child = inner
+
+        element_type = table.get(child.type)
+
+        if child.type in {"lexical_declaration", "variable_declaration"}:
+            _collect_function_variables(child, outer, source, parent, elements)
+            continue
+        if child.type == "type_declaration":
+            _collect_go_types(child, outer, source, elements)
+            continue
+        if child.type == "impl_item":
+            impl_type = child.child_by_field_name("type")
+            body = child.child_by_field_name("body")
+            if impl_type is not None and body is not None:
+                _collect(body, source, _text(impl_type, source), table, elements)
+            continue
+        if element_type is None:
+            continue
+
+        element_parent = parent
+        if element_type == "import":
+            name = _text(outer, source).strip()
+        else:
+            name = _node_name(child, source)
+            if child.type == "method_declaration":
+                element_parent = _go_receiver(child, source)
+        if not name:
+            continue
+
+        if element_type == "function" and element_parent is not None:
+            element_type = "method"
+        _add_element(elements, element_type, name, element_parent, outer, source)
+
+        if element_type in {"class", "interface"}:
+            body = child.child_by_field_name("body")
+            if body is not None and body.type in _CLASS_BODIES:
+                _collect(body, source, name, table, elements)
+
+
+def _collect_function_variables(
+    node: Any,
+    outer: Any,
+    source: bytes,
+    parent: str | None,
+    elements: dict[str, ExtractedElement],
+) -> None:
+    """Record `const f = () => ...` style functions (JS/TS)."""
+    declarators = [c for c in node.named_children if c.type == "variable_declarator"]
+    for declarator in declarators:
+        value = declarator.child_by_field_name("value")
+        name_node = declarator.child_by_field_name("name")
+        if value is None or name_node is None or value.type not in _FUNCTION_VALUES:
+            continue
+        span = outer if len(declarators) == 1 else declarator
+        _add_element(
+            elements, "function", _text(name_node, source), parent, span, source
+        )
+
+
+def _collect_go_types(
+    node: Any, outer: Any, source: bytes, elements: dict[str, ExtractedElement]
+) -> None:
+    """Record Go type declarations (structs as classes, interfaces, aliases)."""
+    specs = [c for c in node.named_children if c.type in {"type_spec", "type_alias"}]
+    for spec in specs:
+        name_node = spec.child_by_field_name("name")
+        type_node = spec.child_by_field_name("type")
+        if name_node is None:
+            continue
+        if type_node is not None and type_node.type == "struct_type":
+            element_type = "class"
+        elif type_node is not None and type_node.type == "interface_type":
+            element_type = "interface"
+        else:
+            element_type = "type"
+        span = outer if len(specs) == 1 else spec
+        _add_element(
+            elements, element_type, _text(name_node, source), None, span, source
+        )
+
+
+def _add_element(
+    elements: dict[str, ExtractedElement],
+    element_type: str,
+    name: str,
+    parent: str | None,
+    node: Any,
+    source: bytes,
+) -> None:
+    qualified = f"{parent}.{name}" if parent else name
+    key = f"{element_type}:{qualified}"
+    # Overloads / repeated impl blocks: keep every occurrence distinct
+    occurrence = 2
+    while key in elements:
+        key = f"{element_type}:{qualified}#{occurrence}"
+        occurrence += 1
+
+    elements[key] = ExtractedElement(
+        element_type=element_type,
+        name=qualified,
+        start_line=node.start_point[0] + 1,
+        end_line=node.end_point[0] + 1,
+        content=_text(node, source),
+        parent=parent,
+        metadata={"start_byte": node.start_byte, "end_byte": node.end_byte},
+    )
+
+
+def _add_class_shells(elements: dict[str, ExtractedElement], source: bytes) -> None:
+    """Store each class's text without its members, to detect class-level edits."""
+    for element in elements.values():
+        if element.element_type not in {"class", "interface"}:
+            continue
+        start, end = element.metadata["start_byte"], element.metadata["end_byte"]
+        members = sorted(
+            (m.metadata["start_byte"], m.metadata["end_byte"])
+            for m in elements.values()
+            if m.parent == element.name
+            and start <= m.metadata["start_byte"]
+            and m.metadata["end_byte"] <= end
+        )
+        pieces, cursor = [], start
+        for member_start, member_end in members:
+            pieces.append(source[cursor:member_start])
+            cursor = member_end
+        pieces.append(source[cursor:end])
+        shell = b"".join(pieces).decode("utf-8", "replace")
+        # Ignore the blank lines left behind where members were cut out
+        element.metadata["shell"] = "\n".join(
+            line.rstrip() for line in shell.splitlines() if line.strip()
+        )
+
+
+def _node_name(node: Any, source: bytes) -> str:
+    name_node = node.child_by_field_name("name")
+    return _text(name_node, source) if name_node is not None else ""
+
+
+def _go_receiver(node: Any, source: bytes) -> str | None:
+    receiver = node.child_by_field_name("receiver")
+    if receiver is None:
+        return None
+    for param in receiver.named_children:
+        type_node = param.child_by_field_name("type")
+        if type_node is not None:
+            return _text(type_node, source).lstrip("*")
+    return None
+
+
+def _text(node: Any, source: bytes) -> str:
+    return source[node.start_byte : node.end_byte].decode("utf-8", "replace")
+
+
+def analyze_with_tree_sitter(
+    file_path: str,
+    before: str,
+    after: str,
+    ext: str,
+) -> FileAnalysis | None:
+    """
+    Analyze code changes by comparing tree-sitter symbol tables.
+
+    Args:
+        file_path: Path to the file being analyzed
+        before: Content before changes
+        after: Content after changes
+        ext: File extension
+
+    Returns:
+        FileAnalysis with exact symbol spans, or None if tree-sitter or the
+        grammar for this extension is unavailable
+    """
+    # Normalize line endings to LF, matching the regex analyzer and file merger
+    before_normalized = before.replace("\r\n", "\n").replace("\r", "\n")
+    after_normalized = after.replace("\r\n", "\n").replace("\r", "\n")
+
+    before_elements = extract_elements(before_normalized, ext)
+    after_elements = extract_elements(after_normalized, ext)
+    if before_elements is None or after_elements is None:
+        return None
+
+    # A class whose only edits are inside its members isn't itself modified
+    compared_after = dict(after_elements)
+    for key, elem_after in after_elements.items():
+        elem_before = before_elements.get(key)
+        if (
+            elem_before is not None
+            and "shell" in elem_after.metadata
+            and elem_before.metadata.get("shell") == elem_after.metadata["shell"]
+        ):
+            compared_after[key] = elem_before
+
+    changes = compare_elements(before_elements, compared_after, ext)
+    for change in changes:
+        if change.change_type in {
+            ChangeType.ADD_IMPORT,
+            ChangeType.REMOVE_IMPORT,
+            ChangeType.MODIFY_IMPORT,
+        }:
+            # Same location the regex analyzer and import merging rules use
+            change.location = "file_top"
+    changes.sort(key=lambda c: (c.line_start, c.change_type.value, c.target))
+
+    analysis = FileAnalysis(file_path=file_path, changes=changes)
+    for change in changes:
+        if change.change_type == ChangeType.ADD_IMPORT:
+            analysis.imports_added.add(change.target)
+        elif change.change_type == ChangeType.REMOVE_IMPORT:
+            analysis.imports_removed.add(change.target)
+        elif change.change_type in {ChangeType.ADD_FUNCTION, ChangeType.ADD_METHOD}:
+            analysis.functions_added.add(change.target)
+        elif change.change_type in {
+            ChangeType.MODIFY_FUNCTION,
+            ChangeType.MODIFY_METHOD,
+            ChangeType.ADD_HOOK_CALL,
+            ChangeType.REMOVE_HOOK_CALL,
+            ChangeType.WRAP_JSX,
+            ChangeType.UNWRAP_JSX,
+            ChangeType.MODIFY_JSX_PROPS,
+        }:
+            analysis.functions_modified.add(change.target)
+        elif change.change_type == ChangeType.MODIFY_CLASS:
+            analysis.classes_modified.add(change.target)
+
+    analysis.total_lines_changed = sum(
+        1
+        for line in difflib.unified_diff(
+            before_normalized.splitlines(),
+            after_normalized.splitlines(),
+            lineterm="",
+            n=0,
+        )
+        if line[:1] in {"+", "-"} and not line.startswith(("+++", "---"))
+    )
+    return analysis
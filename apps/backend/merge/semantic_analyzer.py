@@ -2,7 +2,8 @@
 Semantic Analyzer
 =================
 
-Analyzes code changes at a semantic level using regex-based heuristics.
+Analyzes code changes at a semantic level using regex-based heuristics,
+or tree-sitter parsing when structural analysis is requested and available.
 
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
@@ -45,11 +46,25 @@ MODULE = "merge.semantic_analyzer"
 # Import regex-based analyzer
 from .semantic_analysis.models import ExtractedElement
 from .semantic_analysis.regex_analyzer import analyze_with_regex
+from .semantic_analysis.tree_sitter_analyzer import (
+    GRAMMARS,
+    TREE_SITTER_AVAILABLE,
+    analyze_with_tree_sitter,
+    is_language_supported,
+)
+
+# Whether the missing tree-sitter install has been reported
+_structural_fallback_logged = False
 
 
 class SemanticAnalyzer:
     """
-    Analyzes code changes at a semantic level using regex-based heuristics.
+    Analyzes code changes at a semantic level.
+
+    By default changes are detected with regex heuristics. With
+    structural=True, files in languages with an installed tree-sitter
+    grammar are parsed instead, giving exact spans for functions, classes,
+    methods and types; other files still use the regex analyzer.
 
     Example:
         analyzer = SemanticAnalyzer()
@@ -58,9 +73,27 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer."""
-        debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+    def __init__(self, structural: bool = False):
+        """
+        Initialize the analyzer.
+
+        Args:
+            structural: Use tree-sitter parsing where a grammar is available
+        """
+        self.structural = structural and TREE_SITTER_AVAILABLE
+        if structural and not TREE_SITTER_AVAILABLE:
+            global _structural_fallback_logged
+            if not _structural_fallback_logged:
+                _structural_fallback_logged = True
+                logger.info(
+                    "Structural analysis requested but tree-sitter is not "
+                    "installed; using regex-based analysis (see requirements.txt)"
+                )
+        debug(
+            MODULE,
+            "Initializing SemanticAnalyzer "
+            f"({'tree-sitter' if self.structural else 'regex-based'})",
+        )
 
     def analyze_diff(
         self,
@@ -93,8 +126,11 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
-        # Use regex-based analysis
-        analysis = analyze_with_regex(file_path, before, after, ext)
+        analysis = None
+        if self.structural:
+            analysis = analyze_with_tree_sitter(file_path, before, after, ext)
+        if analysis is None:
+            analysis = analyze_with_regex(file_path, before, after, ext)
 
         debug_success(
             MODULE,
@@ -137,7 +173,10 @@ class SemanticAnalyzer:
     @property
     def supported_extensions(self) -> set[str]:
         """Get the set of supported file extensions."""
-        return {".py", ".js", ".jsx", ".ts", ".tsx"}
+        extensions = {".py", ".js", ".jsx", ".ts", ".tsx"}
+        if self.structural:
+            extensions |= {ext for ext in GRAMMARS if is_language_supported(ext)}
+        return extensions
 
     def is_supported(self, file_path: str) -> bool:
         """Check if a file type is supported for semantic analysis."""
@@ -97,6 +97,29 @@ class TimelineGitHelper:
         except Exception:
             return None
 
+    def read_blob(self, object_id: str) -> str | None:
+        """
+        Read a blob by its git object id.
+
+        Args:
+            object_id: Git blob object id
+
+        Returns:
+            Blob content as string, or None if the object doesn't exist
+        """
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "blob", object_id],
+                cwd=self.project_path,
+                capture_output=True,
+                env=get_isolated_git_env(),
+            )
+            if result.returncode == 0:
+                return result.stdout.decode("utf-8", errors="replace")
+            return None
+        except Exception:
+            return None
+
     def get_files_changed_in_commit(self, commit_hash: str) -> list[str]:
         """
         Get list of files changed in a commit.
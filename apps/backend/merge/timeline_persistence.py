@@ -6,14 +6,20 @@ Storage and persistence for file timelines.
 
 This module handles:
 - Saving/loading timelines to/from disk
+- Content-addressed blob storage for file contents referenced by timelines
+- Loading timelines on demand instead of all at startup
 - Managing the timeline index
 - File path encoding for safe storage
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import zlib
+from collections.abc import Callable, Iterator, MutableMapping
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -35,51 +41,198 @@ except ImportError:
 MODULE = "merge.timeline_persistence"
 
 
+def compute_blob_id(content: str) -> str:
+    """Compute the git blob object id of content (as UTF-8)."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(
+        b"blob %d\0" % len(data) + data, usedforsecurity=False
+    ).hexdigest()
+
+
+class TimelineBlobStore:
+    """
+    Deduplicated, zlib-compressed storage of file contents keyed by blob id.
+
+    Blob ids are git object ids, so content that was committed can still be
+    read from the repository if its blob file is missing.
+    """
+
+    def __init__(
+        self,
+        blobs_dir: Path,
+        fallback_reader: Callable[[str], str | None] | None = None,
+    ):
+        """
+        Initialize the blob store.
+
+        Args:
+            blobs_dir: Directory holding the blob files
+            fallback_reader: Optional reader for blobs missing from the store
+                (e.g. TimelineGitHelper.read_blob)
+        """
+        self.blobs_dir = blobs_dir
+        self.fallback_reader = fallback_reader
+        self._known: set[str] = set()
+
+    def put(self, content: str) -> str:
+        """
+        Store content (once) and return its blob id.
+
+        Args:
+            content: File content
+
+        Returns:
+            The content's blob id
+        """
+        blob_id = compute_blob_id(content)
+        if blob_id in self._known:
+            return blob_id
+
+        blob_path = self._blob_path(blob_id)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f"{blob_id}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(zlib.compress(content.encode("utf-8")))
+            os.replace(tmp_path, blob_path)
+        self._known.add(blob_id)
+        return blob_id
+
+    def get(self, blob_id: str) -> str | None:
+        """
+        Read content by blob id.
+
+        Args:
+            blob_id: Id returned by put()
+
+        Returns:
+            The content, or None if it can't be found
+        """
+        blob_path = self._blob_path(blob_id)
+        try:
+            return zlib.decompress(blob_path.read_bytes()).decode("utf-8")
+        except FileNotFoundError:
+            pass
+        except (OSError, zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Corrupt timeline blob {blob_id}: {e}")
+
+        if self.fallback_reader is not None:
+            return self.fallback_reader(blob_id)
+        return None
+
+    def _blob_path(self, blob_id: str) -> Path:
+        return self.blobs_dir / blob_id[:2] / blob_id[2:]
+
+
+class LazyTimelines(MutableMapping):
+    """
+    Mapping of file path to FileTimeline that reads timelines on first access.
+
+    Membership, iteration and len() only use the index, so they never
+    touch timeline files.
+    """
+
+    def __init__(self, persistence: TimelinePersistence, file_paths: list[str]):
+        self._persistence = persistence
+        self._paths: dict[str, None] = dict.fromkeys(file_paths)
+        self._loaded: dict[str, FileTimeline] = {}
+
+    def __getitem__(self, file_path: str) -> FileTimeline:
+        timeline = self._loaded.get(file_path)
+        if timeline is not None:
+            return timeline
+        if file_path not in self._paths:
+            raise KeyError(file_path)
+
+        timeline = self._persistence.load_timeline(file_path)
+        if timeline is None:
+            # Indexed but unreadable - treat as untracked
+            del self._paths[file_path]
+            raise KeyError(file_path)
+        self._loaded[file_path] = timeline
+        return timeline
+
+    def __setitem__(self, file_path: str, timeline: FileTimeline) -> None:
+        self._paths[file_path] = None
+        self._loaded[file_path] = timeline
+
+    def __delitem__(self, file_path: str) -> None:
+        del self._paths[file_path]
+        self._loaded.pop(file_path, None)
+
+    def __contains__(self, file_path: object) -> bool:
+        return file_path in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._paths))
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def loaded_count(self) -> int:
+        """Number of timelines read into memory so far."""
+        return len(self._loaded)
+
+
 class TimelinePersistence:
     """
     Handles persistence of file timelines to disk.
 
     Timelines are stored as JSON files with an index for quick lookup.
+    File contents are kept out of the timeline JSON: events reference them
+    by blob id in a shared TimelineBlobStore under file-timelines/blobs/.
     """
 
-    def __init__(self, storage_path: Path):
+    # Content-bearing objects inside a serialized timeline
+    _CONTENT_KEY = "content"
+    _BLOB_KEY = "content_blob"
+
+    def __init__(
+        self,
+        storage_path: Path,
+        blob_fallback: Callable[[str], str | None] | None = None,
+    ):
         """
         Initialize the persistence layer.
 
         Args:
             storage_path: Directory for timeline storage (e.g., .auto-claude/)
+            blob_fallback: Optional reader for blobs missing from the store
         """
         self.storage_path = Path(storage_path).resolve()
         self.timelines_dir = self.storage_path / "file-timelines"
+        self.blobs = TimelineBlobStore(self.timelines_dir / "blobs", blob_fallback)
 
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
+        # In-memory copy of index.json: {file_path: [task_id, ...]}
+        self._index: dict[str, list[str]] | None = None
+
+    def open_timelines(self) -> LazyTimelines:
+        """
+        Open stored timelines for on-demand loading.
+
+        Returns:
+            Mapping of file_path to FileTimeline that loads on first access
+        """
+        timelines = LazyTimelines(self, list(self._load_index()))
+        debug(MODULE, f"Indexed {len(timelines)} timelines from storage")
+        return timelines
+
     def load_all_timelines(self) -> dict[str, FileTimeline]:
         """
-        Load all timelines from disk on startup.
+        Load all timelines from disk.
 
         Returns:
             Dictionary mapping file_path to FileTimeline objects
         """
-        from .timeline_models import FileTimeline
-
         timelines = {}
-        index_path = self.timelines_dir / "index.json"
-
-        if not index_path.exists():
-            return timelines
-
         try:
-            with open(index_path, encoding="utf-8") as f:
-                index = json.load(f)
-
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+            for file_path in self._load_index():
+                timeline = self.load_timeline(file_path)
+                if timeline is not None:
+                    timelines[file_path] = timeline
 
             debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
 
@@ -88,6 +241,30 @@ class TimelinePersistence:
 
         return timelines
 
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load a single timeline from disk.
+
+        Args:
+            file_path: The file path (used as key)
+
+        Returns:
+            The FileTimeline, or None if missing or unreadable
+        """
+        from .timeline_models import FileTimeline
+
+        timeline_file = self._get_timeline_file_path(file_path)
+        if not timeline_file.exists():
+            return None
+
+        try:
+            with open(timeline_file, encoding="utf-8") as f:
+                data = json.load(f)
+            return FileTimeline.from_dict(self._inline_contents(data))
+        except Exception as e:
+            logger.error(f"Failed to load timeline for {file_path}: {e}")
+            return None
+
     def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
         """
         Save a single timeline to disk.
@@ -101,8 +278,9 @@ class TimelinePersistence:
             timeline_file = self._get_timeline_file_path(file_path)
             timeline_file.parent.mkdir(parents=True, exist_ok=True)
 
+            data = self._extract_contents(timeline.to_dict())
             with open(timeline_file, "w", encoding="utf-8") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
+                json.dump(data, f, indent=2)
 
         except Exception as e:
             logger.error(f"Failed to persist timeline for {file_path}: {e}")
@@ -114,14 +292,105 @@ class TimelinePersistence:
         Args:
             file_paths: List of all file paths being tracked
         """
+        index = self._load_index()
+        updated = {path: index.get(path, []) for path in file_paths}
+        if list(updated.items()) != list(index.items()):
+            self._index = updated
+            self._write_index()
+
+    def update_index_entry(self, file_path: str, task_ids: list[str]) -> None:
+        """
+        Record one file's task ids in the index, writing only on change.
+
+        Args:
+            file_path: The file path (used as key)
+            task_ids: Tasks that have a view of this file
+        """
+        index = self._load_index()
+        if index.get(file_path) == task_ids:
+            return
+        index[file_path] = list(task_ids)
+        self._write_index()
+
+    def get_files_for_task(self, task_id: str) -> list[str]:
+        """
+        Get indexed files that a task has a view of, without loading timelines.
+
+        Args:
+            task_id: Unique task identifier
+
+        Returns:
+            List of file paths
+        """
+        return [path for path, tasks in self._load_index().items() if task_id in tasks]
+
+    def _load_index(self) -> dict[str, list[str]]:
+        """Read index.json once, upgrading the old list-only format."""
+        if self._index is not None:
+            return self._index
+
+        self._index = {}
+        index_path = self.timelines_dir / "index.json"
+        if not index_path.exists():
+            return self._index
+
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load timeline index: {e}")
+            return self._index
+
+        tasks = data.get("tasks")
+        for file_path in data.get("files", []):
+            if tasks is not None:
+                self._index[file_path] = tasks.get(file_path, [])
+            else:
+                # Old index without task ids - read them from the timeline once
+                timeline = self.load_timeline(file_path)
+                if timeline is not None:
+                    self._index[file_path] = list(timeline.task_views)
+        return self._index
+
+    def _write_index(self) -> None:
         index_path = self.timelines_dir / "index.json"
         index = {
-            "files": file_paths,
+            "files": list(self._index),
+            "tasks": self._index,
             "last_updated": datetime.now().isoformat(),
         }
         with open(index_path, "w", encoding="utf-8") as f:
             json.dump(index, f, indent=2)
 
+    def _content_holders(self, data: dict) -> Iterator[dict]:
+        """Yield every dict in a serialized timeline that carries file content."""
+        yield from data.get("main_branch_history", [])
+        for view in data.get("task_views", {}).values():
+            if view.get("branch_point"):
+                yield view["branch_point"]
+            if view.get("worktree_state"):
+                yield view["worktree_state"]
+
+    def _extract_contents(self, data: dict) -> dict:
+        """Move contents into the blob store, leaving blob ids behind."""
+        for holder in self._content_holders(data):
+            content = holder.pop(self._CONTENT_KEY, None)
+            if content is not None:
+                holder[self._BLOB_KEY] = self.blobs.put(content)
+        return data
+
+    def _inline_contents(self, data: dict) -> dict:
+        """Replace blob ids with contents (timelines written inline load as-is)."""
+        for holder in self._content_holders(data):
+            blob_id = holder.pop(self._BLOB_KEY, None)
+            if blob_id is not None:
+                content = self.blobs.get(blob_id)
+                if content is None:
+                    logger.warning(f"Missing timeline blob {blob_id}")
+                    content = ""
+                holder[self._CONTENT_KEY] = content
+        return data
+
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
         Get the storage path for a file's timeline.
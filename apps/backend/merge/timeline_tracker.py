@@ -13,6 +13,7 @@ This service is the "brain" of the intent-aware merge system. It:
 from __future__ import annotations
 
 import logging
+from collections.abc import MutableMapping
 from datetime import datetime
 from pathlib import Path
 
@@ -72,18 +73,19 @@ class FileTimelineTracker:
 
         # Initialize sub-components
         self.git = TimelineGitHelper(self.project_path)
-        self.persistence = TimelinePersistence(self.storage_path)
-
-        # In-memory cache of timelines
-        self._timelines: dict[str, FileTimeline] = {}
+        self.persistence = TimelinePersistence(
+            self.storage_path, blob_fallback=self.git.read_blob
+        )
 
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Timelines are read from disk on first access and cached in memory
+        self._timelines: MutableMapping[str, FileTimeline] = (
+            self.persistence.open_timelines()
+        )
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_indexed=len(self._timelines),
         )
 
     # =========================================================================
@@ -422,11 +424,12 @@ class FileTimelineTracker:
         Returns:
             List of file paths
         """
-        files = []
-        for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
-                files.append(file_path)
-        return files
+        # The index records each file's tasks, so no timeline has to be loaded
+        return [
+            file_path
+            for file_path in self.persistence.get_files_for_task(task_id)
+            if file_path in self._timelines
+        ]
 
     def get_pending_tasks_for_file(self, file_path: str) -> list[TaskFileView]:
         """
@@ -454,8 +457,8 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
-            task_view = timeline.get_task_view(task_id)
+        for file_path in self.get_files_for_task(task_id):
+            task_view = self._timelines[file_path].get_task_view(task_id)
             if task_view and task_view.status == "active":
                 drift[file_path] = task_view.commits_behind_main
         return drift
@@ -611,4 +614,4 @@ class FileTimelineTracker:
             return
 
         self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
+        self.persistence.update_index_entry(file_path, list(timeline.task_views))
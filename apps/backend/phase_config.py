@@ -104,6 +104,7 @@ class TaskMetadataConfig(TypedDict, total=False):
     model: str
     thinkingLevel: str
     fastMode: bool
+    maxParallelSubtasks: int
 
 
 Phase = Literal["spec", "planning", "coding", "qa"]
@@ -495,6 +496,31 @@ def get_fast_mode(spec_dir: Path) -> bool:
     return False
 
 
+def get_max_parallel_subtasks(spec_dir: Path) -> int:
+    """
+    Get how many independent subtasks the coder may run concurrently.
+
+    Reads maxParallelSubtasks from task_metadata.json, falling back to the
+    AUTO_CLAUDE_MAX_PARALLEL_SUBTASKS environment variable. Defaults to 1
+    (one subtask at a time).
+
+    Args:
+        spec_dir: Path to the spec directory
+
+    Returns:
+        Concurrency cap (at least 1)
+    """
+    metadata = load_task_metadata(spec_dir) or {}
+    value = metadata.get(
+        "maxParallelSubtasks", os.environ.get("AUTO_CLAUDE_MAX_PARALLEL_SUBTASKS", 1)
+    )
+    try:
+        return max(1, int(value))
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid maxParallelSubtasks value: {value!r}, using 1")
+        return 1
+
+
 def get_spec_phase_thinking_budget(phase_name: str) -> int:
     """
     Get the thinking budget for a specific spec runner phase.
@@ -8,12 +8,23 @@ Called from Node.js (Electron main process) via child_process.spawn().
 Usage:
     python query_memory.py get-status <db-path> <database>
     python query_memory.py get-memories <db-path> <database> [--limit N]
-    python query_memory.py search <db-path> <database> <query> [--limit N]
+    python query_memory.py search <db-path> <database> <query> [--limit N] [--offset N]
     python query_memory.py semantic-search <db-path> <database> <query> [--limit N]
     python query_memory.py get-entities <db-path> <database> [--limit N]
+    python query_memory.py serve [--workers N] [--idle-timeout SECONDS]
 
 Output:
     JSON to stdout with structure: {"success": bool, "data": ..., "error": ...}
+
+Server mode:
+    `serve` keeps databases and Graphiti clients open and answers
+    newline-delimited JSON-RPC 2.0 requests on stdin, one response per line
+    on stdout, so repeated queries skip the interpreter and database startup:
+
+        -> {"jsonrpc": "2.0", "id": 1, "method": "get-memories",
+            "params": {"db_path": "...", "database": "...", "limit": 20}}
+        <- {"jsonrpc": "2.0", "id": 1, "result": {"success": true, ...},
+            "latency_ms": 3.1}
 """
 
 import argparse
@@ -22,9 +33,16 @@ import json
 import os
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+# Set while running as a long-lived server (see run_server)
+_server = None
+
 
 # Apply LadybugDB monkeypatch BEFORE any graphiti imports
 def apply_monkeypatch():
@@ -61,17 +79,32 @@ def serialize_value(val):
     return val
 
 
-def output_json(success: bool, data=None, error: str = None):
-    """Output JSON result to stdout and exit."""
+def make_result(success: bool, data=None, error: str = None) -> dict:
+    """Build a command result: {"success": bool, "data": ..., "error": ...}."""
     result = {"success": success}
     if data is not None:
         result["data"] = data
     if error:
         result["error"] = error
+    return result
+
+
+def error_result(message: str) -> dict:
+    """Build a failed command result."""
+    return make_result(False, error=message)
+
+
+def output_result(result: dict):
+    """Output a command result as JSON to stdout and exit."""
     print(
         json.dumps(result, default=str)
     )  # Use default=str for any non-serializable types
-    sys.exit(0 if success else 1)
+    sys.exit(0 if result.get("success") else 1)
+
+
+def output_json(success: bool, data=None, error: str = None):
+    """Output JSON result to stdout and exit."""
+    output_result(make_result(success, data, error))
 
 
 def output_error(message: str):
@@ -79,6 +112,25 @@ def output_error(message: str):
     output_json(False, error=message)
 
 
+def _open_database(full_path: Path):
+    """
+    Open the kuzu Database at full_path.
+
+    In server mode the database stays open between requests; the returned
+    handle is only valid until the current request finishes.
+    """
+    if _server is not None:
+        return _server.acquire_database(full_path)
+
+    # Try to import kuzu (might be real_ladybug via monkeypatch or native)
+    try:
+        import kuzu
+    except ImportError:
+        import real_ladybug as kuzu
+
+    return kuzu.Database(str(full_path))
+
+
 def get_db_connection(db_path: str, database: str):
     """Get a database connection."""
     try:
@@ -92,7 +144,7 @@ def get_db_connection(db_path: str, database: str):
         if not full_path.exists():
             return None, f"Database not found at {full_path}"
 
-        db = kuzu.Database(str(full_path))
+        db = _open_database(full_path)
         conn = kuzu.Connection(db)
         return conn, None
     except Exception as e:
@@ -107,7 +159,7 @@ def cmd_get_status(args):
     # Check if kuzu/LadybugDB is available
     db_backend = apply_monkeypatch()
     if not db_backend:
-        output_json(
+        return make_result(
             True,
             data={
                 "available": False,
@@ -118,7 +170,6 @@ def cmd_get_status(args):
                 "message": "Neither kuzu nor LadybugDB is installed",
             },
         )
-        return
 
     full_path = db_path / database
     db_exists = full_path.exists()
@@ -145,7 +196,7 @@ def cmd_get_status(args):
             connected = False
             error = str(e)
 
-    output_json(
+    return make_result(
         True,
         data={
             "available": True,
@@ -163,13 +214,11 @@ def cmd_get_status(args):
 def cmd_get_memories(args):
     """Get episodic memories from the database."""
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return error_result("Neither kuzu nor LadybugDB is installed")
 
     conn, error = get_db_connection(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return error_result(error or "Failed to connect to database")
 
     try:
         limit = args.limit or 20
@@ -215,31 +264,154 @@ def cmd_get_memories(args):
 
             memories.append(memory)
 
-        output_json(True, data={"memories": memories, "count": len(memories)})
+        return make_result(True, data={"memories": memories, "count": len(memories)})
 
     except Exception as e:
         # Table might not exist yet
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0})
+            return make_result(True, data={"memories": [], "count": 0})
         else:
-            output_error(f"Query failed: {e}")
+            return error_result(f"Query failed: {e}")
+
+
+# Episodes fetched per query when bringing the keyword index up to date
+INDEX_SYNC_BATCH_SIZE = 500
+
+
+def _episode_memory(
+    uuid_val, name_val, created_at_val, content_val, description_val, group_id_val
+) -> dict:
+    """Build a memory dict from an episode's serialized fields."""
+    memory = {
+        "id": uuid_val or name_val or "unknown",
+        "name": name_val or "",
+        "type": infer_episode_type(name_val or "", content_val or ""),
+        "timestamp": created_at_val or datetime.now().isoformat(),
+        "content": content_val or description_val or name_val or "",
+        "description": description_val or "",
+        "group_id": group_id_val or "",
+    }
+
+    session_num = extract_session_number(name_val or "")
+    if session_num:
+        memory["session_number"] = session_num
+
+    return memory
+
+
+def _fetch_index_records(conn, uuids: list[str]):
+    """Yield episode index records for the given UUIDs."""
+    query = """
+        MATCH (e:Episodic)
+        WHERE e.uuid IN $uuids
+        RETURN e.uuid, e.name, e.content, e.source_description, e.group_id,
+               e.created_at
+    """
+    for start in range(0, len(uuids), INDEX_SYNC_BATCH_SIZE):
+        result = conn.execute(
+            query,
+            parameters={"uuids": uuids[start : start + INDEX_SYNC_BATCH_SIZE]},
+        )
+        while result.has_next():
+            row = result.get_next()
+            yield {
+                "uuid": serialize_value(row[0]),
+                "name": serialize_value(row[1]),
+                "content": serialize_value(row[2]),
+                "source_description": serialize_value(row[3]),
+                "group_id": serialize_value(row[4]),
+                "created_at": serialize_value(row[5]),
+            }
+
+
+def _sync_episode_index(conn, index) -> None:
+    """Index episodes that were saved without updating the keyword index."""
+    result = conn.execute("MATCH (e:Episodic) RETURN count(e)")
+    graph_count = result.get_next()[0] if result.has_next() else 0
+    if graph_count == index.count():
+        return
+
+    result = conn.execute("MATCH (e:Episodic) RETURN e.uuid")
+    graph_uuids = set()
+    while result.has_next():
+        graph_uuids.add(serialize_value(result.get_next()[0]))
+    index.sync(graph_uuids, lambda uuids: _fetch_index_records(conn, uuids))
+
+
+def _indexed_search(conn, args, limit: int, offset: int):
+    """
+    Search the episode full-text index, syncing it with the graph first.
+
+    Returns:
+        SearchPage, or None if the index can't answer this query
+    """
+    try:
+        import sqlite3
+
+        from integrations.graphiti.episode_index import EpisodeIndex, build_match_query
+    except ImportError:
+        return None
+
+    if build_match_query(args.query) is None:
+        return None
+
+    try:
+        with EpisodeIndex.for_database(Path(args.db_path) / args.database) as index:
+            _sync_episode_index(conn, index)
+            return index.search(args.query, limit=limit, offset=offset)
+    except sqlite3.Error as e:
+        sys.stderr.write(f"Episode index unavailable, scanning instead: {e}\n")
+        return None
 
 
 def cmd_search(args):
-    """Search memories by keyword."""
+    """
+    Search memories by keyword.
+
+    Results come from the episode full-text index, ranked by BM25 score. If
+    the index can't be used, every episode is scanned for the query as a
+    substring instead (newest first, score 1.0).
+    """
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return error_result("Neither kuzu nor LadybugDB is installed")
 
     conn, error = get_db_connection(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return error_result(error or "Failed to connect to database")
 
     try:
         limit = args.limit or 20
+        # semantic-search falls back to this command without an offset
+        offset = getattr(args, "offset", 0) or 0
+
+        page = _indexed_search(conn, args, limit, offset)
+        if page is not None:
+            memories = []
+            for episode in page.episodes:
+                memory = _episode_memory(
+                    episode["uuid"],
+                    episode["name"],
+                    episode["created_at"],
+                    episode["content"],
+                    episode["source_description"],
+                    episode["group_id"],
+                )
+                memory["score"] = episode["score"]
+                memories.append(memory)
+
+            return make_result(
+                True,
+                data={
+                    "memories": memories,
+                    "count": len(memories),
+                    "query": args.query,
+                    "total": page.total,
+                    "offset": offset,
+                },
+            )
+
         search_query = args.query.lower()
 
         # Search in episodic nodes using CONTAINS with parameterized query
@@ -252,11 +424,13 @@ def cmd_search(args):
                    e.content as content, e.source_description as description,
                    e.group_id as group_id
             ORDER BY e.created_at DESC
+            SKIP $offset
             LIMIT $limit
         """
 
         result = conn.execute(
-            query, parameters={"search_query": search_query, "limit": limit}
+            query,
+            parameters={"search_query": search_query, "offset": offset, "limit": limit},
         )
 
         # Process results without pandas
@@ -264,31 +438,11 @@ def cmd_search(args):
         while result.has_next():
             row = result.get_next()
             # Row order: uuid, name, created_at, content, description, group_id
-            uuid_val = serialize_value(row[0]) if len(row) > 0 else None
-            name_val = serialize_value(row[1]) if len(row) > 1 else ""
-            created_at_val = serialize_value(row[2]) if len(row) > 2 else None
-            content_val = serialize_value(row[3]) if len(row) > 3 else ""
-            description_val = serialize_value(row[4]) if len(row) > 4 else ""
-            group_id_val = serialize_value(row[5]) if len(row) > 5 else ""
-
-            memory = {
-                "id": uuid_val or name_val or "unknown",
-                "name": name_val or "",
-                "type": infer_episode_type(name_val or "", content_val or ""),
-                "timestamp": created_at_val or datetime.now().isoformat(),
-                "content": content_val or description_val or name_val or "",
-                "description": description_val or "",
-                "group_id": group_id_val or "",
-                "score": 1.0,  # Keyword match score
-            }
-
-            session_num = extract_session_number(name_val or "")
-            if session_num:
-                memory["session_number"] = session_num
-
+            memory = _episode_memory(*(serialize_value(value) for value in row[:6]))
+            memory["score"] = 1.0  # Keyword match score
             memories.append(memory)
 
-        output_json(
+        return make_result(
             True,
             data={"memories": memories, "count": len(memories), "query": args.query},
         )
@@ -297,9 +451,11 @@ def cmd_search(args):
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0, "query": args.query})
+            return make_result(
+                True, data={"memories": [], "count": 0, "query": args.query}
+            )
         else:
-            output_error(f"Search failed: {e}")
+            return error_result(f"Search failed: {e}")
 
 
 def cmd_semantic_search(args):
@@ -320,9 +476,12 @@ def cmd_semantic_search(args):
 
     # Try semantic search
     try:
-        result = asyncio.run(_async_semantic_search(args))
+        if _server is None:
+            result = asyncio.run(_async_semantic_search(args))
+        else:
+            result = _server.semantic_search(args)
         if result.get("success"):
-            output_json(True, data=result.get("data"))
+            return make_result(True, data=result.get("data"))
         else:
             # Semantic search failed, fall back to keyword search
             return cmd_search(args)
@@ -332,31 +491,52 @@ def cmd_semantic_search(args):
         return cmd_search(args)
 
 
-async def _async_semantic_search(args):
-    """Async implementation of semantic search using GraphitiClient."""
+def _graphiti_config(db_path: str, database: str):
+    """Create a GraphitiConfig from the environment for the given database."""
+    # Add auto-claude to path for imports
+    auto_claude_dir = Path(__file__).parent
+    if str(auto_claude_dir) not in sys.path:
+        sys.path.insert(0, str(auto_claude_dir))
+
+    from integrations.graphiti.config import GraphitiConfig
+
+    # Create config from environment
+    config = GraphitiConfig.from_env()
+
+    # Override database location from CLI args
+    # Note: We only override db_path/database for CLI-specified locations.
+    # The config.enabled flag is respected - if the user has disabled memory,
+    # this CLI tool should not be used. The caller (main()) routes to this
+    # function only when semantic-search command is explicitly requested.
+    config.db_path = db_path
+    config.database = database
+    return config
+
+
+async def _open_graphiti_client(db_path: str, database: str):
+    """Create and initialize a GraphitiClient, raising if it can't connect."""
+    from integrations.graphiti.queries_pkg.client import GraphitiClient
+
+    client = GraphitiClient(_graphiti_config(db_path, database))
+    if not await client.initialize():
+        raise RuntimeError("Failed to initialize Graphiti client")
+    return client
+
+
+async def _async_semantic_search(args, client=None):
+    """
+    Async implementation of semantic search using GraphitiClient.
+
+    Args:
+        args: Parsed command arguments
+        client: Initialized GraphitiClient to reuse (server mode). If None, a
+            client is created for this search and closed afterwards.
+    """
     if not apply_monkeypatch():
         return {"success": False, "error": "LadybugDB not installed"}
 
     try:
-        # Add auto-claude to path for imports
-        auto_claude_dir = Path(__file__).parent
-        if str(auto_claude_dir) not in sys.path:
-            sys.path.insert(0, str(auto_claude_dir))
-
-        # Import Graphiti components
-        from integrations.graphiti.config import GraphitiConfig
-        from integrations.graphiti.queries_pkg.client import GraphitiClient
-
-        # Create config from environment
-        config = GraphitiConfig.from_env()
-
-        # Override database location from CLI args
-        # Note: We only override db_path/database for CLI-specified locations.
-        # The config.enabled flag is respected - if the user has disabled memory,
-        # this CLI tool should not be used. The caller (main()) routes to this
-        # function only when semantic-search command is explicitly requested.
-        config.db_path = args.db_path
-        config.database = args.database
+        config = _graphiti_config(args.db_path, args.database)
 
         # Validate embedder configuration using public API
         validation_errors = config.get_validation_errors()
@@ -366,12 +546,9 @@ async def _async_semantic_search(args):
                 "error": f"Embedder provider not properly configured: {'; '.join(validation_errors)}",
             }
 
-        # Initialize client
-        client = GraphitiClient(config)
-        initialized = await client.initialize()
-
-        if not initialized:
-            return {"success": False, "error": "Failed to initialize Graphiti client"}
+        owns_client = client is None
+        if owns_client:
+            client = await _open_graphiti_client(args.db_path, args.database)
 
         try:
             # Perform semantic search using Graphiti
@@ -443,7 +620,8 @@ async def _async_semantic_search(args):
             }
 
         finally:
-            await client.close()
+            if owns_client:
+                await client.close()
 
     except ImportError as e:
         return {"success": False, "error": f"Missing dependencies: {e}"}
@@ -454,13 +632,11 @@ async def _async_semantic_search(args):
 def cmd_get_entities(args):
     """Get entity memories (patterns, gotchas, etc.) from the database."""
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return error_result("Neither kuzu nor LadybugDB is installed")
 
     conn, error = get_db_connection(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return error_result(error or "Failed to connect to database")
 
     try:
         limit = args.limit or 20
@@ -498,15 +674,15 @@ def cmd_get_entities(args):
             }
             entities.append(entity)
 
-        output_json(True, data={"entities": entities, "count": len(entities)})
+        return make_result(True, data={"entities": entities, "count": len(entities)})
 
     except Exception as e:
         if "Entity" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"entities": [], "count": 0})
+            return make_result(True, data={"entities": [], "count": 0})
         else:
-            output_error(f"Query failed: {e}")
+            return error_result(f"Query failed: {e}")
 
 
 def cmd_add_episode(args):
@@ -525,8 +701,7 @@ def cmd_add_episode(args):
         args.group_id: Optional group ID for namespacing
     """
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return error_result("Neither kuzu nor LadybugDB is installed")
 
     try:
         import uuid as uuid_module
@@ -559,7 +734,7 @@ def cmd_add_episode(args):
             Path(args.db_path).mkdir(parents=True, exist_ok=True)
 
         # Open database (creates it if it doesn't exist)
-        db = kuzu.Database(str(full_path))
+        db = _open_database(full_path)
         conn = kuzu.Connection(db)
 
         # Always try to create the Episodic table if it doesn't exist
@@ -604,7 +779,27 @@ def cmd_add_episode(args):
                 },
             )
 
-            output_json(
+            # Keep the keyword index current; a miss is caught up on next search
+            try:
+                from integrations.graphiti.episode_index import index_episodes
+
+                index_episodes(
+                    full_path,
+                    [
+                        {
+                            "uuid": episode_uuid,
+                            "name": args.name,
+                            "content": content,
+                            "source_description": f"[{args.episode_type}] {args.name}",
+                            "group_id": args.group_id or "",
+                            "created_at": created_at,
+                        }
+                    ],
+                )
+            except ImportError:
+                pass
+
+            return make_result(
                 True,
                 data={
                     "id": episode_uuid,
@@ -615,10 +810,10 @@ def cmd_add_episode(args):
             )
 
         except Exception as e:
-            output_error(f"Failed to insert episode: {e}")
+            return error_result(f"Failed to insert episode: {e}")
 
     except Exception as e:
-        output_error(f"Failed to add episode: {e}")
+        return error_result(f"Failed to add episode: {e}")
 
 
 def infer_episode_type(name: str, content: str = "") -> str:
@@ -665,6 +860,433 @@ def extract_session_number(name: str) -> int | None:
     return None
 
 
+# Route to command handler
+COMMANDS = {
+    "get-status": cmd_get_status,
+    "get-memories": cmd_get_memories,
+    "search": cmd_search,
+    "semantic-search": cmd_semantic_search,
+    "get-entities": cmd_get_entities,
+    "add-episode": cmd_add_episode,
+}
+
+
+# =============================================================================
+# SERVER MODE
+# =============================================================================
+
+# Seconds an unused database stays open. An open database holds its file lock,
+# so this is kept short to let agent sessions write between UI bursts.
+DEFAULT_IDLE_TIMEOUT = 10.0
+DEFAULT_SERVER_WORKERS = 4
+
+# Request params per command in server mode: (required names, optional defaults)
+COMMAND_PARAMS = {
+    "get-status": (("db_path", "database"), {}),
+    "get-memories": (("db_path", "database"), {"limit": 20}),
+    "search": (("db_path", "database", "query"), {"limit": 20, "offset": 0}),
+    "semantic-search": (("db_path", "database", "query"), {"limit": 20}),
+    "get-entities": (("db_path", "database"), {"limit": 20}),
+    "add-episode": (
+        ("db_path", "database", "name", "content"),
+        {"episode_type": "session_insight", "group_id": None},
+    ),
+}
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+
+def _close_database(db) -> None:
+    """Close a kuzu Database if the installed version supports it."""
+    close = getattr(db, "close", None)
+    if close is not None:
+        close()
+
+
+def params_to_args(command: str, params: dict) -> argparse.Namespace:
+    """
+    Convert server request params into the args a command handler expects.
+
+    Raises:
+        ValueError: If params are missing, unknown or of the wrong type
+    """
+    if not isinstance(params, dict):
+        raise ValueError("params must be an object")
+
+    required, defaults = COMMAND_PARAMS[command]
+    missing = [name for name in required if params.get(name) in (None, "")]
+    if missing:
+        raise ValueError(f"Missing required params: {', '.join(missing)}")
+    unknown = sorted(set(params) - set(required) - set(defaults))
+    if unknown:
+        raise ValueError(f"Unknown params: {', '.join(unknown)}")
+
+    values = {**defaults, **params}
+    limit = values.get("limit")
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int)):
+        raise ValueError("limit must be an integer")
+    return argparse.Namespace(command=command, **values)
+
+
+class _WarmHandle:
+    """An open database handle shared by concurrent requests."""
+
+    def __init__(self, kind: str, close):
+        self.kind = kind
+        self.close = close
+        self.handle = None
+        self.ready = False
+        self.draining = False
+        self.users = 1
+        self.last_used = time.monotonic()
+
+
+class WarmHandles:
+    """
+    Database handles kept open between server requests, one per database path.
+
+    A database is opened either directly ("kuzu") or through a GraphitiClient
+    ("graphiti"), never both at once: kuzu allows a single read-write Database
+    per path. Switching kinds waits for in-flight users and closes the old
+    handle first. Handles unused for idle_timeout seconds are closed by
+    reap_idle().
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._handles: dict[str, _WarmHandle] = {}
+        self._cond = threading.Condition()
+
+    def acquire(self, key: str, kind: str, open_handle, close_handle):
+        """
+        Get the open handle for key, opening it if needed.
+
+        Every successful acquire() must be paired with release(key).
+
+        Args:
+            key: Resolved database path
+            kind: Handle kind ("kuzu" or "graphiti")
+            open_handle: Callable returning a new handle
+            close_handle: Callable closing a handle returned by open_handle
+        """
+        with self._cond:
+            while True:
+                entry = self._handles.get(key)
+                if entry is None:
+                    entry = _WarmHandle(kind, close_handle)
+                    self._handles[key] = entry
+                    break
+                if entry.kind == kind and entry.ready and not entry.draining:
+                    entry.users += 1
+                    return entry.handle
+                if entry.kind != kind:
+                    if entry.ready and entry.users == 0:
+                        self._close(key, entry)
+                        continue
+                    # Stop handing out the old kind so it can be closed
+                    entry.draining = True
+                self._cond.wait()
+
+        # Open outside the lock so other databases stay usable meanwhile
+        try:
+            handle = open_handle()
+        except BaseException:
+            with self._cond:
+                del self._handles[key]
+                self._cond.notify_all()
+            raise
+
+        with self._cond:
+            entry.handle = handle
+            entry.ready = True
+            self._cond.notify_all()
+        return handle
+
+    def release(self, key: str) -> None:
+        """Release a handle obtained from acquire()."""
+        with self._cond:
+            entry = self._handles[key]
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            if entry.users == 0:
+                self._cond.notify_all()
+
+    @contextmanager
+    def lease(self, key: str, kind: str, open_handle, close_handle):
+        """Context manager around acquire() and release()."""
+        handle = self.acquire(key, kind, open_handle, close_handle)
+        try:
+            yield handle
+        finally:
+            self.release(key)
+
+    def reap_idle(self) -> int:
+        """Close handles unused for idle_timeout seconds. Returns how many."""
+        now = time.monotonic()
+        with self._cond:
+            idle = [
+                (key, entry)
+                for key, entry in self._handles.items()
+                if entry.ready
+                and entry.users == 0
+                and now - entry.last_used >= self.idle_timeout
+            ]
+            for key, entry in idle:
+                self._close(key, entry)
+            if idle:
+                self._cond.notify_all()
+        return len(idle)
+
+    def close_all(self) -> None:
+        """Close every handle that isn't in use."""
+        with self._cond:
+            for key, entry in list(self._handles.items()):
+                if entry.ready and entry.users == 0:
+                    self._close(key, entry)
+            self._cond.notify_all()
+
+    def open_databases(self) -> dict[str, str]:
+        """Return {path: kind} for the currently open handles."""
+        with self._cond:
+            return {
+                key: entry.kind for key, entry in self._handles.items() if entry.ready
+            }
+
+    def _close(self, key: str, entry: _WarmHandle) -> None:
+        # Caller holds the lock, so the path can't be reopened until closed
+        del self._handles[key]
+        try:
+            entry.close(entry.handle)
+        except Exception as e:
+            sys.stderr.write(f"Failed to close {entry.kind} handle for {key}: {e}\n")
+
+
+class MemoryQueryServer:
+    """
+    Long-lived memory query server speaking newline-delimited JSON-RPC 2.0.
+
+    Each request line is {"jsonrpc": "2.0", "id": ..., "method": <command>,
+    "params": {...}} where method is one of the CLI commands and params are
+    the CLI arguments by name (db_path, database, query, limit, ...). The
+    response carries the exact JSON the CLI would print as "result", plus
+    the request's "latency_ms". The "stats" method reports per-command
+    latency and the open databases.
+
+    Requests run concurrently on a thread pool. Databases and Graphiti clients
+    (with their embedders) stay open between requests; async work runs on
+    one background event loop so clients stay bound to the loop that
+    created them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_SERVER_WORKERS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        output=None,
+    ):
+        self.handles = WarmHandles(idle_timeout)
+        self._output = output or sys.stdout
+        self._write_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="memory-query"
+        )
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="memory-query-loop", daemon=True
+        )
+        self._loop_thread.start()
+        self._stopping = threading.Event()
+        self._reaper = threading.Thread(
+            target=self._reap_idle, name="memory-query-reaper", daemon=True
+        )
+        self._reaper.start()
+        self._request_state = threading.local()
+        self._stats_lock = threading.Lock()
+        self._latency: dict[str, dict] = {}
+
+    def run_async(self, coro):
+        """Run a coroutine on the server's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def acquire_database(self, full_path: Path):
+        """Get the warm kuzu Database for full_path for the current request."""
+        try:
+            import kuzu
+        except ImportError:
+            import real_ladybug as kuzu
+
+        key = str(Path(full_path).resolve())
+        db = self.handles.acquire(
+            key, "kuzu", lambda: kuzu.Database(key), _close_database
+        )
+        self._request_state.leases.append(key)
+        return db
+
+    def semantic_search(self, args) -> dict:
+        """Run a semantic search with the warm Graphiti client for the database."""
+        key = str((Path(args.db_path) / args.database).resolve())
+        with self.handles.lease(
+            key,
+            "graphiti",
+            lambda: self.run_async(_open_graphiti_client(args.db_path, args.database)),
+            lambda client: self.run_async(client.close()),
+        ) as client:
+            return self.run_async(_async_semantic_search(args, client))
+
+    def handle_request(self, request: dict) -> dict:
+        """Execute one request and return its JSON-RPC response."""
+        request_id = request.get("id")
+        method = request.get("method")
+
+        if method == "stats":
+            return self._response(request_id, make_result(True, data=self.stats()))
+        if method not in COMMANDS:
+            return self._error(
+                request_id, METHOD_NOT_FOUND, f"Unknown method: {method}"
+            )
+        try:
+            args = params_to_args(method, request.get("params", {}))
+        except ValueError as e:
+            return self._error(request_id, INVALID_PARAMS, str(e))
+
+        start = time.perf_counter()
+        self._request_state.leases = []
+        try:
+            result = COMMANDS[method](args)
+        except Exception as e:
+            result = error_result(f"{method} failed: {e}")
+        finally:
+            for key in self._request_state.leases:
+                self.handles.release(key)
+            self._request_state.leases = []
+        latency_ms = (time.perf_counter() - start) * 1000
+
+        self._record_latency(method, latency_ms, result.get("success", False))
+        response = self._response(request_id, result)
+        response["latency_ms"] = round(latency_ms, 2)
+        return response
+
+    def stats(self) -> dict:
+        """Per-command request counts and latency, plus open databases."""
+        with self._stats_lock:
+            commands = {
+                method: {
+                    "count": s["count"],
+                    "errors": s["errors"],
+                    "avg_ms": round(s["total_ms"] / s["count"], 2),
+                    "max_ms": round(s["max_ms"], 2),
+                }
+                for method, s in self._latency.items()
+            }
+        return {"commands": commands, "open_databases": self.handles.open_databases()}
+
+    def serve(self, input_stream=None) -> None:
+        """Serve requests from input_stream (stdin) until it is closed."""
+        input_stream = input_stream or sys.stdin
+        self._write(
+            {"jsonrpc": "2.0", "method": "ready", "params": {"pid": os.getpid()}}
+        )
+        try:
+            for line in input_stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self._write(self._error(None, PARSE_ERROR, f"Parse error: {e}"))
+                    continue
+                if not isinstance(request, dict):
+                    self._write(
+                        self._error(None, INVALID_REQUEST, "Request must be an object")
+                    )
+                    continue
+                self._executor.submit(self._serve_request, request)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Wait for in-flight requests, then close all databases."""
+        self._executor.shutdown(wait=True)
+        self._stopping.set()
+        self._reaper.join()
+        # Graphiti clients close on the loop, so it must still be running
+        self.handles.close_all()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+
+    def _serve_request(self, request: dict) -> None:
+        try:
+            response = self.handle_request(request)
+        except Exception as e:
+            response = self._response(request.get("id"), error_result(str(e)))
+        # Requests without an id are notifications and get no response
+        if "id" in request:
+            self._write(response)
+
+    def _reap_idle(self) -> None:
+        interval = min(self.handles.idle_timeout, 1.0)
+        while not self._stopping.wait(interval):
+            self.handles.reap_idle()
+
+    def _record_latency(self, method: str, latency_ms: float, success: bool) -> None:
+        with self._stats_lock:
+            s = self._latency.setdefault(
+                method, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            s["count"] += 1
+            s["total_ms"] += latency_ms
+            s["max_ms"] = max(s["max_ms"], latency_ms)
+            if not success:
+                s["errors"] += 1
+
+    def _write(self, message: dict) -> None:
+        line = json.dumps(message, default=str)
+        with self._write_lock:
+            self._output.write(line + "\n")
+            self._output.flush()
+
+    @staticmethod
+    def _response(request_id, result: dict) -> dict:
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+
+def run_server(args):
+    """Run the memory query server on stdin/stdout until stdin is closed."""
+    global _server
+
+    # Apply the LadybugDB monkeypatch before any graphiti import
+    apply_monkeypatch()
+
+    # Keep stray prints from libraries out of the protocol stream
+    protocol_output = sys.stdout
+    sys.stdout = sys.stderr
+
+    _server = MemoryQueryServer(
+        max_workers=args.workers,
+        idle_timeout=args.idle_timeout,
+        output=protocol_output,
+    )
+    try:
+        _server.serve(sys.stdin)
+    finally:
+        _server = None
+        sys.stdout = protocol_output
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Query LadybugDB memory database for auto-claude-ui"
@@ -692,6 +1314,9 @@ def main():
     search_parser.add_argument("database", help="Database name")
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--limit", type=int, default=20, help="Maximum results")
+    search_parser.add_argument(
+        "--offset", type=int, default=0, help="Number of results to skip"
+    )
 
     # semantic-search command
     semantic_parser = subparsers.add_parser(
@@ -734,6 +1359,24 @@ def main():
         "--group-id", dest="group_id", help="Optional group ID for namespacing"
     )
 
+    # serve command (long-lived JSON-RPC server for the Electron app)
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve newline-delimited JSON-RPC requests on stdin/stdout",
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SERVER_WORKERS,
+        help="Maximum concurrent requests",
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DEFAULT_IDLE_TIMEOUT,
+        help="Seconds before an unused database is closed",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -741,19 +1384,13 @@ def main():
         output_error("No command specified")
         return
 
-    # Route to command handler
-    commands = {
-        "get-status": cmd_get_status,
-        "get-memories": cmd_get_memories,
-        "search": cmd_search,
-        "semantic-search": cmd_semantic_search,
-        "get-entities": cmd_get_entities,
-        "add-episode": cmd_add_episode,
-    }
+    if args.command == "serve":
+        run_server(args)
+        return
 
-    handler = commands.get(args.command)
+    handler = COMMANDS.get(args.command)
     if handler:
-        handler(args)
+        output_result(handler(args))
     else:
         output_error(f"Unknown command: {args.command}")
 
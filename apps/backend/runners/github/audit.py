@@ -11,6 +11,7 @@ Features:
 - Actor tracking (user/bot/automation)
 - Duration and token usage tracking
 - Log rotation with configurable retention
+- Sidecar indexes for fast filtered queries and statistics (see audit_index)
 """
 
 from __future__ import annotations
@@ -26,6 +27,23 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .audit_index import (
+        AuditFileIndex,
+        add_to_stats,
+        empty_stats,
+        index_path,
+        merge_stats,
+    )
+except (ImportError, ValueError, SystemError):
+    from audit_index import (
+        AuditFileIndex,
+        add_to_stats,
+        empty_stats,
+        index_path,
+        merge_stats,
+    )
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -193,6 +211,9 @@ class AuditLogger:
 
     _instance: AuditLogger | None = None
 
+    # Appended entries between saves of the current file's index
+    INDEX_SAVE_INTERVAL = 50
+
     def __init__(
         self,
         log_dir: Path | None = None,
@@ -213,6 +234,8 @@ class AuditLogger:
         self.retention_days = retention_days
         self.max_file_size_mb = max_file_size_mb
         self.enabled = enabled
+        self._indexes: dict[Path, AuditFileIndex] = {}
+        self._unsaved_writes = 0
 
         if enabled:
             self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -253,7 +276,13 @@ class AuditLogger:
                 # Rotate: add timestamp suffix
                 timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
                 rotated = log_file.with_suffix(f".{timestamp}.jsonl")
+                self._save_index(log_file)
                 log_file.rename(rotated)
+                self._indexes.pop(log_file, None)
+                try:
+                    index_path(log_file).rename(index_path(rotated))
+                except OSError:
+                    pass  # Rebuilt from the rotated log on first query
                 logger.info(f"Rotated audit log to {rotated}")
 
         self._current_log_file = log_file
@@ -270,6 +299,8 @@ class AuditLogger:
         for log_file in self.log_dir.glob("audit_*.jsonl"):
             if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
+                self._indexes.pop(log_file, None)
+                index_path(log_file).unlink(missing_ok=True)
                 logger.info(f"Deleted old audit log: {log_file}")
 
     def generate_correlation_id(self) -> str:
@@ -369,10 +400,83 @@ class AuditLogger:
 
         try:
             log_file = self._get_log_file_path()
+            line = entry.to_json() + "\n"
             with open(log_file, "a", encoding="utf-8") as f:
-                f.write(entry.to_json() + "\n")
+                offset = f.tell()
+                f.write(line)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
+            return
+
+        try:
+            index = self._get_index(log_file, refresh=False)
+            index.add_entry(entry.to_dict(), offset, offset + len(line.encode("utf-8")))
+            self._unsaved_writes += 1
+            if self._unsaved_writes >= self.INDEX_SAVE_INTERVAL:
+                self._save_index(log_file)
+        except Exception as e:
+            # Unindexed entries are picked up from the log on the next load
+            logger.warning(f"Failed to index audit entry: {e}")
+
+    def _get_index(self, log_file: Path, refresh: bool = True) -> AuditFileIndex:
+        """
+        Index for a log file, loaded once per process.
+
+        Args:
+            refresh: Index entries other processes appended since last use
+        """
+        index = self._indexes.get(log_file)
+        if index is None:
+            index = AuditFileIndex.load(log_file)
+            self._indexes[log_file] = index
+        elif refresh:
+            index.catch_up()
+        return index
+
+    def _save_index(self, log_file: Path) -> None:
+        index = self._indexes.get(log_file)
+        if index is not None:
+            index.save()
+        self._unsaved_writes = 0
+
+    def flush_indexes(self) -> None:
+        """Persist all loaded log indexes."""
+        for index in self._indexes.values():
+            index.save()
+        self._unsaved_writes = 0
+
+    def _log_files(self) -> list[Path]:
+        """Log files, newest first."""
+        return sorted(self.log_dir.glob("audit_*.jsonl"), reverse=True)
+
+    def _read_entries(
+        self, log_file: Path, index: AuditFileIndex, offsets: list[int] | None
+    ):
+        """
+        Yield (offset, entry dict) for lines at ``offsets`` (every line if None).
+
+        Only the covered part of the log is read, so entries appended
+        concurrently are never seen by half of a query.
+        """
+        with open(log_file, "rb") as f:
+            if offsets is None:
+                offset = 0
+                for line in f:
+                    if offset >= index.size:
+                        break
+                    start, offset = offset, offset + len(line)
+                    if line.strip():
+                        try:
+                            yield start, json.loads(line)
+                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            continue
+                return
+            for offset in offsets:
+                f.seek(offset)
+                try:
+                    yield offset, json.loads(f.readline())
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
 
     @contextmanager
     def operation(
@@ -581,65 +685,70 @@ class AuditLogger:
         if not self.enabled or not self.log_dir.exists():
             return []
 
+        filters = {
+            "correlation_id": correlation_id,
+            "action": action.value if action else None,
+            "repo": repo,
+            "pr_number": pr_number,
+            "issue_number": issue_number,
+        }
         results = []
 
-        for log_file in sorted(self.log_dir.glob("audit_*.jsonl"), reverse=True):
+        for log_file in self._log_files():
             try:
-                with open(log_file, encoding="utf-8") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
+                index = self._get_index(log_file)
+                if since and index.ends_before(since):
+                    continue
 
-                        try:
-                            data = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
+                offsets = index.candidates(filters)
+                if offsets == []:
+                    continue
 
-                        # Apply filters
-                        if (
-                            correlation_id
-                            and data.get("correlation_id") != correlation_id
-                        ):
-                            continue
-                        if action and data.get("action") != action.value:
-                            continue
-                        if repo and data.get("repo") != repo:
-                            continue
-                        if pr_number and data.get("pr_number") != pr_number:
-                            continue
-                        if issue_number and data.get("issue_number") != issue_number:
-                            continue
-                        if since:
-                            entry_time = datetime.fromisoformat(data["timestamp"])
-                            if entry_time < since:
-                                continue
-
-                        # Reconstruct entry
-                        entry = AuditEntry(
-                            timestamp=datetime.fromisoformat(data["timestamp"]),
-                            correlation_id=data["correlation_id"],
-                            action=AuditAction(data["action"]),
-                            actor_type=ActorType(data["actor_type"]),
-                            actor_id=data.get("actor_id"),
-                            repo=data.get("repo"),
-                            pr_number=data.get("pr_number"),
-                            issue_number=data.get("issue_number"),
-                            result=data["result"],
-                            duration_ms=data.get("duration_ms"),
-                            error=data.get("error"),
-                            details=data.get("details", {}),
-                            token_usage=data.get("token_usage"),
-                        )
-                        results.append(entry)
-
-                        if len(results) >= limit:
-                            return results
+                for _, data in self._read_entries(log_file, index, offsets):
+                    if not self._matches(data, filters, since):
+                        continue
+                    results.append(self._entry_from_dict(data))
+                    if len(results) >= limit:
+                        return results
 
             except Exception as e:
                 logger.error(f"Error reading audit log {log_file}: {e}")
 
         return results
 
+    @staticmethod
+    def _matches(
+        data: dict[str, Any], filters: dict[str, Any], since: datetime | None
+    ) -> bool:
+        """Check an entry against query filters (falsy filters match anything)."""
+        for key, value in filters.items():
+            if value and data.get(key) != value:
+                return False
+        if since:
+            entry_time = datetime.fromisoformat(data["timestamp"])
+            if entry_time < since:
+                return False
+        return True
+
+    @staticmethod
+    def _entry_from_dict(data: dict[str, Any]) -> AuditEntry:
+        """Reconstruct an AuditEntry from its logged JSON."""
+        return AuditEntry(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data["correlation_id"],
+            action=AuditAction(data["action"]),
+            actor_type=ActorType(data["actor_type"]),
+            actor_id=data.get("actor_id"),
+            repo=data.get("repo"),
+            pr_number=data.get("pr_number"),
+            issue_number=data.get("issue_number"),
+            result=data["result"],
+            duration_ms=data.get("duration_ms"),
+            error=data.get("error"),
+            details=data.get("details", {}),
+            token_usage=data.get("token_usage"),
+        )
+
     def get_operation_history(self, correlation_id: str) -> list[AuditEntry]:
         """Get all entries for a specific operation by correlation ID."""
         return self.query_logs(correlation_id=correlation_id, limit=1000)
@@ -652,44 +761,40 @@ class AuditLogger:
         """
         Get aggregate statistics from audit logs.
 
+        Served from each file's index aggregates; only files that straddle
+        ``since`` have their entries read.
+
         Returns:
             Dictionary with counts by action, result, and actor type
         """
-        entries = self.query_logs(repo=repo, since=since, limit=10000)
-
-        stats = {
-            "total_entries": len(entries),
-            "by_action": {},
-            "by_result": {},
-            "by_actor_type": {},
-            "total_duration_ms": 0,
-            "total_input_tokens": 0,
-            "total_output_tokens": 0,
-        }
+        stats = empty_stats()
+        if not self.enabled or not self.log_dir.exists():
+            return stats
 
-        for entry in entries:
-            # Count by action
-            action = entry.action.value
-            stats["by_action"][action] = stats["by_action"].get(action, 0) + 1
-
-            # Count by result
-            result = entry.result
-            stats["by_result"][result] = stats["by_result"].get(result, 0) + 1
-
-            # Count by actor type
-            actor = entry.actor_type.value
-            stats["by_actor_type"][actor] = stats["by_actor_type"].get(actor, 0) + 1
-
-            # Sum durations
-            if entry.duration_ms:
-                stats["total_duration_ms"] += entry.duration_ms
-
-            # Sum token usage
-            if entry.token_usage:
-                stats["total_input_tokens"] += entry.token_usage.get("input_tokens", 0)
-                stats["total_output_tokens"] += entry.token_usage.get(
-                    "output_tokens", 0
-                )
+        filters = {"repo": repo}
+        for log_file in self._log_files():
+            try:
+                index = self._get_index(log_file)
+                if since and index.ends_before(since):
+                    continue
+
+                if not since or index.starts_at_or_after(since):
+                    # Whole file is in range: use the maintained aggregates
+                    if repo:
+                        merge_stats(stats, index.stats.get(repo, empty_stats()))
+                    else:
+                        for repo_stats in index.stats.values():
+                            merge_stats(stats, repo_stats)
+                    continue
+
+                # File straddles `since`: count its matching entries
+                offsets = index.candidates(filters)
+                for _, data in self._read_entries(log_file, index, offsets):
+                    if self._matches(data, filters, since):
+                        add_to_stats(stats, data)
+
+            except Exception as e:
+                logger.error(f"Error reading audit log {log_file}: {e}")
 
         return stats
 
@@ -0,0 +1,242 @@
+"""
+Audit Log Index
+===============
+
+Sidecar index for one ``audit_*.jsonl`` file, stored next to it as
+``audit_*.idx.json``:
+
+- Time range (first/last entry timestamp) so queries skip whole files
+- Postings of byte offsets per correlation_id, action, repo, pr_number and
+  issue_number so filtered queries seek straight to matching lines
+- Aggregate statistics per repository, so get_statistics() doesn't read
+  entries at all for files entirely inside the requested time range
+
+The index records how many bytes of the log it covers. Entries appended
+since (by another process, or before an unsaved index was lost) are indexed
+from that offset on the next use, so the index never needs to be saved on
+every write.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Entry fields with postings lists
+INDEXED_FIELDS = ("correlation_id", "action", "repo", "pr_number", "issue_number")
+
+
+def index_path(log_file: Path) -> Path:
+    """Sidecar index file for ``log_file``."""
+    return log_file.with_name(log_file.name[: -len(".jsonl")] + ".idx.json")
+
+
+def empty_stats() -> dict[str, Any]:
+    """Aggregates in the shape returned by AuditLogger.get_statistics()."""
+    return {
+        "total_entries": 0,
+        "by_action": {},
+        "by_result": {},
+        "by_actor_type": {},
+        "total_duration_ms": 0,
+        "total_input_tokens": 0,
+        "total_output_tokens": 0,
+    }
+
+
+def add_to_stats(stats: dict[str, Any], data: dict[str, Any]) -> None:
+    """Count one entry (as a dict) into ``stats``."""
+    stats["total_entries"] += 1
+    for key, field in (
+        ("by_action", "action"),
+        ("by_result", "result"),
+        ("by_actor_type", "actor_type"),
+    ):
+        value = data.get(field)
+        stats[key][value] = stats[key].get(value, 0) + 1
+    if data.get("duration_ms"):
+        stats["total_duration_ms"] += data["duration_ms"]
+    token_usage = data.get("token_usage")
+    if token_usage:
+        stats["total_input_tokens"] += token_usage.get("input_tokens", 0)
+        stats["total_output_tokens"] += token_usage.get("output_tokens", 0)
+
+
+def merge_stats(into: dict[str, Any], other: dict[str, Any]) -> None:
+    """Add the aggregates in ``other`` to ``into``."""
+    for key, value in other.items():
+        if isinstance(value, dict):
+            for name, count in value.items():
+                into[key][name] = into[key].get(name, 0) + count
+        else:
+            into[key] += value
+
+
+class AuditFileIndex:
+    """Postings, time range and aggregates for one audit log file."""
+
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self._reset()
+
+    def _reset(self) -> None:
+        self.size = 0  # Bytes of the log covered by the index
+        self.first_ts: str | None = None
+        self.last_ts: str | None = None
+        self.postings: dict[str, dict[str, list[int]]] = {
+            field: {} for field in INDEXED_FIELDS
+        }
+        # repo ("" for entries without one) -> aggregates
+        self.stats: dict[str, dict[str, Any]] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, log_file: Path) -> AuditFileIndex:
+        """Load the sidecar index for ``log_file`` and index any new entries."""
+        index = cls(log_file)
+        try:
+            with open(index_path(log_file), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                index.size = data["size"]
+                index.first_ts = data["first_ts"]
+                index.last_ts = data["last_ts"]
+                index.postings = data["postings"]
+                index.stats = data["stats"]
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+            index._reset()
+        index.catch_up()
+        return index
+
+    def save(self) -> None:
+        """Write the sidecar index if it changed."""
+        if not self.dirty:
+            return
+        path = index_path(self.log_file)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        data = {
+            "version": INDEX_VERSION,
+            "size": self.size,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "postings": self.postings,
+            "stats": self.stats,
+        }
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+            self.dirty = False
+        except OSError as e:
+            # The log itself is intact; the index is rebuilt from it when needed
+            logger.warning(f"Failed to save audit index {path}: {e}")
+
+    def catch_up(self) -> None:
+        """Index entries written past the covered size (rebuild if truncated)."""
+        try:
+            file_size = self.log_file.stat().st_size
+        except OSError:
+            return
+        if file_size == self.size:
+            return
+        if file_size < self.size or not self._ends_line(self.size):
+            # Replaced or truncated underneath us
+            self._reset()
+
+        with open(self.log_file, "rb") as f:
+            f.seek(self.size)
+            offset = self.size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written entry; index it once complete
+                    break
+                self._add_line(line, offset)
+                offset += len(line)
+                self.size = offset
+        self.dirty = True
+
+    def _ends_line(self, size: int) -> bool:
+        if size == 0:
+            return True
+        try:
+            with open(self.log_file, "rb") as f:
+                f.seek(size - 1)
+                return f.read(1) == b"\n"
+        except OSError:
+            return False
+
+    def _add_line(self, line: bytes, offset: int) -> None:
+        if not line.strip():
+            return
+        try:
+            data = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if isinstance(data, dict):
+            self._add(data, offset)
+
+    def _add(self, data: dict[str, Any], offset: int) -> None:
+        for field in INDEXED_FIELDS:
+            value = data.get(field)
+            if value is not None:
+                self.postings[field].setdefault(str(value), []).append(offset)
+
+        timestamp = data.get("timestamp")
+        if isinstance(timestamp, str):
+            try:
+                ts = datetime.fromisoformat(timestamp)
+                if self.first_ts is None or ts < datetime.fromisoformat(self.first_ts):
+                    self.first_ts = timestamp
+                if self.last_ts is None or ts > datetime.fromisoformat(self.last_ts):
+                    self.last_ts = timestamp
+            except (ValueError, TypeError):
+                pass
+
+        repo_stats = self.stats.setdefault(data.get("repo") or "", empty_stats())
+        add_to_stats(repo_stats, data)
+
+    def add_entry(self, data: dict[str, Any], offset: int, end: int) -> None:
+        """Index an entry this process just appended at ``offset``."""
+        if offset != self.size:
+            # Another writer appended in between; catch_up covers this entry too
+            self.catch_up()
+            if self.size >= end:
+                return
+        self._add(data, offset)
+        self.size = end
+        self.dirty = True
+
+    def candidates(self, filters: dict[str, Any]) -> list[int] | None:
+        """
+        Offsets of lines matching every equality filter, in file order.
+
+        Returns:
+            None if no indexed filter is set (every line is a candidate)
+        """
+        result: set[int] | None = None
+        for field, value in filters.items():
+            if not value:
+                continue
+            offsets = set(self.postings[field].get(str(value), ()))
+            result = offsets if result is None else result & offsets
+            if not result:
+                return []
+        return sorted(result) if result is not None else None
+
+    def ends_before(self, since: datetime) -> bool:
+        """True if every entry in the file is older than ``since``."""
+        return self.last_ts is not None and datetime.fromisoformat(self.last_ts) < since
+
+    def starts_at_or_after(self, since: datetime) -> bool:
+        """True if no entry in the file is older than ``since``."""
+        return (
+            self.first_ts is not None and datetime.fromisoformat(self.first_ts) >= since
+        )
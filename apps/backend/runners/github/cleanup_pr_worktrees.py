@@ -27,6 +27,7 @@ pr_worktree_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(pr_worktree_module)
 
 PRWorktreeManager = pr_worktree_module.PRWorktreeManager
+PRWorktreePool = pr_worktree_module.PRWorktreePool
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = pr_worktree_module.DEFAULT_PR_WORKTREE_MAX_AGE_DAYS
 DEFAULT_MAX_PR_WORKTREES = pr_worktree_module.DEFAULT_MAX_PR_WORKTREES
 _get_max_age_days = pr_worktree_module._get_max_age_days
@@ -93,13 +94,19 @@ def show_stats(manager: PRWorktreeManager) -> None:
     print()
 
 
-def cleanup_worktrees(manager: PRWorktreeManager, force: bool = False) -> None:
+def cleanup_worktrees(
+    manager: PRWorktreeManager,
+    force: bool = False,
+    pool: PRWorktreePool | None = None,
+) -> None:
     """Run cleanup policies on worktrees."""
     print("\nRunning PR worktree cleanup...")
     if force:
         print("WARNING: Force cleanup - removing ALL worktrees!")
         count = manager.cleanup_all_worktrees()
         print(f"Removed {count} worktrees.")
+        if pool is not None:
+            print(f"Removed {pool.remove_all()} idle pooled worktrees.")
     else:
         stats = manager.cleanup_worktrees()
         if stats["total"] == 0:
@@ -127,6 +134,7 @@ Examples:
 Environment variables:
   MAX_PR_WORKTREES=10           # Max number of worktrees to keep
   PR_WORKTREE_MAX_AGE_DAYS=7    # Max age in days before cleanup
+  PR_WORKTREE_POOL_SIZE=2       # Reusable review worktrees kept warm
         """,
     )
 
@@ -190,7 +198,8 @@ Environment variables:
                 "This will remove ALL PR worktrees. Are you sure? (yes/no): "
             )
             if response.lower() == "yes":
-                cleanup_worktrees(manager, force=True)
+                pool = PRWorktreePool(manager, ".auto-claude/github/pr/worktree-pool")
+                cleanup_worktrees(manager, force=True, pool=pool)
             else:
                 print("Aborted.")
 
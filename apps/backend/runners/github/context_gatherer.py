@@ -25,13 +25,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 try:
-    from .gh_client import GHClient, PRTooLargeError
+    from .gh_client import GHClient, GHCommandError, GHTimeoutError, PRTooLargeError
+    from .git_objects import GitObjectReader
     from .services.io_utils import safe_print
 except (ImportError, ValueError, SystemError):
     # Import from core.io_utils directly to avoid circular import with services package
     # (services/__init__.py imports pr_review_engine which imports context_gatherer)
     from core.io_utils import safe_print
-    from gh_client import GHClient, PRTooLargeError
+    from gh_client import GHClient, GHCommandError, GHTimeoutError, PRTooLargeError
+    from git_objects import GitObjectReader
 
 # Validation patterns for git refs and paths (defense-in-depth)
 # These patterns allow common valid characters while rejecting potentially dangerous ones
@@ -243,6 +245,8 @@ class PRContextGatherer:
             max_retries=3,
             repo=repo,
         )
+        # Metadata, files, commits and comments from one GraphQL round-trip
+        self._pr_data: dict | None = None
 
     async def gather(self) -> PRContext:
         """
@@ -336,7 +340,21 @@ class PRContextGatherer:
         )
 
     async def _fetch_pr_metadata(self) -> dict:
-        """Fetch PR metadata from GitHub API via gh CLI."""
+        """
+        Fetch PR metadata from GitHub API via gh CLI.
+
+        Uses a single GraphQL query that also returns commits and comments;
+        falls back to `gh pr view` if it fails.
+        """
+        if self._pr_data is None:
+            try:
+                contexts = await self.gh_client.get_pr_contexts([self.pr_number])
+                self._pr_data = contexts.get(self.pr_number)
+            except (GHCommandError, GHTimeoutError, KeyError, TypeError) as e:
+                safe_print(f"[Context] GraphQL fetch failed, using gh pr view: {e}")
+        if self._pr_data is not None:
+            return self._pr_data
+
         return await self.gh_client.pr_get(
             self.pr_number,
             json_fields=[
@@ -444,40 +462,43 @@ class PRContextGatherer:
         - Current content (HEAD of PR branch)
         - Base content (before changes)
         - Diff patch
+
+        Contents for all files are streamed through one long-lived
+        ``git cat-file`` process and patches come from a single ``git diff``.
         """
-        changed_files = []
         files = pr_data.get("files", [])
 
+        # Use commit SHAs if available (works for fork PRs), fallback to branch names
+        head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
+        base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+
+        paths = [file_info["path"] for file_info in files]
         for file_info in files:
-            path = file_info["path"]
             status = self._normalize_status(file_info.get("status", "modified"))
-            additions = file_info.get("additions", 0)
-            deletions = file_info.get("deletions", 0)
-
-            safe_print(f"[Context]   Processing {path} ({status})...")
-
-            # Use commit SHAs if available (works for fork PRs), fallback to branch names
-            head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
-            base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+            safe_print(f"[Context]   Processing {file_info['path']} ({status})...")
 
+        async with GitObjectReader(self.project_dir) as reader:
             # Get current content (from PR head commit)
-            content = await self._read_file_content(path, head_ref)
+            contents = await self._read_file_contents(reader, paths, head_ref)
 
             # Get base content (from base commit)
-            base_content = await self._read_file_content(path, base_ref)
+            base_contents = await self._read_file_contents(reader, paths, base_ref)
 
-            # Get the patch for this specific file
-            patch = await self._get_file_patch(path, base_ref, head_ref)
+            # Get the patch for each file
+            patches = await self._get_file_patches(reader, paths, base_ref, head_ref)
 
+        changed_files = []
+        for file_info in files:
+            path = file_info["path"]
             changed_files.append(
                 ChangedFile(
                     path=path,
-                    status=status,
-                    additions=additions,
-                    deletions=deletions,
-                    content=content,
-                    base_content=base_content,
-                    patch=patch,
+                    status=self._normalize_status(file_info.get("status", "modified")),
+                    additions=file_info.get("additions", 0),
+                    deletions=file_info.get("deletions", 0),
+                    content=contents.get(path, ""),
+                    base_content=base_contents.get(path, ""),
+                    patch=patches.get(path, ""),
                 )
             )
 
@@ -497,104 +518,87 @@ class PRContextGatherer:
         else:
             return status_lower
 
-    async def _read_file_content(self, path: str, ref: str) -> str:
+    async def _read_file_contents(
+        self, reader: GitObjectReader, paths: list[str], ref: str
+    ) -> dict[str, str]:
         """
-        Read file content from a specific git ref.
+        Read file contents from a specific git ref.
 
         Args:
-            path: File path relative to repo root
+            reader: Batched git object reader
+            paths: File paths relative to repo root
             ref: Git ref (branch name, commit hash, etc.)
 
         Returns:
-            File content as string, or empty string if file doesn't exist
+            {path: content}, with an empty string for files that don't exist
+            at that ref (e.g. new files in the base branch)
         """
         # Validate inputs to prevent command injection
-        if not _validate_file_path(path):
-            safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
-            return ""
         if not _validate_git_ref(ref):
             safe_print(f"[Context] Invalid git ref rejected: {ref[:50]}...")
-            return ""
+            return {}
+        valid_paths = []
+        for path in paths:
+            if _validate_file_path(path):
+                valid_paths.append(path)
+            else:
+                safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "git",
-                "show",
-                f"{ref}:{path}",
-                cwd=self.project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-
-            # File might not exist in base branch (new file)
-            if proc.returncode != 0:
-                return ""
-
-            return stdout.decode("utf-8")
-        except asyncio.TimeoutError:
-            safe_print(f"[Context] Timeout reading {path} from {ref}")
-            return ""
+            blobs = await reader.read_files([(ref, path) for path in valid_paths])
         except Exception as e:
-            safe_print(f"[Context] Error reading {path} from {ref}: {e}")
-            return ""
+            safe_print(f"[Context] Error reading files from {ref}: {e}")
+            return {}
+
+        return {path: blobs.get((ref, path)) or "" for path in valid_paths}
 
-    async def _get_file_patch(self, path: str, base_ref: str, head_ref: str) -> str:
+    async def _get_file_patches(
+        self,
+        reader: GitObjectReader,
+        paths: list[str],
+        base_ref: str,
+        head_ref: str,
+    ) -> dict[str, str]:
         """
-        Get the diff patch for a specific file using git diff.
+        Get the diff patch for each file using git diff.
 
         Args:
-            path: File path relative to repo root
+            reader: Batched git object reader
+            paths: File paths relative to repo root
             base_ref: Base branch ref
             head_ref: Head branch ref
 
         Returns:
-            Unified diff patch for this file
+            {path: unified diff patch for that file}
         """
         # Validate inputs to prevent command injection
-        if not _validate_file_path(path):
-            safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
-            return ""
         if not _validate_git_ref(base_ref):
             safe_print(
                 f"[Context] Invalid base ref rejected: {base_ref[:50]}...", flush=True
             )
-            return ""
+            return {}
         if not _validate_git_ref(head_ref):
             safe_print(
                 f"[Context] Invalid head ref rejected: {head_ref[:50]}...", flush=True
             )
-            return ""
+            return {}
+        valid_paths = [path for path in paths if _validate_file_path(path)]
+        if not valid_paths:
+            return {}
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "git",
-                "diff",
-                f"{base_ref}...{head_ref}",
-                "--",
-                path,
-                cwd=self.project_dir,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10.0)
-
-            if proc.returncode != 0:
-                safe_print(
-                    f"[Context] Failed to get patch for {path}: {stderr.decode('utf-8')}",
-                    flush=True,
-                )
-                return ""
-
-            return stdout.decode("utf-8")
-        except asyncio.TimeoutError:
-            safe_print(f"[Context] Timeout getting patch for {path}")
-            return ""
+            patches = await reader.diff_files(base_ref, head_ref, valid_paths)
         except Exception as e:
-            safe_print(f"[Context] Error getting patch for {path}: {e}")
-            return ""
+            safe_print(f"[Context] Error getting patches: {e}")
+            return {}
+
+        if patches is None:
+            safe_print(
+                f"[Context] Failed to get patches for {base_ref[:8]}...{head_ref[:8]}",
+                flush=True,
+            )
+            return {}
+        return patches
 
     async def _fetch_pr_diff(self) -> str:
         """
@@ -615,6 +619,8 @@ class PRContextGatherer:
 
     async def _fetch_commits(self) -> list[dict]:
         """Fetch commit history for this PR."""
+        if self._pr_data is not None:
+            return self._pr_data.get("commits", [])
         try:
             data = await self.gh_client.pr_get(self.pr_number, json_fields=["commits"])
             return data.get("commits", [])
@@ -703,6 +709,8 @@ class PRContextGatherer:
 
     async def _fetch_pr_review_comments(self) -> list[dict]:
         """Fetch inline review comments on the PR."""
+        if self._pr_data is not None:
+            return self._pr_data.get("review_comments", [])
         try:
             result = await self.gh_client.run(
                 [
@@ -722,6 +730,8 @@ class PRContextGatherer:
 
     async def _fetch_pr_issue_comments(self) -> list[dict]:
         """Fetch general issue comments on the PR."""
+        if self._pr_data is not None:
+            return self._pr_data.get("issue_comments", [])
         try:
             result = await self.gh_client.run(
                 [
@@ -1443,6 +1453,9 @@ class FollowupContextGatherer:
             flush=True,
         )
 
+        # GitHub omits patches for very large diffs - fill those in locally
+        local_patches = await self._get_local_patches(files, previous_sha, current_sha)
+
         # Build diff from file patches
         # Note: PR files endpoint returns 'filename' key, compare returns 'filename' too
         diff_parts = []
@@ -1450,7 +1463,7 @@ class FollowupContextGatherer:
         for file_info in files:
             filename = file_info.get("filename", "")
             files_changed.append(filename)
-            patch = file_info.get("patch", "")
+            patch = file_info.get("patch", "") or local_patches.get(filename, "")
             if patch:
                 diff_parts.append(f"--- a/{filename}\n+++ b/{filename}\n{patch}")
 
@@ -1561,3 +1574,43 @@ class FollowupContextGatherer:
             has_merge_conflicts=has_merge_conflicts,
             merge_state_status=merge_state_status,
         )
+
+    async def _get_local_patches(
+        self, files: list[dict], previous_sha: str, current_sha: str
+    ) -> dict[str, str]:
+        """
+        Diff files without an API patch from the local repository, in one batch.
+
+        Returns an empty dict if the commits aren't available locally.
+        """
+        paths = [
+            f.get("filename", "")
+            for f in files
+            if not f.get("patch") and _validate_file_path(f.get("filename", ""))
+        ]
+        if (
+            not paths
+            or not _validate_git_ref(previous_sha)
+            or not _validate_git_ref(current_sha)
+        ):
+            return {}
+
+        try:
+            async with GitObjectReader(self.project_dir) as reader:
+                patches = await reader.diff_files(
+                    previous_sha, current_sha, paths, merge_base=False
+                )
+        except Exception as e:
+            safe_print(f"[Followup] Error diffing files locally: {e}")
+            return {}
+
+        # Match the API's "patch" shape: hunks only, without the diff --git,
+        # index and ---/+++ headers (the caller adds its own ---/+++ lines).
+        # Binary files produce no hunks - nothing useful to show.
+        hunks = {}
+        for path, patch in (patches or {}).items():
+            if patch.startswith("@@"):
+                hunks[path] = patch
+            elif "\n@@" in patch:
+                hunks[path] = patch[patch.index("\n@@") + 1 :]
+        return hunks
@@ -5,7 +5,8 @@ Semantic Duplicate Detection
 Uses embeddings-based similarity to detect duplicate issues:
 - Replaces simple word overlap with semantic similarity
 - Integrates with OpenAI/Voyage AI embeddings
-- Caches embeddings with TTL
+- Caches embeddings with TTL in a memory-mapped float32 store
+- Scores an issue against all cached issues in one vectorized pass
 - Extracts entities (error codes, file paths, function names)
 - Provides similarity breakdown by component
 """
@@ -17,10 +18,15 @@ import json
 import logging
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .embedding_store import EmbeddingStore, np, open_embedding_store
+except (ImportError, ValueError, SystemError):
+    from embedding_store import EmbeddingStore, np, open_embedding_store
+
 logger = logging.getLogger(__name__)
 
 # Thresholds for duplicate detection
@@ -333,40 +339,47 @@ class DuplicateDetector:
         self.entity_extractor = EntityExtractor()
 
     def _get_cache_file(self, repo: str) -> Path:
+        """Legacy JSON cache file (migrated into the binary store on first use)."""
         safe_name = repo.replace("/", "_")
         return self.cache_dir / f"{safe_name}_embeddings.json"
 
-    def _content_hash(self, title: str, body: str) -> str:
-        """Generate hash of issue content."""
-        content = f"{title}\n{body}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+    def _get_store(self, repo: str) -> EmbeddingStore:
+        """Get the process-wide embedding store for a repo."""
+        safe_name = repo.replace("/", "_")
+        store = open_embedding_store(self.cache_dir / f"{safe_name}_embeddings")
+        self._migrate_legacy_cache(repo, store)
+        return store
 
-    def _load_cache(self, repo: str) -> dict[int, CachedEmbedding]:
-        """Load embedding cache for a repo."""
+    def _migrate_legacy_cache(self, repo: str, store: EmbeddingStore) -> None:
+        """Import unexpired entries from the old JSON cache, then remove it."""
         cache_file = self._get_cache_file(repo)
         if not cache_file.exists():
-            return {}
+            return
 
-        with open(cache_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        cache = {}
-        for item in data.get("embeddings", []):
-            embedding = CachedEmbedding.from_dict(item)
-            if not embedding.is_expired():
-                cache[embedding.issue_number] = embedding
-
-        return cache
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+            for item in data.get("embeddings", []):
+                cached = CachedEmbedding.from_dict(item)
+                if cached.is_expired():
+                    continue
+                created = datetime.fromisoformat(cached.created_at)
+                expires = datetime.fromisoformat(cached.expires_at)
+                store.put(
+                    cached.issue_number,
+                    cached.content_hash,
+                    cached.embedding,
+                    ttl_hours=(expires - created).total_seconds() / 3600,
+                    created_at=created.timestamp(),
+                )
+        except (OSError, json.JSONDecodeError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping unreadable legacy embedding cache: {e}")
+        cache_file.unlink(missing_ok=True)
 
-    def _save_cache(self, repo: str, cache: dict[int, CachedEmbedding]) -> None:
-        """Save embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        data = {
-            "embeddings": [e.to_dict() for e in cache.values()],
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-        }
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+    def _content_hash(self, title: str, body: str) -> str:
+        """Generate hash of issue content."""
+        content = f"{title}\n{body}"
+        return hashlib.sha256(content.encode()).hexdigest()[:16]
 
     async def get_embedding(
         self,
@@ -376,29 +389,20 @@ class DuplicateDetector:
         body: str,
     ) -> list[float]:
         """Get embedding for an issue, using cache if available."""
-        cache = self._load_cache(repo)
+        store = self._get_store(repo)
         content_hash = self._content_hash(title, body)
 
         # Check cache
-        if issue_number in cache:
-            cached = cache[issue_number]
-            if cached.content_hash == content_hash and not cached.is_expired():
-                return cached.embedding
+        cached = store.get(issue_number, content_hash)
+        if cached is not None:
+            return cached
 
         # Generate new embedding
         content = f"{title}\n\n{body}"
         embedding = await self.embedding_provider.get_embedding(content)
 
         # Cache it
-        now = datetime.now(timezone.utc)
-        cache[issue_number] = CachedEmbedding(
-            issue_number=issue_number,
-            content_hash=content_hash,
-            embedding=embedding,
-            created_at=now.isoformat(),
-            expires_at=(now + timedelta(hours=self.cache_ttl_hours)).isoformat(),
-        )
-        self._save_cache(repo, cache)
+        store.put(issue_number, content_hash, embedding, self.cache_ttl_hours)
 
         return embedding
 
@@ -407,6 +411,15 @@ class DuplicateDetector:
         if len(a) != len(b):
             return 0.0
 
+        if np is not None:
+            va = np.asarray(a, dtype=np.float64)
+            vb = np.asarray(b, dtype=np.float64)
+            magnitude_a = float(np.linalg.norm(va))
+            magnitude_b = float(np.linalg.norm(vb))
+            if magnitude_a == 0 or magnitude_b == 0:
+                return 0.0
+            return float(va @ vb) / (magnitude_a * magnitude_b)
+
         dot_product = sum(x * y for x, y in zip(a, b))
         magnitude_a = sum(x * x for x in a) ** 0.5
         magnitude_b = sum(x * x for x in b) ** 0.5
@@ -416,6 +429,43 @@ class DuplicateDetector:
 
         return dot_product / (magnitude_a * magnitude_b)
 
+    async def find_similar(
+        self,
+        repo: str,
+        issue_number: int,
+        title: str,
+        body: str,
+        k: int = 5,
+        candidates: set[int] | None = None,
+        min_score: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Score an issue against all cached issues in a single pass.
+
+        Only issues whose embeddings are already cached (e.g. via
+        precompute_embeddings) are considered.
+
+        Args:
+            repo: Repository in owner/repo format
+            issue_number: Issue to score (excluded from results)
+            title: Issue title
+            body: Issue body
+            k: Maximum number of results
+            candidates: Restrict scoring to these issue numbers
+            min_score: Minimum cosine similarity to include
+
+        Returns:
+            (issue_number, similarity) pairs sorted by similarity, descending
+        """
+        query = await self.get_embedding(repo, issue_number, title, body)
+        return self._get_store(repo).top_k(
+            query,
+            k=k,
+            exclude={issue_number},
+            candidates=candidates,
+            min_score=min_score,
+        )
+
     async def compare_issues(
         self,
         repo: str,
@@ -547,14 +597,37 @@ class DuplicateDetector:
             "title": title,
             "body": body,
         }
+        issues_by_number = {
+            issue["number"]: issue
+            for issue in open_issues
+            if issue.get("number") is not None and issue["number"] != issue_number
+        }
 
-        results = []
-        for issue in open_issues:
-            if issue.get("number") == issue_number:
-                continue
+        # Make sure every candidate is embedded, then shortlist in one pass
+        await self.precompute_embeddings(repo, list(issues_by_number.values()))
+        try:
+            shortlist = await self.find_similar(
+                repo,
+                issue_number,
+                title,
+                body,
+                k=len(issues_by_number),
+                candidates=set(issues_by_number),
+                min_score=self.similar_threshold,
+            )
+        except Exception as e:
+            logger.error(f"Error scoring issue #{issue_number}: {e}")
+            return []
 
+        # Detailed breakdown only for the issues that can make the cut
+        results = []
+        for number, _score in shortlist:
+            if len(results) >= limit:
+                break
             try:
-                result = await self.compare_issues(repo, target_issue, issue)
+                result = await self.compare_issues(
+                    repo, target_issue, issues_by_number[number]
+                )
                 if result.is_similar:
                     results.append(result)
             except Exception as e:
@@ -599,3 +672,4 @@ class DuplicateDetector:
         cache_file = self._get_cache_file(repo)
         if cache_file.exists():
             cache_file.unlink()
+        self._get_store(repo).clear()
@@ -0,0 +1,457 @@
+"""
+Binary Embedding Store
+======================
+
+Persistent, append-friendly storage for issue embeddings used by
+duplicate detection:
+
+- Embeddings live in a raw float32 matrix file (``*.f32``), one row per vector
+- A line-delimited index (``*.idx.jsonl``) maps issue number + content hash to a row
+- The matrix is memory-mapped once per process and shared by all detectors
+- Top-k cosine similarity scores a query against every cached issue in one pass
+  (vectorized with numpy when it is installed, plain Python otherwise)
+
+Rows are never rewritten in place: updating an issue appends a new row and
+index record, and superseded rows are dropped by periodic compaction.
+Appends and compaction hold a cross-process file lock, and a new row's
+number comes from the matrix file's size under that lock, so several
+runner processes can share one store.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import math
+import mmap
+import operator
+import os
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    from .file_lock import FileLock, FileLockError
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, FileLockError
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_FLOAT_SIZE = array("f").itemsize
+
+# Seconds to wait for another process appending to or compacting a store
+_LOCK_TIMEOUT = 10.0
+
+
+@dataclass
+class StoredEmbedding:
+    """Index record for one embedding row."""
+
+    issue_number: int
+    content_hash: str
+    row: int
+    created_at: float
+    expires_at: float
+
+    def is_expired(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) > self.expires_at
+
+    def to_dict(self) -> dict:
+        return {
+            "issue_number": self.issue_number,
+            "content_hash": self.content_hash,
+            "row": self.row,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+        }
+
+
+class EmbeddingStore:
+    """
+    Float32 embedding matrix with an issue/content-hash index.
+
+    Usage:
+        store = open_embedding_store(cache_dir / "owner_repo_embeddings")
+        vector = store.get(123, content_hash)
+        if vector is None:
+            store.put(123, content_hash, await provider.get_embedding(text), ttl)
+        top = store.top_k(vector, k=5, exclude={123})
+    """
+
+    # Compact once superseded rows outnumber live rows (and exceed this floor)
+    COMPACT_MIN_DEAD_ROWS = 256
+
+    def __init__(self, base_path: Path):
+        self.base_path = Path(base_path)
+        self.matrix_file = self.base_path.with_name(self.base_path.name + ".f32")
+        self.index_file = self.base_path.with_name(self.base_path.name + ".idx.jsonl")
+        self.dim: int | None = None
+        self._entries: dict[int, StoredEmbedding] = {}
+        self._rows = 0
+        self._mm: mmap.mmap | None = None
+        self._np_matrix = None
+        self._np_norms = None
+        self._lock = threading.RLock()
+        self._load_index()
+        # Disk state this instance last saw (see _sync_with_disk)
+        self._signature = self._disk_signature()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> None:
+        """Read the index once; the matrix itself is mapped lazily."""
+        if not self.index_file.exists():
+            return
+
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn trailing write
+                    if "dim" in record:
+                        self.dim = int(record["dim"])
+                        continue
+                    entry = StoredEmbedding(**record)
+                    self._entries[entry.issue_number] = entry
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(
+                f"Discarding unreadable embedding index {self.index_file}: {e}"
+            )
+            self._entries = {}
+            self.dim = None
+            return
+
+        if self.dim and self.matrix_file.exists():
+            self._rows = self.matrix_file.stat().st_size // (self.dim * _FLOAT_SIZE)
+        # Drop records whose row never made it to disk
+        self._entries = {
+            number: entry
+            for number, entry in self._entries.items()
+            if entry.row < self._rows
+        }
+
+    def _unmap(self) -> None:
+        self._np_matrix = None
+        self._np_norms = None
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _mapping(self) -> mmap.mmap | None:
+        """Map the matrix file, re-mapping after appends."""
+        if self._mm is None and self._rows and self.dim:
+            with open(self.matrix_file, "rb") as f:
+                self._mm = mmap.mmap(
+                    f.fileno(),
+                    self._rows * self.dim * _FLOAT_SIZE,
+                    access=mmap.ACCESS_READ,
+                )
+        return self._mm
+
+    def _row(self, row: int) -> list[float]:
+        mm = self._mapping()
+        start = row * self.dim * _FLOAT_SIZE
+        return array("f", mm[start : start + self.dim * _FLOAT_SIZE]).tolist()
+
+    # ------------------------------------------------------------------
+    # Reads / writes
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, issue_number: int, content_hash: str) -> list[float] | None:
+        """Return the cached embedding if present, current and unexpired."""
+        with self._lock:
+            entry = self._entries.get(issue_number)
+            if (
+                entry is None
+                or entry.content_hash != content_hash
+                or entry.is_expired()
+            ):
+                return None
+            return self._row(entry.row)
+
+    def put(
+        self,
+        issue_number: int,
+        content_hash: str,
+        embedding: list[float],
+        ttl_hours: float,
+        created_at: float | None = None,
+    ) -> None:
+        """Append an embedding row and its index record."""
+        with self._lock:
+            try:
+                with self._file_lock():
+                    self._put_locked(
+                        issue_number, content_hash, embedding, ttl_hours, created_at
+                    )
+            except FileLockError as e:
+                # The store is a cache; the embedding is recomputed next time
+                logger.warning(
+                    f"Skipping embedding cache write for #{issue_number}: {e}"
+                )
+
+    def _file_lock(self) -> FileLock:
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+        return FileLock(self.base_path, timeout=_LOCK_TIMEOUT)
+
+    def _disk_signature(self) -> tuple | None:
+        """Matrix size plus index identity; changes whenever another process writes."""
+        try:
+            matrix = self.matrix_file.stat()
+            index = self.index_file.stat()
+        except OSError:
+            return None
+        return matrix.st_size, index.st_ino, index.st_size
+
+    def _sync_with_disk(self) -> None:
+        """
+        Reload the index if another process appended, compacted or cleared
+        the store since this one last read or wrote it.
+
+        Must hold the file lock. A torn trailing row is truncated so the
+        next row starts on a row boundary.
+        """
+        signature = self._disk_signature()
+        if signature is not None and signature == self._signature:
+            return
+
+        self._unmap()
+        self._entries = {}
+        self._rows = 0
+        self.dim = None
+        self._load_index()
+        if signature is not None and self.dim:
+            row_bytes = self.dim * _FLOAT_SIZE
+            if signature[0] % row_bytes:
+                with open(self.matrix_file, "r+b") as f:
+                    f.truncate(self._rows * row_bytes)
+        self._signature = self._disk_signature()
+
+    def _put_locked(
+        self,
+        issue_number: int,
+        content_hash: str,
+        embedding: list[float],
+        ttl_hours: float,
+        created_at: float | None,
+    ) -> None:
+        self._sync_with_disk()
+        if self.dim is not None and len(embedding) != self.dim:
+            # Provider/model changed - existing rows are not comparable
+            logger.info(
+                f"Embedding dimension changed ({self.dim} -> {len(embedding)}), "
+                f"resetting {self.base_path.name}"
+            )
+            self._clear_locked()
+
+        if self.dim is None:
+            self.dim = len(embedding)
+            self._unmap()
+            self._rows = 0
+            self.matrix_file.write_bytes(b"")
+            with open(self.index_file, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"dim": self.dim}) + "\n")
+
+        now = created_at if created_at is not None else time.time()
+        entry = StoredEmbedding(
+            issue_number=issue_number,
+            content_hash=content_hash,
+            row=self._rows,
+            created_at=now,
+            expires_at=now + ttl_hours * 3600,
+        )
+        with open(self.matrix_file, "ab") as f:
+            f.write(array("f", embedding).tobytes())
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry.to_dict()) + "\n")
+
+        self._unmap()
+        self._rows += 1
+        self._entries[issue_number] = entry
+        self._signature = self._disk_signature()
+
+        dead_rows = self._rows - len(self._entries)
+        if dead_rows > max(self.COMPACT_MIN_DEAD_ROWS, len(self._entries)):
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """Rewrite the store keeping only live, unexpired rows."""
+        with self._lock, self._file_lock():
+            self._sync_with_disk()
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        if not self.dim:
+            return
+        now = time.time()
+        live = sorted(
+            (e for e in self._entries.values() if not e.is_expired(now)),
+            key=lambda e: e.row,
+        )
+        rows = [self._row(e.row) for e in live]
+        self._unmap()
+
+        tmp_matrix = self.matrix_file.with_name(self.matrix_file.name + ".tmp")
+        tmp_index = self.index_file.with_name(self.index_file.name + ".tmp")
+        entries: dict[int, StoredEmbedding] = {}
+        with open(tmp_matrix, "wb") as mf, open(tmp_index, "w", encoding="utf-8") as xf:
+            xf.write(json.dumps({"dim": self.dim}) + "\n")
+            for new_row, (entry, vector) in enumerate(zip(live, rows)):
+                mf.write(array("f", vector).tobytes())
+                entry = StoredEmbedding(
+                    issue_number=entry.issue_number,
+                    content_hash=entry.content_hash,
+                    row=new_row,
+                    created_at=entry.created_at,
+                    expires_at=entry.expires_at,
+                )
+                xf.write(json.dumps(entry.to_dict()) + "\n")
+                entries[entry.issue_number] = entry
+        # Matrix first: a stale index pointing past the end is pruned on load
+        os.replace(tmp_matrix, self.matrix_file)
+        os.replace(tmp_index, self.index_file)
+        self._entries = entries
+        self._rows = len(entries)
+        self._signature = self._disk_signature()
+
+    def clear(self) -> None:
+        """Delete all stored embeddings."""
+        with self._lock, self._file_lock():
+            self._clear_locked()
+
+    def _clear_locked(self) -> None:
+        self._unmap()
+        for path in (self.matrix_file, self.index_file):
+            if path.exists():
+                path.unlink()
+        self._entries = {}
+        self._rows = 0
+        self.dim = None
+        self._signature = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+
+    # ------------------------------------------------------------------
+    # Similarity
+    # ------------------------------------------------------------------
+
+    def top_k(
+        self,
+        query: list[float],
+        k: int = 5,
+        exclude: set[int] | None = None,
+        candidates: set[int] | None = None,
+        min_score: float | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Score a query against all cached issues in one pass.
+
+        Args:
+            query: Query embedding
+            k: Maximum number of results
+            exclude: Issue numbers to skip (e.g. the query issue itself)
+            candidates: If given, only score these issue numbers
+            min_score: Drop results below this cosine similarity
+
+        Returns:
+            (issue_number, cosine_similarity) pairs, best first
+        """
+        with self._lock:
+            if not self.dim or len(query) != self.dim:
+                return []
+
+            now = time.time()
+            selected = [
+                e
+                for e in self._entries.values()
+                if not e.is_expired(now)
+                and (candidates is None or e.issue_number in candidates)
+                and not (exclude and e.issue_number in exclude)
+            ]
+            if not selected:
+                return []
+
+            if np is not None:
+                scores = self._scores_numpy(query, [e.row for e in selected])
+            else:
+                scores = self._scores_python(query, [e.row for e in selected])
+
+            scored = [
+                (entry.issue_number, score)
+                for entry, score in zip(selected, scores)
+                if min_score is None or score >= min_score
+            ]
+            return heapq.nlargest(k, scored, key=lambda item: item[1])
+
+    def _scores_numpy(self, query: list[float], rows: list[int]) -> list[float]:
+        if self._np_matrix is None:
+            self._np_matrix = np.frombuffer(
+                self._mapping(), dtype=np.float32, count=self._rows * self.dim
+            ).reshape(self._rows, self.dim)
+            self._np_norms = np.linalg.norm(self._np_matrix, axis=1)
+
+        q = np.asarray(query, dtype=np.float32)
+        q_norm = float(np.linalg.norm(q))
+        if q_norm == 0:
+            return [0.0] * len(rows)
+
+        idx = np.asarray(rows, dtype=np.intp)
+        norms = self._np_norms[idx]
+        dots = self._np_matrix[idx] @ q
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sims = np.where(norms > 0, dots / (norms * q_norm), 0.0)
+        return sims.astype(float).tolist()
+
+    def _scores_python(self, query: list[float], rows: list[int]) -> list[float]:
+        q_norm = math.sqrt(sum(x * x for x in query))
+        if q_norm == 0:
+            return [0.0] * len(rows)
+
+        view = memoryview(self._mapping()).cast("f")
+        scores = []
+        try:
+            for row in rows:
+                start = row * self.dim
+                vector = view[start : start + self.dim]
+                dot = sum(map(operator.mul, vector, query))
+                norm = math.sqrt(sum(map(operator.mul, vector, vector)))
+                scores.append(dot / (norm * q_norm) if norm else 0.0)
+        finally:
+            view.release()
+        return scores
+
+
+# Stores are opened once per process and shared between detectors
+_open_stores: dict[Path, EmbeddingStore] = {}
+_open_stores_lock = threading.Lock()
+
+
+def open_embedding_store(base_path: Path) -> EmbeddingStore:
+    """Return the process-wide store for ``base_path``, loading it on first use."""
+    key = Path(base_path).resolve()
+    with _open_stores_lock:
+        store = _open_stores.get(key)
+        if store is None:
+            store = EmbeddingStore(key)
+            _open_stores[key] = store
+        return store
@@ -23,9 +23,23 @@ from typing import Any
 from core.gh_executable import get_gh_executable
 
 try:
+    from .pr_graphql import fetch_pr_contexts
     from .rate_limiter import RateLimiter, RateLimitExceeded
+    from .response_cache import (
+        is_cacheable,
+        open_response_cache,
+        parse_included_response,
+        ttl_for,
+    )
 except (ImportError, ValueError, SystemError):
+    from pr_graphql import fetch_pr_contexts
     from rate_limiter import RateLimiter, RateLimitExceeded
+    from response_cache import (
+        is_cacheable,
+        open_response_cache,
+        parse_included_response,
+        ttl_for,
+    )
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -87,6 +101,7 @@ class GHClient:
         max_retries: int = 3,
         enable_rate_limiting: bool = True,
         repo: str | None = None,
+        enable_response_cache: bool = True,
     ):
         """
         Initialize GitHub CLI client.
@@ -98,6 +113,8 @@ class GHClient:
             enable_rate_limiting: Whether to enforce rate limiting (default: True)
             repo: Repository in 'owner/repo' format. If provided, uses -R flag
                   instead of inferring from git remotes.
+            enable_response_cache: Cache REST GET responses on disk and
+                  revalidate them with conditional requests (default: True)
         """
         self.project_dir = Path(project_dir)
         self.default_timeout = default_timeout
@@ -109,6 +126,14 @@ class GHClient:
         if enable_rate_limiting:
             self._rate_limiter = RateLimiter.get_instance()
 
+        self._response_cache = (
+            open_response_cache(
+                self.project_dir / ".auto-claude" / "github" / "http_cache"
+            )
+            if enable_response_cache
+            else None
+        )
+
     async def run(
         self,
         args: list[str],
@@ -218,9 +243,13 @@ class GHClient:
                 )
 
                 if result.returncode != 0:
-                    logger.warning(
-                        f"gh {args[0]} failed with exit code {result.returncode}: {stderr_str}"
-                    )
+                    if "HTTP 304" in stderr_str:
+                        # Conditional request answered Not Modified (see api_get_cached)
+                        logger.debug(f"gh {args[0]}: not modified")
+                    else:
+                        logger.warning(
+                            f"gh {args[0]} failed with exit code {result.returncode}: {stderr_str}"
+                        )
 
                     # Check for rate limit errors (403/429)
                     error_lower = stderr_str.lower()
@@ -287,6 +316,86 @@ class GHClient:
             return args + ["-R", self.repo]
         return args
 
+    def _cache_key(self, endpoint: str) -> str:
+        """Response cache key: endpoints use {owner}/{repo} resolved per repo."""
+        return f"{self.repo or self.project_dir.resolve()}|GET|{endpoint}"
+
+    async def api_get_cached(
+        self,
+        endpoint: str,
+        timeout: float | None = None,
+        raise_on_error: bool = True,
+    ) -> GHCommandResult:
+        """
+        GET a REST endpoint through the response cache.
+
+        Fresh cached responses (see response_cache.ENDPOINT_TTLS) are returned
+        without a request. Stale ones are revalidated with a conditional
+        request; a 304 Not Modified reuses the cached body and doesn't count
+        against the rate limit.
+        Endpoints that are not cacheable (``since=`` polls) are fetched
+        directly.
+
+        Args:
+            endpoint: API endpoint including query string
+            timeout: Timeout in seconds (uses default if None)
+            raise_on_error: Raise GHCommandError on non-zero exit
+
+        Returns:
+            GHCommandResult whose stdout is the response body
+        """
+        args = ["api", "--method", "GET", endpoint]
+        if self._response_cache is None or not is_cacheable(endpoint):
+            return await self.run(args, timeout=timeout, raise_on_error=raise_on_error)
+
+        key = self._cache_key(endpoint)
+        cached = self._response_cache.get(key)
+        if cached is not None and cached.is_fresh():
+            if self.enable_rate_limiting:
+                self._rate_limiter.record_cache_hit()
+            return GHCommandResult(
+                stdout=cached.body,
+                stderr="",
+                returncode=0,
+                command=["gh", *args],
+                attempts=0,
+                total_time=0.0,
+            )
+
+        conditional_args = ["api", "--method", "GET", "--include", endpoint]
+        for header in cached.conditional_headers() if cached else []:
+            conditional_args.extend(["-H", header])
+
+        # gh exits non-zero for a 304, so check the status before raising
+        result = await self.run(conditional_args, timeout=timeout, raise_on_error=False)
+        status, headers, body = parse_included_response(result.stdout)
+
+        if cached is not None and (status == 304 or "HTTP 304" in result.stderr):
+            self._response_cache.touch(key)
+            if self.enable_rate_limiting:
+                self._rate_limiter.record_cache_revalidated()
+            result.stdout, result.stderr, result.returncode = cached.body, "", 0
+            return result
+
+        result.stdout = body
+        if result.returncode != 0:
+            if raise_on_error:
+                raise GHCommandError(
+                    f"gh api failed: {result.stderr or 'Unknown error'}"
+                )
+            return result
+
+        if self.enable_rate_limiting:
+            self._rate_limiter.record_cache_miss()
+        self._response_cache.put(
+            key,
+            body,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            ttl=ttl_for(endpoint),
+        )
+        return result
+
     # =========================================================================
     # Convenience methods for common gh commands
     # =========================================================================
@@ -589,6 +698,78 @@ class GHClient:
         result = await self.run(args)
         return json.loads(result.stdout)
 
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, str | int] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a GraphQL query.
+
+        Placeholders {owner} and {repo} in string variables are filled in by
+        gh from the current repository.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            timeout: Timeout in seconds (uses default if None)
+
+        Returns:
+            The response's "data" object. Partial data is returned (and the
+            errors logged) when some fields failed, e.g. a missing PR.
+
+        Raises:
+            GHCommandError: If the query failed without returning any data
+        """
+        args = ["api", "graphql", "-f", f"query={query}"]
+        for name, value in (variables or {}).items():
+            # -F resolves placeholders and sends integers as numbers
+            typed = isinstance(value, int) or "{owner}" in value or "{repo}" in value
+            args.extend(["-F" if typed else "-f", f"{name}={value}"])
+
+        # gh exits non-zero when the response carries errors, even with data
+        result = await self.run(args, timeout=timeout, raise_on_error=False)
+        try:
+            response = json.loads(result.stdout) if result.stdout.strip() else {}
+        except json.JSONDecodeError:
+            response = {}
+
+        data = response.get("data")
+        if data is None:
+            raise GHCommandError(
+                f"gh api graphql failed: {result.stderr or response.get('errors') or 'Unknown error'}"
+            )
+        if response.get("errors"):
+            logger.warning(f"GraphQL query returned errors: {response['errors']}")
+        return data
+
+    async def get_pr_contexts(self, pr_numbers: list[int]) -> dict[int, dict[str, Any]]:
+        """
+        Fetch metadata, files, commits and comments for PRs.
+
+        One GraphQL query covers up to pr_graphql.BATCH_SIZE PRs; connections
+        longer than one page are paginated with cursors.
+
+        Args:
+            pr_numbers: PR numbers to fetch
+
+        Returns:
+            {pr_number: data} in the shapes documented in pr_graphql.normalize_pr.
+            PRs that don't exist are omitted.
+        """
+        if self.repo:
+            owner, _, name = self.repo.partition("/")
+        else:
+            owner, name = "{owner}", "{repo}"
+
+        async def run_query(query: str) -> dict[str, Any]:
+            return await self.graphql(
+                query, variables={"owner": owner, "name": name}, timeout=60.0
+            )
+
+        return await fetch_pr_contexts(run_query, pr_numbers)
+
     async def pr_merge(
         self,
         pr_number: int,
@@ -683,9 +864,9 @@ class GHClient:
             - total_commits: Total number of commits in comparison
         """
         endpoint = f"repos/{{owner}}/{{repo}}/compare/{base_sha}...{head_sha}"
-        args = ["api", endpoint]
 
-        result = await self.run(args, timeout=60.0)  # Longer timeout for large diffs
+        # Longer timeout for large diffs
+        result = await self.api_get_cached(endpoint, timeout=60.0)
         return json.loads(result.stdout)
 
     async def get_comments_since(
@@ -706,8 +887,7 @@ class GHClient:
         # Fetch inline review comments
         # Use query string syntax - the -f flag sends POST body fields, not query params
         review_endpoint = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments?since={since_timestamp}"
-        review_args = ["api", "--method", "GET", review_endpoint]
-        review_result = await self.run(review_args, raise_on_error=False)
+        review_result = await self.api_get_cached(review_endpoint, raise_on_error=False)
 
         review_comments = []
         if review_result.returncode == 0:
@@ -719,8 +899,7 @@ class GHClient:
         # Fetch general issue comments
         # Use query string syntax - the -f flag sends POST body fields, not query params
         issue_endpoint = f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments?since={since_timestamp}"
-        issue_args = ["api", "--method", "GET", issue_endpoint]
-        issue_result = await self.run(issue_args, raise_on_error=False)
+        issue_result = await self.api_get_cached(issue_endpoint, raise_on_error=False)
 
         issue_comments = []
         if issue_result.returncode == 0:
@@ -763,8 +942,9 @@ class GHClient:
         # Note: The reviews endpoint doesn't support 'since' parameter,
         # so we fetch all and filter client-side
         reviews_endpoint = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/reviews"
-        reviews_args = ["api", "--method", "GET", reviews_endpoint]
-        reviews_result = await self.run(reviews_args, raise_on_error=False)
+        reviews_result = await self.api_get_cached(
+            reviews_endpoint, raise_on_error=False
+        )
 
         reviews = []
         if reviews_result.returncode == 0:
@@ -918,9 +1098,7 @@ class GHClient:
             endpoint = (
                 "repos/{owner}/{repo}/actions/runs?status=action_required&per_page=100"
             )
-            args = ["api", "--method", "GET", endpoint]
-
-            result = await self.run(args, timeout=30.0)
+            result = await self.api_get_cached(endpoint, timeout=30.0)
             data = json.loads(result.stdout) if result.stdout.strip() else {}
             all_runs = data.get("workflow_runs", [])
 
@@ -1032,9 +1210,7 @@ class GHClient:
 
         while True:
             endpoint = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/files?page={page}&per_page={per_page}"
-            args = ["api", "--method", "GET", endpoint]
-
-            result = await self.run(args, timeout=60.0)
+            result = await self.api_get_cached(endpoint, timeout=60.0)
             page_files = json.loads(result.stdout) if result.stdout.strip() else []
 
             if not page_files:
@@ -1084,9 +1260,7 @@ class GHClient:
 
         while True:
             endpoint = f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/commits?page={page}&per_page={per_page}"
-            args = ["api", "--method", "GET", endpoint]
-
-            result = await self.run(args, timeout=60.0)
+            result = await self.api_get_cached(endpoint, timeout=60.0)
             page_commits = json.loads(result.stdout) if result.stdout.strip() else []
 
             if not page_commits:
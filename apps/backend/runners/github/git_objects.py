@@ -0,0 +1,369 @@
+"""
+Batched Git Object Reads
+========================
+
+Reads file contents and per-file patches from the local repository without
+spawning one git process per file:
+
+- Blobs are resolved and streamed through two long-lived
+  ``git cat-file --batch-check`` / ``git cat-file --batch`` processes, with
+  requests pipelined in bounded windows
+- Blob contents are kept in a process-wide LRU keyed by object id, so the
+  same blob is never transferred twice (e.g. unchanged files shared by a
+  review and its follow-up)
+- Patches for many files come from a single ``git diff`` per chunk of paths;
+  paths whose header git still quotes (control characters, quotes) are
+  diffed on their own
+
+Example Usage:
+    async with GitObjectReader(project_dir) as reader:
+        contents = await reader.read_files([(head_sha, "src/app.py")])
+        patches = await reader.diff_files(base_sha, head_sha, ["src/app.py"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_DIFF_HEADER_RE = re.compile(r"^diff --git (.*)$", re.MULTILINE)
+
+
+class BlobCache:
+    """Byte-bounded LRU of decoded blob contents keyed by object id."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, oid: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(oid)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(oid)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, oid: str, content: str, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if oid in self._entries:
+                self._entries.move_to_end(oid)
+                return
+            self._entries[oid] = (content, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Blob ids are content hashes, so one cache is safe to share across repos
+blob_cache = BlobCache()
+
+
+class _CatFileProcess:
+    """One long-lived ``git cat-file`` process answering requests in order."""
+
+    def __init__(self, project_dir: Path, mode: str):
+        self.project_dir = project_dir
+        self.mode = mode  # "--batch" or "--batch-check"
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_started(self) -> asyncio.subprocess.Process:
+        if self._proc is None or self._proc.returncode is not None:
+            self._proc = await asyncio.create_subprocess_exec(
+                "git",
+                "cat-file",
+                self.mode,
+                cwd=self.project_dir,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        return self._proc
+
+    async def query(
+        self, requests: list[str], window: int, timeout: float
+    ) -> list[tuple[str, str, bytes | None] | None]:
+        """
+        Send requests and collect one response per request.
+
+        Returns:
+            (object id, type, content or None for --batch-check) per request,
+            or None if the object is missing or could not be read
+        """
+        results: list[tuple[str, str, bytes | None] | None] = [None] * len(requests)
+        async with self._lock:
+            for start in range(0, len(requests), window):
+                chunk = requests[start : start + window]
+                try:
+                    proc = await self._ensure_started()
+                    answers = await asyncio.wait_for(
+                        self._round_trip(proc, chunk), timeout=timeout
+                    )
+                except (
+                    asyncio.TimeoutError,
+                    asyncio.IncompleteReadError,
+                    BrokenPipeError,
+                    ConnectionResetError,
+                    OSError,
+                    ValueError,
+                ) as e:
+                    # Leave this window unanswered; the next one restarts git
+                    logger.warning(f"git cat-file {self.mode} failed: {e!r}")
+                    await self.close()
+                    continue
+                results[start : start + len(chunk)] = answers
+        return results
+
+    async def _round_trip(
+        self, proc: asyncio.subprocess.Process, chunk: list[str]
+    ) -> list[tuple[str, str, bytes | None] | None]:
+        # A window of short request lines always fits in the pipe buffer, so
+        # writing it all before reading cannot deadlock against git's output
+        proc.stdin.write("".join(f"{request}\n" for request in chunk).encode("utf-8"))
+        await proc.stdin.drain()
+
+        answers: list[tuple[str, str, bytes | None] | None] = []
+        for _ in chunk:
+            header = (await proc.stdout.readline()).decode("utf-8", "replace")
+            if not header:
+                raise asyncio.IncompleteReadError(b"", None)
+            parts = header.split()
+            # "<request> missing" / "<request> ambiguous" etc. carry no payload
+            if len(parts) != 3 or not parts[2].isdigit():
+                answers.append(None)
+                continue
+            oid, obj_type, size = parts[0], parts[1], int(parts[2])
+            content = None
+            if self.mode == "--batch":
+                content = (await proc.stdout.readexactly(size + 1))[:-1]
+            answers.append((oid, obj_type, content))
+        return answers
+
+    async def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=2.0)
+        except (asyncio.TimeoutError, OSError):
+            try:
+                proc.kill()
+                await proc.wait()
+            except ProcessLookupError:
+                pass
+
+
+class GitObjectReader:
+    """Reads many files and patches from a repository over a few git processes."""
+
+    # Requests pipelined per round-trip to a cat-file process
+    WINDOW = 64
+    # Paths per `git diff` invocation (keeps argv well under OS limits)
+    DIFF_CHUNK = 200
+
+    def __init__(
+        self,
+        project_dir: Path,
+        timeout: float = 10.0,
+        cache: BlobCache | None = None,
+    ):
+        self.project_dir = Path(project_dir)
+        self.timeout = timeout
+        self.cache = cache if cache is not None else blob_cache
+        self._check = _CatFileProcess(self.project_dir, "--batch-check")
+        self._batch = _CatFileProcess(self.project_dir, "--batch")
+
+    async def __aenter__(self) -> GitObjectReader:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the cat-file processes (they restart on the next read)."""
+        await self._check.close()
+        await self._batch.close()
+
+    async def read_files(
+        self, requests: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], str | None]:
+        """
+        Read ``path`` at ``ref`` for each (ref, path) pair.
+
+        Returns:
+            {(ref, path): content}, with None for paths that don't exist at
+            that ref, aren't regular files, or aren't valid UTF-8
+        """
+        unique = list(dict.fromkeys(requests))
+        results: dict[tuple[str, str], str | None] = dict.fromkeys(unique)
+        # Newlines would desynchronize the line-based protocol
+        askable = [(ref, path) for ref, path in unique if "\n" not in ref + path]
+        if not askable:
+            return results
+
+        infos = await self._check.query(
+            [f"{ref}:{path}" for ref, path in askable], self.WINDOW, self.timeout
+        )
+        oids: dict[tuple[str, str], str] = {}
+        for request, info in zip(askable, infos):
+            if info is not None and info[1] == "blob":
+                oids[request] = info[0]
+
+        contents: dict[str, str | None] = {}
+        missing: list[str] = []
+        for oid in dict.fromkeys(oids.values()):
+            cached = self.cache.get(oid)
+            if cached is None:
+                missing.append(oid)
+            else:
+                contents[oid] = cached
+
+        if missing:
+            blobs = await self._batch.query(missing, self.WINDOW, self.timeout)
+            for oid, blob in zip(missing, blobs):
+                if blob is None or blob[2] is None:
+                    continue
+                try:
+                    text = blob[2].decode("utf-8")
+                except UnicodeDecodeError:
+                    logger.debug(f"Blob {oid} is not valid UTF-8")
+                    contents[oid] = None
+                    continue
+                contents[oid] = text
+                self.cache.put(oid, text, len(blob[2]))
+
+        for request, oid in oids.items():
+            results[request] = contents.get(oid)
+        return results
+
+    async def diff_files(
+        self,
+        base_ref: str,
+        head_ref: str,
+        paths: list[str],
+        merge_base: bool = True,
+    ) -> dict[str, str] | None:
+        """
+        Per-file unified diffs between two refs from one ``git diff`` per chunk.
+
+        Each patch is identical to ``git diff base...head -- path`` run for
+        that path alone (``base..head`` with merge_base=False): rename
+        detection is disabled so every path is diffed on its own, and
+        non-ASCII paths are not quoted (``core.quotePath=false``).
+
+        Returns:
+            {path: patch} ("" for unchanged paths), or None if git failed
+        """
+        spec = f"{base_ref}...{head_ref}" if merge_base else f"{base_ref}..{head_ref}"
+        patches: dict[str, str] = dict.fromkeys(paths, "")
+        unique = list(dict.fromkeys(paths))
+
+        for start in range(0, len(unique), self.DIFF_CHUNK):
+            chunk = unique[start : start + self.DIFF_CHUNK]
+            args = ["--no-renames", "--src-prefix=a/", "--dst-prefix=b/", spec]
+            output = await self._git_diff(args, chunk)
+            if output is None:
+                return None
+            split, unparsed = self._split_diff(output)
+            patches.update(split)
+            if not unparsed:
+                continue
+            # Some header could not be attributed to a path; diff the paths
+            # it may belong to one at a time
+            for path in chunk:
+                if path not in split:
+                    patch = await self._git_diff(args, [path])
+                    if patch is None:
+                        return None
+                    patches[path] = patch
+
+        return patches
+
+    async def _git_diff(self, args: list[str], paths: list[str]) -> str | None:
+        """Run ``git diff <args> -- <paths>``; None if git failed or timed out."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "-c",
+                "core.quotePath=false",
+                "diff",
+                "--no-color",
+                "--no-ext-diff",
+                *args,
+                "--",
+                *paths,
+                cwd=self.project_dir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            logger.warning(f"Error running git diff: {e}")
+            return None
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=self.timeout + 0.1 * len(paths)
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout diffing {len(paths)} files")
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await proc.wait()
+            return None
+
+        if proc.returncode != 0:
+            logger.warning(
+                f"git diff failed: {stderr.decode('utf-8', 'replace').strip()}"
+            )
+            return None
+        return stdout.decode("utf-8", "replace")
+
+    @staticmethod
+    def _split_diff(output: str) -> tuple[dict[str, str], int]:
+        """
+        Split multi-file diff output into {path: patch}.
+
+        Returns:
+            (patches, number of headers that could not be parsed)
+        """
+        headers = list(_DIFF_HEADER_RE.finditer(output))
+        patches: dict[str, str] = {}
+        unparsed = 0
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(output)
+            # "a/<path> b/<path>" - both sides are equal without renames
+            rest = header.group(1)
+            path = rest[2 : 2 + (len(rest) - 5) // 2]
+            if rest != f"a/{path} b/{path}":
+                unparsed += 1
+                continue
+            patches[path] = output[header.start() : end]
+        return patches, unparsed
@@ -10,6 +10,15 @@ Features:
 - Pattern detection for cross-project learning
 - Feedback loop for prompt optimization
 
+Storage:
+- Each repo has an append-only ``<repo>_outcomes.jsonl`` log; recording a
+  prediction or outcome appends one line (the latest record wins)
+- The log is periodically compacted into the ``<repo>_outcomes.json``
+  snapshot
+- Accuracy counters (per repo, prediction type and day) and pattern
+  counters (per file type, category and change size) are kept up to date
+  on every record, so queries don't iterate outcomes
+
 Usage:
     tracker = LearningTracker(state_dir=Path(".auto-claude/github"))
 
@@ -25,13 +34,33 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
 import json
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .file_lock import FileLock, atomic_write
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, atomic_write
+
+logger = logging.getLogger(__name__)
+
+# Compact a repo's outcome log once it holds more than this many lines and
+# more lines than there are live outcomes for the repo
+COMPACTION_MIN_ENTRIES = 1000
+
+# Learning pattern dimensions: (name, ReviewOutcome attribute, is a list)
+PATTERN_DIMENSIONS = (
+    ("file_type", "file_types", True),
+    ("category", "categories", True),
+    ("change_size", "change_size", False),
+)
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -255,6 +284,154 @@ class LearningPattern:
         }
 
 
+def _day_number(dt: datetime) -> int:
+    """Ordinal of the (UTC, for aware datetimes) calendar day of ``dt``."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.date().toordinal()
+
+
+@dataclass
+class OutcomeCounts:
+    """Additive accuracy counters for a group of outcomes."""
+
+    total: int = 0
+    correct: int = 0
+    incorrect: int = 0
+    pending: int = 0
+    merge_seconds: float = 0.0
+    merges: int = 0
+
+    def apply(self, outcome: ReviewOutcome, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) an outcome's contribution."""
+        self.total += sign
+        if not outcome.is_complete:
+            self.pending += sign
+            return
+
+        was_correct = outcome.was_correct
+        if was_correct is True:
+            self.correct += sign
+        elif was_correct is False:
+            self.incorrect += sign
+        if outcome.actual_outcome == OutcomeType.MERGED and outcome.time_to_outcome:
+            self.merge_seconds += sign * outcome.time_to_outcome.total_seconds()
+            self.merges += sign
+
+    def add_to_stats(self, stats: AccuracyStats, type_key: str) -> None:
+        """Add these counters to ``stats`` under prediction type ``type_key``."""
+        stats.total_predictions += self.total
+        stats.correct_predictions += self.correct
+        stats.incorrect_predictions += self.incorrect
+        stats.pending_outcomes += self.pending
+
+        by_type = stats.by_type.setdefault(
+            type_key, {"total": 0, "correct": 0, "incorrect": 0}
+        )
+        by_type["total"] += self.total
+        by_type["correct"] += self.correct
+        by_type["incorrect"] += self.incorrect
+
+
+class OutcomeAggregates:
+    """
+    Incrementally maintained aggregates over a set of ReviewOutcomes.
+
+    Accuracy counters are kept per (repo, prediction type), overall and per
+    creation day. An all-time query sums one bucket per (repo, type); a
+    time-window query also sums the daily buckets after the start day and
+    only looks at individual outcomes created on the start day itself.
+    """
+
+    def __init__(self):
+        self.totals: dict[tuple[str, str], OutcomeCounts] = {}
+        self.daily: dict[int, dict[tuple[str, str], OutcomeCounts]] = {}
+        self.days: list[int] = []  # Sorted keys of daily
+        # Dimension -> value -> [correct, incorrect]
+        self.patterns: dict[str, dict[str, list[int]]] = {
+            name: {} for name, _attr, _is_list in PATTERN_DIMENSIONS
+        }
+
+    def apply(self, outcome: ReviewOutcome, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) an outcome's contribution."""
+        key = (outcome.repo, outcome.prediction.value)
+        self.totals.setdefault(key, OutcomeCounts()).apply(outcome, sign)
+
+        day = _day_number(outcome.created_at)
+        if day not in self.daily:
+            self.daily[day] = {}
+            bisect.insort(self.days, day)
+        self.daily[day].setdefault(key, OutcomeCounts()).apply(outcome, sign)
+
+        was_correct = outcome.was_correct if outcome.is_complete else None
+        if was_correct is None:
+            return
+        slot = 0 if was_correct else 1
+        for name, attr, is_list in PATTERN_DIMENSIONS:
+            values = getattr(outcome, attr)
+            for value in values if is_list else [values]:
+                counts = self.patterns[name].setdefault(value, [0, 0])
+                counts[slot] += sign
+
+    def accuracy(
+        self,
+        repo: str | None,
+        since: datetime | None,
+        prediction_type: PredictionType | None,
+        outcomes_on_day,
+    ) -> AccuracyStats:
+        """
+        Build AccuracyStats from the counters.
+
+        Args:
+            repo: Filter by repo (None for all)
+            since: Only include predictions created at or after this time
+            prediction_type: Filter by prediction type
+            outcomes_on_day: Callable returning the outcomes created on a day
+                number (used for the partial first day of a time window)
+
+        Returns:
+            AccuracyStats with aggregated metrics
+        """
+        type_filter = prediction_type.value if prediction_type else None
+
+        def wanted(key: tuple[str, str]) -> bool:
+            return (not repo or key[0] == repo) and (
+                type_filter is None or key[1] == type_filter
+            )
+
+        buckets: list[tuple[str, OutcomeCounts]] = []
+        if since is None:
+            buckets.extend((key[1], c) for key, c in self.totals.items() if wanted(key))
+        else:
+            start_day = _day_number(since)
+            for day in self.days[bisect.bisect_right(self.days, start_day) :]:
+                buckets.extend(
+                    (key[1], c) for key, c in self.daily[day].items() if wanted(key)
+                )
+            for outcome in outcomes_on_day(start_day):
+                key = (outcome.repo, outcome.prediction.value)
+                if wanted(key) and outcome.created_at >= since:
+                    counts = OutcomeCounts()
+                    counts.apply(outcome)
+                    buckets.append((key[1], counts))
+
+        stats = AccuracyStats()
+        merge_seconds = 0.0
+        merges = 0
+        for type_key, counts in buckets:
+            if counts.total:
+                counts.add_to_stats(stats, type_key)
+            merge_seconds += counts.merge_seconds
+            merges += counts.merges
+
+        # Calculate average merge time
+        if merges:
+            stats.avg_time_to_merge = timedelta(seconds=merge_seconds / merges)
+
+        return stats
+
+
 class LearningTracker:
     """
     Tracks predictions and outcomes to enable learning.
@@ -289,41 +466,155 @@ class LearningTracker:
         self.learning_dir.mkdir(parents=True, exist_ok=True)
 
         self._outcomes: dict[str, ReviewOutcome] = {}
+        self._aggregates = OutcomeAggregates()
+        # Review IDs without an outcome, and review IDs per creation day
+        self._pending: dict[str, None] = {}
+        self._by_day: dict[int, dict[str, None]] = {}
+        # Review IDs ordered by (created_at, review_id), overall and per repo
+        self._recent: list[tuple[datetime, str]] = []
+        self._recent_by_repo: dict[str, list[tuple[datetime, str]]] = {}
+        self._repo_sizes: dict[str, int] = {}
+        # Lines in each repo's outcome log (for compaction)
+        self._log_entries: dict[str, int] = {}
         self._load_outcomes()
 
     def _get_outcomes_file(self, repo: str) -> Path:
         safe_name = repo.replace("/", "_")
         return self.learning_dir / f"{safe_name}_outcomes.json"
 
+    def _get_log_file(self, repo: str) -> Path:
+        return self._get_outcomes_file(repo).with_suffix(".jsonl")
+
+    def _read_repo_file(self, snapshot_file: Path) -> tuple[dict[str, dict], int]:
+        """
+        Read one repo's snapshot plus its outcome log.
+
+        Returns:
+            (outcome dicts by review_id with the latest record winning,
+             number of lines in the log)
+        """
+        records: dict[str, dict] = {}
+        try:
+            with open(snapshot_file, encoding="utf-8") as f:
+                for item in json.load(f).get("outcomes", []):
+                    records[item["review_id"]] = item
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Skipping unreadable outcomes file {snapshot_file}: {e}")
+
+        log_entries = 0
+        try:
+            with open(snapshot_file.with_suffix(".jsonl"), encoding="utf-8") as f:
+                for line in f:
+                    log_entries += 1
+                    try:
+                        item = json.loads(line)
+                        records[item["review_id"]] = item
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # Torn or corrupt line
+        except FileNotFoundError:
+            pass
+        return records, log_entries
+
     def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
-            try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
-
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
-
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
+        """Load all outcomes from disk and build the aggregates."""
+        snapshot_files = {
+            file.with_suffix(".json")
+            for pattern in ("*_outcomes.json", "*_outcomes.jsonl")
+            for file in self.learning_dir.glob(pattern)
         }
+        for snapshot_file in sorted(snapshot_files):
+            records, log_entries = self._read_repo_file(snapshot_file)
+            for item in records.values():
+                try:
+                    outcome = ReviewOutcome.from_dict(item)
+                except (KeyError, ValueError, TypeError):
+                    continue
+                self._index(outcome)
+                self._log_entries.setdefault(outcome.repo, log_entries)
+
+    def _index(self, outcome: ReviewOutcome) -> None:
+        """Add an outcome to the in-memory indexes and aggregates."""
+        previous = self._outcomes.get(outcome.review_id)
+        if previous is not None:
+            self._unindex(previous)
+
+        self._outcomes[outcome.review_id] = outcome
+        self._aggregates.apply(outcome)
+        if not outcome.is_complete:
+            self._pending[outcome.review_id] = None
+        self._by_day.setdefault(_day_number(outcome.created_at), {})[
+            outcome.review_id
+        ] = None
+        entry = (outcome.created_at, outcome.review_id)
+        bisect.insort(self._recent, entry)
+        bisect.insort(self._recent_by_repo.setdefault(outcome.repo, []), entry)
+        self._repo_sizes[outcome.repo] = self._repo_sizes.get(outcome.repo, 0) + 1
+
+    def _unindex(self, outcome: ReviewOutcome) -> None:
+        """Remove an outcome from the in-memory indexes and aggregates."""
+        del self._outcomes[outcome.review_id]
+        self._aggregates.apply(outcome, sign=-1)
+        self._pending.pop(outcome.review_id, None)
+        self._by_day.get(_day_number(outcome.created_at), {}).pop(
+            outcome.review_id, None
+        )
+        entry = (outcome.created_at, outcome.review_id)
+        for recent in (self._recent, self._recent_by_repo[outcome.repo]):
+            i = bisect.bisect_left(recent, entry)
+            if i < len(recent) and recent[i] == entry:
+                del recent[i]
+        self._repo_sizes[outcome.repo] -= 1
+
+    def _outcomes_on_day(self, day: int) -> list[ReviewOutcome]:
+        return [self._outcomes[rid] for rid in self._by_day.get(day, {})]
+
+    def _append_outcome(self, outcome: ReviewOutcome) -> None:
+        """Append an outcome record to its repo's log, compacting when due."""
+        repo = outcome.repo
+        line = json.dumps(outcome.to_dict()) + "\n"
+
+        # The lock keeps appends from interleaving with another process's
+        # compaction of the same log
+        with FileLock(self._get_outcomes_file(repo), timeout=5.0):
+            with open(self._get_log_file(repo), "a", encoding="utf-8") as f:
+                f.write(line)
+
+        self._log_entries[repo] = self._log_entries.get(repo, 0) + 1
+        if self._log_entries[repo] > max(
+            COMPACTION_MIN_ENTRIES, self._repo_sizes.get(repo, 0)
+        ):
+            self.compact(repo)
+
+    def compact(self, repo: str | None = None) -> None:
+        """
+        Fold outcome logs into their snapshot files.
+
+        Reads the files (not memory) under the repo's lock, so records
+        appended by other processes are kept.
 
-        # Use file locking and atomic write for safe concurrent access
-        with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+        Args:
+            repo: Repository to compact (None for every repo with a log)
+        """
+        if repo is None:
+            repos = [r for r, entries in self._log_entries.items() if entries]
+        else:
+            repos = [repo]
+
+        for name in repos:
+            snapshot_file = self._get_outcomes_file(name)
+            with FileLock(snapshot_file, timeout=5.0):
+                records, _log_entries = self._read_repo_file(snapshot_file)
+                data = {
+                    "repo": name,
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                    "outcomes": list(records.values()),
+                }
+                with atomic_write(snapshot_file) as f:
+                    json.dump(data, f, separators=(",", ":"))
+                self._get_log_file(name).unlink(missing_ok=True)
+            self._log_entries[name] = 0
 
     def record_prediction(
         self,
@@ -366,8 +657,8 @@ class LearningTracker:
             categories=categories or [],
         )
 
-        self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._index(outcome)
+        self._append_outcome(outcome)
 
         return outcome
 
@@ -396,23 +687,21 @@ class LearningTracker:
             return None
 
         review_outcome = self._outcomes[review_id]
+        self._unindex(review_outcome)
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
+        self._index(review_outcome)
 
-        self._save_outcomes(repo)
+        self._append_outcome(review_outcome)
 
         return review_outcome
 
     def get_pending_outcomes(self, repo: str | None = None) -> list[ReviewOutcome]:
         """Get predictions that don't have outcomes yet."""
-        pending = []
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete:
-                if repo is None or outcome.repo == repo:
-                    pending.append(outcome)
-        return pending
+        pending = (self._outcomes[rid] for rid in self._pending)
+        return [o for o in pending if repo is None or o.repo == repo]
 
     def get_accuracy(
         self,
@@ -431,50 +720,9 @@ class LearningTracker:
         Returns:
             AccuracyStats with aggregated metrics
         """
-        stats = AccuracyStats()
-        merge_times = []
-
-        for outcome in self._outcomes.values():
-            # Apply filters
-            if repo and outcome.repo != repo:
-                continue
-            if since and outcome.created_at < since:
-                continue
-            if prediction_type and outcome.prediction != prediction_type:
-                continue
-
-            stats.total_predictions += 1
-
-            # Track by type
-            type_key = outcome.prediction.value
-            if type_key not in stats.by_type:
-                stats.by_type[type_key] = {"total": 0, "correct": 0, "incorrect": 0}
-            stats.by_type[type_key]["total"] += 1
-
-            if outcome.is_complete:
-                was_correct = outcome.was_correct
-                if was_correct is True:
-                    stats.correct_predictions += 1
-                    stats.by_type[type_key]["correct"] += 1
-                elif was_correct is False:
-                    stats.incorrect_predictions += 1
-                    stats.by_type[type_key]["incorrect"] += 1
-
-                # Track merge times
-                if (
-                    outcome.actual_outcome == OutcomeType.MERGED
-                    and outcome.time_to_outcome
-                ):
-                    merge_times.append(outcome.time_to_outcome)
-            else:
-                stats.pending_outcomes += 1
-
-        # Calculate average merge time
-        if merge_times:
-            avg_seconds = sum(t.total_seconds() for t in merge_times) / len(merge_times)
-            stats.avg_time_to_merge = timedelta(seconds=avg_seconds)
-
-        return stats
+        return self._aggregates.accuracy(
+            repo, since, prediction_type, self._outcomes_on_day
+        )
 
     def get_recent_outcomes(
         self,
@@ -482,13 +730,9 @@ class LearningTracker:
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
-
-        if repo:
-            outcomes = [o for o in outcomes if o.repo == repo]
-
-        outcomes.sort(key=lambda o: o.created_at, reverse=True)
-        return outcomes[:limit]
+        recent = self._recent if not repo else self._recent_by_repo.get(repo, [])
+        newest = recent[-limit:] if limit > 0 else []
+        return [self._outcomes[rid] for _created_at, rid in reversed(newest)]
 
     def detect_patterns(self, min_sample_size: int = 20) -> list[LearningPattern]:
         """
@@ -504,98 +748,23 @@ class LearningTracker:
         """
         patterns = []
 
-        # Pattern: Accuracy by file type
-        by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for file_type in outcome.file_types:
-                if file_type not in by_file_type:
-                    by_file_type[file_type] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_file_type[file_type]["correct"] += 1
-                else:
-                    by_file_type[file_type]["incorrect"] += 1
-
-        for file_type, counts in by_file_type.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)  # More samples = higher confidence
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"file_type_{file_type}",
-                        pattern_type="file_type_accuracy",
-                        context={"file_type": file_type},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
-
-        # Pattern: Accuracy by category
-        by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            for category in outcome.categories:
-                if category not in by_category:
-                    by_category[category] = {"correct": 0, "incorrect": 0}
-
-                if outcome.was_correct:
-                    by_category[category]["correct"] += 1
-                else:
-                    by_category[category]["incorrect"] += 1
-
-        for category, counts in by_category.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
-                confidence = min(1.0, total / 100)
-
-                patterns.append(
-                    LearningPattern(
-                        pattern_id=f"category_{category}",
-                        pattern_type="category_accuracy",
-                        context={"category": category},
-                        sample_size=total,
-                        accuracy=accuracy,
-                        confidence=confidence,
-                    )
-                )
+        # Accuracy by file type, category and change size
+        for name, _attr, _is_list in PATTERN_DIMENSIONS:
+            for value, (correct, incorrect) in self._aggregates.patterns[name].items():
+                total = correct + incorrect
+                if total < max(min_sample_size, 1):
+                    continue
 
-        # Pattern: Accuracy by change size
-        by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete or outcome.was_correct is None:
-                continue
-
-            size = outcome.change_size
-            if size not in by_size:
-                by_size[size] = {"correct": 0, "incorrect": 0}
-
-            if outcome.was_correct:
-                by_size[size]["correct"] += 1
-            else:
-                by_size[size]["incorrect"] += 1
-
-        for size, counts in by_size.items():
-            total = counts["correct"] + counts["incorrect"]
-            if total >= min_sample_size:
-                accuracy = counts["correct"] / total
+                # More samples = higher confidence
                 confidence = min(1.0, total / 100)
 
                 patterns.append(
                     LearningPattern(
-                        pattern_id=f"change_size_{size}",
-                        pattern_type="change_size_accuracy",
-                        context={"change_size": size},
+                        pattern_id=f"{name}_{value}",
+                        pattern_type=f"{name}_accuracy",
+                        context={name: value},
                         sample_size=total,
-                        accuracy=accuracy,
+                        accuracy=correct / total,
                         confidence=confidence,
                     )
                 )
@@ -611,16 +780,17 @@ class LearningTracker:
         now = datetime.now(timezone.utc)
         week_ago = now - timedelta(days=7)
         month_ago = now - timedelta(days=30)
+        all_time = self.get_accuracy(repo)
 
         return {
-            "all_time": self.get_accuracy(repo).to_dict(),
+            "all_time": all_time.to_dict(),
             "last_week": self.get_accuracy(repo, since=week_ago).to_dict(),
             "last_month": self.get_accuracy(repo, since=month_ago).to_dict(),
             "patterns": [p.to_dict() for p in self.detect_patterns()],
             "recent_outcomes": [
                 o.to_dict() for o in self.get_recent_outcomes(repo, limit=10)
             ],
-            "pending_count": len(self.get_pending_outcomes(repo)),
+            "pending_count": all_time.pending_outcomes,
         }
 
     def check_pr_status(
@@ -0,0 +1,271 @@
+"""
+Batched PR Context Queries
+==========================
+
+Fetches the PR context a review reads - metadata, changed files, commits,
+review comments and issue comments - for one or many PRs through GitHub's
+GraphQL API:
+
+- Up to BATCH_SIZE PRs are requested in a single query (one aliased
+  ``pullRequest`` per PR)
+- Connections with more than PAGE_SIZE items are followed with cursor
+  pagination; the follow-up pages for all PRs in a batch are requested
+  together in one query per round
+
+Results are normalized to the shapes the rest of the runner already uses:
+top-level fields match ``gh pr view --json``; comments match the REST API.
+
+Example Usage:
+    contexts = await fetch_pr_contexts(gh_client.graphql, [101, 102])
+    files = contexts[101]["files"]
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# PRs per query and items per connection page (GitHub's maximum page size)
+BATCH_SIZE = 10
+PAGE_SIZE = 100
+# Follow-up pages requested per pagination query
+MAX_PAGES_PER_QUERY = 20
+
+# Scalar fields, named as in `gh pr view --json`
+PR_SCALAR_FIELDS = [
+    "number",
+    "title",
+    "body",
+    "state",
+    "headRefName",
+    "baseRefName",
+    "headRefOid",
+    "baseRefOid",
+    "additions",
+    "deletions",
+    "changedFiles",
+    "mergeable",
+    "mergeStateStatus",
+]
+
+_COMMIT_FIELDS = (
+    "commit { oid messageHeadline messageBody committedDate authoredDate "
+    "authors(first: 10) { nodes { name email user { login } } } }"
+)
+# __typename tells bots apart; REST and gh spell their logins differently
+_AUTHOR_FIELDS = "author { __typename login }"
+# Inline comments come per thread; threads rarely exceed one page of comments
+_THREAD_FIELDS = (
+    f"comments(first: {PAGE_SIZE}) {{ nodes {{ databaseId {_AUTHOR_FIELDS} body "
+    "path line originalLine createdAt } }"
+)
+_COMMENT_FIELDS = f"databaseId {_AUTHOR_FIELDS} body createdAt"
+
+
+def _page(field: str, fields: str, cursor: str | None) -> str:
+    after = f", after: {json.dumps(cursor)}" if cursor else ""
+    return (
+        f"{field}(first: {PAGE_SIZE}{after}) "
+        f"{{ pageInfo {{ hasNextPage endCursor }} nodes {{ {fields} }} }}"
+    )
+
+
+# Paginated connections of a PR node and the fields selected on their nodes
+CONNECTIONS: dict[str, str] = {
+    "labels": "name",
+    "files": "path additions deletions changeType",
+    "commits": _COMMIT_FIELDS,
+    "reviewThreads": _THREAD_FIELDS,
+    "comments": _COMMENT_FIELDS,
+}
+
+
+def _repository_query(selections: list[str]) -> str:
+    body = "\n".join(selections)
+    return (
+        "query($owner: String!, $name: String!) {\n"
+        "repository(owner: $owner, name: $name) {\n"
+        f"{body}\n"
+        "}\n}"
+    )
+
+
+def build_pr_query(pr_numbers: list[int]) -> str:
+    """Query for the first page of everything about each PR, aliased ``pr<N>``."""
+    connections = "\n".join(
+        _page(name, fields, None) for name, fields in CONNECTIONS.items()
+    )
+    return _repository_query(
+        [
+            f"pr{number}: pullRequest(number: {number}) {{\n"
+            f"{' '.join(PR_SCALAR_FIELDS)}\n{_AUTHOR_FIELDS}\n{connections}\n}}"
+            for number in pr_numbers
+        ]
+    )
+
+
+def build_page_query(pages: list[tuple[int, str, str]]) -> str:
+    """Query for the next page of (pr_number, connection, cursor) requests."""
+    return _repository_query(
+        [
+            f"p{i}: pullRequest(number: {number}) "
+            f"{{ {_page(name, CONNECTIONS[name], cursor)} }}"
+            for i, (number, name, cursor) in enumerate(pages)
+        ]
+    )
+
+
+def _login(actor: dict | None) -> dict:
+    """REST ``user`` shape; apps get the "[bot]" suffix REST logins have."""
+    # Deleted users come back as null authors
+    actor = actor or {}
+    login = actor.get("login", "")
+    if actor.get("__typename") == "Bot" and login:
+        login = f"{login}[bot]"
+    return {"login": login}
+
+
+def _pr_author(actor: dict | None) -> dict:
+    """``gh pr view --json author`` shape, where apps are "app/<login>"."""
+    actor = actor or {}
+    login = actor.get("login", "")
+    is_bot = actor.get("__typename") == "Bot"
+    if is_bot and login:
+        login = f"app/{login}"
+    return {"login": login, "is_bot": is_bot}
+
+
+def normalize_pr(pr: dict, nodes: dict[str, list[dict]]) -> dict[str, Any]:
+    """
+    Convert a PR node and its fully paginated connections to runner shapes.
+
+    Returns:
+        ``gh pr view --json`` fields plus "review_comments" and
+        "issue_comments" (REST shapes)
+    """
+    data = {key: pr.get(key) for key in PR_SCALAR_FIELDS}
+    data["author"] = _pr_author(pr.get("author"))
+    data["body"] = pr.get("body") or ""
+    data["labels"] = [{"name": label["name"]} for label in nodes.get("labels", [])]
+    data["files"] = [
+        {
+            "path": f["path"],
+            "additions": f.get("additions", 0),
+            "deletions": f.get("deletions", 0),
+            "status": (f.get("changeType") or "MODIFIED").lower(),
+        }
+        for f in nodes.get("files", [])
+    ]
+    data["commits"] = []
+    for node in nodes.get("commits", []):
+        commit = node.get("commit") or {}
+        data["commits"].append(
+            {
+                "oid": commit.get("oid"),
+                "messageHeadline": commit.get("messageHeadline", ""),
+                "messageBody": commit.get("messageBody", ""),
+                "committedDate": commit.get("committedDate"),
+                "authoredDate": commit.get("authoredDate"),
+                "authors": [
+                    {
+                        "login": (a.get("user") or {}).get("login", ""),
+                        "name": a.get("name", ""),
+                        "email": a.get("email", ""),
+                    }
+                    for a in (commit.get("authors") or {}).get("nodes", [])
+                ],
+            }
+        )
+    data["review_comments"] = [
+        {
+            "id": c.get("databaseId"),
+            "user": _login(c.get("author")),
+            "body": c.get("body", ""),
+            "path": c.get("path"),
+            "line": c.get("line"),
+            "original_line": c.get("originalLine"),
+            "created_at": c.get("createdAt"),
+        }
+        for thread in nodes.get("reviewThreads", [])
+        for c in (thread.get("comments") or {}).get("nodes", [])
+    ]
+    data["issue_comments"] = [
+        {
+            "id": c.get("databaseId"),
+            "user": _login(c.get("author")),
+            "body": c.get("body", ""),
+            "created_at": c.get("createdAt"),
+        }
+        for c in nodes.get("comments", [])
+    ]
+    return data
+
+
+def _collect(
+    nodes: dict[int, dict[str, list[dict]]],
+    pending: list[tuple[int, str, str]],
+    number: int,
+    name: str,
+    connection: dict | None,
+) -> None:
+    """Add a connection page's nodes and queue its next page, if any."""
+    if not connection:
+        return
+    nodes[number][name].extend(connection.get("nodes") or [])
+    page_info = connection.get("pageInfo") or {}
+    if page_info.get("hasNextPage") and page_info.get("endCursor"):
+        pending.append((number, name, page_info["endCursor"]))
+
+
+async def fetch_pr_contexts(
+    graphql: Callable[[str], Awaitable[dict]],
+    pr_numbers: list[int],
+) -> dict[int, dict[str, Any]]:
+    """
+    Fetch and normalize the full context of several PRs.
+
+    Args:
+        graphql: Runs a repository query and returns its "data" object
+        pr_numbers: PRs to fetch
+
+    Returns:
+        {pr_number: normalized PR}; PRs that don't exist are omitted
+    """
+    unique = list(dict.fromkeys(pr_numbers))
+    results: dict[int, dict[str, Any]] = {}
+
+    for start in range(0, len(unique), BATCH_SIZE):
+        batch = unique[start : start + BATCH_SIZE]
+        repository = (await graphql(build_pr_query(batch))).get("repository") or {}
+
+        prs: dict[int, dict] = {}
+        nodes: dict[int, dict[str, list[dict]]] = {}
+        pending: list[tuple[int, str, str]] = []
+
+        for number in batch:
+            pr = repository.get(f"pr{number}")
+            if not pr:
+                continue
+            prs[number] = pr
+            nodes[number] = {name: [] for name in CONNECTIONS}
+            for name in CONNECTIONS:
+                _collect(nodes, pending, number, name, pr.get(name))
+
+        while pending:
+            pages, pending = (
+                pending[:MAX_PAGES_PER_QUERY],
+                pending[MAX_PAGES_PER_QUERY:],
+            )
+            repository = (await graphql(build_page_query(pages))).get(
+                "repository"
+            ) or {}
+            for i, (number, name, _) in enumerate(pages):
+                pr = repository.get(f"p{i}")
+                if pr:
+                    _collect(nodes, pending, number, name, pr.get(name))
+
+        for number, pr in prs.items():
+            results[number] = normalize_pr(pr, nodes[number])
+
+    return results
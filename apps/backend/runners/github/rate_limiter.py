@@ -139,6 +139,11 @@ class TokenBucket:
             wait_time = min(tokens_needed / self.refill_rate, 1.0)  # Max 1 second wait
             await asyncio.sleep(wait_time)
 
+    def release(self, tokens: int = 1) -> None:
+        """Return tokens for an operation that turned out not to cost any."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + tokens)
+
     def available(self) -> int:
         """Get number of available tokens."""
         self._refill()
@@ -324,6 +329,11 @@ class RateLimiter:
         self.github_errors = 0
         self.start_time = datetime.now()
 
+        # Response cache statistics
+        self.github_cache_hits = 0  # Served from cache without a request
+        self.github_cache_revalidated = 0  # 304 Not Modified
+        self.github_cache_misses = 0  # Fetched a new response
+
         RateLimiter._initialized = True
 
     @classmethod
@@ -439,6 +449,24 @@ class RateLimiter:
         """Record a GitHub API error."""
         self.github_errors += 1
 
+    def record_cache_hit(self) -> None:
+        """Record a GitHub response served from cache without any request."""
+        self.github_cache_hits += 1
+
+    def record_cache_revalidated(self) -> None:
+        """
+        Record a 304 Not Modified response to a conditional request.
+
+        GitHub doesn't count these against the rate limit, so the token
+        consumed for the request is returned to the bucket.
+        """
+        self.github_cache_revalidated += 1
+        self.github_bucket.release()
+
+    def record_cache_miss(self) -> None:
+        """Record a cacheable GitHub request that returned a new response."""
+        self.github_cache_misses += 1
+
     def statistics(self) -> dict:
         """
         Get rate limiter statistics.
@@ -447,6 +475,11 @@ class RateLimiter:
             Dictionary of statistics
         """
         runtime = (datetime.now() - self.start_time).total_seconds()
+        cache_lookups = (
+            self.github_cache_hits
+            + self.github_cache_revalidated
+            + self.github_cache_misses
+        )
 
         return {
             "runtime_seconds": runtime,
@@ -456,6 +489,17 @@ class RateLimiter:
                 "errors": self.github_errors,
                 "available_tokens": self.github_bucket.available(),
                 "requests_per_second": self.github_requests / max(runtime, 1),
+                "cache": {
+                    "hits": self.github_cache_hits,
+                    "revalidated": self.github_cache_revalidated,
+                    "misses": self.github_cache_misses,
+                    "hit_rate": (
+                        (self.github_cache_hits + self.github_cache_revalidated)
+                        / cache_lookups
+                        if cache_lookups
+                        else 0.0
+                    ),
+                },
             },
             "cost": {
                 "total_cost": self.cost_tracker.total_cost,
@@ -481,6 +525,9 @@ class RateLimiter:
             f"  Errors: {stats['github']['errors']}",
             f"  Available Tokens: {stats['github']['available_tokens']}",
             f"  Rate: {stats['github']['requests_per_second']:.2f} req/s",
+            f"  Cache: {stats['github']['cache']['hits']} hits, "
+            f"{stats['github']['cache']['revalidated']} revalidated (304), "
+            f"{stats['github']['cache']['misses']} misses",
             "",
             "AI Cost:",
             f"  Total: ${stats['cost']['total_cost']:.4f}",
@@ -0,0 +1,260 @@
+"""
+GitHub API Response Cache
+=========================
+
+On-disk cache of GitHub REST responses fetched through ``gh api``:
+
+- Responses are keyed by repository + endpoint (including query parameters)
+- Within an endpoint's TTL a cached response is served without any request
+- After the TTL the response is revalidated with a conditional request
+  (``If-None-Match`` / ``If-Modified-Since``); GitHub answers unchanged
+  resources with 304 Not Modified, which does not count against the quota
+
+Entries are stored one JSON file per key under
+``.auto-claude/github/http_cache/``. At most MAX_ENTRIES responses are kept;
+the least recently used are deleted as new ones are stored. Endpoints whose
+query makes every request unique (see UNCACHED_QUERY_PARAMS) are not cached.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Seconds a response is served without revalidation, by endpoint pattern.
+# First match wins; endpoints matching nothing are revalidated on every use.
+ENDPOINT_TTLS: list[tuple[re.Pattern, float]] = [
+    # Comparisons between two commit SHAs never change
+    (re.compile(r"/compare/[0-9a-f]{40}\.\.\.[0-9a-f]{40}$"), 24 * 3600.0),
+    (re.compile(r"/pulls/\d+/(files|commits)\b"), 60.0),
+    (re.compile(r"/pulls/\d+/reviews\b"), 30.0),
+    (re.compile(r"/(pulls|issues)/\d+/comments\b"), 30.0),
+    (re.compile(r"/actions/runs\b"), 15.0),
+]
+
+# Query parameters that give every request its own key (e.g. a polling
+# timestamp); such responses would never be reused
+UNCACHED_QUERY_PARAMS = frozenset({"since"})
+
+# Responses kept per cache directory, on disk and in memory
+MAX_ENTRIES = 1000
+
+
+def is_cacheable(endpoint: str) -> bool:
+    """Whether responses from ``endpoint`` are worth caching."""
+    query = urllib.parse.urlsplit(endpoint).query
+    return not any(
+        name in UNCACHED_QUERY_PARAMS
+        for name, _ in urllib.parse.parse_qsl(query, keep_blank_values=True)
+    )
+
+
+def ttl_for(endpoint: str) -> float:
+    """Time-to-live in seconds for responses from ``endpoint``."""
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.search(endpoint):
+            return ttl
+    return 0.0
+
+
+@dataclass
+class CachedResponse:
+    """A cached response body with its validators."""
+
+    key: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    ttl: float
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) - self.fetched_at < self.ttl
+
+    def conditional_headers(self) -> list[str]:
+        """Request headers that make GitHub answer 304 if nothing changed."""
+        headers = []
+        if self.etag:
+            headers.append(f"If-None-Match: {self.etag}")
+        if self.last_modified:
+            headers.append(f"If-Modified-Since: {self.last_modified}")
+        return headers
+
+
+def parse_included_response(output: str) -> tuple[int | None, dict[str, str], str]:
+    """
+    Split ``gh api --include`` output into (status, headers, body).
+
+    Header names are lowercased. Status is None if the output has no
+    status line.
+    """
+    head, sep, body = output.partition("\r\n\r\n")
+    if not sep:
+        head, sep, body = output.partition("\n\n")
+    if not sep or not head.startswith("HTTP/"):
+        return None, {}, output
+
+    lines = head.replace("\r\n", "\n").split("\n")
+    status = None
+    parts = lines[0].split()
+    if len(parts) >= 2 and parts[1].isdigit():
+        status = int(parts[1])
+
+    headers = {}
+    for line in lines[1:]:
+        name, colon, value = line.partition(":")
+        if colon:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+class ResponseCache:
+    """Persistent LRU cache of API responses, one file per key."""
+
+    def __init__(self, cache_dir: Path, max_entries: int = MAX_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        # key -> entry (None if not cached), least recently used first
+        self._entries: OrderedDict[str, CachedResponse | None] = OrderedDict()
+        # Cache file name -> key (None until read), least recently used first;
+        # scanned from disk on first use
+        self._files: OrderedDict[str, str | None] | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return (
+            self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+        )
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for ``key`` (fresh or stale), if any."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._entries[key] = self._load(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            entry = self._entries[key]
+            if entry is not None:
+                self._mark_used(key)
+            return entry
+
+    def _load(self, key: str) -> CachedResponse | None:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = CachedResponse(**json.load(f))
+        except (OSError, json.JSONDecodeError, TypeError, UnicodeDecodeError):
+            return None
+        # Guard against hash collisions
+        return entry if entry.key == key else None
+
+    def put(
+        self,
+        key: str,
+        body: str,
+        etag: str | None,
+        last_modified: str | None,
+        ttl: float,
+    ) -> CachedResponse:
+        """Store a freshly fetched response."""
+        entry = CachedResponse(
+            key=key,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=time.time(),
+            ttl=ttl,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._write(entry)
+            self._mark_used(key)
+            self._evict()
+        return entry
+
+    def touch(self, key: str) -> None:
+        """Mark a cached response as just revalidated (after a 304)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.fetched_at = time.time()
+            self._write(entry)
+            self._mark_used(key)
+
+    def _write(self, entry: CachedResponse) -> None:
+        path = self._path(entry.key)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f)
+            os.replace(tmp, path)
+        except OSError as e:
+            # The cache is an optimization - keep serving from memory
+            logger.debug(f"Could not persist cached response {entry.key}: {e}")
+
+    def _scan(self) -> OrderedDict[str, str | None]:
+        """Cache files on disk, oldest first (written by any process)."""
+        if self._files is None:
+            files = []
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    files.append((path.stat().st_mtime, path.name))
+                except OSError:
+                    continue
+            self._files = OrderedDict((name, None) for _, name in sorted(files))
+        return self._files
+
+    def _mark_used(self, key: str) -> None:
+        files = self._scan()
+        name = self._path(key).name
+        files[name] = key
+        files.move_to_end(name)
+
+    def _evict(self) -> None:
+        """Delete least recently used responses beyond max_entries."""
+        files = self._scan()
+        while len(files) > self.max_entries:
+            name, key = files.popitem(last=False)
+            if key is not None:
+                self._entries.pop(key, None)
+            (self.cache_dir / name).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self._files = OrderedDict()
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*.json"):
+                    path.unlink(missing_ok=True)
+
+
+# Caches are opened once per process and shared between clients
+_open_caches: dict[Path, ResponseCache] = {}
+_open_caches_lock = threading.Lock()
+
+
+def open_response_cache(cache_dir: Path) -> ResponseCache:
+    """Return the process-wide cache for ``cache_dir``."""
+    key = Path(cache_dir).resolve()
+    with _open_caches_lock:
+        cache = _open_caches.get(key)
+        if cache is None:
+            cache = ResponseCache(key)
+            _open_caches[key] = cache
+        return cache
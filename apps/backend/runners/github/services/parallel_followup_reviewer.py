@@ -50,7 +50,11 @@ try:
     from .agent_utils import create_working_dir_injector
     from .category_utils import map_category
     from .io_utils import safe_print
-    from .pr_worktree_manager import PRWorktreeManager
+    from .pr_worktree_manager import (
+        PRWorktreeManager,
+        PRWorktreePool,
+        _use_sparse_checkout,
+    )
     from .pydantic_models import FollowupExtractionResponse, ParallelFollowupResponse
     from .recovery_utils import create_finding_from_summary
     from .sdk_utils import process_sdk_stream
@@ -75,7 +79,11 @@ except (ImportError, ValueError, SystemError):
     from services.agent_utils import create_working_dir_injector
     from services.category_utils import map_category
     from services.io_utils import safe_print
-    from services.pr_worktree_manager import PRWorktreeManager
+    from services.pr_worktree_manager import (
+        PRWorktreeManager,
+        PRWorktreePool,
+        _use_sparse_checkout,
+    )
     from services.pydantic_models import (
         FollowupExtractionResponse,
         ParallelFollowupResponse,
@@ -91,6 +99,8 @@ DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 
 # Directory for PR review worktrees (shared with initial reviewer)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
+# Reusable worktrees kept warm between reviews (shared with initial reviewer)
+PR_WORKTREE_POOL_DIR = ".auto-claude/github/pr/worktree-pool"
 
 # Severity mapping for AI responses
 _SEVERITY_MAPPING = {
@@ -137,6 +147,7 @@ class ParallelFollowupReviewer:
         self.config = config
         self.progress_callback = progress_callback
         self.worktree_manager = PRWorktreeManager(project_dir, PR_WORKTREE_DIR)
+        self.worktree_pool = PRWorktreePool(self.worktree_manager, PR_WORKTREE_POOL_DIR)
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -167,12 +178,19 @@ class ParallelFollowupReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+    def _create_pr_worktree(
+        self,
+        head_sha: str,
+        pr_number: int,
+        changed_paths: list[str] | None = None,
+    ) -> Path:
+        """Check out a worktree at the PR head commit (reused from the pool when possible).
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            changed_paths: Paths changed by the PR, used to limit the checkout
+                when PR_WORKTREE_SPARSE_CHECKOUT is enabled
 
         Returns:
             Path to the created worktree
@@ -188,15 +206,16 @@ class ParallelFollowupReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        sparse_paths = changed_paths if _use_sparse_checkout() else None
+        return self.worktree_pool.acquire(head_sha, pr_number, sparse_paths)
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Return a PR review worktree to the pool, or remove it if not pooled.
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_pool.release(worktree_path)
 
     def _define_specialist_agents(
         self, project_root: Path | None = None
@@ -499,7 +518,9 @@ The SDK will run invoked agents in parallel automatically.
                             flush=True,
                         )
                     worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                        head_sha,
+                        context.pr_number,
+                        context.files_changed_since_review,
                     )
                     project_root = worktree_path
                     safe_print(
@@ -53,7 +53,11 @@ try:
     from .agent_utils import create_working_dir_injector
     from .category_utils import map_category
     from .io_utils import safe_print
-    from .pr_worktree_manager import PRWorktreeManager
+    from .pr_worktree_manager import (
+        PRWorktreeManager,
+        PRWorktreePool,
+        _use_sparse_checkout,
+    )
     from .pydantic_models import (
         AgentAgreement,
         FindingValidationResponse,
@@ -83,7 +87,11 @@ except (ImportError, ValueError, SystemError):
     from services.agent_utils import create_working_dir_injector
     from services.category_utils import map_category
     from services.io_utils import safe_print
-    from services.pr_worktree_manager import PRWorktreeManager
+    from services.pr_worktree_manager import (
+        PRWorktreeManager,
+        PRWorktreePool,
+        _use_sparse_checkout,
+    )
     from services.pydantic_models import (
         AgentAgreement,
         FindingValidationResponse,
@@ -145,6 +153,8 @@ DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 
 # Directory for PR review worktrees (inside github/pr for consistency)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
+# Reusable worktrees kept warm between reviews
+PR_WORKTREE_POOL_DIR = ".auto-claude/github/pr/worktree-pool"
 
 
 def _is_finding_in_scope(
@@ -208,6 +218,7 @@ class ParallelOrchestratorReviewer:
         self.config = config
         self.progress_callback = progress_callback
         self.worktree_manager = PRWorktreeManager(project_dir, PR_WORKTREE_DIR)
+        self.worktree_pool = PRWorktreePool(self.worktree_manager, PR_WORKTREE_POOL_DIR)
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -238,12 +249,19 @@ class ParallelOrchestratorReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+    def _create_pr_worktree(
+        self,
+        head_sha: str,
+        pr_number: int,
+        changed_paths: list[str] | None = None,
+    ) -> Path:
+        """Check out a worktree at the PR head commit (reused from the pool when possible).
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            changed_paths: Paths changed by the PR, used to limit the checkout
+                when PR_WORKTREE_SPARSE_CHECKOUT is enabled
 
         Returns:
             Path to the created worktree
@@ -259,15 +277,16 @@ class ParallelOrchestratorReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        sparse_paths = changed_paths if _use_sparse_checkout() else None
+        return self.worktree_pool.acquire(head_sha, pr_number, sparse_paths)
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Return a PR review worktree to the pool, or remove it if not pooled.
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_pool.release(worktree_path)
 
     def _cleanup_stale_pr_worktrees(self) -> None:
         """Clean up orphaned, expired, and excess PR review worktrees on startup."""
@@ -1111,28 +1130,19 @@ The SDK will run invoked agents in parallel automatically.
                     )
                 try:
                     worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                        head_sha,
+                        context.pr_number,
+                        [f.path for f in context.changed_files],
                     )
                     project_root = worktree_path
-                    # Count files in worktree to give user visibility (with limit to avoid slowdown)
-                    MAX_FILE_COUNT = 10000
-                    try:
-                        file_count = 0
-                        for f in worktree_path.rglob("*"):
-                            if f.is_file() and ".git" not in f.parts:
-                                file_count += 1
-                                if file_count >= MAX_FILE_COUNT:
-                                    break
-                    except (OSError, PermissionError):
-                        file_count = 0
-                    file_count_str = (
-                        f"{file_count:,}+"
-                        if file_count >= MAX_FILE_COUNT
-                        else f"{file_count:,}"
+                    # Count files from the git index to give user visibility
+                    file_count = self.worktree_manager.count_checked_out_files(
+                        worktree_path
                     )
                     # Always log worktree creation with file count (not gated by DEBUG_MODE)
                     safe_print(
-                        f"[PRReview] Created temporary worktree: {worktree_path.name} ({file_count_str} files)",
+                        f"[PRReview] Using worktree: {worktree_path.name} ({file_count:,} files, "
+                        f"checkout {self.worktree_pool.stats.last_checkout_seconds:.1f}s)",
                         flush=True,
                     )
                     safe_print(
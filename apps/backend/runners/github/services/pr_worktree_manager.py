@@ -9,6 +9,7 @@ Features:
 - Count-based cleanup (keep only N most recent worktrees)
 - Orphaned worktree cleanup (worktrees not registered with git)
 - Automatic cleanup on review completion
+- Warm pool of reusable worktrees re-pointed to each new head SHA
 """
 
 from __future__ import annotations
@@ -28,6 +29,8 @@ logger = logging.getLogger(__name__)
 # Default cleanup policies (can be overridden via environment variables)
 DEFAULT_MAX_PR_WORKTREES = 10  # Max worktrees to keep
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = 7  # Max age in days
+DEFAULT_PR_WORKTREE_POOL_SIZE = 2  # Reusable worktrees kept warm (0 disables)
+POOL_LEASE_TIMEOUT_SECONDS = 4 * 3600  # Leases older than this are abandoned
 
 
 def _get_max_pr_worktrees() -> int:
@@ -52,6 +55,26 @@ def _get_max_age_days() -> int:
         return DEFAULT_PR_WORKTREE_MAX_AGE_DAYS
 
 
+def _get_pool_size() -> int:
+    """Get worktree pool size setting, read at runtime for testability."""
+    try:
+        value = int(
+            os.environ.get("PR_WORKTREE_POOL_SIZE", str(DEFAULT_PR_WORKTREE_POOL_SIZE))
+        )
+        return value if value >= 0 else DEFAULT_PR_WORKTREE_POOL_SIZE
+    except (ValueError, TypeError):
+        return DEFAULT_PR_WORKTREE_POOL_SIZE
+
+
+def _use_sparse_checkout() -> bool:
+    """Whether pooled worktrees check out only the PR's changed directories."""
+    return os.environ.get("PR_WORKTREE_SPARSE_CHECKOUT", "").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+
 # Safe pattern for git refs (SHA, branch names)
 # Allows: alphanumeric, dots, underscores, hyphens, forward slashes
 import re
@@ -106,15 +129,7 @@ class PRWorktreeManager:
             RuntimeError: If worktree creation fails
             ValueError: If head_sha or pr_number are invalid
         """
-        # Validate inputs to prevent command injection
-        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
-            raise ValueError(
-                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
-            )
-        if not isinstance(pr_number, int) or pr_number <= 0:
-            raise ValueError(
-                f"Invalid pr_number: must be a positive integer, got {pr_number}"
-            )
+        self._validate_inputs(head_sha, pr_number)
 
         # Run cleanup before creating new worktree (can be disabled for tests)
         if auto_cleanup:
@@ -132,24 +147,7 @@ class PRWorktreeManager:
         logger.debug(f"Creating worktree: {worktree_path}")
 
         env = get_isolated_git_env()
-        try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin", head_sha],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env,
-            )
-
-            if fetch_result.returncode != 0:
-                logger.warning(
-                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
-                )
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                f"Timeout fetching {head_sha} from origin, continuing anyway"
-            )
+        self.fetch_head(head_sha)
 
         try:
             result = subprocess.run(
@@ -184,6 +182,74 @@ class PRWorktreeManager:
         logger.info(f"[WorktreeManager] Created worktree at {worktree_path}")
         return worktree_path
 
+    @staticmethod
+    def _validate_inputs(head_sha: str, pr_number: int) -> None:
+        """Validate inputs to prevent command injection."""
+        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
+            raise ValueError(
+                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+        if not isinstance(pr_number, int) or pr_number <= 0:
+            raise ValueError(
+                f"Invalid pr_number: must be a positive integer, got {pr_number}"
+            )
+
+    def fetch_head(self, head_sha: str) -> None:
+        """
+        Fetch a PR head commit from origin (best effort).
+
+        Args:
+            head_sha: Git commit SHA to fetch
+        """
+        try:
+            fetch_result = subprocess.run(
+                ["git", "fetch", "origin", head_sha],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=get_isolated_git_env(),
+            )
+
+            if fetch_result.returncode != 0:
+                logger.warning(
+                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
+                )
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f"Timeout fetching {head_sha} from origin, continuing anyway"
+            )
+
+    def count_checked_out_files(self, worktree_path: Path) -> int:
+        """
+        Count files checked out in a worktree from the git index.
+
+        Args:
+            worktree_path: Path to the worktree
+
+        Returns:
+            Number of tracked files present on disk (0 on error)
+        """
+        try:
+            result = subprocess.run(
+                ["git", "ls-files", "-t", "-z"],
+                cwd=worktree_path,
+                capture_output=True,
+                text=True,
+                timeout=30,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            return 0
+        if result.returncode != 0:
+            return 0
+        # "S " marks entries skipped by sparse checkout
+        return sum(
+            1
+            for entry in result.stdout.split("\0")
+            if entry and not entry.startswith("S ")
+        )
+
     def remove_worktree(self, worktree_path: Path) -> None:
         """
         Remove a PR worktree with fallback chain.
@@ -441,3 +507,290 @@ class PRWorktreeManager:
             logger.info(f"[WorktreeManager] Removed all {count} PR worktrees")
 
         return count
+
+
+def sparse_checkout_dirs(changed_paths: list[str]) -> list[str]:
+    """
+    Directories a sparse checkout needs to cover a PR's changed paths.
+
+    Cone-mode sparse checkout always includes files at the repository root,
+    so only the parent directories of nested paths are returned.
+
+    Args:
+        changed_paths: Repository-relative paths changed by the PR
+
+    Returns:
+        Sorted, de-duplicated list of directories
+    """
+    dirs = set()
+    for path in changed_paths:
+        parent = Path(path.replace("\\", "/")).parent.as_posix()
+        if parent not in ("", "."):
+            dirs.add(parent)
+    return sorted(dirs)
+
+
+class WorktreePoolStats:
+    """Hit/miss and checkout-time counters for a PRWorktreePool."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.checkout_seconds = 0.0
+        self.last_checkout_seconds = 0.0
+
+    def record(self, hit: bool, seconds: float) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        self.checkout_seconds += seconds
+        self.last_checkout_seconds = seconds
+
+    def to_dict(self) -> dict[str, float]:
+        acquisitions = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / acquisitions if acquisitions else 0.0,
+            "checkout_seconds": round(self.checkout_seconds, 3),
+            "avg_checkout_seconds": (
+                round(self.checkout_seconds / acquisitions, 3) if acquisitions else 0.0
+            ),
+            "last_checkout_seconds": round(self.last_checkout_seconds, 3),
+        }
+
+
+class PRWorktreePool:
+    """
+    Bounded pool of reusable PR review worktrees.
+
+    Instead of creating and deleting a worktree per review, a fixed number
+    of slot worktrees stay registered and are re-pointed at each new head
+    SHA with an incremental checkout, which only rewrites files that differ.
+    Slots are claimed with lease files, so concurrent reviews (in this or
+    other processes) never share one. When every slot is busy, or the pool
+    is disabled, acquire() falls back to a throwaway worktree from the
+    PRWorktreeManager.
+
+    Slots live outside the manager's worktree directory so its age/count
+    cleanup policies never remove them.
+    """
+
+    def __init__(
+        self,
+        manager: PRWorktreeManager,
+        pool_dir: str | Path,
+        max_size: int | None = None,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            manager: Manager used for fetching and for fallback worktrees
+            pool_dir: Directory for pooled worktrees (relative to project_dir)
+            max_size: Number of slots (default: PR_WORKTREE_POOL_SIZE)
+        """
+        self.manager = manager
+        self.pool_dir = manager.project_dir / pool_dir
+        self.max_size = _get_pool_size() if max_size is None else max_size
+        self.stats = WorktreePoolStats()
+
+    def acquire(
+        self,
+        head_sha: str,
+        pr_number: int,
+        sparse_paths: list[str] | None = None,
+    ) -> Path:
+        """
+        Get a worktree checked out at head_sha.
+
+        Args:
+            head_sha: Git commit SHA to checkout
+            pr_number: PR number (used for fallback worktree naming)
+            sparse_paths: If given, check out only these paths' directories
+                (plus root files) in a pooled worktree
+
+        Returns:
+            Path to the worktree; hand it back with release()
+
+        Raises:
+            RuntimeError: If no worktree could be prepared
+            ValueError: If head_sha or pr_number are invalid
+        """
+        self.manager._validate_inputs(head_sha, pr_number)
+        start = time.monotonic()
+
+        slot = self._lease_slot()
+        if slot is None:
+            worktree_path = self.manager.create_worktree(head_sha, pr_number)
+            self._record(False, start, worktree_path)
+            return worktree_path
+
+        self.manager.fetch_head(head_sha)
+        warm = (slot / ".git").is_file()
+        try:
+            if not warm:
+                self._add_slot(slot, head_sha)
+            self._checkout(slot, head_sha, sparse_paths)
+        except RuntimeError as e:
+            if not warm:
+                self._release_lease(slot)
+                raise
+            # A broken slot is rebuilt from scratch rather than failing the review
+            logger.warning(f"[WorktreePool] Rebuilding {slot.name}: {e}")
+            warm = False
+            try:
+                self.manager.remove_worktree(slot)
+                self._add_slot(slot, head_sha)
+                self._checkout(slot, head_sha, sparse_paths)
+            except RuntimeError:
+                self._release_lease(slot)
+                raise
+
+        self._record(warm, start, slot)
+        return slot
+
+    def release(self, worktree_path: Path) -> None:
+        """
+        Return a worktree obtained from acquire().
+
+        Pooled worktrees are kept for reuse; fallback worktrees are removed.
+
+        Args:
+            worktree_path: Path returned by acquire()
+        """
+        if self.is_pooled(worktree_path):
+            self._release_lease(worktree_path)
+        else:
+            self.manager.remove_worktree(worktree_path)
+
+    def is_pooled(self, worktree_path: Path) -> bool:
+        """Check whether a path is one of this pool's slots."""
+        return Path(worktree_path).parent.resolve() == self.pool_dir.resolve()
+
+    def remove_all(self) -> int:
+        """
+        Remove every idle pooled worktree.
+
+        Returns:
+            Number of slots removed
+        """
+        count = 0
+        for index in range(self.max_size):
+            slot = self.pool_dir / f"slot-{index}"
+            if not slot.exists() or not self._try_lease(slot):
+                continue
+            self.manager.remove_worktree(slot)
+            self._release_lease(slot)
+            count += 1
+        return count
+
+    def _record(self, hit: bool, start: float, worktree_path: Path) -> None:
+        elapsed = time.monotonic() - start
+        self.stats.record(hit, elapsed)
+        logger.info(
+            f"[WorktreePool] {'Hit' if hit else 'Miss'}: {worktree_path.name} "
+            f"ready in {elapsed:.2f}s (hits={self.stats.hits}, misses={self.stats.misses})"
+        )
+
+    def _lease_slot(self) -> Path | None:
+        """Claim the first free slot, or None if the pool is exhausted."""
+        if self.max_size <= 0:
+            return None
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        for index in range(self.max_size):
+            slot = self.pool_dir / f"slot-{index}"
+            if self._try_lease(slot):
+                return slot
+        return None
+
+    def _lease_path(self, slot: Path) -> Path:
+        return slot.with_name(f"{slot.name}.lease")
+
+    def _try_lease(self, slot: Path) -> bool:
+        lease = self._lease_path(slot)
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                # Leases left behind by crashed reviews expire
+                try:
+                    age = time.time() - lease.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if age <= POOL_LEASE_TIMEOUT_SECONDS:
+                    return False
+                logger.warning(f"[WorktreePool] Breaking stale lease on {slot.name}")
+                lease.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return True
+        return False
+
+    def _release_lease(self, slot: Path) -> None:
+        self._lease_path(slot).unlink(missing_ok=True)
+
+    def _git(
+        self, cwd: Path, *args: str, timeout: int = 120, stdin: str | None = None
+    ) -> subprocess.CompletedProcess:
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                input=stdin,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Timeout running git {args[0]} in {cwd.name}")
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+        return result
+
+    def _add_slot(self, slot: Path, head_sha: str) -> None:
+        """Register a new slot worktree without checking anything out yet."""
+        if slot.exists():
+            shutil.rmtree(slot, ignore_errors=True)
+        self._git(self.manager.project_dir, "worktree", "prune", timeout=30)
+        self._git(
+            self.manager.project_dir,
+            "worktree",
+            "add",
+            "--detach",
+            "--no-checkout",
+            str(slot),
+            head_sha,
+        )
+        logger.info(f"[WorktreePool] Created pooled worktree {slot.name}")
+
+    def _checkout(
+        self, slot: Path, head_sha: str, sparse_paths: list[str] | None
+    ) -> None:
+        """Point a slot at head_sha, rewriting only files that changed."""
+        if sparse_paths is not None:
+            dirs = sparse_checkout_dirs(sparse_paths)
+            self._git(
+                slot,
+                "sparse-checkout",
+                "set",
+                "--cone",
+                "--stdin",
+                stdin="".join(f"{d}\n" for d in dirs),
+            )
+        elif self._is_sparse(slot):
+            self._git(slot, "sparse-checkout", "disable")
+
+        self._git(slot, "checkout", "--detach", "--force", head_sha)
+        # Drop anything the previous review left behind
+        self._git(slot, "clean", "-ffdx", "--quiet")
+
+    def _is_sparse(self, slot: Path) -> bool:
+        try:
+            result = self._git(slot, "config", "--get", "core.sparseCheckout")
+        except RuntimeError:
+            return False
+        return result.stdout.strip() == "true"
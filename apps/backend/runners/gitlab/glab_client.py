@@ -4,12 +4,24 @@ GitLab API Client
 
 Client for GitLab API operations.
 Uses direct API calls with PRIVATE-TOKEN authentication.
+
+The async methods (get_mr_async, get_mr_changes_async, get_mr_commits_async)
+share a pool of keep-alive connections, follow pagination (Link and
+X-Next-Page headers) and back off from rate limits without blocking the
+event loop. Requests are paced by the same token bucket the GitHub runner
+uses.
 """
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
+import re
+import sys
+import threading
 import time
+import urllib.error
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
@@ -18,6 +30,34 @@ from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
+# Share the GitHub runner's token bucket. Its directory is appended (not
+# inserted) so its modules never shadow this runner's models/orchestrator.
+_github_runner_dir = str(Path(__file__).parent.parent / "github")
+if _github_runner_dir not in sys.path:
+    sys.path.append(_github_runner_dir)
+from rate_limiter import TokenBucket  # noqa: E402
+
+# Maximum page size GitLab accepts for list endpoints
+PER_PAGE = 100
+
+# Keep-alive connections per client (also caps concurrent async requests)
+DEFAULT_MAX_CONNECTIONS = 4
+
+# GitLab.com allows 2000 authenticated API requests per minute
+DEFAULT_RATE_LIMIT = 2000
+DEFAULT_REFILL_RATE = DEFAULT_RATE_LIMIT / 60
+
+_LINK_NEXT_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="?next"?')
+
+
+class GitLabAPIError(Exception):
+    """Raised when the GitLab API returns an error status."""
+
+    def __init__(self, status: int, body: str = ""):
+        super().__init__(f"GitLab API error {status}: {body}")
+        self.status = status
+        self.body = body
+
 
 @dataclass
 class GitLabConfig:
@@ -71,6 +111,154 @@ def validate_endpoint(endpoint: str) -> None:
         )
 
 
+def retry_after_seconds(retry_after: str | None, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a rate-limited (429) request.
+
+    Uses the Retry-After header (integer seconds or HTTP-date) when present,
+    otherwise exponential backoff: 1s, 2s, 4s.
+    """
+    wait_time = 2**attempt
+    if retry_after:
+        try:
+            # Try parsing as integer seconds first
+            wait_time = int(retry_after)
+        except ValueError:
+            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                now = datetime.now(timezone.utc)
+                delta = (retry_date - now).total_seconds()
+                wait_time = max(1, int(delta))  # At least 1 second
+            except (ValueError, TypeError):
+                # Parsing failed, keep exponential backoff default
+                pass
+    return wait_time
+
+
+def next_page_url(url: str, headers) -> str | None:
+    """
+    Return the URL of the next page of a paginated response.
+
+    Prefers the Link header's rel="next" URL. Falls back to X-Next-Page
+    (which GitLab leaves empty on the last page), since Link is omitted for
+    some endpoints and keyset pagination. A Link URL on another host is
+    ignored so the token is never sent elsewhere.
+
+    Returns:
+        Absolute URL, or None on the last page
+    """
+    current = urllib.parse.urlsplit(url)
+
+    link = headers.get("Link") or ""
+    match = _LINK_NEXT_PATTERN.search(link)
+    if match:
+        next_url = urllib.parse.urljoin(url, match.group(1))
+        parsed = urllib.parse.urlsplit(next_url)
+        if (parsed.scheme, parsed.netloc) == (current.scheme, current.netloc):
+            return next_url
+
+    next_page = (headers.get("X-Next-Page") or "").strip()
+    if not next_page:
+        return None
+    query = dict(urllib.parse.parse_qsl(current.query))
+    query["page"] = next_page
+    return urllib.parse.urlunsplit(
+        current._replace(query=urllib.parse.urlencode(query))
+    )
+
+
+class _ConnectionPool:
+    """
+    Keep-alive HTTP(S) connections to one GitLab instance.
+
+    Requests are blocking and thread-safe; the async client runs them in
+    worker threads. At most max_connections requests are in flight at once.
+    """
+
+    def __init__(self, base_url: str, max_connections: int):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self._connection_class = (
+            http.client.HTTPSConnection
+            if parsed.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        # Number of connections opened, for diagnostics
+        self.connections_opened = 0
+
+    def _checkout(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.timeout = timeout
+                return conn, True
+            self.connections_opened += 1
+        return self._connection_class(self.netloc, timeout=timeout), False
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send a request, reusing an idle connection when one is available.
+
+        A reused connection the server has already closed is retried once on
+        a new connection.
+
+        Returns:
+            (status, headers, body)
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if (parsed.scheme, parsed.netloc) != (self.scheme, self.netloc):
+            raise ValueError(f"URL is not on the GitLab instance: {url}")
+        target = urllib.parse.urlunsplit(("", "", parsed.path, parsed.query, ""))
+
+        with self._slots:
+            while True:
+                conn, reused = self._checkout(timeout)
+                try:
+                    conn.request(method, target, body=body, headers=headers)
+                    response = conn.getresponse()
+                    data = response.read()
+                except (
+                    http.client.RemoteDisconnected,
+                    ConnectionResetError,
+                    BrokenPipeError,
+                ):
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append(conn)
+                return response.status, response.headers, data
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 class GitLabClient:
     """Client for GitLab API operations."""
 
@@ -79,10 +267,18 @@ class GitLabClient:
         project_dir: Path,
         config: GitLabConfig,
         default_timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        rate_limit: int = DEFAULT_RATE_LIMIT,
+        refill_rate: float = DEFAULT_REFILL_RATE,
     ):
         self.project_dir = Path(project_dir)
         self.config = config
         self.default_timeout = default_timeout
+        self.max_connections = max_connections
+        self._pool: _ConnectionPool | None = None
+        self._bucket = TokenBucket(capacity=rate_limit, refill_rate=refill_rate)
+        # Monotonic time until which all async requests wait after a 429
+        self._backoff_until = 0.0
 
     def _api_url(self, endpoint: str) -> str:
         """Build full API URL."""
@@ -139,25 +335,9 @@ class GitLabClient:
 
                 # Handle rate limit (429) with exponential backoff
                 if e.code == 429:
-                    # Default to exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-
-                    # Check for Retry-After header (can be integer seconds or HTTP-date)
-                    retry_after = e.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            # Try parsing as integer seconds first
-                            wait_time = int(retry_after)
-                        except ValueError:
-                            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
-                            try:
-                                retry_date = parsedate_to_datetime(retry_after)
-                                now = datetime.now(timezone.utc)
-                                delta = (retry_date - now).total_seconds()
-                                wait_time = max(1, int(delta))  # At least 1 second
-                            except (ValueError, TypeError):
-                                # Parsing failed, keep exponential backoff default
-                                pass
+                    wait_time = retry_after_seconds(
+                        e.headers.get("Retry-After"), attempt
+                    )
 
                     if attempt < max_retries - 1:
                         print(
@@ -168,11 +348,158 @@ class GitLabClient:
                         time.sleep(wait_time)
                         continue
 
-                raise Exception(f"GitLab API error {e.code}: {error_body}") from e
+                raise GitLabAPIError(e.code, error_body) from e
 
         # Should not reach here, but just in case
         raise Exception(f"GitLab API error after {max_retries} retries") from last_error
 
+    def _get_pool(self) -> _ConnectionPool:
+        if self._pool is None:
+            self._pool = _ConnectionPool(self.config.instance_url, self.max_connections)
+        return self._pool
+
+    def close(self) -> None:
+        """Close pooled connections used by the async methods."""
+        if self._pool is not None:
+            self._pool.close()
+
+    async def _request_async(
+        self,
+        url: str,
+        method: str = "GET",
+        data: dict | None = None,
+        timeout: float | None = None,
+        max_retries: int = 3,
+    ) -> tuple[Any, http.client.HTTPMessage]:
+        """
+        Make an API request on a pooled connection.
+
+        Waits for the token bucket and for any rate-limit backoff with
+        asyncio.sleep, so other requests keep running. A 429 pauses every
+        request of this client until its Retry-After has passed.
+
+        Returns:
+            (parsed JSON body or None for 204, response headers)
+        """
+        headers = {
+            "PRIVATE-TOKEN": self.config.token,
+            "Content-Type": "application/json",
+        }
+        request_data = json.dumps(data).encode("utf-8") if data else None
+        pool = self._get_pool()
+
+        for attempt in range(max_retries):
+            await self._bucket.acquire()
+            delay = self._backoff_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            status, response_headers, body = await asyncio.to_thread(
+                pool.request,
+                method,
+                url,
+                request_data,
+                headers,
+                timeout or self.default_timeout,
+            )
+
+            if status == 429 and attempt < max_retries - 1:
+                wait_time = retry_after_seconds(
+                    response_headers.get("Retry-After"), attempt
+                )
+                self._backoff_until = max(
+                    self._backoff_until, time.monotonic() + wait_time
+                )
+                print(
+                    f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
+                    f"(attempt {attempt + 1}/{max_retries})...",
+                    flush=True,
+                )
+                continue
+
+            if status >= 400:
+                raise GitLabAPIError(status, body.decode("utf-8", errors="replace"))
+            if status == 204:
+                return None, response_headers
+            try:
+                return json.loads(body.decode("utf-8")), response_headers
+            except json.JSONDecodeError as e:
+                raise Exception(f"Invalid JSON response from GitLab: {e}") from e
+
+        # Should not reach here, but just in case
+        raise Exception(f"GitLab API error after {max_retries} retries")
+
+    async def _fetch_async(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Async counterpart of _fetch()."""
+        validate_endpoint(endpoint)
+        result, _ = await self._request_async(
+            self._api_url(endpoint), method=method, data=data, timeout=timeout
+        )
+        return result
+
+    async def _fetch_all_async(
+        self,
+        endpoint: str,
+        timeout: float | None = None,
+    ) -> list:
+        """
+        Fetch every page of a list endpoint.
+
+        Pages are requested PER_PAGE items at a time and followed through
+        the Link / X-Next-Page headers.
+        """
+        validate_endpoint(endpoint)
+        separator = "&" if "?" in endpoint else "?"
+        url: str | None = self._api_url(f"{endpoint}{separator}per_page={PER_PAGE}")
+
+        items: list = []
+        while url:
+            page, headers = await self._request_async(url, timeout=timeout)
+            items.extend(page or [])
+            url = next_page_url(url, headers)
+        return items
+
+    async def get_mr_async(self, mr_iid: int) -> dict:
+        """Get MR details."""
+        encoded_project = encode_project_path(self.config.project)
+        return await self._fetch_async(
+            f"/projects/{encoded_project}/merge_requests/{mr_iid}"
+        )
+
+    async def get_mr_changes_async(self, mr_iid: int) -> dict:
+        """
+        Get MR changes (diff), in the same shape as get_mr_changes().
+
+        Uses the paginated /diffs endpoint, which unlike /changes returns
+        every file of a large MR. Falls back to /changes on instances older
+        than GitLab 15.7.
+        """
+        encoded_project = encode_project_path(self.config.project)
+        try:
+            diffs = await self._fetch_all_async(
+                f"/projects/{encoded_project}/merge_requests/{mr_iid}/diffs"
+            )
+        except GitLabAPIError as e:
+            if e.status != 404:
+                raise
+            return await self._fetch_async(
+                f"/projects/{encoded_project}/merge_requests/{mr_iid}/changes"
+            )
+        return {"changes": diffs}
+
+    async def get_mr_commits_async(self, mr_iid: int) -> list[dict]:
+        """Get all commits for an MR."""
+        encoded_project = encode_project_path(self.config.project)
+        return await self._fetch_all_async(
+            f"/projects/{encoded_project}/merge_requests/{mr_iid}/commits"
+        )
+
     def get_mr(self, mr_iid: int) -> dict:
         """Get MR details."""
         encoded_project = encode_project_path(self.config.project)
@@ -9,6 +9,7 @@ Main coordinator for GitLab automation workflows:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import traceback
 import urllib.error
@@ -134,14 +135,12 @@ class GitLabOrchestrator:
         """Gather context for an MR."""
         safe_print(f"[GitLab] Fetching MR !{mr_iid} data...")
 
-        # Get MR details
-        mr_data = self.client.get_mr(mr_iid)
-
-        # Get changes
-        changes_data = self.client.get_mr_changes(mr_iid)
-
-        # Get commits
-        commits = self.client.get_mr_commits(mr_iid)
+        # Fetch MR details, changes and commits concurrently
+        mr_data, changes_data, commits = await asyncio.gather(
+            self.client.get_mr_async(mr_iid),
+            self.client.get_mr_changes_async(mr_iid),
+            self.client.get_mr_commits_async(mr_iid),
+        )
 
         # Build diff from changes
         diffs = []
@@ -4,12 +4,18 @@ Insights Runner - AI chat for codebase insights using Claude SDK
 
 This script provides an AI-powered chat interface for asking questions
 about a codebase. It can also suggest tasks based on the conversation.
+
+By default one message is answered per process. With --serve the process
+stays up for a whole conversation: the SDK client and project context stay
+warm, and follow-up messages are sent to the open session without
+replaying the history (see serve()).
 """
 
 import argparse
 import asyncio
 import json
 import sys
+import time
 from pathlib import Path
 
 # Add auto-claude to path
@@ -49,9 +55,48 @@ from debug import (
 )
 from phase_config import get_thinking_budget, resolve_model_id, sanitize_thinking_level
 
+# Project context per resolved project dir: (source file signature, context)
+_context_cache: dict[str, tuple[tuple, str]] = {}
+
+
+def _context_signature(project_dir: str) -> tuple:
+    """Stat signature of the files load_project_context() summarizes."""
+    auto_claude_dir = Path(project_dir) / ".auto-claude"
+    signature = []
+    for path in (
+        auto_claude_dir / "project_index.json",
+        auto_claude_dir / "roadmap" / "roadmap.json",
+        # A directory's mtime changes when specs are added or removed
+        auto_claude_dir / "specs",
+    ):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size, stat.st_ino))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
 
 def load_project_context(project_dir: str) -> str:
-    """Load project context for the AI."""
+    """
+    Load project context for the AI.
+
+    The summary is cached and rebuilt only when the project index, roadmap
+    or specs directory changes.
+    """
+    key = str(Path(project_dir).resolve())
+    signature = _context_signature(project_dir)
+    cached = _context_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    context = _build_project_context(project_dir)
+    _context_cache[key] = (signature, context)
+    return context
+
+
+def _build_project_context(project_dir: str) -> str:
+    """Summarize the project index, roadmap and specs of a project."""
     context_parts = []
 
     # Load project index if available (from .auto-claude - the installed instance)
@@ -137,6 +182,148 @@ Be conversational and helpful. Focus on providing actionable insights and clear
 Keep responses concise but informative."""
 
 
+def build_conversation_prompt(message: str, prior_messages: list) -> str:
+    """
+    Build a prompt that carries earlier turns for a client without them.
+
+    Args:
+        message: The current user message
+        prior_messages: Earlier {"role", "content"} turns, oldest first
+
+    Returns:
+        The prompt to send (just message when there are no earlier turns)
+    """
+    conversation_context = ""
+    for msg in prior_messages:
+        role = "User" if msg.get("role") == "user" else "Assistant"
+        conversation_context += f"\n{role}: {msg['content']}\n"
+
+    if not conversation_context.strip():
+        return message
+
+    return f"""Previous conversation:
+{conversation_context}
+
+Current question: {message}"""
+
+
+def create_sdk_client(
+    project_dir: str,
+    model: str,
+    thinking_level: str,
+    system_prompt: str,
+):
+    """Create a Claude SDK client configured for insights chat."""
+    # Convert thinking level to token budget
+    max_thinking_tokens = get_thinking_budget(thinking_level)
+
+    debug(
+        "insights_runner",
+        "Using model configuration",
+        model=model,
+        thinking_level=thinking_level,
+        max_thinking_tokens=max_thinking_tokens,
+    )
+
+    options_kwargs = {
+        "model": resolve_model_id(model),  # Resolve via API Profile if configured
+        "system_prompt": system_prompt,
+        "allowed_tools": ["Read", "Glob", "Grep"],
+        "max_turns": 30,  # Allow sufficient turns for codebase exploration
+        "cwd": str(Path(project_dir).resolve()),
+    }
+
+    options_kwargs["max_thinking_tokens"] = max_thinking_tokens
+
+    return ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs))
+
+
+async def stream_response(client, on_output=None) -> str:
+    """
+    Print a response from client as it arrives.
+
+    Text blocks are printed line by line; tool use is reported with
+    __TOOL_START__/__TOOL_END__ markers for the UI.
+
+    Args:
+        client: SDK client a query was just sent to
+        on_output: Optional callback invoked whenever something is printed
+
+    Returns:
+        The response text
+    """
+    response_text = ""
+    current_tool = None
+
+    async for msg in client.receive_response():
+        msg_type = type(msg).__name__
+        debug_detailed("insights_runner", "Received message", msg_type=msg_type)
+
+        if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+            for block in msg.content:
+                block_type = type(block).__name__
+                debug_detailed(
+                    "insights_runner", "Processing block", block_type=block_type
+                )
+                if block_type == "TextBlock" and hasattr(block, "text"):
+                    text = block.text
+                    debug_detailed(
+                        "insights_runner", "Text block", text_length=len(text)
+                    )
+                    # Print text with newline to ensure proper line separation for parsing
+                    if on_output:
+                        on_output()
+                    print(text, flush=True)
+                    response_text += text
+                elif block_type == "ToolUseBlock" and hasattr(block, "name"):
+                    # Emit tool start marker for UI feedback
+                    tool_name = block.name
+                    tool_input = ""
+
+                    # Extract a brief description of what the tool is doing
+                    if hasattr(block, "input") and block.input:
+                        inp = block.input
+                        if isinstance(inp, dict):
+                            if "pattern" in inp:
+                                tool_input = f"pattern: {inp['pattern']}"
+                            elif "file_path" in inp:
+                                # Shorten path for display
+                                fp = inp["file_path"]
+                                if len(fp) > 50:
+                                    fp = "..." + fp[-47:]
+                                tool_input = fp
+                            elif "path" in inp:
+                                tool_input = inp["path"]
+
+                    current_tool = tool_name
+                    if on_output:
+                        on_output()
+                    print(
+                        f"__TOOL_START__:{json.dumps({'name': tool_name, 'input': tool_input})}",
+                        flush=True,
+                    )
+
+        elif msg_type == "ToolResult":
+            # Tool finished executing
+            if current_tool:
+                print(
+                    f"__TOOL_END__:{json.dumps({'name': current_tool})}",
+                    flush=True,
+                )
+                current_tool = None
+
+    # Ensure we have a newline at the end
+    if response_text and not response_text.endswith("\n"):
+        print()
+
+    debug(
+        "insights_runner",
+        "Response complete",
+        response_length=len(response_text),
+    )
+    return response_text
+
+
 async def run_with_sdk(
     project_dir: str,
     message: str,
@@ -162,46 +349,12 @@ async def run_with_sdk(
     ensure_claude_code_oauth_token()
 
     system_prompt = build_system_prompt(project_dir)
-    project_path = Path(project_dir).resolve()
-
-    # Build conversation context from history
-    conversation_context = ""
-    for msg in history[:-1]:  # Exclude the latest message
-        role = "User" if msg.get("role") == "user" else "Assistant"
-        conversation_context += f"\n{role}: {msg['content']}\n"
-
-    # Build the full prompt with conversation history
-    full_prompt = message
-    if conversation_context.strip():
-        full_prompt = f"""Previous conversation:
-{conversation_context}
 
-Current question: {message}"""
-
-    # Convert thinking level to token budget
-    max_thinking_tokens = get_thinking_budget(thinking_level)
-
-    debug(
-        "insights_runner",
-        "Using model configuration",
-        model=model,
-        thinking_level=thinking_level,
-        max_thinking_tokens=max_thinking_tokens,
-    )
+    # Build the full prompt with conversation history (excluding the latest message)
+    full_prompt = build_conversation_prompt(message, history[:-1])
 
     try:
-        options_kwargs = {
-            "model": resolve_model_id(model),  # Resolve via API Profile if configured
-            "system_prompt": system_prompt,
-            "allowed_tools": ["Read", "Glob", "Grep"],
-            "max_turns": 30,  # Allow sufficient turns for codebase exploration
-            "cwd": str(project_path),
-        }
-
-        options_kwargs["max_thinking_tokens"] = max_thinking_tokens
-
-        # Create Claude SDK client with appropriate settings for insights
-        client = ClaudeSDKClient(options=ClaudeAgentOptions(**options_kwargs))
+        client = create_sdk_client(project_dir, model, thinking_level, system_prompt)
 
         # Use async context manager pattern
         async with client:
@@ -209,71 +362,7 @@ Current question: {message}"""
             await client.query(full_prompt)
 
             # Stream the response
-            response_text = ""
-            current_tool = None
-
-            async for msg in client.receive_response():
-                msg_type = type(msg).__name__
-                debug_detailed("insights_runner", "Received message", msg_type=msg_type)
-
-                if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                    for block in msg.content:
-                        block_type = type(block).__name__
-                        debug_detailed(
-                            "insights_runner", "Processing block", block_type=block_type
-                        )
-                        if block_type == "TextBlock" and hasattr(block, "text"):
-                            text = block.text
-                            debug_detailed(
-                                "insights_runner", "Text block", text_length=len(text)
-                            )
-                            # Print text with newline to ensure proper line separation for parsing
-                            print(text, flush=True)
-                            response_text += text
-                        elif block_type == "ToolUseBlock" and hasattr(block, "name"):
-                            # Emit tool start marker for UI feedback
-                            tool_name = block.name
-                            tool_input = ""
-
-                            # Extract a brief description of what the tool is doing
-                            if hasattr(block, "input") and block.input:
-                                inp = block.input
-                                if isinstance(inp, dict):
-                                    if "pattern" in inp:
-                                        tool_input = f"pattern: {inp['pattern']}"
-                                    elif "file_path" in inp:
-                                        # Shorten path for display
-                                        fp = inp["file_path"]
-                                        if len(fp) > 50:
-                                            fp = "..." + fp[-47:]
-                                        tool_input = fp
-                                    elif "path" in inp:
-                                        tool_input = inp["path"]
-
-                            current_tool = tool_name
-                            print(
-                                f"__TOOL_START__:{json.dumps({'name': tool_name, 'input': tool_input})}",
-                                flush=True,
-                            )
-
-                elif msg_type == "ToolResult":
-                    # Tool finished executing
-                    if current_tool:
-                        print(
-                            f"__TOOL_END__:{json.dumps({'name': current_tool})}",
-                            flush=True,
-                        )
-                        current_tool = None
-
-            # Ensure we have a newline at the end
-            if response_text and not response_text.endswith("\n"):
-                print()
-
-            debug(
-                "insights_runner",
-                "Response complete",
-                response_length=len(response_text),
-            )
+            await stream_response(client)
 
     except Exception as e:
         print(f"Error using Claude SDK: {e}", file=sys.stderr)
@@ -337,10 +426,227 @@ Assistant:"""
         print(f"Error: {e}")
 
 
+def _continues_conversation(prior_messages: list, conversation: list) -> bool:
+    """Whether prior_messages are the turns a session's client has already seen."""
+    if len(prior_messages) != len(conversation):
+        return False
+    # Only user turns are compared; the UI may store assistant text with
+    # markers stripped
+    return all(
+        sent.get("content") == seen.get("content")
+        for sent, seen in zip(prior_messages, conversation)
+        if seen.get("role") == "user"
+    )
+
+
+class InsightsSession:
+    """
+    A warm insights conversation for one project (server mode).
+
+    One connected SDK client is kept across messages and holds the
+    conversation, so a follow-up only sends the new message. The client is
+    recreated, replaying earlier turns in its first prompt, when the model,
+    thinking level or project context changes, or when the caller's history
+    doesn't continue the conversation this session has seen.
+    """
+
+    def __init__(self, project_dir: str, client_factory=None):
+        """
+        Args:
+            project_dir: Project the conversation is about
+            client_factory: Callable (project_dir, model, thinking_level,
+                system_prompt) -> SDK client; defaults to create_sdk_client
+        """
+        self.project_dir = project_dir
+        self._client_factory = client_factory or create_sdk_client
+        self._client = None
+        # (model, thinking_level, system_prompt) the client was created with
+        self._client_key = None
+        # {"role", "content"} turns the client has seen
+        self.conversation: list[dict] = []
+
+    async def connect(self, model: str, thinking_level: str) -> None:
+        """Connect a client for a new conversation ahead of the first message."""
+        key = (model, thinking_level, build_system_prompt(self.project_dir))
+        await self._reconnect(key)
+        self.conversation = []
+
+    async def ask(
+        self,
+        message: str,
+        history: list | None,
+        model: str,
+        thinking_level: str,
+        on_output=None,
+    ) -> str:
+        """
+        Send a message and stream the response to stdout.
+
+        Args:
+            message: The user message
+            history: Full conversation ending with this message (as passed to
+                the CLI), or None to continue the session's conversation
+            model: Model shorthand or ID
+            thinking_level: Thinking level for extended reasoning
+            on_output: Optional callback invoked whenever something is printed
+
+        Returns:
+            The response text
+        """
+        prior = self.conversation if history is None else history[:-1]
+        key = (model, thinking_level, build_system_prompt(self.project_dir))
+
+        if (
+            self._client is None
+            or key != self._client_key
+            or not _continues_conversation(prior, self.conversation)
+        ):
+            debug(
+                "insights_runner",
+                "Starting session client",
+                replayed_turns=len(prior),
+            )
+            await self._reconnect(key)
+            prompt = build_conversation_prompt(message, prior)
+            self.conversation = list(prior)
+        else:
+            prompt = message
+
+        try:
+            await self._client.query(prompt)
+            response_text = await stream_response(self._client, on_output)
+        except Exception:
+            # The client's state is unknown; start over on the next message
+            await self.close()
+            raise
+
+        self.conversation += [
+            {"role": "user", "content": message},
+            {"role": "assistant", "content": response_text},
+        ]
+        return response_text
+
+    async def close(self) -> None:
+        """Disconnect the client, if any."""
+        client, self._client, self._client_key = self._client, None, None
+        if client is not None:
+            try:
+                await client.disconnect()
+            except Exception as e:
+                debug_error("insights_runner", f"Failed to disconnect client: {e}")
+
+    async def _reconnect(self, key: tuple) -> None:
+        await self.close()
+        model, thinking_level, system_prompt = key
+        client = self._client_factory(
+            self.project_dir, model, thinking_level, system_prompt
+        )
+        await client.connect()
+        self._client, self._client_key = client, key
+
+
+async def serve(project_dir: str, model: str, thinking_level: str) -> None:
+    """
+    Run a persistent insights session, one JSON request per stdin line.
+
+    Requests are {"message": ..., "history": [...], "model": ...,
+    "thinking_level": ...}; only message is required, and history follows
+    the --history format (the full conversation ending with message). Each
+    response is streamed exactly as in single-message mode and followed by
+    a __RESPONSE_END__:{"id", "latency_ms", "first_output_ms", "error"}
+    line. The session ends when stdin is closed.
+    """
+    session = None
+    if SDK_AVAILABLE and get_auth_token():
+        # Ensure SDK can find the token
+        ensure_claude_code_oauth_token()
+        session = InsightsSession(project_dir)
+        try:
+            await session.connect(model, thinking_level)
+        except Exception as e:
+            debug_error("insights_runner", f"Failed to start session client: {e}")
+    else:
+        print(
+            "Claude SDK or authentication not available, using simple mode",
+            file=sys.stderr,
+        )
+
+    print("__SESSION_READY__", flush=True)
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+            if not line:
+                break
+            if line.strip():
+                await _serve_request(session, project_dir, line, model, thinking_level)
+    finally:
+        if session is not None:
+            await session.close()
+
+
+async def _serve_request(
+    session: InsightsSession | None,
+    project_dir: str,
+    line: str,
+    default_model: str,
+    default_thinking_level: str,
+) -> None:
+    """Answer one server request and print its end marker."""
+    started = time.perf_counter()
+    first_output = None
+    error = None
+    request_id = None
+
+    def on_output() -> None:
+        nonlocal first_output
+        if first_output is None:
+            first_output = time.perf_counter()
+
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        message = request["message"]
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError) as e:
+        error = f"Invalid request: {e}"
+    else:
+        history = request.get("history")
+        model = request.get("model") or default_model
+        thinking_level = sanitize_thinking_level(
+            request.get("thinking_level") or default_thinking_level
+        )
+        if session is None:
+            run_simple(project_dir, message, history or [])
+        else:
+            try:
+                await session.ask(message, history, model, thinking_level, on_output)
+            except Exception as e:
+                print(f"Error using Claude SDK: {e}", file=sys.stderr)
+                import traceback
+
+                traceback.print_exc(file=sys.stderr)
+                error = str(e)
+                fallback_history = history or [
+                    *session.conversation,
+                    {"role": "user", "content": message},
+                ]
+                run_simple(project_dir, message, fallback_history)
+
+    end = {
+        "id": request_id,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "first_output_ms": round((first_output - started) * 1000, 1)
+        if first_output is not None
+        else None,
+        "error": error,
+    }
+    print(f"__RESPONSE_END__:{json.dumps(end)}", flush=True)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Insights AI Chat Runner")
     parser.add_argument("--project-dir", required=True, help="Project directory path")
-    parser.add_argument("--message", required=True, help="User message")
+    parser.add_argument("--message", help="User message")
     parser.add_argument("--history", default="[]", help="JSON conversation history")
     parser.add_argument(
         "--history-file", help="Path to JSON file containing conversation history"
@@ -355,13 +661,25 @@ def main():
         default="medium",
         help="Thinking level for extended reasoning (low, medium, high)",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep a session open and read JSON requests from stdin",
+    )
     args = parser.parse_args()
 
+    if not args.serve and args.message is None:
+        parser.error("--message is required unless --serve is used")
+
     # Validate and sanitize thinking level (handles legacy values like 'ultrathink')
     args.thinking_level = sanitize_thinking_level(args.thinking_level)
 
     debug_section("insights_runner", "Starting Insights Chat")
 
+    if args.serve:
+        asyncio.run(serve(args.project_dir, args.model, args.thinking_level))
+        return
+
     project_dir = args.project_dir
     user_message = args.message
     model = args.model
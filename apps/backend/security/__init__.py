@@ -16,7 +16,8 @@ Main functions:
 - bash_security_hook: Pre-tool-use hook for command validation
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
-- reset_profile_cache: Reset cached security profile
+- reset_profile_cache: Reset cached security profiles
+- get_profile_cache_stats: Hit/miss counters for the profile cache
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
@@ -46,6 +47,7 @@ from .parser import (
 
 # Profile management
 from .profile import (
+    get_profile_cache_stats,
     get_security_profile,
     reset_profile_cache,
 )
@@ -87,6 +89,7 @@ __all__ = [
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "get_profile_cache_stats",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
@@ -6,6 +6,9 @@ Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
 """
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from project_analyzer import (
@@ -19,12 +22,26 @@ from .constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
-_cached_spec_dir: Path | None = None  # Track spec directory for cache key
-_cached_profile_mtime: float | None = None  # Track file modification time
-_cached_allowlist_mtime: float | None = None  # Track allowlist modification time
+# Maximum number of (project_dir, spec_dir) profiles kept in memory. Parallel
+# specs run in separate worktrees, each with its own profile.
+PROFILE_CACHE_SIZE = 32
+
+
+@dataclass
+class _CachedProfile:
+    """A cached profile plus the file mtimes it was loaded with."""
+
+    profile: SecurityProfile
+    profile_mtime: float | None  # Track file modification time
+    allowlist_mtime: float | None  # Track allowlist modification time
+
+
+# Cache security profiles to avoid re-analyzing on every command, keyed by
+# (project_dir, spec_dir) and ordered least- to most-recently used
+_profile_cache: OrderedDict[tuple[Path, Path | None], _CachedProfile] = OrderedDict()
+_profile_cache_lock = threading.Lock()
+_cache_hits = 0
+_cache_misses = 0
 
 
 def _get_profile_path(project_dir: Path) -> Path:
@@ -61,8 +78,10 @@ def get_security_profile(
     """
     Get the security profile for a project, using cache when possible.
 
-    The cache is invalidated when:
-    - The project directory changes
+    Profiles for up to PROFILE_CACHE_SIZE (project_dir, spec_dir) pairs are
+    cached; the least recently used entry is evicted beyond that.
+
+    A cached entry is invalidated when:
     - The security profile file is created (was None, now exists)
     - The security profile file is modified (mtime changed)
     - The allowlist file is created, modified, or deleted
@@ -74,55 +93,63 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
+    global _cache_hits, _cache_misses
 
     project_dir = Path(project_dir).resolve()
     resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
+    key = (project_dir, resolved_spec_dir)
 
-    # Check if cache is valid (both project_dir and spec_dir must match)
-    if (
-        _cached_profile is not None
-        and _cached_project_dir == project_dir
-        and _cached_spec_dir == resolved_spec_dir
-    ):
-        # Check if files have been created or modified since caching
-        current_profile_mtime = _get_profile_mtime(project_dir)
-        current_allowlist_mtime = _get_allowlist_mtime(project_dir)
+    # Check if files have been created or modified since caching
+    current_profile_mtime = _get_profile_mtime(project_dir)
+    current_allowlist_mtime = _get_allowlist_mtime(project_dir)
 
+    with _profile_cache_lock:
+        cached = _profile_cache.get(key)
         # Cache is valid if both mtimes are unchanged
         if (
-            current_profile_mtime == _cached_profile_mtime
-            and current_allowlist_mtime == _cached_allowlist_mtime
+            cached is not None
+            and cached.profile_mtime == current_profile_mtime
+            and cached.allowlist_mtime == current_allowlist_mtime
         ):
-            return _cached_profile
-
-        # File was created, modified, or deleted - invalidate cache
-        # (This happens when analyzer creates the file after agent starts,
-        # or when user adds/updates the allowlist)
-
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
-    _cached_spec_dir = resolved_spec_dir
-    _cached_profile_mtime = _get_profile_mtime(project_dir)
-    _cached_allowlist_mtime = _get_allowlist_mtime(project_dir)
-
-    return _cached_profile
+            _profile_cache.move_to_end(key)
+            _cache_hits += 1
+            return cached.profile
+        _cache_misses += 1
+
+    # File was created, modified, or deleted (or never cached) - (re)analyze.
+    # This happens when analyzer creates the file after agent starts,
+    # or when user adds/updates the allowlist.
+    profile = get_or_create_profile(project_dir, spec_dir)
+    entry = _CachedProfile(
+        profile=profile,
+        profile_mtime=_get_profile_mtime(project_dir),
+        allowlist_mtime=_get_allowlist_mtime(project_dir),
+    )
+
+    with _profile_cache_lock:
+        _profile_cache[key] = entry
+        _profile_cache.move_to_end(key)
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+
+    return profile
+
+
+def get_profile_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and current size of the profile cache."""
+    with _profile_cache_lock:
+        return {
+            "hits": _cache_hits,
+            "misses": _cache_misses,
+            "size": len(_profile_cache),
+            "max_size": PROFILE_CACHE_SIZE,
+        }
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
-    _cached_profile = None
-    _cached_project_dir = None
-    _cached_spec_dir = None
-    _cached_profile_mtime = None
-    _cached_allowlist_mtime = None
+    """Reset the cached profiles and counters (useful for testing or re-analysis)."""
+    global _cache_hits, _cache_misses
+    with _profile_cache_lock:
+        _profile_cache.clear()
+        _cache_hits = 0
+        _cache_misses = 0
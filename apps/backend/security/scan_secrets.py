@@ -7,7 +7,7 @@ Scans staged git files for potential secrets before commit.
 Designed to prevent accidental exposure of API keys, tokens, and credentials.
 
 Usage:
-    python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
+    python scan_secrets.py [--staged-only] [--all-files] [--path PATH] [--jobs N]
 
 Exit codes:
     0 - No secrets detected
@@ -16,9 +16,12 @@ Exit codes:
 """
 
 import argparse
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -146,6 +149,95 @@ ALL_PATTERNS = (
 )
 
 
+# Literal substrings (lowercase) of which at least one occurs in every match
+# of the named pattern. Files and lines containing none of them are not run
+# through that pattern at all. Patterns without an entry are always run.
+PATTERN_LITERALS: dict[str, tuple[str, ...]] = {
+    "Generic API key assignment": ("api", "secret"),
+    "Generic access token": ("token",),
+    "Password assignment": ("pass", "pwd"),
+    "Secret assignment": ("secret",),
+    "Bearer token": ("bearer",),
+    "Potential base64-encoded secret": ('"', "'"),
+    "OpenAI/Anthropic-style API key": ("sk-",),
+    "Anthropic API key": ("sk-ant-",),
+    "OpenAI project API key": ("sk-proj-",),
+    "AWS Access Key ID": ("akia",),
+    "AWS Secret Access Key": ("aws_secret",),
+    "Google API Key": ("aiza",),
+    "Google Service Account JSON": ("service_account",),
+    "GitHub Personal Access Token": ("ghp_",),
+    "GitHub Fine-grained PAT": ("github_pat_",),
+    "GitHub OAuth Token": ("gho_",),
+    "GitHub App Installation Token": ("ghs_",),
+    "GitHub Refresh Token": ("ghr_",),
+    "Stripe Live Secret Key": ("sk_live_",),
+    "Stripe Test Secret Key": ("sk_test_",),
+    "Stripe Live Publishable Key": ("pk_live_",),
+    "Stripe Restricted Key": ("rk_live_",),
+    "Slack Token": ("xox",),
+    "Slack Webhook URL": ("hooks.slack.com/services/",),
+    "Discord Bot Token": (".",),
+    "Discord Webhook URL": ("/api/webhooks/",),
+    "Twilio API Key": ("sk",),
+    "Twilio Account SID": ("ac",),
+    "SendGrid API Key": ("sg.",),
+    "Mailchimp API Key": ("-us",),
+    "NPM Access Token": ("npm_",),
+    "PyPI API Token": ("pypi-",),
+    "Supabase/JWT Token": ("eyjhbgcioijiuzi1niisinr5cci6ikpxvcj9.",),
+    "Linear API Key": ("lin_api_",),
+    "Potential Vercel Token": ("_",),
+    "Heroku API Key / UUID": ("-",),
+    "Doppler Service Token": ("dp.pt.",),
+    "RSA Private Key": ("-----begin",),
+    "OpenSSH Private Key": ("-----begin",),
+    "DSA Private Key": ("-----begin",),
+    "EC Private Key": ("-----begin",),
+    "PGP Private Key": ("-----begin",),
+    "Certificate (may contain private key)": ("-----begin",),
+    "MongoDB Connection String with credentials": ("mongodb",),
+    "PostgreSQL Connection String with credentials": ("postgres",),
+    "MySQL Connection String with credentials": ("mysql://",),
+    "Redis Connection String with credentials": ("redis://",),
+    "RabbitMQ Connection String with credentials": ("amqp://",),
+}
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but
+# str.lower() does not map onto them
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for literal prefiltering, consistent with re.IGNORECASE."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_CASE_FOLD).lower()
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, str]],
+) -> list[tuple[re.Pattern, str, tuple[str, ...] | None]]:
+    """Compile patterns case-insensitively with their literal prefilters."""
+    compiled = []
+    for pattern, pattern_name in patterns:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            # Invalid regex, skip
+            continue
+        compiled.append((regex, pattern_name, PATTERN_LITERALS.get(pattern_name)))
+    return compiled
+
+
+def _compile_alternation(patterns: list[str], flags: int = 0) -> re.Pattern:
+    """Compile patterns into one alternation that matches wherever any of them does."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+_COMPILED_PATTERNS = _compile_patterns(ALL_PATTERNS)
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -250,6 +342,14 @@ FALSE_POSITIVE_PATTERNS = [
     r"REPLACE[-_]?WITH",
 ]
 
+_IGNORE_RE = _compile_alternation(DEFAULT_IGNORE_PATTERNS)
+_FALSE_POSITIVE_RE = _compile_alternation(FALSE_POSITIVE_PATTERNS)
+_TYPE_HINT_RE = re.compile(r"^[a-z_]+:\s*str\s*$", re.IGNORECASE)
+_LONG_KEY_RE = re.compile(r"[a-zA-Z0-9_-]{40,}")
+
+# Below this many files, process start-up costs more than it saves
+MIN_FILES_PER_WORKER = 32
+
 
 # =============================================================================
 # CORE FUNCTIONS
@@ -285,9 +385,8 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
         return True
 
     # Check default ignore patterns
-    for pattern in DEFAULT_IGNORE_PATTERNS:
-        if re.search(pattern, file_path):
-            return True
+    if _IGNORE_RE.search(file_path):
+        return True
 
     # Check custom ignore patterns
     for pattern in custom_ignores:
@@ -299,14 +398,11 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
 
 def is_false_positive(line: str, matched_text: str) -> bool:
     """Check if a match is likely a false positive."""
-    line_lower = line.lower()
-
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, line_lower):
-            return True
+    if _FALSE_POSITIVE_RE.search(line.lower()):
+        return True
 
     # Check if it's just a variable name or type hint
-    if re.match(r"^[a-z_]+:\s*str\s*$", line.strip(), re.IGNORECASE):
+    if _TYPE_HINT_RE.match(line.strip()):
         return True
 
     # Check if it's in a comment
@@ -317,7 +413,7 @@ def is_false_positive(line: str, matched_text: str) -> bool:
         or stripped.startswith("*")
     ):
         # But still flag if there's an actual long key-like string
-        if not re.search(r"[a-zA-Z0-9_-]{40,}", matched_text):
+        if not _LONG_KEY_RE.search(matched_text):
             return True
 
     return False
@@ -333,30 +429,43 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
     """Scan file content for potential secrets."""
     matches = []
+
+    # Narrow down to patterns that can match this file at all: first by their
+    # required literals, then by one whole-file search. No pattern is
+    # anchored, so a pattern that matches some line also matches the file.
+    folded = _fold(content)
+    candidates = [
+        (pattern, pattern_name, literals)
+        for pattern, pattern_name, literals in _COMPILED_PATTERNS
+        if (literals is None or any(lit in folded for lit in literals))
+        and pattern.search(content)
+    ]
+    if not candidates:
+        return matches
+
     lines = content.splitlines()
 
     for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
-                    )
-            except re.error:
-                # Invalid regex, skip
+        folded_line = _fold(line)
+        for pattern, pattern_name, literals in candidates:
+            if literals is not None and not any(lit in folded_line for lit in literals):
                 continue
+            for match in pattern.finditer(line):
+                matched_text = match.group(0)
+
+                # Skip false positives
+                if is_false_positive(line, matched_text):
+                    continue
+
+                matches.append(
+                    SecretMatch(
+                        file_path=file_path,
+                        line_number=line_num,
+                        pattern_name=pattern_name,
+                        matched_text=matched_text,
+                        line_content=line.strip()[:100],  # Truncate long lines
+                    )
+                )
 
     return matches
 
@@ -391,36 +500,74 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+def _scan_file(full_path: Path, file_path: str) -> list[SecretMatch]:
+    """Read and scan one file, returning no matches if it can't be read."""
+    # Skip if file doesn't exist or is a directory
+    if not full_path.exists() or full_path.is_dir():
+        return []
+
+    try:
+        content = full_path.read_text(encoding="utf-8", errors="ignore")
+    except (OSError, UnicodeDecodeError):
+        # Skip files that can't be read
+        return []
+    return scan_content(content, file_path)
+
+
+def _scan_file_batch(batch: list[tuple[Path, str]]) -> list[list[SecretMatch]]:
+    """Worker entry point: scan a batch of files in a child process."""
+    return [_scan_file(full_path, file_path) for full_path, file_path in batch]
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    jobs: int = 1,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Args:
+        files: Paths relative to project_dir
+        project_dir: Project root (defaults to the current directory)
+        jobs: Worker processes to use; 0 means one per CPU. Small file lists
+            are always scanned in-process. Results are in input order either way.
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
-    all_matches = []
-
-    for file_path in files:
-        # Skip files based on ignore patterns
-        if should_skip_file(file_path, custom_ignores):
-            continue
-
-        full_path = project_dir / file_path
-
-        # Skip if file doesn't exist or is a directory
-        if not full_path.exists() or full_path.is_dir():
-            continue
 
+    # Skip files based on ignore patterns
+    to_scan = [
+        (project_dir / file_path, file_path)
+        for file_path in files
+        if not should_skip_file(file_path, custom_ignores)
+    ]
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(to_scan) // MIN_FILES_PER_WORKER)
+
+    if jobs > 1:
+        # Contiguous batches keep results in input order
+        size = -(-len(to_scan) // (jobs * 4))
+        batches = [to_scan[i : i + size] for i in range(0, len(to_scan), size)]
         try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
-            continue
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                results = [
+                    matches
+                    for batch_result in executor.map(_scan_file_batch, batches)
+                    for matches in batch_result
+                ]
+            return [match for matches in results for match in matches]
+        except (OSError, BrokenProcessPool):
+            # No usable process pool here (e.g. sandboxed) - scan in-process
+            pass
 
+    all_matches = []
+    for full_path, file_path in to_scan:
+        all_matches.extend(_scan_file(full_path, file_path))
     return all_matches
 
 
@@ -514,6 +661,13 @@ def main() -> int:
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Worker processes for large scans (default: one per CPU, 1 = serial)",
+    )
 
     args = parser.parse_args()
 
@@ -545,7 +699,7 @@ def main() -> int:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
     # Scan files
-    matches = scan_files(files, project_dir)
+    matches = scan_files(files, project_dir, jobs=args.jobs)
 
     # Output results
     if args.json:
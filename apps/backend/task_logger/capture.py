@@ -33,6 +33,8 @@ class StreamingLogCapture:
                 self.current_tool, success=exc_type is None, phase=self.phase
             )
             self.current_tool = None
+        # Session boundary - make everything captured visible in task_logs.json
+        self.logger.flush()
         return False
 
     def process_text(self, text: str) -> None:
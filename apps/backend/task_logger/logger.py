@@ -177,6 +177,9 @@ class TaskLogger:
         # Also print the message (sanitized)
         print(phase_message, flush=True)
 
+        # Phase transitions are compacted right away so status readers see them
+        self.storage.save()
+
     def end_phase(
         self, phase: LogPhase, success: bool = True, message: str | None = None
     ) -> None:
@@ -545,6 +548,10 @@ class TaskLogger:
             else:
                 print(f"   [{status}]", flush=True)
 
+    def flush(self) -> None:
+        """Compact any buffered entries into task_logs.json."""
+        self.storage.flush()
+
     def get_logs(self) -> dict:
         """Get all logs."""
         return self._data
@@ -555,4 +562,5 @@ class TaskLogger:
 
     def clear(self) -> None:
         """Clear all logs (useful for testing)."""
+        self.storage.flush()
         self.storage = LogStorage(self.spec_dir)
@@ -1,22 +1,110 @@
 """
 Storage functionality for task logs.
+
+Entries are appended to a line-delimited segment file per phase
+(``task_logs.<phase>.jsonl``) so that logging costs O(1) per entry. The
+segments are periodically compacted into ``task_logs.json``, which keeps the
+shape the UI has always consumed.
 """
 
+import atexit
 import json
 import os
 import sys
 import tempfile
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .models import LogEntry, LogPhase
 
+# Live storages, flushed on interpreter exit so no buffered entries are lost
+_live_storages: "weakref.WeakSet[LogStorage]" = weakref.WeakSet()
+
+
+def _flush_live_storages() -> None:
+    for storage in list(_live_storages):
+        storage.flush()
+
+
+atexit.register(_flush_live_storages)
+
+
+def _segment_file(spec_dir: Path, phase: str) -> Path:
+    """Path of the append-only segment file for a phase."""
+    return spec_dir / f"task_logs.{phase}.jsonl"
+
+
+def _read_segment(segment: Path) -> list[dict]:
+    """Read entries from a segment file, skipping a torn trailing line."""
+    entries = []
+    try:
+        with open(segment, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except (OSError, UnicodeDecodeError):
+        pass
+    return entries
+
+
+def _entry_key(entry: dict) -> tuple:
+    return (entry.get("timestamp"), entry.get("type"), entry.get("content"))
+
+
+def _merge_segments(data: dict, spec_dir: Path) -> bool:
+    """
+    Merge uncompacted segment entries into loaded log data.
+
+    Segments left behind by an interrupted process may partly overlap with
+    what was already compacted, so entries already present are skipped.
+
+    Returns:
+        True if any entries were merged
+    """
+    merged = False
+    phases = data.setdefault("phases", {})
+    for segment in spec_dir.glob("task_logs.*.jsonl"):
+        phase_key = segment.name[len("task_logs.") : -len(".jsonl")]
+        pending = _read_segment(segment)
+        if not pending:
+            continue
+        phase_data = phases.setdefault(
+            phase_key,
+            {
+                "phase": phase_key,
+                "status": "active",
+                "started_at": pending[0].get("timestamp"),
+                "completed_at": None,
+                "entries": [],
+            },
+        )
+        entries = phase_data.setdefault("entries", [])
+        seen = {_entry_key(e) for e in entries[-len(pending) :]}
+        for entry in pending:
+            if _entry_key(entry) not in seen:
+                entries.append(entry)
+                merged = True
+    return merged
+
 
 class LogStorage:
     """Handles persistent storage of task logs."""
 
     LOG_FILE = "task_logs.json"
 
+    # Compact segments into LOG_FILE at most this often (seconds)...
+    COMPACT_INTERVAL = 1.0
+    # ...or as soon as this many entries are pending
+    COMPACT_MAX_PENDING = 200
+
     def __init__(self, spec_dir: Path):
         """
         Initialize log storage.
@@ -26,18 +114,26 @@ class LogStorage:
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._last_compact = 0.0
+        self._flush_timer: threading.Timer | None = None
         self._data: dict = self._load_or_create()
+        _live_storages.add(self)
 
     def _load_or_create(self) -> dict:
-        """Load existing logs or create new structure."""
+        """Load existing logs (plus any uncompacted segments) or create new structure."""
         if self.log_file.exists():
             try:
                 with open(self.log_file, encoding="utf-8") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                if self.spec_dir.exists() and _merge_segments(data, self.spec_dir):
+                    self._pending = 1
+                return data
             except (OSError, json.JSONDecodeError, UnicodeDecodeError):
                 pass
 
-        return {
+        data = {
             "spec_id": self.spec_dir.name,
             "created_at": self._timestamp(),
             "updated_at": self._timestamp(),
@@ -65,29 +161,83 @@ class LogStorage:
                 },
             },
         }
+        if self.spec_dir.exists() and _merge_segments(data, self.spec_dir):
+            self._pending = 1
+        return data
 
     def save(self) -> None:
-        """Save logs to file atomically to prevent corruption from concurrent reads."""
-        self._data["updated_at"] = self._timestamp()
+        """
+        Compact all logs into the log file atomically.
+
+        Writes to a temp file and renames it to prevent corruption from
+        concurrent reads, then truncates the per-phase segments whose
+        entries are now part of the log file.
+        """
+        with self._lock:
+            self._cancel_flush_timer()
+            self._data["updated_at"] = self._timestamp()
+            try:
+                self.spec_dir.mkdir(parents=True, exist_ok=True)
+                # Write to temp file first, then atomic rename to prevent corruption
+                # when the UI reads mid-write
+                fd, tmp_path = tempfile.mkstemp(
+                    dir=self.spec_dir, prefix=".task_logs_", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(self._data, f, indent=2, ensure_ascii=False)
+                    # Atomic rename (on POSIX systems, rename is atomic)
+                    os.replace(tmp_path, self.log_file)
+                except Exception:
+                    # Clean up temp file on failure
+                    if os.path.exists(tmp_path):
+                        os.unlink(tmp_path)
+                    raise
+                for segment in self.spec_dir.glob("task_logs.*.jsonl"):
+                    segment.unlink(missing_ok=True)
+                self._pending = 0
+                self._last_compact = time.monotonic()
+            except OSError as e:
+                print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+
+    def flush(self) -> None:
+        """Compact pending segment entries into the log file, if any."""
+        with self._lock:
+            if self._pending:
+                self.save()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _schedule_flush(self) -> None:
+        """Compact now if due, otherwise make sure a trailing flush is pending."""
+        elapsed = time.monotonic() - self._last_compact
+        if (
+            self._pending >= self.COMPACT_MAX_PENDING
+            or elapsed >= self.COMPACT_INTERVAL
+        ):
+            self.save()
+            return
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(
+                self.COMPACT_INTERVAL - elapsed, self.flush
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _append_segment(self, phase_key: str, entry_dict: dict) -> bool:
+        """Append one entry to the phase segment. Returns False on I/O failure."""
         try:
             self.spec_dir.mkdir(parents=True, exist_ok=True)
-            # Write to temp file first, then atomic rename to prevent corruption
-            # when the UI reads mid-write
-            fd, tmp_path = tempfile.mkstemp(
-                dir=self.spec_dir, prefix=".task_logs_", suffix=".tmp"
-            )
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(self._data, f, indent=2, ensure_ascii=False)
-                # Atomic rename (on POSIX systems, rename is atomic)
-                os.replace(tmp_path, self.log_file)
-            except Exception:
-                # Clean up temp file on failure
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
-                raise
-        except OSError as e:
-            print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+            with open(
+                _segment_file(self.spec_dir, phase_key), "a", encoding="utf-8"
+            ) as f:
+                f.write(json.dumps(entry_dict, ensure_ascii=False) + "\n")
+            return True
+        except OSError:
+            return False
 
     def _timestamp(self) -> str:
         """Get current timestamp in ISO format."""
@@ -97,22 +247,33 @@ class LogStorage:
         """
         Add an entry to the specified phase.
 
+        The entry is appended to the phase segment immediately; compaction
+        into the log file is batched (see COMPACT_INTERVAL/COMPACT_MAX_PENDING).
+
         Args:
             entry: The log entry to add
         """
-        phase_key = entry.phase
-        if phase_key not in self._data["phases"]:
-            # Create phase if it doesn't exist
-            self._data["phases"][phase_key] = {
-                "phase": phase_key,
-                "status": "active",
-                "started_at": self._timestamp(),
-                "completed_at": None,
-                "entries": [],
-            }
+        with self._lock:
+            phase_key = entry.phase
+            if phase_key not in self._data["phases"]:
+                # Create phase if it doesn't exist
+                self._data["phases"][phase_key] = {
+                    "phase": phase_key,
+                    "status": "active",
+                    "started_at": self._timestamp(),
+                    "completed_at": None,
+                    "entries": [],
+                }
+
+            entry_dict = entry.to_dict()
+            self._data["phases"][phase_key]["entries"].append(entry_dict)
+            self._pending += 1
 
-        self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+            if not self._append_segment(phase_key, entry_dict):
+                # Segment unavailable - fall back to writing the full log
+                self.save()
+                return
+            self._schedule_flush()
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
@@ -125,10 +286,12 @@ class LogStorage:
             status: New status (pending, active, completed, failed)
             completed_at: Optional completion timestamp
         """
-        if phase in self._data["phases"]:
-            self._data["phases"][phase]["status"] = status
-            if completed_at:
-                self._data["phases"][phase]["completed_at"] = completed_at
+        with self._lock:
+            if phase in self._data["phases"]:
+                self._data["phases"][phase]["status"] = status
+                if completed_at:
+                    self._data["phases"][phase]["completed_at"] = completed_at
+                self._pending += 1
 
     def set_phase_started(self, phase: str, started_at: str) -> None:
         """
@@ -138,8 +301,10 @@ class LogStorage:
             phase: Phase name
             started_at: Start timestamp
         """
-        if phase in self._data["phases"]:
-            self._data["phases"][phase]["started_at"] = started_at
+        with self._lock:
+            if phase in self._data["phases"]:
+                self._data["phases"][phase]["started_at"] = started_at
+                self._pending += 1
 
     def get_data(self) -> dict:
         """Get all log data."""
@@ -163,6 +328,9 @@ def load_task_logs(spec_dir: Path) -> dict | None:
     """
     Load task logs from a spec directory.
 
+    Entries still sitting in uncompacted phase segments are merged in, so the
+    result always reflects everything that has been logged.
+
     Args:
         spec_dir: Path to the spec directory
 
@@ -175,10 +343,13 @@ def load_task_logs(spec_dir: Path) -> dict | None:
 
     try:
         with open(log_file, encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return None
 
+    _merge_segments(data, spec_dir)
+    return data
+
 
 def get_active_phase(spec_dir: Path) -> str | None:
     """
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared file inventory used by project analyzers.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from analysis.analyzers import FileInventory, ServiceAnalyzer, inventory_scope
+from analysis.analyzers.file_inventory import current_inventory
+from analysis.analyzers.route_detector import RouteDetector
+
+
+def create_files(root: Path, files: dict[str, str]) -> Path:
+    for filepath, content in files.items():
+        full_path = root / filepath
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    return root
+
+
+class TestFileInventory:
+    """Tests for FileInventory."""
+
+    def test_buckets_by_suffix_and_name(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                "app/main.py": "",
+                "app/urls.py": "",
+                "web/index.ts": "",
+            },
+        )
+        inventory = FileInventory(tmp_path)
+
+        assert {p.name for p in inventory.files_with_suffix(".py")} == {
+            "main.py",
+            "urls.py",
+        }
+        assert [p.name for p in inventory.files_named("urls.py")] == ["urls.py"]
+        assert [p.name for p in inventory.files_with_suffix(".ts")] == ["index.ts"]
+
+    def test_prunes_skip_dirs_and_gitignore(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                ".gitignore": "generated/\n/local_only\n*.log\n",
+                "src/app.py": "",
+                "node_modules/pkg/index.js": "",
+                "pkg.egg-info/setup.py": "",
+                "generated/models.py": "",
+                "local_only/settings.py": "",
+                "src/debug.log": "",
+            },
+        )
+        inventory = FileInventory(tmp_path)
+
+        names = {p.relative_to(tmp_path).as_posix() for p in inventory.files()}
+        assert names == {".gitignore", "src/app.py"}
+
+    def test_under_restricts_to_subdirectory(self, tmp_path):
+        create_files(tmp_path, {"a/x.py": "", "b/y.py": ""})
+        inventory = FileInventory(tmp_path)
+
+        found = inventory.files_with_suffix(".py", under=tmp_path / "a")
+        assert [p.name for p in found] == ["x.py"]
+
+    def test_read_text_cached(self, tmp_path):
+        create_files(tmp_path, {"a.py": "first"})
+        inventory = FileInventory(tmp_path)
+
+        assert inventory.read_text(tmp_path / "a.py") == "first"
+        (tmp_path / "a.py").write_text("second")
+        assert inventory.read_text(tmp_path.resolve() / "a.py") == "first"
+
+    def test_scope_shared_with_nested_analyzers(self, tmp_path):
+        create_files(tmp_path, {"api/main.py": ""})
+
+        with inventory_scope(tmp_path) as outer:
+            with inventory_scope(tmp_path / "api") as inner:
+                assert inner is outer
+            assert RouteDetector(tmp_path / "api").inventory is outer
+
+        assert current_inventory() is None
+
+
+class TestAnalyzersUseInventory:
+    """Analyzer results built from the shared inventory."""
+
+    def test_routes_detected_without_globbing(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                "main.py": (
+                    "from fastapi import FastAPI\n"
+                    "app = FastAPI()\n"
+                    '@app.get("/health")\n'
+                    "def health(): ...\n"
+                ),
+                "node_modules/lib/server.js": "app.get('/ignored', h)\n",
+                "app/api/users/[id]/route.ts": "export async function GET() {}\n",
+            },
+        )
+
+        routes = RouteDetector(tmp_path).detect_all_routes()
+
+        paths = {(r["framework"], r["path"]) for r in routes}
+        assert ("FastAPI", "/health") in paths
+        assert ("Next.js", "/api/users/:id") in paths
+        assert not any(r["path"] == "/ignored" for r in routes)
+
+    def test_service_analyzer_walks_once(self, tmp_path, monkeypatch):
+        create_files(
+            tmp_path,
+            {
+                "requirements.txt": "fastapi\n",
+                "main.py": '@app.get("/items")\ndef items(): ...\n',
+            },
+        )
+        walks = []
+        original_walk = FileInventory._walk
+
+        def counting_walk(self):
+            walks.append(self.root)
+            original_walk(self)
+
+        monkeypatch.setattr(FileInventory, "_walk", counting_walk)
+
+        analysis = ServiceAnalyzer(tmp_path, "api").analyze()
+
+        assert len(walks) == 1
+        assert analysis["api"]["routes"][0]["path"] == "/items"
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental project_index.json regeneration.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from analysis.analyzers import ProjectAnalyzer, ServiceAnalyzer, analyze_project
+from analysis.analyzers.index_fingerprints import (
+    fingerprints_path,
+    load_fingerprints,
+)
+
+
+def create_monorepo(root: Path) -> Path:
+    files = {
+        "packages/api/requirements.txt": "fastapi\n",
+        "packages/api/main.py": '@app.get("/items")\ndef items(): ...\n',
+        "packages/web/package.json": json.dumps({"dependencies": {"react": "18"}}),
+        "packages/web/src/App.tsx": "export default function App() {}\n",
+    }
+    for filepath, content in files.items():
+        full_path = root / filepath
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    return root
+
+
+def count_service_analyses(monkeypatch) -> list[str]:
+    analyzed = []
+    original = ServiceAnalyzer.analyze
+
+    def counting_analyze(self):
+        analyzed.append(self.name)
+        return original(self)
+
+    monkeypatch.setattr(ServiceAnalyzer, "analyze", counting_analyze)
+    return analyzed
+
+
+class TestIncrementalIndex:
+    """Tests for analyze_project(..., incremental=True)."""
+
+    def test_fingerprints_written_with_index(self, tmp_path):
+        project = create_monorepo(tmp_path / "project")
+        index_file = project / ".auto-claude" / "project_index.json"
+
+        analyze_project(project, index_file)
+
+        fingerprints = load_fingerprints(index_file)
+        assert fingerprints_path(index_file).exists()
+        # "packages" itself is also analyzed as a service (SERVICE_INDICATORS)
+        assert set(fingerprints["services"]) == {"api", "web", "packages"}
+        assert "main.py" in fingerprints["services"]["api"]["files"]
+
+    def test_unchanged_project_reuses_all_services(self, tmp_path, monkeypatch):
+        project = create_monorepo(tmp_path / "project")
+        index_file = project / ".auto-claude" / "project_index.json"
+        first = analyze_project(project, index_file)
+
+        analyzed = count_service_analyses(monkeypatch)
+        second = analyze_project(project, index_file, incremental=True)
+
+        assert analyzed == []
+        assert second == first
+
+    def test_only_changed_service_reanalyzed(self, tmp_path, monkeypatch):
+        project = create_monorepo(tmp_path / "project")
+        index_file = project / ".auto-claude" / "project_index.json"
+        analyze_project(project, index_file)
+
+        routes_file = project / "packages" / "api" / "main.py"
+        routes_file.write_text(
+            '@app.get("/items")\ndef items(): ...\n@app.post("/orders")\ndef o(): ...\n'
+        )
+        stat = routes_file.stat()
+        os.utime(routes_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        analyzed = count_service_analyses(monkeypatch)
+        result = analyze_project(project, index_file, incremental=True)
+
+        # "web" is untouched; "packages" contains api/ so it changes too
+        assert sorted(analyzed) == ["api", "packages"]
+        paths = {r["path"] for r in result["services"]["api"]["api"]["routes"]}
+        assert paths == {"/items", "/orders"}
+        assert json.loads(index_file.read_text()) == result
+
+    def test_gitignored_env_file_change_reanalyzes_service(self, tmp_path, monkeypatch):
+        project = create_monorepo(tmp_path / "project")
+        (project / ".gitignore").write_text(".env\n")
+        env_file = project / "packages" / "api" / ".env"
+        env_file.write_text("DATABASE_URL=postgres://localhost/db\n")
+        index_file = project / ".auto-claude" / "project_index.json"
+        analyze_project(project, index_file)
+
+        env_file.write_text("DATABASE_URL=postgres://localhost/db\nREDIS_URL=redis://\n")
+        stat = env_file.stat()
+        os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        analyzed = count_service_analyses(monkeypatch)
+        result = analyze_project(project, index_file, incremental=True)
+
+        assert "api" in analyzed and "web" not in analyzed
+        variables = result["services"]["api"]["environment"]["variables"]
+        assert set(variables) >= {"DATABASE_URL", "REDIS_URL"}
+
+    def test_without_fingerprints_falls_back_to_full_scan(self, tmp_path, monkeypatch):
+        project = create_monorepo(tmp_path / "project")
+        index_file = project / ".auto-claude" / "project_index.json"
+        analyze_project(project, index_file)
+        fingerprints_path(index_file).unlink()
+
+        analyzed = count_service_analyses(monkeypatch)
+        analyze_project(project, index_file, incremental=True)
+
+        assert sorted(analyzed) == ["api", "packages", "web"]
+
+    def test_consumes_recomputed_for_reused_services(self, tmp_path):
+        project = create_monorepo(tmp_path / "project")
+        analyzer = ProjectAnalyzer(project)
+        index = analyzer.analyze()
+
+        reused = ProjectAnalyzer(
+            project, index, {"services": analyzer.fingerprints}
+        ).analyze()
+
+        assert reused["services"]["web"].get("consumes") == index["services"][
+            "web"
+        ].get("consumes")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the inverted code index behind ContextBuilder code search.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from context.code_index import CodeIndex
+from context.search import CodeSearcher
+
+
+def create_files(root: Path, files: dict[str, str]) -> Path:
+    for filepath, content in files.items():
+        full_path = root / filepath
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+    return root
+
+
+def touch_later(path: Path, content: str) -> None:
+    """Rewrite a file and bump its mtime so the change is always detected."""
+    st = path.stat()
+    path.write_text(content)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def as_tuples(matches):
+    return sorted(
+        (m.path, m.relevance_score, m.reason, tuple(m.matching_lines)) for m in matches
+    )
+
+
+class TestCodeIndex:
+    """Tests for CodeIndex."""
+
+    def test_substring_hits_with_counts_and_lines(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                "api/users.py": "class UserService:\n    pass\n\ndef get_user(): user = 1\n",
+                "api/orders.py": "def order(): pass\n",
+                "api/notes.md": "user\n",
+            },
+        )
+        index = CodeIndex(tmp_path)
+        index.update(tmp_path / "api")
+
+        hits = index.keyword_hits(tmp_path / "api", ["user", "missing"])
+
+        assert hits["user"] == {"api/users.py": (3, [1, 4])}
+        assert hits["missing"] == {}
+
+    def test_update_reindexes_only_changed_files(self, tmp_path):
+        create_files(tmp_path, {"a.py": "alpha\n", "b.py": "beta\n"})
+        index = CodeIndex(tmp_path)
+
+        assert index.update(tmp_path) == 2
+        assert index.update(tmp_path) == 0
+
+        touch_later(tmp_path / "a.py", "gamma\n")
+        (tmp_path / "b.py").unlink()
+        assert index.update(tmp_path) == 2
+
+        hits = index.keyword_hits(tmp_path, ["alpha", "beta", "gamma"])
+        assert hits == {"alpha": {}, "beta": {}, "gamma": {"a.py": (1, [1])}}
+
+    def test_persisted_between_instances(self, tmp_path):
+        create_files(tmp_path, {"src/app.py": "retry_proxy()\n"})
+        (tmp_path / ".auto-claude").mkdir()
+
+        first = CodeIndex.for_project(tmp_path)
+        first.update(tmp_path / "src")
+        first.close()
+
+        second = CodeIndex.for_project(tmp_path)
+        assert second.db_path == tmp_path.resolve() / ".auto-claude" / "code_index.db"
+        assert second.update(tmp_path / "src") == 0
+        assert second.keyword_hits(tmp_path / "src", ["proxy"])["proxy"] == {
+            "src/app.py": (1, [1])
+        }
+
+    def test_corrupt_database_rebuilt(self, tmp_path):
+        create_files(tmp_path, {"app.py": "x = 1\n"})
+        (tmp_path / ".auto-claude").mkdir()
+        (tmp_path / ".auto-claude" / "code_index.db").write_bytes(b"not a database")
+
+        index = CodeIndex.for_project(tmp_path)
+
+        assert index.update(tmp_path) == 1
+
+
+class TestCodeSearcher:
+    """CodeSearcher results from the index match a full scan."""
+
+    def test_index_matches_full_scan(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                "svc/handlers/auth.py": (
+                    "def login(user):\n"
+                    "    # user-profile lookup\n"
+                    "    return load_user_profile(user)\n"
+                ),
+                "svc/web/App.tsx": "export const UserProfile = () => null; // user\n",
+                "svc/node_modules/lib/index.js": "user user user\n",
+                "svc/build/out.py": "user\n",
+                "other/user.py": "user\n",
+            },
+        )
+        searcher = CodeSearcher(tmp_path)
+        keywords = ["user", "profile", "user-profile", "login(user)", "absent"]
+
+        indexed = searcher.search_service(tmp_path / "svc", "svc", keywords)
+        scanned = searcher._scan_service(tmp_path / "svc", "svc", keywords)
+
+        assert as_tuples(indexed) == as_tuples(scanned)
+        assert {m.path for m in indexed} == {
+            str(Path("svc/handlers/auth.py")),
+            str(Path("svc/web/App.tsx")),
+        }
+
+    def test_nested_service_in_skipped_dir_not_evicted(self, tmp_path):
+        create_files(
+            tmp_path,
+            {
+                "app/main.py": "token\n",
+                "app/vendor/sdk/client.py": "token\n",
+            },
+        )
+        searcher = CodeSearcher(tmp_path)
+
+        sdk = searcher.search_service(tmp_path / "app/vendor/sdk", "sdk", ["token"])
+        app = searcher.search_service(tmp_path / "app", "app", ["token"])
+        sdk_again = searcher.search_service(
+            tmp_path / "app/vendor/sdk", "sdk", ["token"]
+        )
+
+        assert [m.path for m in app] == [str(Path("app/main.py"))]
+        assert [m.path for m in sdk] == [m.path for m in sdk_again]
+        assert searcher.index.update(tmp_path / "app/vendor/sdk") == 0
@@ -0,0 +1,124 @@
+"""
+Tests for the Audit Log Index
+=============================
+
+Tests that indexed AuditLogger queries and statistics match a plain scan of
+the log, survive restarts and pick up entries appended by other writers.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_github_dir = Path(__file__).parent.parent / "apps" / "backend" / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from audit import ActorType, AuditAction, AuditLogger
+from audit_index import index_path
+
+
+def populate(audit: AuditLogger) -> list[str]:
+    """Log a mix of operations; returns their correlation IDs."""
+    ids = []
+    for i in range(12):
+        ctx = audit.start_operation(
+            actor_type=ActorType.AUTOMATION if i % 2 else ActorType.USER,
+            repo="owner/a" if i % 3 else "owner/b",
+            pr_number=i % 4 or None,
+            issue_number=100 + i if i % 5 == 0 else None,
+        )
+        audit.log(ctx, AuditAction.PR_REVIEW_STARTED, result="started")
+        audit.log_ai_agent(ctx, "reviewer", "model", input_tokens=10 * i, output_tokens=i)
+        audit.log(
+            ctx,
+            AuditAction.PR_REVIEW_FAILED if i == 7 else AuditAction.PR_REVIEW_COMPLETED,
+            result="failure" if i == 7 else "success",
+            duration_ms=i,
+        )
+        ids.append(ctx.correlation_id)
+    return ids
+
+
+def scan(log_dir: Path) -> list[dict]:
+    entries = []
+    for log_file in sorted(log_dir.glob("audit_*.jsonl"), reverse=True):
+        entries.extend(json.loads(line) for line in log_file.read_text().splitlines())
+    return entries
+
+
+@pytest.fixture
+def audit(tmp_path):
+    return AuditLogger(log_dir=tmp_path)
+
+
+class TestAuditIndex:
+    """Indexed queries and statistics."""
+
+    def test_filtered_queries_match_scan(self, audit, tmp_path):
+        ids = populate(audit)
+        entries = scan(tmp_path)
+
+        history = audit.get_operation_history(ids[3])
+        assert [e.to_dict() for e in history] == [
+            e for e in entries if e["correlation_id"] == ids[3]
+        ]
+
+        by_pr = audit.query_logs(repo="owner/a", pr_number=1)
+        assert [e.to_dict() for e in by_pr] == [
+            e for e in entries if e["repo"] == "owner/a" and e["pr_number"] == 1
+        ]
+
+        failed = audit.query_logs(action=AuditAction.PR_REVIEW_FAILED)
+        assert [e.correlation_id for e in failed] == [ids[7]]
+        assert audit.query_logs(issue_number=999) == []
+        assert len(audit.query_logs(limit=5)) == 5
+
+    def test_statistics_match_scan(self, audit, tmp_path):
+        populate(audit)
+        entries = scan(tmp_path)
+
+        stats = audit.get_statistics(repo="owner/b")
+
+        expected = [e for e in entries if e["repo"] == "owner/b"]
+        assert stats["total_entries"] == len(expected)
+        assert stats["total_input_tokens"] == sum(
+            (e["token_usage"] or {}).get("input_tokens", 0) for e in expected
+        )
+        assert "failure" not in stats["by_result"]
+        assert audit.get_statistics()["by_result"]["failure"] == 1
+
+        future = datetime.now(timezone.utc) + timedelta(hours=1)
+        assert audit.get_statistics(since=future)["total_entries"] == 0
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert audit.get_statistics(since=past) == audit.get_statistics()
+
+    def test_index_persisted_and_caught_up(self, audit, tmp_path):
+        ids = populate(audit)
+        audit.flush_indexes()
+        log_file = next(tmp_path.glob("audit_*.jsonl"))
+        assert index_path(log_file).exists()
+
+        # Another process appends after the index was saved
+        other = AuditLogger(log_dir=tmp_path)
+        ctx = other.start_operation(
+            actor_type=ActorType.SYSTEM, correlation_id=ids[0], repo="owner/a"
+        )
+        other.log(ctx, AuditAction.STATE_TRANSITION)
+
+        assert len(audit.get_operation_history(ids[0])) == 4
+        restarted = AuditLogger(log_dir=tmp_path)
+        assert len(restarted.get_operation_history(ids[0])) == 4
+
+    def test_rebuilt_when_log_replaced(self, audit, tmp_path):
+        populate(audit)
+        audit.flush_indexes()
+        log_file = next(tmp_path.glob("audit_*.jsonl"))
+        lines = log_file.read_text().splitlines(keepends=True)
+        log_file.write_text("".join(lines[:3]))
+
+        assert len(AuditLogger(log_dir=tmp_path).query_logs()) == 3
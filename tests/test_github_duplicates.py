@@ -0,0 +1,182 @@
+"""
+Tests for Duplicate Detection and the Binary Embedding Store
+=============================================================
+
+Tests the memory-mapped EmbeddingStore and DuplicateDetector's use of it.
+"""
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from duplicates import DuplicateDetector
+from embedding_store import EmbeddingStore, open_embedding_store
+
+
+class FakeProvider:
+    """Deterministic embedding provider keyed on the first word of the text."""
+
+    VECTORS = {
+        "login": [1.0, 0.0, 0.0],
+        "signin": [0.95, 0.05, 0.0],
+        "crash": [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_embedding(self, text: str) -> list[float]:
+        self.calls += 1
+        word = text.split()[0].lower() if text.split() else ""
+        return self.VECTORS.get(word, [0.0, 0.0, 1.0])
+
+
+@pytest.fixture
+def detector(tmp_path):
+    detector = DuplicateDetector(cache_dir=tmp_path / "embeddings")
+    detector.embedding_provider = FakeProvider()
+    return detector
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_put_get_roundtrip(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.put(1, "hash-a", [0.5, 0.25, 1.0], ttl_hours=1)
+
+        assert store.get(1, "hash-a") == [0.5, 0.25, 1.0]
+        assert store.get(1, "other-hash") is None
+        assert store.get(2, "hash-a") is None
+
+    def test_reload_from_disk(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.put(1, "a", [1.0, 0.0], ttl_hours=1)
+        store.put(2, "b", [0.0, 1.0], ttl_hours=1)
+        store.put(1, "c", [0.5, 0.5], ttl_hours=1)
+        store.close()
+
+        reloaded = EmbeddingStore(tmp_path / "repo_embeddings")
+        assert len(reloaded) == 2
+        assert reloaded.get(1, "c") == [0.5, 0.5]
+        assert reloaded.get(2, "b") == [0.0, 1.0]
+
+    def test_expired_entries_ignored(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.put(1, "a", [1.0, 0.0], ttl_hours=1, created_at=0.0)
+
+        assert store.get(1, "a") is None
+        assert store.top_k([1.0, 0.0]) == []
+
+    def test_top_k_orders_and_filters(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.put(1, "a", [1.0, 0.0], ttl_hours=1)
+        store.put(2, "b", [0.0, 1.0], ttl_hours=1)
+        store.put(3, "c", [1.0, 1.0], ttl_hours=1)
+
+        top = store.top_k([1.0, 0.0], k=2)
+        assert [number for number, _ in top] == [1, 3]
+        assert top[0][1] == pytest.approx(1.0)
+
+        assert [n for n, _ in store.top_k([1.0, 0.0], exclude={1})] == [3, 2]
+        assert [n for n, _ in store.top_k([1.0, 0.0], min_score=0.5)] == [1, 3]
+        assert [n for n, _ in store.top_k([1.0, 0.0], candidates={2})] == [2]
+
+    def test_compaction_drops_superseded_rows(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.COMPACT_MIN_DEAD_ROWS = 2
+        for i in range(5):
+            store.put(1, f"v{i}", [float(i), 1.0], ttl_hours=1)
+
+        assert store.matrix_file.stat().st_size < 5 * 2 * 4
+        assert store.get(1, "v4") == [4.0, 1.0]
+
+    def test_dimension_change_resets_store(self, tmp_path):
+        store = EmbeddingStore(tmp_path / "repo_embeddings")
+        store.put(1, "a", [1.0, 0.0], ttl_hours=1)
+        store.put(2, "b", [1.0, 0.0, 0.0], ttl_hours=1)
+
+        assert store.get(1, "a") is None
+        assert store.get(2, "b") == [1.0, 0.0, 0.0]
+
+    def test_stores_in_separate_processes_do_not_share_rows(self, tmp_path):
+        # Two instances on one path stand in for two runner processes
+        first = EmbeddingStore(tmp_path / "repo_embeddings")
+        second = EmbeddingStore(tmp_path / "repo_embeddings")
+
+        first.put(1, "a", [1.0, 0.0, 0.0], ttl_hours=1)
+        second.put(2, "b", [0.0, 1.0, 0.0], ttl_hours=1)
+        first.put(3, "c", [0.0, 0.0, 1.0], ttl_hours=1)
+
+        assert second.get(2, "b") == [0.0, 1.0, 0.0]
+        reloaded = EmbeddingStore(tmp_path / "repo_embeddings")
+        assert reloaded.get(1, "a") == [1.0, 0.0, 0.0]
+        assert reloaded.get(2, "b") == [0.0, 1.0, 0.0]
+        assert reloaded.get(3, "c") == [0.0, 0.0, 1.0]
+        assert first.get(2, "b") == [0.0, 1.0, 0.0]
+
+    def test_open_embedding_store_is_shared(self, tmp_path):
+        assert open_embedding_store(tmp_path / "x") is open_embedding_store(
+            tmp_path / "x"
+        )
+
+
+class TestDuplicateDetector:
+    """Tests for DuplicateDetector using the embedding store."""
+
+    def test_get_embedding_cached(self, detector):
+        provider = detector.embedding_provider
+
+        first = asyncio.run(detector.get_embedding("o/r", 1, "Login broken", ""))
+        second = asyncio.run(detector.get_embedding("o/r", 1, "Login broken", ""))
+
+        assert first == second
+        assert provider.calls == 1
+
+    def test_legacy_json_cache_migrated(self, detector):
+        now = datetime.now(timezone.utc)
+        legacy = detector.cache_dir / "o_r_embeddings.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "embeddings": [
+                        {
+                            "issue_number": 7,
+                            "content_hash": detector._content_hash("Crash", ""),
+                            "embedding": [0.0, 1.0, 0.0],
+                            "created_at": now.isoformat(),
+                            "expires_at": (now + timedelta(hours=1)).isoformat(),
+                        }
+                    ]
+                }
+            )
+        )
+
+        embedding = asyncio.run(detector.get_embedding("o/r", 7, "Crash", ""))
+
+        assert embedding == [0.0, 1.0, 0.0]
+        assert detector.embedding_provider.calls == 0
+        assert not legacy.exists()
+
+    def test_find_duplicates_shortlists_similar(self, detector):
+        open_issues = [
+            {"number": 2, "title": "Signin fails", "body": ""},
+            {"number": 3, "title": "Crash on start", "body": ""},
+        ]
+
+        results = asyncio.run(
+            detector.find_duplicates("o/r", 1, "Login fails", "", open_issues)
+        )
+
+        assert [r.issue_b for r in results] == [2]
+        assert results[0].is_duplicate
@@ -0,0 +1,215 @@
+"""
+Tests for Batched Git Object Reads
+==================================
+
+Tests GitObjectReader against a real repository and its use by
+PRContextGatherer.
+"""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from context_gatherer import FollowupContextGatherer, PRContextGatherer
+from git_objects import BlobCache, GitObjectReader
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "config", "user.email", "test@example.com")
+    git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('v1')\n")
+    (tmp_path / "src" / "old.py").write_text("x = 1\n" * 20)
+    (tmp_path / "same.txt").write_text("unchanged\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "base")
+    base = git(tmp_path, "rev-parse", "HEAD").strip()
+
+    (tmp_path / "src" / "app.py").write_text("print('v2')\n")
+    git(tmp_path, "mv", "src/old.py", "src/new.py")
+    (tmp_path / "added.py").write_text("y = 2\n")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "head")
+    head = git(tmp_path, "rev-parse", "HEAD").strip()
+    return tmp_path, base, head
+
+
+class TestGitObjectReader:
+    """Tests for GitObjectReader."""
+
+    def test_reads_blobs_from_refs(self, repo):
+        path, base, head = repo
+
+        async def read():
+            async with GitObjectReader(path, cache=BlobCache()) as reader:
+                return await reader.read_files(
+                    [
+                        (head, "src/app.py"),
+                        (base, "src/app.py"),
+                        (base, "added.py"),
+                        (head, "src"),
+                    ]
+                )
+
+        contents = asyncio.run(read())
+
+        assert contents[(head, "src/app.py")] == "print('v2')\n"
+        assert contents[(base, "src/app.py")] == "print('v1')\n"
+        assert contents[(base, "added.py")] is None  # Missing at base
+        assert contents[(head, "src")] is None  # Tree, not a file
+
+    def test_blob_cache_keyed_by_object_id(self, repo):
+        path, base, head = repo
+        cache = BlobCache()
+
+        async def read():
+            async with GitObjectReader(path, cache=cache) as reader:
+                await reader.read_files([(base, "same.txt")])
+                # Same blob at a different ref is served from the cache
+                return await reader.read_files([(head, "same.txt")])
+
+        contents = asyncio.run(read())
+
+        assert contents[(head, "same.txt")] == "unchanged\n"
+        assert cache.hits == 1
+        assert len(cache) == 1
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = BlobCache(max_bytes=10)
+        cache.put("a", "aaaa", 4)
+        cache.put("b", "bbbb", 4)
+        cache.get("a")
+        cache.put("c", "cccc", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "aaaa"
+
+    def test_diff_files_matches_per_file_diff(self, repo):
+        path, base, head = repo
+        paths = ["src/app.py", "src/new.py", "src/old.py", "added.py", "same.txt"]
+
+        async def diff():
+            async with GitObjectReader(path) as reader:
+                return await reader.diff_files(base, head, paths)
+
+        patches = asyncio.run(diff())
+
+        for file_path in paths:
+            expected = git(path, "diff", f"{base}...{head}", "--", file_path)
+            assert patches[file_path] == expected
+        assert patches["same.txt"] == ""
+
+    def test_diff_files_with_quoted_paths(self, repo):
+        path, base, _ = repo
+        # Non-ASCII names are quoted by default; tabs are quoted regardless
+        paths = ["src/app.py", "é.py", "tab\tname.py"]
+        for name in paths:
+            (path / name).write_text(f"{name!r}\n")
+        git(path, "add", "-A")
+        git(path, "commit", "-q", "-m", "quoted")
+
+        async def diff():
+            async with GitObjectReader(path) as reader:
+                return await reader.diff_files(base, "HEAD", paths)
+
+        patches = asyncio.run(diff())
+
+        for file_path in paths:
+            expected = git(
+                path, "-c", "core.quotePath=false", "diff", f"{base}...HEAD", "--", file_path
+            )
+            assert patches[file_path] == expected
+        assert "é.py" in patches["é.py"]
+        assert "é.py" not in patches["src/app.py"]
+
+    def test_diff_files_bad_revision(self, repo):
+        path, base, _ = repo
+
+        async def diff():
+            async with GitObjectReader(path) as reader:
+                return await reader.diff_files(base, "0" * 40, ["src/app.py"])
+
+        assert asyncio.run(diff()) is None
+
+
+class TestPRContextGathererBatchedReads:
+    """PRContextGatherer reads changed files through one batch."""
+
+    def test_fetch_changed_files(self, repo, monkeypatch):
+        path, base, head = repo
+        spawned = []
+        original_exec = asyncio.create_subprocess_exec
+
+        async def counting_exec(*args, **kwargs):
+            spawned.append(args[:2])
+            return await original_exec(*args, **kwargs)
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", counting_exec)
+        gatherer = PRContextGatherer(path, pr_number=1)
+        pr_data = {
+            "headRefOid": head,
+            "baseRefOid": base,
+            "headRefName": "feature",
+            "baseRefName": "main",
+            "files": [
+                {"path": "src/app.py", "status": "MODIFIED"},
+                {"path": "added.py", "status": "ADDED"},
+                {"path": "src/old.py", "status": "DELETED"},
+            ],
+        }
+
+        files = asyncio.run(gatherer._fetch_changed_files(pr_data))
+
+        by_path = {f.path: f for f in files}
+        assert by_path["src/app.py"].content == "print('v2')\n"
+        assert by_path["src/app.py"].base_content == "print('v1')\n"
+        assert by_path["added.py"].base_content == ""
+        assert by_path["src/old.py"].content == ""
+        assert by_path["src/old.py"].patch.startswith("diff --git a/src/old.py")
+        assert by_path["added.py"].status == "added"
+        # Two cat-file processes and one diff, regardless of file count
+        assert len(spawned) == 3
+
+
+class TestFollowupLocalPatches:
+    """FollowupContextGatherer fills in patches GitHub omitted from the local repo."""
+
+    def test_local_patches_match_api_patch_shape(self, repo):
+        path, base, head = repo
+        with patch("context_gatherer.GHClient"):
+            gatherer = FollowupContextGatherer(
+                project_dir=path, pr_number=1, previous_review=MagicMock()
+            )
+        files = [
+            {"filename": "src/app.py"},
+            {"filename": "added.py", "patch": "@@ -0,0 +1 @@\n+y = 2"},
+            {"filename": "same.txt"},
+        ]
+
+        patches = asyncio.run(gatherer._get_local_patches(files, base, head))
+
+        assert set(patches) == {"src/app.py"}
+        full_diff = git(path, "diff", base, head, "--", "src/app.py")
+        assert patches["src/app.py"] == full_diff[full_diff.index("@@") :]
+        assert "diff --git" not in patches["src/app.py"]
+        assert "+++ b/" not in patches["src/app.py"]
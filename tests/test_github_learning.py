@@ -0,0 +1,219 @@
+"""
+Tests for the Learning Tracker
+==============================
+
+Tests that incrementally maintained accuracy and pattern aggregates match a
+plain scan of the outcomes, and that the append-only outcome log survives
+restarts and compaction.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_github_dir = Path(__file__).parent.parent / "apps" / "backend" / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+import learning
+from learning import (
+    AccuracyStats,
+    AuthorResponse,
+    LearningTracker,
+    OutcomeType,
+    PredictionType,
+    ReviewOutcome,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def scan_accuracy(outcomes, repo=None, since=None, prediction_type=None):
+    """Reference implementation: filter and count every outcome."""
+    stats = AccuracyStats()
+    merge_seconds = []
+    for o in outcomes:
+        if repo and o.repo != repo:
+            continue
+        if since and o.created_at < since:
+            continue
+        if prediction_type and o.prediction != prediction_type:
+            continue
+        stats.total_predictions += 1
+        by_type = stats.by_type.setdefault(
+            o.prediction.value, {"total": 0, "correct": 0, "incorrect": 0}
+        )
+        by_type["total"] += 1
+        if not o.is_complete:
+            stats.pending_outcomes += 1
+            continue
+        if o.was_correct is True:
+            stats.correct_predictions += 1
+            by_type["correct"] += 1
+        elif o.was_correct is False:
+            stats.incorrect_predictions += 1
+            by_type["incorrect"] += 1
+        if o.actual_outcome == OutcomeType.MERGED and o.time_to_outcome:
+            merge_seconds.append(o.time_to_outcome.total_seconds())
+    if merge_seconds:
+        stats.avg_time_to_merge = timedelta(seconds=sum(merge_seconds) / len(merge_seconds))
+    return stats.to_dict()
+
+
+def populate(tracker, count=60):
+    """Record a mix of predictions and outcomes spread over 40 days."""
+    predictions = [
+        PredictionType.REVIEW_APPROVE,
+        PredictionType.REVIEW_REQUEST_CHANGES,
+        PredictionType.TRIAGE_SPAM,
+    ]
+    outcomes = [OutcomeType.MERGED, OutcomeType.MODIFIED, OutcomeType.CLOSED, None]
+    for i in range(count):
+        review_id = f"review-{i}"
+        tracker.record_prediction(
+            repo="owner/a" if i % 3 else "owner/b",
+            review_id=review_id,
+            prediction=predictions[i % 3],
+            pr_number=i,
+            file_types=["py", "ts"][: 1 + i % 2],
+            categories=["security"] if i % 4 == 0 else ["style"],
+            change_size=["small", "medium", "large"][i % 3],
+        )
+        # Spread creation times, crossing day boundaries
+        recorded = tracker._outcomes[review_id]
+        tracker._unindex(recorded)
+        recorded.created_at = NOW - timedelta(hours=16 * i)
+        tracker._index(recorded)
+        tracker._append_outcome(recorded)
+
+        outcome = outcomes[i % 4]
+        if outcome is not None:
+            tracker.record_outcome(
+                recorded.repo,
+                review_id,
+                outcome,
+                time_to_outcome=timedelta(hours=i),
+                author_response=AuthorResponse.ACCEPTED,
+            )
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return LearningTracker(state_dir=tmp_path)
+
+
+class TestAggregates:
+    """Aggregates must match a scan of every outcome."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"repo": "owner/a"},
+            {"prediction_type": PredictionType.REVIEW_APPROVE},
+            {"since": NOW - timedelta(days=7)},
+            {"since": NOW - timedelta(days=3, hours=5), "repo": "owner/b"},
+            {"since": NOW + timedelta(days=1)},
+        ],
+    )
+    def test_accuracy_matches_scan(self, tracker, kwargs):
+        populate(tracker)
+
+        expected = scan_accuracy(tracker._outcomes.values(), **kwargs)
+
+        assert tracker.get_accuracy(**kwargs).to_dict() == expected
+
+    def test_patterns(self, tracker):
+        populate(tracker)
+
+        patterns = {p.pattern_id: p for p in tracker.detect_patterns(min_sample_size=5)}
+
+        resolved = [
+            o for o in tracker._outcomes.values() if o.is_complete and o.was_correct is not None
+        ]
+        py = [o for o in resolved if "py" in o.file_types]
+        assert patterns["file_type_py"].sample_size == len(py)
+        assert patterns["file_type_py"].accuracy == sum(o.was_correct for o in py) / len(py)
+        assert patterns["change_size_small"].context == {"change_size": "small"}
+        assert {p.pattern_type for p in patterns.values()} == {
+            "file_type_accuracy",
+            "category_accuracy",
+            "change_size_accuracy",
+        }
+
+    def test_recent_and_pending(self, tracker):
+        populate(tracker)
+
+        recent = tracker.get_recent_outcomes("owner/a", limit=3)
+        pending = tracker.get_pending_outcomes()
+
+        assert [o.review_id for o in recent] == ["review-1", "review-2", "review-4"]
+        assert {o.review_id for o in pending} == {f"review-{i}" for i in range(3, 60, 4)}
+        assert tracker.get_dashboard_data()["pending_count"] == len(pending)
+
+
+class TestOutcomeLog:
+    """Tests for the append-only outcome log."""
+
+    def test_records_append_to_log(self, tracker, tmp_path):
+        tracker.record_prediction("owner/a", "r1", PredictionType.REVIEW_APPROVE)
+        tracker.record_outcome("owner/a", "r1", OutcomeType.MERGED)
+
+        log_file = tmp_path / "learning" / "owner_a_outcomes.jsonl"
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["actual_outcome"] == "merged"
+        assert not (tmp_path / "learning" / "owner_a_outcomes.json").exists()
+
+    def test_reload_replays_log(self, tracker, tmp_path):
+        populate(tracker, count=20)
+        before = tracker.get_dashboard_data()
+
+        reopened = LearningTracker(state_dir=tmp_path)
+
+        assert reopened.get_dashboard_data() == before
+
+    def test_compaction(self, tracker, tmp_path, monkeypatch):
+        monkeypatch.setattr(learning, "COMPACTION_MIN_ENTRIES", 5)
+        populate(tracker, count=20)
+        before = tracker.get_accuracy().to_dict()
+        learning_dir = tmp_path / "learning"
+
+        # Logs were compacted while recording
+        assert (learning_dir / "owner_a_outcomes.json").exists()
+        assert len((learning_dir / "owner_a_outcomes.jsonl").read_text().splitlines()) < 20
+
+        tracker.compact()
+
+        assert list(learning_dir.glob("*.jsonl")) == []
+        reopened = LearningTracker(state_dir=tmp_path)
+        assert len(reopened._outcomes) == 20
+        assert reopened.get_accuracy().to_dict() == before
+
+    def test_loads_legacy_snapshot_and_torn_log_line(self, tmp_path):
+        learning_dir = tmp_path / "learning"
+        learning_dir.mkdir()
+        legacy = ReviewOutcome(
+            review_id="old",
+            repo="owner/a",
+            pr_number=1,
+            prediction=PredictionType.REVIEW_APPROVE,
+            findings_count=0,
+            high_severity_count=0,
+        )
+        (learning_dir / "owner_a_outcomes.json").write_text(
+            json.dumps({"repo": "owner/a", "outcomes": [legacy.to_dict()]}, indent=2)
+        )
+        updated = legacy.to_dict() | {"actual_outcome": "merged"}
+        (learning_dir / "owner_a_outcomes.jsonl").write_text(
+            json.dumps(updated) + "\n" + '{"review_id": "torn'
+        )
+
+        tracker = LearningTracker(state_dir=tmp_path)
+
+        assert tracker._outcomes["old"].actual_outcome == OutcomeType.MERGED
+        assert tracker.get_accuracy().correct_predictions == 1
@@ -0,0 +1,263 @@
+"""
+Tests for Batched PR Context Queries
+====================================
+
+Tests query building, cursor pagination and normalization in pr_graphql,
+and GHClient.graphql / get_pr_contexts with canned gh output.
+"""
+
+import asyncio
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from context_gatherer import PRContextGatherer
+from gh_client import GHClient, GHCommandError, GHCommandResult
+from pr_graphql import build_page_query, build_pr_query, fetch_pr_contexts
+from rate_limiter import RateLimiter
+
+
+def connection(nodes, cursor=None):
+    return {
+        "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+        "nodes": nodes,
+    }
+
+
+def pr_node(number, files, files_cursor=None):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": None,
+        "state": "OPEN",
+        "headRefName": "feature",
+        "baseRefName": "main",
+        "headRefOid": "h" * 40,
+        "baseRefOid": "b" * 40,
+        "author": None,
+        "additions": 3,
+        "deletions": 1,
+        "changedFiles": len(files),
+        "mergeable": "MERGEABLE",
+        "mergeStateStatus": "CLEAN",
+        "labels": connection([{"name": "bug"}]),
+        "files": connection(files, files_cursor),
+        "commits": connection(
+            [
+                {
+                    "commit": {
+                        "oid": "c1",
+                        "messageHeadline": "Fix",
+                        "messageBody": "",
+                        "committedDate": "2024-01-01T00:00:00Z",
+                        "authoredDate": "2024-01-01T00:00:00Z",
+                        "authors": {
+                            "nodes": [
+                                {"name": "A", "email": "a@x", "user": {"login": "alice"}}
+                            ]
+                        },
+                    }
+                }
+            ]
+        ),
+        "reviewThreads": connection(
+            [
+                {
+                    "comments": {
+                        "nodes": [
+                            {
+                                "databaseId": 7,
+                                "author": {"__typename": "Bot", "login": "coderabbitai"},
+                                "body": "nit",
+                                "path": "a.py",
+                                "line": 3,
+                                "originalLine": 3,
+                                "createdAt": "2024-01-02T00:00:00Z",
+                            }
+                        ]
+                    }
+                }
+            ]
+        ),
+        "comments": connection(
+            [
+                {
+                    "databaseId": 8,
+                    "author": {"__typename": "Bot", "login": "codecov"},
+                    "body": "Coverage report",
+                    "createdAt": "2024-01-02T00:00:00Z",
+                }
+            ]
+        ),
+    }
+
+
+def file_node(path, change_type="MODIFIED"):
+    return {"path": path, "additions": 1, "deletions": 0, "changeType": change_type}
+
+
+class FakeGraphQL:
+    """Answers initial and follow-up queries from canned PR nodes and pages."""
+
+    def __init__(self, prs: dict[int, dict], pages: dict[str, dict]):
+        self.prs = prs
+        self.pages = pages  # cursor -> files connection
+        self.queries: list[str] = []
+
+    async def __call__(self, query: str) -> dict:
+        self.queries.append(query)
+        repository = {}
+        for alias, number in re.findall(r"(\w+): pullRequest\(number: (\d+)\)", query):
+            if alias.startswith("pr"):
+                if int(number) in self.prs:
+                    repository[alias] = self.prs[int(number)]
+            else:
+                cursor = re.search(
+                    rf"{alias}: pullRequest.*?after: \"([^\"]+)\"", query
+                ).group(1)
+                repository[alias] = {"files": self.pages[cursor]}
+        return {"repository": repository}
+
+
+class TestPRGraphQL:
+    """Tests for pr_graphql."""
+
+    def test_queries_alias_each_pr(self):
+        query = build_pr_query([3, 5])
+        assert "pr3: pullRequest(number: 3)" in query
+        assert "pr5: pullRequest(number: 5)" in query
+        assert "reviews" not in query
+        assert "statusCheckRollup" not in query
+
+        page = build_page_query([(5, "files", "Y3Vy")])
+        assert 'p0: pullRequest(number: 5) { files(first: 100, after: "Y3Vy")' in page
+
+    def test_batch_with_pagination_and_missing_pr(self):
+        fake = FakeGraphQL(
+            prs={
+                1: pr_node(1, [file_node("a.py")], files_cursor="c1"),
+                2: pr_node(2, [file_node("new.py", "ADDED")]),
+            },
+            pages={
+                "c1": connection([file_node("b.py")], "c2"),
+                "c2": connection([file_node("c.py", "REMOVED")]),
+            },
+        )
+
+        contexts = asyncio.run(fetch_pr_contexts(fake, [1, 2, 404]))
+
+        # One batched query plus one per page round, never one per PR
+        assert len(fake.queries) == 3
+        assert set(contexts) == {1, 2}
+        assert [f["path"] for f in contexts[1]["files"]] == ["a.py", "b.py", "c.py"]
+        assert contexts[1]["files"][2]["status"] == "removed"
+        assert contexts[2]["files"][0]["status"] == "added"
+
+        pr = contexts[1]
+        assert pr["author"] == {"login": "", "is_bot": False}
+        assert pr["body"] == ""
+        assert pr["labels"] == [{"name": "bug"}]
+        assert pr["commits"][0]["oid"] == "c1"
+        assert pr["commits"][0]["authors"][0]["login"] == "alice"
+        assert pr["review_comments"][0]["user"]["login"] == "coderabbitai[bot]"
+        assert pr["review_comments"][0]["path"] == "a.py"
+
+        assert pr["issue_comments"][0]["user"]["login"] == "codecov[bot]"
+
+
+class TestGHClientGraphQL:
+    """Tests for GHClient.graphql and its use by PRContextGatherer."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        RateLimiter.reset_instance()
+        yield GHClient(project_dir=tmp_path, enable_rate_limiting=False)
+        RateLimiter.reset_instance()
+
+    @staticmethod
+    def fake_run(calls, returncode, response):
+        async def run(args, timeout=None, raise_on_error=True):
+            calls.append(args)
+            return GHCommandResult(
+                stdout=json.dumps(response),
+                stderr="gh: Could not resolve" if returncode else "",
+                returncode=returncode,
+                command=["gh", *args],
+                attempts=1,
+                total_time=0.0,
+            )
+
+        return run
+
+    def test_partial_data_returned_and_placeholders_resolved(self, client, monkeypatch):
+        calls = []
+        response = {
+            "data": {"repository": {"pr1": None}},
+            "errors": [{"type": "NOT_FOUND"}],
+        }
+        monkeypatch.setattr(client, "run", self.fake_run(calls, 1, response))
+
+        data = asyncio.run(
+            client.graphql("query", variables={"owner": "{owner}", "name": "x"})
+        )
+
+        assert data == {"repository": {"pr1": None}}
+        assert calls[0][:4] == ["api", "graphql", "-f", "query=query"]
+        assert ["-F", "owner={owner}"] == calls[0][4:6]
+        assert ["-f", "name=x"] == calls[0][6:8]
+
+    def test_no_data_raises(self, client, monkeypatch):
+        monkeypatch.setattr(
+            client, "run", self.fake_run([], 1, {"errors": [{"message": "bad"}]})
+        )
+        with pytest.raises(GHCommandError):
+            asyncio.run(client.graphql("query"))
+
+    def test_gatherer_reads_everything_from_one_query(self, tmp_path, monkeypatch):
+        fake = FakeGraphQL(prs={9: pr_node(9, [file_node("a.py")])}, pages={})
+        gatherer = PRContextGatherer(tmp_path, 9)
+
+        async def graphql(query, variables=None, timeout=None):
+            return await fake(query)
+
+        async def no_gh(*args, **kwargs):
+            raise AssertionError("unexpected gh call")
+
+        monkeypatch.setattr(gatherer.gh_client, "graphql", graphql)
+        monkeypatch.setattr(gatherer.gh_client, "run", no_gh)
+
+        metadata = asyncio.run(gatherer._fetch_pr_metadata())
+        commits = asyncio.run(gatherer._fetch_commits())
+        ai_comments = asyncio.run(gatherer._fetch_ai_bot_comments())
+
+        assert metadata["title"] == "PR 9"
+        assert [c["oid"] for c in commits] == ["c1"]
+        assert [(c.tool_name, c.file, c.line) for c in ai_comments] == [
+            ("CodeRabbit", "a.py", 3),
+            ("Codecov", None, None),
+        ]
+        assert len(fake.queries) == 1
+
+    def test_bot_authors_match_ai_bot_patterns(self, tmp_path):
+        node = pr_node(9, [file_node("a.py")])
+        node["author"] = {"__typename": "Bot", "login": "renovate"}
+        contexts = asyncio.run(
+            fetch_pr_contexts(FakeGraphQL(prs={9: node}, pages={}), [9])
+        )
+        gatherer = PRContextGatherer(tmp_path, 9)
+
+        # GraphQL drops the "[bot]" suffix that REST logins carry
+        assert contexts[9]["author"] == {"login": "app/renovate", "is_bot": True}
+        comment = gatherer._parse_ai_comment(contexts[9]["issue_comments"][0], False)
+        assert (comment.author, comment.tool_name) == ("codecov[bot]", "Codecov")
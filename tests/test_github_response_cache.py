@@ -0,0 +1,198 @@
+"""
+Tests for the GitHub API Response Cache
+=======================================
+
+Tests ResponseCache and GHClient.api_get_cached with canned ``gh api``
+output: TTL hits, 304 revalidation and rate limiter accounting.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from gh_client import GHClient, GHCommandError, GHCommandResult
+from rate_limiter import RateLimiter
+from response_cache import (
+    ResponseCache,
+    is_cacheable,
+    parse_included_response,
+    ttl_for,
+)
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+
+
+def included(status: str, body: str = "", etag: str | None = None) -> str:
+    lines = [f"HTTP/2.0 {status}", "Content-Type: application/json"]
+    if etag:
+        lines.append(f"Etag: {etag}")
+    return "\r\n".join(lines) + "\r\n\r\n" + body
+
+
+class FakeGH:
+    """Stands in for GHClient.run, answering from a queue of responses."""
+
+    def __init__(self, responses: list[tuple[int, str, str]]):
+        self.responses = list(responses)
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, args, timeout=None, raise_on_error=True):
+        self.calls.append(list(args))
+        returncode, stdout, stderr = self.responses.pop(0)
+        return GHCommandResult(
+            stdout=stdout,
+            stderr=stderr,
+            returncode=returncode,
+            command=["gh", *args],
+            attempts=1,
+            total_time=0.0,
+        )
+
+
+@pytest.fixture
+def client(tmp_path):
+    RateLimiter.reset_instance()
+    client = GHClient(project_dir=tmp_path, repo="owner/repo")
+    yield client
+    RateLimiter.reset_instance()
+
+
+class TestResponseCache:
+    """Tests for ResponseCache and helpers."""
+
+    def test_parse_included_response(self):
+        status, headers, body = parse_included_response(
+            included("200 OK", '[{"id": 1}]', etag='W/"abc"')
+        )
+        assert status == 200
+        assert headers["etag"] == 'W/"abc"'
+        assert body == '[{"id": 1}]'
+
+        assert parse_included_response("[]") == (None, {}, "[]")
+
+    def test_ttl_for(self):
+        assert ttl_for(f"repos/o/r/compare/{SHA_A}...{SHA_B}") == 24 * 3600
+        assert ttl_for("repos/o/r/compare/main...feature") == 0
+        assert ttl_for("repos/o/r/pulls/7/files?per_page=100&page=2") == 60
+        assert ttl_for("repos/o/r/issues/7/comments") == 30
+        assert ttl_for("repos/o/r/pulls/7") == 0
+
+    def test_persisted_between_instances(self, tmp_path):
+        ResponseCache(tmp_path).put("k", "body", etag='"e"', last_modified=None, ttl=60)
+
+        entry = ResponseCache(tmp_path).get("k")
+
+        assert entry.body == "body"
+        assert entry.conditional_headers() == ['If-None-Match: "e"']
+        assert entry.is_fresh()
+
+    def test_least_recently_used_evicted_from_disk(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, key, etag=None, last_modified=None, ttl=60)
+        cache.get("a")
+        cache.put("c", "c", etag=None, last_modified=None, ttl=60)
+
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        assert cache.get("b") is None
+        # A new process sees the same two files and keeps the cap
+        reopened = ResponseCache(tmp_path, max_entries=2)
+        assert reopened.get("a").body == "a"
+        reopened.put("d", "d", etag=None, last_modified=None, ttl=60)
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        assert reopened.get("c") is None
+
+    def test_is_cacheable(self):
+        assert is_cacheable("repos/{owner}/{repo}/pulls/7/comments")
+        assert not is_cacheable(
+            "repos/{owner}/{repo}/pulls/7/comments?since=2025-01-01T00:00:00Z"
+        )
+
+
+class TestApiGetCached:
+    """Tests for GHClient.api_get_cached."""
+
+    def test_fresh_entry_served_without_request(self, client, monkeypatch):
+        endpoint = f"repos/{{owner}}/{{repo}}/compare/{SHA_A}...{SHA_B}"
+        fake = FakeGH([(0, included("200 OK", '{"files": []}', etag='"v1"'), "")])
+        monkeypatch.setattr(client, "run", fake)
+
+        first = asyncio.run(client.api_get_cached(endpoint))
+        second = asyncio.run(client.api_get_cached(endpoint))
+
+        assert first.stdout == second.stdout == '{"files": []}'
+        assert len(fake.calls) == 1
+        assert "--include" in fake.calls[0]
+        stats = client._rate_limiter.statistics()["github"]["cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_stale_entry_revalidated_with_etag(self, client, monkeypatch):
+        endpoint = "repos/{owner}/{repo}/pulls/7/reviews"
+        fake = FakeGH(
+            [
+                (0, included("200 OK", "[1]", etag='"v1"'), ""),
+                (1, included("304 Not Modified"), "gh: HTTP 304"),
+            ]
+        )
+        monkeypatch.setattr(client, "run", fake)
+
+        asyncio.run(client.api_get_cached(endpoint))
+        client._response_cache.get(client._cache_key(endpoint)).fetched_at -= 3600
+        tokens_before = client._rate_limiter.github_bucket.tokens
+        result = asyncio.run(client.api_get_cached(endpoint))
+
+        assert result.returncode == 0
+        assert result.stdout == "[1]"
+        assert fake.calls[1][-2:] == ["-H", 'If-None-Match: "v1"']
+        assert client._response_cache.get(client._cache_key(endpoint)).is_fresh()
+        assert client._rate_limiter.statistics()["github"]["cache"]["revalidated"] == 1
+        assert client._rate_limiter.github_bucket.tokens >= tokens_before
+
+    def test_changed_resource_replaces_entry(self, client, monkeypatch):
+        endpoint = "repos/{owner}/{repo}/pulls/7"
+        fake = FakeGH(
+            [
+                (0, included("200 OK", '{"v": 1}', etag='"v1"'), ""),
+                (0, included("200 OK", '{"v": 2}', etag='"v2"'), ""),
+            ]
+        )
+        monkeypatch.setattr(client, "run", fake)
+
+        asyncio.run(client.api_get_cached(endpoint))
+        result = asyncio.run(client.api_get_cached(endpoint))
+
+        assert result.stdout == '{"v": 2}'
+        assert client._response_cache.get(client._cache_key(endpoint)).etag == '"v2"'
+
+    def test_errors_not_cached(self, client, monkeypatch):
+        endpoint = "repos/{owner}/{repo}/pulls/7/files"
+        fake = FakeGH([(1, included("404 Not Found", "{}"), "gh: HTTP 404")] * 2)
+        monkeypatch.setattr(client, "run", fake)
+
+        result = asyncio.run(client.api_get_cached(endpoint, raise_on_error=False))
+        assert result.returncode == 1
+        with pytest.raises(GHCommandError):
+            asyncio.run(client.api_get_cached(endpoint))
+
+        assert client._response_cache.get(client._cache_key(endpoint)) is None
+
+    def test_since_polls_bypass_cache(self, client, monkeypatch):
+        fake = FakeGH([(0, "[]", "")] * 2)
+        monkeypatch.setattr(client, "run", fake)
+
+        asyncio.run(client.get_comments_since(7, "2025-01-01T00:00:00Z"))
+
+        assert all("--include" not in call for call in fake.calls)
+        assert not list(client._response_cache.cache_dir.glob("*.json"))
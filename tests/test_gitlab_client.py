@@ -0,0 +1,196 @@
+"""
+Tests for the GitLab API Client
+===============================
+
+Tests the async client against a local stub GitLab server: connection
+reuse, pagination through Link and X-Next-Page headers, rate-limit backoff
+and concurrent MR context fetching.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add the backend and GitLab runner directories to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_gitlab_dir = _backend_dir / "runners" / "gitlab"
+for _path in (_backend_dir, _gitlab_dir):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from glab_client import GitLabAPIError, GitLabClient, GitLabConfig, next_page_url
+
+PROJECT = "group/repo"
+MR_PATH = "/api/v4/projects/group%2Frepo/merge_requests/7"
+
+
+class StubGitLab(BaseHTTPRequestHandler):
+    """Serves a merge request with paginated diffs and commits."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        parsed = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        page = int(query.get("page", 1))
+        self.server.requests.append(self.path)
+        assert self.headers["PRIVATE-TOKEN"] == "secret"
+
+        if self.server.rate_limited:
+            self.server.rate_limited -= 1
+            return self.respond(429, {"message": "slow down"}, {"Retry-After": "0"})
+
+        if parsed.path == MR_PATH:
+            return self.respond(200, {"iid": 7, "title": "Big MR", "sha": "abc"})
+
+        if parsed.path == f"{MR_PATH}/diffs":
+            if self.server.legacy:
+                return self.respond(404, {"message": "404 Not found"})
+            # X-Next-Page only, three pages of two files
+            files = [{"new_path": f"f{page}{i}.py", "diff": "+x\n"} for i in range(2)]
+            next_page = str(page + 1) if page < 3 else ""
+            return self.respond(200, files, {"X-Next-Page": next_page})
+
+        if parsed.path == f"{MR_PATH}/changes":
+            return self.respond(200, {"changes": [{"new_path": "old.py"}]})
+
+        if parsed.path == f"{MR_PATH}/commits":
+            # Link header only, two pages
+            headers = {}
+            if page == 1:
+                base = f"http://{self.headers['Host']}{parsed.path}"
+                headers["Link"] = (
+                    f'<{base}?page=2&per_page=100>; rel="next", '
+                    f'<{base}?page=1&per_page=100>; rel="first"'
+                )
+            return self.respond(200, [{"id": f"c{page}"}], headers)
+
+        self.respond(404, {"message": "404 Not found"})
+
+    def respond(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitLab)
+    server.daemon_threads = True
+    server.connections = 0
+    server.requests = []
+    server.rate_limited = 0
+    server.legacy = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub_server, tmp_path):
+    host, port = stub_server.server_address
+    client = GitLabClient(
+        project_dir=tmp_path,
+        config=GitLabConfig(
+            token="secret", project=PROJECT, instance_url=f"http://{host}:{port}"
+        ),
+        max_connections=2,
+    )
+    yield client
+    client.close()
+
+
+class TestNextPageUrl:
+    def test_link_header(self):
+        url = "https://gitlab.com/api/v4/projects/1/merge_requests/1/commits?per_page=100"
+        headers = {
+            "Link": '<https://gitlab.com/api/v4/projects/1/merge_requests/1/commits?page=2>; rel="next"'
+        }
+
+        assert next_page_url(url, headers).endswith("commits?page=2")
+
+    def test_x_next_page(self):
+        url = "https://gitlab.com/api/v4/projects/1/merge_requests/1/diffs?per_page=100"
+
+        next_url = next_page_url(url, {"X-Next-Page": "3"})
+
+        assert next_url.endswith("diffs?per_page=100&page=3")
+        assert next_page_url(url, {"X-Next-Page": ""}) is None
+
+    def test_link_to_other_host_is_ignored(self):
+        url = "https://gitlab.com/api/v4/projects/1/merge_requests/1/commits"
+        headers = {"Link": '<https://evil.example/steal?page=2>; rel="next"'}
+
+        assert next_page_url(url, headers) is None
+
+
+class TestAsyncClient:
+    def test_fetches_all_pages_on_pooled_connections(self, client, stub_server):
+        async def run():
+            return await asyncio.gather(
+                client.get_mr_async(7),
+                client.get_mr_changes_async(7),
+                client.get_mr_commits_async(7),
+            )
+
+        mr, changes, commits = asyncio.run(run())
+
+        assert mr["title"] == "Big MR"
+        assert len(changes["changes"]) == 6
+        assert [c["id"] for c in commits] == ["c1", "c2"]
+        # 6 requests over at most max_connections keep-alive connections
+        assert len(stub_server.requests) == 6
+        assert stub_server.connections <= 2
+        assert all("per_page=100" in r for r in stub_server.requests[1:])
+
+    def test_falls_back_to_changes_endpoint(self, client, stub_server):
+        stub_server.legacy = True
+
+        changes = asyncio.run(client.get_mr_changes_async(7))
+
+        assert changes == {"changes": [{"new_path": "old.py"}]}
+
+    def test_rate_limit_backoff_does_not_block_event_loop(self, client, stub_server):
+        stub_server.rate_limited = 1
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0)
+
+        async def run():
+            mr, _ = await asyncio.gather(client.get_mr_async(7), ticker())
+            return mr
+
+        assert asyncio.run(run())["iid"] == 7
+        assert len(ticks) == 3
+        assert len(stub_server.requests) == 2
+
+    def test_error_status_raises(self, client, stub_server):
+        with pytest.raises(GitLabAPIError) as exc_info:
+            asyncio.run(client._fetch_async("/projects/group%2Frepo/issues/1"))
+
+        assert exc_info.value.status == 404
+        assert "404 Not found" in str(exc_info.value)
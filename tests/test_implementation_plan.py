@@ -1771,3 +1771,273 @@ class TestStuckSubtaskSkipping:
 
         result = get_next_subtask(spec_dir)
         assert result is None, "Should return None when all pending subtasks are stuck"
+
+
+class TestParallelSubtaskBatch:
+    """Tests for progress.get_parallel_subtask_batch()."""
+
+    def _write_plan(self, spec_dir, phases):
+        spec_dir.mkdir(parents=True, exist_ok=True)
+        plan = {"feature": "Test", "workflow_type": "feature", "phases": phases}
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+    def _phase(self, num, subtasks, parallel_safe=True, depends_on=None):
+        return {
+            "phase": num,
+            "name": f"Phase {num}",
+            "depends_on": depends_on or [],
+            "parallel_safe": parallel_safe,
+            "subtasks": subtasks,
+        }
+
+    def _subtask(self, subtask_id, *files, status="pending"):
+        return {
+            "id": subtask_id,
+            "description": subtask_id,
+            "status": status,
+            "files_to_modify": list(files),
+        }
+
+    def test_disjoint_subtasks_are_batched(self, temp_dir):
+        """Subtasks with disjoint files in a parallel_safe phase are batched."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [
+                self._subtask("a", "src/a.py"),
+                self._subtask("b", "src/b.py"),
+                self._subtask("c", "./src/a.py"),
+                self._subtask("d", "src/d.py"),
+            ]),
+        ])
+
+        batch = get_parallel_subtask_batch(spec_dir, max_subtasks=4)
+
+        assert [s["id"] for s in batch] == ["a", "b", "d"]
+
+    def test_batch_respects_max(self, temp_dir):
+        """The batch never exceeds max_subtasks."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [self._subtask(s, f"{s}.py") for s in "abc"]),
+        ])
+
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 2)] == ["a", "b"]
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 1)] == ["a"]
+
+    def test_unsafe_phase_runs_alone(self, temp_dir):
+        """Subtasks from phases not marked parallel_safe are never batched."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [
+                self._subtask("a", "a.py"),
+                self._subtask("b", "b.py"),
+            ], parallel_safe=False),
+        ])
+
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 4)] == ["a"]
+
+    def test_subtask_without_files_runs_alone(self, temp_dir):
+        """A subtask that declares no files can't be proven independent."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [
+                self._subtask("a"),
+                self._subtask("b", "b.py"),
+                self._subtask("c"),
+            ]),
+        ])
+
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 4)] == ["a"]
+
+    def test_batch_spans_ready_phases_only(self, temp_dir):
+        """Independent phases are batched; phases with unmet dependencies are not."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [self._subtask("a", "a.py")]),
+            self._phase(2, [self._subtask("b", "b.py")]),
+            self._phase(3, [self._subtask("c", "c.py")], depends_on=[1]),
+        ])
+
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 4)] == ["a", "b"]
+
+    def test_stuck_subtasks_are_skipped(self, temp_dir):
+        """Stuck subtasks are left out of the batch."""
+        from progress import get_parallel_subtask_batch
+
+        spec_dir = temp_dir / "spec"
+        self._write_plan(spec_dir, [
+            self._phase(1, [self._subtask(s, f"{s}.py") for s in "abc"]),
+        ])
+        memory_dir = spec_dir / "memory"
+        memory_dir.mkdir()
+        (memory_dir / "attempt_history.json").write_text(
+            json.dumps({"subtasks": {}, "stuck_subtasks": [{"subtask_id": "a"}]})
+        )
+
+        assert [s["id"] for s in get_parallel_subtask_batch(spec_dir, 4)] == ["b", "c"]
+
+
+class TestParallelSubtaskSessions:
+    """Tests for agents.coder.run_parallel_subtasks() and summarize_parallel_results()."""
+
+    def _stub_session_helpers(self, monkeypatch, run_agent_session, post_processing):
+        class DummyClient:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, exc_type, exc, tb):
+                return False
+
+        async def fake_build_subtask_prompt(_spec_dir, _project_dir, subtask, _rm):
+            return f"prompt for {subtask['id']}"
+
+        monkeypatch.setattr(
+            "agents.coder.create_client", lambda *_a, **_k: DummyClient()
+        )
+        monkeypatch.setattr(
+            "agents.coder.build_subtask_prompt", fake_build_subtask_prompt
+        )
+        monkeypatch.setattr(
+            "agents.coder.validate_subtask_files", lambda *_a: {"success": True}
+        )
+        monkeypatch.setattr("agents.coder.get_latest_commit", lambda _p: "abc123")
+        monkeypatch.setattr("agents.coder.get_commit_count", lambda _p: 1)
+        monkeypatch.setattr("agents.coder.run_agent_session", run_agent_session)
+        monkeypatch.setattr("agents.coder.post_session_processing", post_processing)
+
+    @pytest.mark.asyncio
+    async def test_failing_subtask_does_not_affect_sibling(self, temp_dir, monkeypatch):
+        """One failing session is recorded and marked stuck; the other succeeds."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from agents.base import MAX_SUBTASK_RETRIES
+        from agents.coder import run_parallel_subtasks
+        from recovery import RecoveryManager
+
+        spec_dir = temp_dir / "spec"
+        spec_dir.mkdir()
+        recovery_manager = RecoveryManager(spec_dir, temp_dir)
+        for session in range(MAX_SUBTASK_RETRIES - 1):
+            recovery_manager.record_attempt(
+                subtask_id="bad",
+                session=session,
+                success=False,
+                approach="earlier attempt",
+                error="failed",
+            )
+
+        async def fake_run_agent_session(_client, prompt, *_args, **_kwargs):
+            # Yield so both sessions are in flight at once
+            await asyncio.sleep(0)
+            if prompt.startswith("prompt for bad"):
+                raise RuntimeError("session crashed")
+            return "continue", "done", {}
+
+        active = 0
+        post_processed = []
+
+        async def fake_post_session_processing(**kwargs):
+            nonlocal active
+            active += 1
+            assert active == 1, "post-session processing must not overlap"
+            await asyncio.sleep(0)
+            success = not kwargs["error_info"]
+            kwargs["recovery_manager"].record_attempt(
+                subtask_id=kwargs["subtask_id"],
+                session=kwargs["session_num"],
+                success=success,
+                approach="parallel session",
+                error=None if success else kwargs["error_info"]["message"],
+            )
+            post_processed.append(kwargs["subtask_id"])
+            active -= 1
+            return success
+
+        self._stub_session_helpers(
+            monkeypatch, fake_run_agent_session, fake_post_session_processing
+        )
+        status_manager = MagicMock()
+
+        results = await run_parallel_subtasks(
+            [{"id": "bad"}, {"id": "good"}],
+            project_dir=temp_dir,
+            spec_dir=spec_dir,
+            model="test-model",
+            session_num=7,
+            recovery_manager=recovery_manager,
+            status_manager=status_manager,
+        )
+
+        assert [r.subtask_id for r in results] == ["bad", "good"]
+        bad, good = results
+        assert bad.status == "error"
+        assert not bad.success
+        assert bad.error_info["message"] == "session crashed"
+        assert bad.error_info["exception_type"] == "RuntimeError"
+        assert good.status == "continue"
+        assert good.success
+        assert good.error_info == {}
+
+        assert sorted(post_processed) == ["bad", "good"]
+        stuck_ids = [s["subtask_id"] for s in recovery_manager.get_stuck_subtasks()]
+        assert stuck_ids == ["bad"]
+        status_manager.update_subtasks.assert_called_once_with(in_progress=2)
+
+    def test_rate_limit_wins_over_continue(self, temp_dir):
+        """A rate limit in one session pauses the batch even if others continue."""
+        from agents.coder import SubtaskSessionResult, summarize_parallel_results
+
+        rate_limit = {"type": "rate_limit", "message": "429"}
+        results = [
+            SubtaskSessionResult("1.1", "continue", success=True),
+            SubtaskSessionResult("1.2", "error", error_info=rate_limit),
+            SubtaskSessionResult("1.3", "continue", success=True),
+        ]
+
+        assert summarize_parallel_results(results, temp_dir) == ("error", rate_limit)
+
+    def test_authentication_wins_over_rate_limit(self, temp_dir):
+        """The most urgent build-level error is reported first."""
+        from agents.coder import SubtaskSessionResult, summarize_parallel_results
+
+        auth = {"type": "authentication", "message": "expired"}
+        results = [
+            SubtaskSessionResult("1.1", "error", error_info={"type": "rate_limit"}),
+            SubtaskSessionResult("1.2", "error", error_info=auth),
+        ]
+
+        assert summarize_parallel_results(results, temp_dir) == ("error", auth)
+
+    def test_partial_failure_continues(self, temp_dir):
+        """Ordinary failures in some sessions let the loop continue."""
+        from agents.coder import SubtaskSessionResult, summarize_parallel_results
+
+        results = [
+            SubtaskSessionResult("1.1", "error", error_info={"type": "other"}),
+            SubtaskSessionResult("1.2", "continue", success=True),
+        ]
+
+        assert summarize_parallel_results(results, temp_dir) == ("continue", {})
+
+    def test_all_failed_reports_first_error(self, temp_dir):
+        """When every session fails the first error is surfaced."""
+        from agents.coder import SubtaskSessionResult, summarize_parallel_results
+
+        first = {"type": "other", "message": "boom"}
+        results = [
+            SubtaskSessionResult("1.1", "error", error_info=first),
+            SubtaskSessionResult("1.2", "error", error_info={"type": "other"}),
+        ]
+
+        assert summarize_parallel_results(results, temp_dir) == ("error", first)
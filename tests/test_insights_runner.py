@@ -0,0 +1,191 @@
+"""
+Tests for the Insights Runner
+=============================
+
+Tests the cached project context and the persistent insights session:
+follow-up messages reuse the connected client and only send the new turn,
+while model, context or conversation changes start a new client that
+replays earlier turns.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners directory to path
+_runners_dir = Path(__file__).parent.parent / "apps" / "backend" / "runners"
+if str(_runners_dir) not in sys.path:
+    sys.path.insert(0, str(_runners_dir))
+
+import insights_runner
+from insights_runner import InsightsSession, build_conversation_prompt
+
+
+class TextBlock:
+    def __init__(self, text):
+        self.text = text
+
+
+class AssistantMessage:
+    def __init__(self, text):
+        self.content = [TextBlock(text)]
+
+
+class FakeClient:
+    def __init__(self, project_dir, model, thinking_level, system_prompt):
+        self.model = model
+        self.system_prompt = system_prompt
+        self.queries = []
+        self.connected = False
+
+    async def connect(self):
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def query(self, prompt):
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        yield AssistantMessage(f"answer {len(self.queries)}")
+
+
+@pytest.fixture
+def project(tmp_path):
+    auto_claude = tmp_path / ".auto-claude"
+    (auto_claude / "roadmap").mkdir(parents=True)
+    (auto_claude / "specs" / "001-first").mkdir(parents=True)
+    (auto_claude / "roadmap" / "roadmap.json").write_text(
+        json.dumps({"features": [{"title": "Dark mode", "status": "planned"}]})
+    )
+    insights_runner._context_cache.clear()
+    yield tmp_path
+    insights_runner._context_cache.clear()
+
+
+@pytest.fixture
+def session(project):
+    clients = []
+
+    def factory(*args):
+        clients.append(FakeClient(*args))
+        return clients[-1]
+
+    session = InsightsSession(str(project), client_factory=factory)
+    session.clients = clients
+    return session
+
+
+def turn(role, content):
+    return {"role": role, "content": content}
+
+
+class TestProjectContext:
+    def test_context_cached_until_sources_change(self, project, monkeypatch):
+        builds = []
+        build = insights_runner._build_project_context
+        monkeypatch.setattr(
+            insights_runner,
+            "_build_project_context",
+            lambda project_dir: builds.append(project_dir) or build(project_dir),
+        )
+
+        first = insights_runner.load_project_context(str(project))
+        insights_runner.build_system_prompt(str(project))
+        assert len(builds) == 1
+        assert "Dark mode" in first and "001-first" in first
+
+        (project / ".auto-claude" / "specs" / "002-second").mkdir()
+        specs_dir = project / ".auto-claude" / "specs"
+        stat = specs_dir.stat()
+        os.utime(specs_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert "002-second" in insights_runner.load_project_context(str(project))
+        assert len(builds) == 2
+
+
+def test_build_conversation_prompt():
+    assert build_conversation_prompt("hi", []) == "hi"
+
+    prompt = build_conversation_prompt("why?", [turn("user", "q"), turn("assistant", "a")])
+
+    assert "User: q" in prompt and "Assistant: a" in prompt
+    assert prompt.endswith("Current question: why?")
+
+
+class TestInsightsSession:
+    def test_follow_ups_send_only_the_new_message(self, session):
+        async def run():
+            await session.connect("sonnet", "medium")
+            await session.ask("first", ["first"], "sonnet", "medium")
+            history = [turn("user", "first"), turn("assistant", "edited"), turn("user", "second")]
+            await session.ask("second", history, "sonnet", "medium")
+            await session.ask("third", None, "sonnet", "medium")
+
+        asyncio.run(run())
+
+        assert len(session.clients) == 1
+        assert session.clients[0].queries == ["first", "second", "third"]
+        assert [t["content"] for t in session.conversation[::2]] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+    def test_model_change_replays_conversation(self, session):
+        async def run():
+            await session.ask("first", None, "sonnet", "medium")
+            await session.ask("second", None, "opus", "medium")
+
+        asyncio.run(run())
+
+        old, new = session.clients
+        assert not old.connected and new.connected
+        assert new.model == "opus"
+        assert "User: first" in new.queries[0]
+        assert "Assistant: answer 1" in new.queries[0]
+
+    def test_new_conversation_and_context_change_restart_client(self, session, project):
+        async def run():
+            await session.ask("first", None, "sonnet", "medium")
+            # The UI started a new conversation
+            await session.ask("other", [turn("user", "other")], "sonnet", "medium")
+            roadmap = project / ".auto-claude" / "roadmap" / "roadmap.json"
+            roadmap.write_text(json.dumps({"features": [{"title": "Offline sync"}]}))
+            await session.ask("again", None, "sonnet", "medium")
+
+        asyncio.run(run())
+
+        assert len(session.clients) == 3
+        assert session.clients[1].queries == ["other"]
+        assert "Offline sync" in session.clients[2].system_prompt
+        assert "User: other" in session.clients[2].queries[0]
+
+    def test_serve_request_reports_latency(self, session, capsys):
+        line = json.dumps({"id": 7, "message": "hello"})
+
+        asyncio.run(
+            insights_runner._serve_request(session, session.project_dir, line, "sonnet", "medium")
+        )
+
+        out = capsys.readouterr().out.splitlines()
+        assert out[0] == "answer 1"
+        marker, payload = out[-1].split(":", 1)
+        end = json.loads(payload)
+        assert marker == "__RESPONSE_END__"
+        assert end["id"] == 7 and end["error"] is None
+        assert 0 <= end["first_output_ms"] <= end["latency_ms"]
+
+    def test_serve_request_rejects_invalid_json(self, session, capsys):
+        asyncio.run(
+            insights_runner._serve_request(session, session.project_dir, "{", "sonnet", "medium")
+        )
+
+        end = json.loads(capsys.readouterr().out.split("__RESPONSE_END__:")[1])
+        assert end["error"].startswith("Invalid request")
+        assert session.clients == []
@@ -0,0 +1,265 @@
+"""
+Tests for the Linear Updater
+============================
+
+Tests the direct GraphQL path against a local fake Linear endpoint:
+coalescing and batching of queued updates, retries, the agent fallback,
+and the updater's transition functions.
+"""
+
+import asyncio
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from integrations.linear import updater
+from integrations.linear.api import LinearAPIClient
+from integrations.linear.update_queue import LinearUpdateQueue, build_batch_mutation
+
+STATES = [
+    {"id": "state-todo", "name": "Todo"},
+    {"id": "state-progress", "name": "In Progress"},
+    {"id": "state-review", "name": "In Review"},
+]
+
+
+class FakeLinear(BaseHTTPRequestHandler):
+    """Answers the GraphQL documents the updater sends."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        query, variables = request["query"], request["variables"]
+        self.server.requests.append(request)
+        assert self.headers["Authorization"] == "lin_api_test"
+
+        if self.server.unavailable:
+            self.server.unavailable -= 1
+            return self.respond(503, {"errors": [{"message": "unavailable"}]})
+
+        if "IssueStates" in query:
+            states = {"nodes": STATES}
+            return self.respond(200, {"data": {"issue": {"team": {"id": "team-1", "states": states}}}})
+
+        if "CreateIssue" in query:
+            issue = {"identifier": "VAL-9", "team": {"id": "team-1"}}
+            return self.respond(200, {"data": {"issueCreate": {"success": True, "issue": issue}}})
+
+        if "Teams" in query:
+            return self.respond(200, {"data": {"teams": {"nodes": [{"id": "team-1"}]}}})
+
+        if self.server.batch_error:
+            # A request-level error: HTTP 200, no data, no error path
+            return self.respond(200, {"data": None, "errors": [{"message": self.server.batch_error}]})
+
+        data, errors = {}, []
+        for alias in re.findall(r"(m\d+): \w+\(", query):
+            value = variables[f"v{alias[1:]}"]
+            issue = variables.get(f"i{alias[1:]}") or value.get("issueId")
+            if issue in self.server.rejected_issues:
+                data[alias] = None
+                errors.append({"message": "Entity not found", "path": [alias]})
+            else:
+                data[alias] = {"success": True}
+        self.respond(200, {"data": data, **({"errors": errors} if errors else {})})
+
+    def respond(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def linear_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLinear)
+    server.daemon_threads = True
+    server.requests = []
+    server.unavailable = 0
+    server.rejected_issues = set()
+    server.batch_error = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    server.url = f"http://{host}:{port}/graphql"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(linear_server):
+    return LinearAPIClient("lin_api_test", url=linear_server.url, backoff_base=0.01)
+
+
+def batches(server):
+    return [r for r in server.requests if "LinearBatch" in r["query"]]
+
+
+def test_build_batch_mutation():
+    document, variables = build_batch_mutation(
+        [("status", "VAL-1", "state-1"), ("comment", "VAL-1", "hi")]
+    )
+
+    assert "m0: issueUpdate(id: $i0, input: $v0)" in document
+    assert "m1: commentCreate(input: $v1)" in document
+    assert variables == {
+        "i0": "VAL-1",
+        "v0": {"stateId": "state-1"},
+        "v1": {"issueId": "VAL-1", "body": "hi"},
+    }
+
+
+class TestUpdateQueue:
+    def test_coalesces_updates_into_one_batch(self, client, linear_server):
+        queue = LinearUpdateQueue(client, coalesce_delay=5)
+        queue.update_status("VAL-1", "In Progress")
+        queue.add_comment("VAL-1", "Build started")
+        queue.update_status("VAL-1", "In Review")
+        queue.add_comment("VAL-1", "QA started")
+        queue.add_comment("VAL-2", "Completed 1.1")
+
+        assert queue.close(timeout=10)
+
+        [batch] = batches(linear_server)
+        assert list(batch["variables"].values()) == [
+            "VAL-1",
+            {"stateId": "state-review"},
+            {"issueId": "VAL-1", "body": "Build started\n\nQA started"},
+            {"issueId": "VAL-2", "body": "Completed 1.1"},
+        ]
+        assert queue.stats["coalesced"] == 2
+        assert queue.stats["mutations"] == 3
+
+    def test_splits_large_batches_and_caches_states(self, client, linear_server):
+        queue = LinearUpdateQueue(client, coalesce_delay=0, max_batch=2)
+        for status in ("Todo", "In Progress"):
+            for issue in ("VAL-1", "VAL-2", "VAL-3"):
+                queue.update_status(issue, status)
+            assert queue.flush(timeout=10)
+
+        states_queries = [r for r in linear_server.requests if "IssueStates" in r["query"]]
+        assert len(states_queries) == 3
+        assert len(batches(linear_server)) == 4
+        assert queue.stats["mutations"] == 6
+
+    def test_retries_transient_failures(self, client, linear_server):
+        linear_server.unavailable = 2
+        queue = LinearUpdateQueue(client, coalesce_delay=0)
+
+        queue.add_comment("VAL-1", "hello")
+        assert queue.flush(timeout=10)
+
+        assert len(batches(linear_server)) == 3
+        assert queue.stats["mutations"] == 1
+        assert queue.stats["fallbacks"] == 0
+
+    def test_failed_mutations_use_fallback(self, client, linear_server):
+        linear_server.rejected_issues = {"VAL-2"}
+        fallen_back = []
+        queue = LinearUpdateQueue(
+            client, fallback=lambda u: fallen_back.append(u) or True, coalesce_delay=0
+        )
+
+        queue.add_comment("VAL-1", "ok")
+        queue.add_comment("VAL-2", "rejected")
+        queue.update_status("VAL-2", "Shipped")  # no such workflow state
+        assert queue.flush(timeout=10)
+
+        assert [(u.issue_id, u.status, u.comment) for u in fallen_back] == [
+            ("VAL-2", "Shipped", None),
+            ("VAL-2", None, "rejected"),
+        ]
+        assert queue.stats["mutations"] == 1
+        assert queue.stats["failed"] == 0
+
+    def test_pathless_error_fails_whole_batch(self, client, linear_server):
+        linear_server.batch_error = "Internal server error"
+        fallen_back = []
+        applied = []
+        queue = LinearUpdateQueue(
+            client, fallback=lambda u: fallen_back.append(u) or False, coalesce_delay=0
+        )
+
+        queue.update_status("VAL-1", "In Progress", on_applied=lambda: applied.append(1))
+        queue.add_comment("VAL-2", "hello")
+        assert queue.flush(timeout=10)
+
+        assert [(u.issue_id, u.status, u.comment) for u in fallen_back] == [
+            ("VAL-1", "In Progress", None),
+            ("VAL-2", None, "hello"),
+        ]
+        assert applied == []
+        assert queue.stats["mutations"] == 0
+        assert queue.stats["failed"] == 2
+
+
+class TestUpdater:
+    @pytest.fixture
+    def spec_dir(self, tmp_path, linear_server, monkeypatch):
+        monkeypatch.setenv("LINEAR_API_KEY", "lin_api_test")
+        monkeypatch.setenv("LINEAR_API_URL", linear_server.url)
+        monkeypatch.delenv("LINEAR_TEAM_ID", raising=False)
+        monkeypatch.setattr(updater, "_update_queue", None)
+        yield tmp_path
+        if updater._update_queue is not None:
+            updater._update_queue.close(timeout=10)
+
+    def test_transitions_are_queued_and_batched(self, spec_dir, linear_server):
+        updater.LinearTaskState(task_id="VAL-1", team_id="team-1").save(spec_dir)
+
+        async def run():
+            assert await updater.linear_task_started(spec_dir)
+            assert await updater.linear_subtask_completed(spec_dir, "1.1", 1, 3)
+
+        asyncio.run(run())
+        assert updater.flush_linear_updates(timeout=10)
+
+        [batch] = batches(linear_server)
+        assert list(batch["variables"].values()) == [
+            "VAL-1",
+            {"stateId": "state-progress"},
+            {
+                "issueId": "VAL-1",
+                "body": "Build started - planning phase initiated\n\n"
+                "Completed 1.1 (1/3 subtasks done)",
+            },
+        ]
+        assert updater.LinearTaskState.load(spec_dir).status == updater.STATUS_IN_PROGRESS
+
+    def test_status_saved_only_once_applied(self, spec_dir, linear_server, monkeypatch):
+        monkeypatch.setattr(updater, "_agent_fallback", lambda update: False)
+        updater.LinearTaskState(task_id="VAL-1", team_id="team-1").save(spec_dir)
+
+        linear_server.batch_error = "Internal server error"
+        assert asyncio.run(updater.linear_qa_started(spec_dir))
+        assert updater.flush_linear_updates(timeout=10)
+        assert updater.LinearTaskState.load(spec_dir).status == updater.STATUS_TODO
+
+        linear_server.batch_error = None
+        assert asyncio.run(updater.linear_qa_started(spec_dir))
+        assert updater.flush_linear_updates(timeout=10)
+        assert updater.LinearTaskState.load(spec_dir).status == updater.STATUS_IN_REVIEW
+
+    def test_create_task_uses_api(self, spec_dir, linear_server):
+        state = asyncio.run(updater.create_linear_task(spec_dir, "Dark mode", "Add it"))
+
+        assert (state.task_id, state.team_id) == ("VAL-9", "team-1")
+        create = next(r for r in linear_server.requests if "CreateIssue" in r["query"])
+        assert create["variables"]["input"] == {
+            "teamId": "team-1",
+            "title": "Dark mode",
+            "description": "Add it",
+        }
@@ -0,0 +1,165 @@
+"""
+Tests for Batched Git Refresh
+=============================
+
+Tests the batched git helpers in merge.git_utils and the single- and
+multi-task refresh paths of FileEvolutionTracker against real repositories.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge import FileEvolutionTracker
+from merge.git_utils import get_file_diffs, get_files_at_ref, list_changed_files
+
+
+def git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository on main with a task branch checked out in a worktree."""
+    main = tmp_path / "main"
+    main.mkdir()
+    git(main, "init", "-q", "-b", "main")
+    git(main, "config", "user.email", "test@example.com")
+    git(main, "config", "user.name", "Test")
+    (main / "src").mkdir()
+    (main / "src" / "app.py").write_text("def app():\n    return 1\n")
+    (main / "src" / "gone.py").write_text("x = 1\n")
+    (main / "with space.py").write_text("a = 1\n")
+    git(main, "add", "-A")
+    git(main, "commit", "-q", "-m", "base")
+    return main
+
+
+def make_task(repo: Path, name: str, edits: dict[str, str | None]) -> Path:
+    worktree = repo.parent / name
+    git(repo, "worktree", "add", "-q", "-b", f"auto-claude/{name}", str(worktree))
+    for rel, content in edits.items():
+        target = worktree / rel
+        if content is None:
+            target.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content)
+    git(worktree, "add", "-A")
+    git(worktree, "commit", "-q", "-m", name)
+    return worktree
+
+
+class TestBatchedGitHelpers:
+    """Tests for the batched git_utils helpers."""
+
+    def test_reads_files_and_diffs_in_one_pass(self, repo):
+        worktree = make_task(
+            repo,
+            "task-a",
+            {
+                "src/app.py": "def app():\n    return 2\n",
+                "src/gone.py": None,
+                "with space.py": "a = 2\n",
+                "src/new.py": "n = 1\n",
+            },
+        )
+        base = git(worktree, "merge-base", "main", "HEAD").strip()
+        spec = f"{base}..HEAD"
+
+        changed = list_changed_files(worktree, spec)
+        assert sorted(changed) == [
+            "src/app.py",
+            "src/gone.py",
+            "src/new.py",
+            "with space.py",
+        ]
+
+        contents = get_files_at_ref(worktree, base, changed + ["src"])
+        assert contents["src/app.py"] == "def app():\n    return 1\n"
+        assert contents["with space.py"] == "a = 1\n"
+        assert contents["src/new.py"] is None  # New file
+        assert contents["src"] is None  # Tree, not a file
+
+        diffs = get_file_diffs(worktree, spec, changed)
+        for path in changed:
+            expected = git(worktree, "diff", spec, "--", path)
+            assert diffs[path] == expected
+
+
+class TestRefreshFromGit:
+    """Tests for single- and multi-task refresh."""
+
+    def test_refresh_records_task_changes(self, repo):
+        worktree = make_task(
+            repo,
+            "task-a",
+            {"src/app.py": "def app():\n    return 2\n", "src/gone.py": None},
+        )
+        tracker = FileEvolutionTracker(repo)
+
+        tracker.refresh_from_git("task-a", worktree, target_branch="main")
+
+        modified = dict(tracker.get_task_modifications("task-a"))
+        assert set(modified) == {"src/app.py", "src/gone.py"}
+        assert "return 2" in modified["src/app.py"].raw_diff
+
+    def test_refresh_many_matches_serial_refresh(self, repo):
+        task_a = make_task(repo, "task-a", {"src/app.py": "def app():\n    return 2\n"})
+        task_b = make_task(repo, "task-b", {"src/new.py": "n = 1\n", "src/gone.py": None})
+        tasks = [("task-a", task_a), ("task-b", task_b)]
+
+        serial = FileEvolutionTracker(repo, storage_dir=repo.parent / "serial")
+        for task_id, worktree in tasks:
+            serial.refresh_from_git(task_id, worktree, target_branch="main")
+
+        batched = FileEvolutionTracker(repo, storage_dir=repo.parent / "batched")
+        batched.refresh_many_from_git(tasks, target_branch="main")
+
+        for task_id, _ in tasks:
+            expected = {
+                path: (snap.content_hash_before, snap.content_hash_after, snap.raw_diff)
+                for path, snap in serial.get_task_modifications(task_id)
+            }
+            actual = {
+                path: (snap.content_hash_before, snap.content_hash_after, snap.raw_diff)
+                for path, snap in batched.get_task_modifications(task_id)
+            }
+            assert actual == expected
+        assert batched.get_files_modified_by_tasks(["task-a", "task-b"]) == {
+            "src/app.py": ["task-a"],
+            "src/new.py": ["task-b"],
+            "src/gone.py": ["task-b"],
+        }
+
+    def test_refresh_many_saves_once(self, repo):
+        task_a = make_task(repo, "task-a", {"src/app.py": "def app():\n    return 2\n"})
+        task_b = make_task(repo, "task-b", {"src/new.py": "n = 1\n"})
+        tracker = FileEvolutionTracker(repo)
+
+        with patch.object(tracker.storage, "save_evolutions") as save:
+            tracker.refresh_many_from_git(
+                [("task-a", task_a), ("task-b", task_b)], target_branch="main"
+            )
+
+        assert save.call_count == 1
+
+    def test_refresh_many_skips_failed_worktree(self, repo):
+        task_a = make_task(repo, "task-a", {"src/app.py": "def app():\n    return 2\n"})
+        tracker = FileEvolutionTracker(repo)
+
+        tracker.refresh_many_from_git(
+            [("task-a", task_a), ("task-b", task_a)], target_branch="no-such-branch"
+        )
+        tracker.refresh_many_from_git([("task-a", task_a)], target_branch="main")
+
+        assert tracker.get_task_modifications("task-b") == []
+        assert len(tracker.get_task_modifications("task-a")) == 1
@@ -11,11 +11,13 @@ Covers:
 - Merge previews
 - Single-task merge pipeline
 - Multi-task merge pipeline with compatible changes
+- Concurrent per-file merging (ordering, determinism, AI hand-off)
 - Merge statistics and reports
 - AI enabled/disabled modes
 - Report serialization
 """
 
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -29,6 +31,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from merge import MergeOrchestrator
 from merge.orchestrator import TaskMergeRequest
+from merge.progress import MergeProgressStage
 
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
@@ -185,6 +188,108 @@ class TestMultiTaskMerge:
         assert report.stats.files_auto_merged >= 0
 
 
+class TestConcurrentMultiTaskMerge:
+    """Tests for the concurrent RESOLVING stage of merge_tasks."""
+
+    @staticmethod
+    def _setup_tasks(orchestrator, project_dir, count=6):
+        """Create files modified by two tasks (plus one single-task file)."""
+        files = []
+        for i in range(count):
+            path = project_dir / "src" / f"mod_{i}.py"
+            path.write_text(SAMPLE_PYTHON_MODULE)
+            files.append(path)
+        orchestrator.evolution_tracker.capture_baselines("task-001", files)
+        orchestrator.evolution_tracker.capture_baselines("task-002", files[:-1])
+        for i in range(count):
+            orchestrator.evolution_tracker.record_modification(
+                "task-001", f"src/mod_{i}.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+            )
+            if i < count - 1:
+                orchestrator.evolution_tracker.record_modification(
+                    "task-002", f"src/mod_{i}.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+                )
+        return [
+            TaskMergeRequest(task_id="task-001", worktree_path=project_dir),
+            TaskMergeRequest(task_id="task-002", worktree_path=project_dir),
+        ]
+
+    @staticmethod
+    def _summarize(report):
+        return [
+            (path, r.decision, r.merged_content, len(r.conflicts_remaining))
+            for path, r in report.file_results.items()
+        ]
+
+    def test_concurrent_matches_serial(self, temp_project):
+        """Concurrent merging gives the same report and progress as serial merging."""
+        orchestrator = MergeOrchestrator(temp_project, dry_run=True, enable_ai=False)
+        requests = self._setup_tasks(orchestrator, temp_project)
+
+        serial_events, concurrent_events = [], []
+        serial = orchestrator.merge_tasks(
+            requests,
+            progress_callback=lambda *args: serial_events.append(args),
+            max_workers=1,
+        )
+        concurrent = orchestrator.merge_tasks(
+            requests,
+            progress_callback=lambda *args: concurrent_events.append(args),
+            max_workers=4,
+        )
+
+        assert concurrent.success is serial.success is True
+        assert len(serial.file_results) == 6
+        assert self._summarize(concurrent) == self._summarize(serial)
+        assert concurrent.stats.to_dict() | {"duration_seconds": 0} == (
+            serial.stats.to_dict() | {"duration_seconds": 0}
+        )
+        assert concurrent_events == serial_events
+        resolving = [e[3]["current_file"] for e in concurrent_events if e[0] == MergeProgressStage.RESOLVING]
+        assert resolving == list(concurrent.file_results)
+
+    def test_ai_candidates_merged_once_with_full_pipeline(self, temp_project):
+        """Files that may need AI are merged once, on the full pipeline; the rest on the pool."""
+        orchestrator = MergeOrchestrator(temp_project, dry_run=True, enable_ai=True)
+        requests = self._setup_tasks(orchestrator, temp_project, count=3)
+
+        calls = []
+        original = orchestrator._merge_file
+
+        def spy(file_path, task_snapshots, target_branch, pipeline=None):
+            calls.append((file_path, pipeline))
+            return original(
+                file_path,
+                task_snapshots,
+                target_branch,
+                pipeline=pipeline or orchestrator.deterministic_pipeline,
+            )
+
+        orchestrator._merge_file = spy
+        orchestrator.deterministic_pipeline.may_need_ai = (
+            lambda file_path, snapshots: file_path == "src/mod_1.py"
+        )
+
+        report = orchestrator.merge_tasks(requests, max_workers=2)
+
+        assert list(report.file_results) == ["src/mod_0.py", "src/mod_1.py", "src/mod_2.py"]
+        assert sorted(path for path, _ in calls) == list(report.file_results)
+        assert [path for path, pipeline in calls if pipeline is None] == ["src/mod_1.py"]
+
+    def test_called_from_running_event_loop(self, temp_project):
+        """merge_tasks is synchronous and works inside async callers."""
+        orchestrator = MergeOrchestrator(temp_project, dry_run=True, enable_ai=False)
+        requests = self._setup_tasks(orchestrator, temp_project, count=3)
+
+        async def merge():
+            return orchestrator.merge_tasks(requests, max_workers=4)
+
+        report = asyncio.run(merge())
+
+        assert report.success is True
+        assert len(report.file_results) == 3
+
+
 class TestMergeStats:
     """Tests for merge statistics and reports."""
 
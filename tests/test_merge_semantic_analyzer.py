@@ -53,6 +53,21 @@ class TestSemanticAnalyzerBasics:
         assert semantic_analyzer.is_supported("test.rb") is False
         assert semantic_analyzer.is_supported("test.txt") is False
 
+    def test_structural_fallback_logged_once(self, monkeypatch, caplog):
+        """Requesting structural analysis without tree-sitter logs one INFO line."""
+        from merge import semantic_analyzer as module
+
+        monkeypatch.setattr(module, "TREE_SITTER_AVAILABLE", False)
+        monkeypatch.setattr(module, "_structural_fallback_logged", False)
+
+        with caplog.at_level("INFO", logger=module.__name__):
+            analyzers = [module.SemanticAnalyzer(structural=True) for _ in range(2)]
+            module.SemanticAnalyzer()
+
+        assert not any(analyzer.structural for analyzer in analyzers)
+        assert len(caplog.records) == 1
+        assert "tree-sitter is not installed" in caplog.records[0].getMessage()
+
 
 class TestPythonAnalysis:
     """Tests for Python code analysis."""
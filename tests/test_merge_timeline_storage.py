@@ -0,0 +1,157 @@
+"""
+Tests for Timeline Storage
+==========================
+
+Tests the content-addressed blob store, on-demand timeline loading and
+incremental index updates used by FileTimelineTracker.
+"""
+
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge.file_timeline import (
+    BranchPoint,
+    FileTimeline,
+    FileTimelineTracker,
+    MainBranchEvent,
+    TaskFileView,
+    TimelineBlobStore,
+    TimelinePersistence,
+    WorktreeState,
+)
+from merge.timeline_persistence import compute_blob_id
+
+
+def make_timeline(file_path="src/app.py", events=3):
+    timeline = FileTimeline(file_path=file_path)
+    timeline.add_task_view(
+        TaskFileView(
+            task_id="task-001",
+            branch_point=BranchPoint("c0", "base\n", datetime(2024, 1, 1)),
+            worktree_state=WorktreeState("task\n", datetime(2024, 1, 2)),
+        )
+    )
+    for i in range(events):
+        timeline.add_main_event(
+            MainBranchEvent(
+                commit_hash=f"c{i + 1}",
+                timestamp=datetime(2024, 1, 3),
+                # Every other event repeats the same content
+                content=f"main {i % 2}\n",
+                source="human",
+            )
+        )
+    return timeline
+
+
+class TestTimelineBlobStore:
+    """Tests for TimelineBlobStore."""
+
+    def test_roundtrip_and_dedup(self, tmp_path):
+        store = TimelineBlobStore(tmp_path / "blobs")
+
+        first = store.put("hello\n")
+        second = store.put("hello\n")
+
+        assert first == second
+        assert store.get(first) == "hello\n"
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # One dir, one blob
+
+    def test_blob_id_is_git_object_id(self, tmp_path):
+        (tmp_path / "f.txt").write_text("some content\n")
+        git_id = subprocess.run(
+            ["git", "hash-object", "f.txt"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        assert compute_blob_id("some content\n") == git_id
+
+    def test_missing_blob_uses_fallback(self, tmp_path):
+        store = TimelineBlobStore(tmp_path / "blobs", fallback_reader=lambda oid: f"from git {oid}")
+
+        assert store.get("ab" * 20) == f"from git {'ab' * 20}"
+
+
+class TestTimelinePersistence:
+    """Tests for timeline files and the index."""
+
+    def test_contents_stored_as_blobs(self, tmp_path):
+        persistence = TimelinePersistence(tmp_path)
+        timeline = make_timeline()
+
+        persistence.save_timeline(timeline.file_path, timeline)
+
+        raw = json.loads(persistence._get_timeline_file_path(timeline.file_path).read_text())
+        view = raw["task_views"]["task-001"]
+        holders = raw["main_branch_history"] + [view["branch_point"], view["worktree_state"]]
+        assert all("content" not in h and "content_blob" in h for h in holders)
+        assert {e["content_blob"] for e in raw["main_branch_history"]} == {
+            compute_blob_id("main 0\n"),
+            compute_blob_id("main 1\n"),
+        }
+
+        loaded = persistence.load_timeline(timeline.file_path)
+        assert loaded.to_dict() == timeline.to_dict()
+
+    def test_loads_legacy_inline_timelines(self, tmp_path):
+        persistence = TimelinePersistence(tmp_path)
+        timeline = make_timeline()
+        timelines_dir = persistence.timelines_dir
+        (timelines_dir / "src_app.py.json").write_text(json.dumps(timeline.to_dict(), indent=2))
+        (timelines_dir / "index.json").write_text(json.dumps({"files": ["src/app.py"]}))
+
+        reopened = TimelinePersistence(tmp_path)
+
+        assert reopened.get_files_for_task("task-001") == ["src/app.py"]
+        assert reopened.open_timelines()["src/app.py"].to_dict() == timeline.to_dict()
+
+    def test_index_written_only_on_change(self, tmp_path):
+        persistence = TimelinePersistence(tmp_path)
+
+        with patch.object(persistence, "_write_index", wraps=persistence._write_index) as write:
+            persistence.update_index_entry("src/app.py", ["task-001"])
+            persistence.update_index_entry("src/app.py", ["task-001"])
+            persistence.update_index_entry("src/app.py", ["task-001", "task-002"])
+
+        assert write.call_count == 2
+        index = json.loads((persistence.timelines_dir / "index.json").read_text())
+        assert index["files"] == ["src/app.py"]
+        assert index["tasks"] == {"src/app.py": ["task-001", "task-002"]}
+
+
+class TestLazyTimelineLoading:
+    """Tests for on-demand loading in FileTimelineTracker."""
+
+    def test_timelines_load_on_first_access(self, temp_git_repo):
+        (temp_git_repo / "a.py").write_text("a = 1\n")
+        (temp_git_repo / "b.py").write_text("b = 1\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "files"], cwd=temp_git_repo, capture_output=True)
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["a.py", "b.py"], task_intent="Edit")
+        tracker.on_task_start("task-002", ["b.py"])
+
+        reopened = FileTimelineTracker(temp_git_repo)
+
+        assert reopened._timelines.loaded_count == 0
+        assert sorted(reopened.get_files_for_task("task-001")) == ["a.py", "b.py"]
+        assert reopened.get_files_for_task("task-002") == ["b.py"]
+        assert reopened.has_timeline("a.py")
+        assert reopened._timelines.loaded_count == 0
+
+        timeline = reopened.get_timeline("b.py")
+
+        assert reopened._timelines.loaded_count == 1
+        assert timeline.task_views["task-001"].branch_point.content == "b = 1\n"
+        assert set(timeline.task_views) == {"task-001", "task-002"}
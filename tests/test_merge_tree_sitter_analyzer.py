@@ -0,0 +1,192 @@
+"""
+Tests for Structural Semantic Analysis
+======================================
+
+Tests the tree-sitter analyzer used by SemanticAnalyzer(structural=True):
+exact symbol spans, class-level changes and the content-hash parse cache.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge import ChangeType, SemanticAnalyzer
+from merge.semantic_analysis.tree_sitter_analyzer import (
+    TREE_SITTER_AVAILABLE,
+    extract_elements,
+    is_language_supported,
+    parse_cache,
+)
+
+pytestmark = pytest.mark.skipif(
+    not TREE_SITTER_AVAILABLE, reason="tree-sitter not installed"
+)
+
+
+def requires_grammar(ext):
+    return pytest.mark.skipif(
+        not is_language_supported(ext), reason=f"no tree-sitter grammar for {ext}"
+    )
+
+
+def summarize(analysis):
+    return [
+        (c.change_type, c.target, c.line_start, c.line_end) for c in analysis.changes
+    ]
+
+
+@pytest.fixture
+def analyzer():
+    return SemanticAnalyzer(structural=True)
+
+
+PY_BEFORE = """\
+import os
+
+
+class Service:
+    timeout = 5
+
+    def start(self):
+        return 1
+
+    def stop(self):
+        return 2
+"""
+
+PY_AFTER = """\
+import os
+import sys
+
+
+class Service:
+    timeout = 5
+
+    def start(self):
+        return 10
+
+    def stop(self):
+        return 2
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+
+def helper():
+    pass
+"""
+
+
+@requires_grammar(".py")
+class TestPythonStructure:
+    """Tests for Python symbol extraction and comparison."""
+
+    def test_exact_spans_and_methods(self, analyzer):
+        analysis = analyzer.analyze_diff("src/service.py", PY_BEFORE, PY_AFTER)
+
+        assert summarize(analysis) == [
+            (ChangeType.ADD_IMPORT, "import sys", 2, 2),
+            (ChangeType.MODIFY_FUNCTION, "Service.start", 8, 9),
+            (ChangeType.ADD_METHOD, "Service.restart", 14, 16),
+            (ChangeType.ADD_FUNCTION, "helper", 19, 20),
+        ]
+        assert analysis.functions_added == {"Service.restart", "helper"}
+        assert analysis.functions_modified == {"Service.start"}
+        assert analysis.classes_modified == set()
+
+    def test_class_level_change(self, analyzer):
+        after = PY_BEFORE.replace("timeout = 5", "timeout = 30")
+
+        analysis = analyzer.analyze_diff("src/service.py", PY_BEFORE, after)
+
+        assert summarize(analysis) == [(ChangeType.MODIFY_CLASS, "Service", 4, 11)]
+        assert analysis.classes_modified == {"Service"}
+
+    def test_decorated_function_spans_decorator(self):
+        elements = extract_elements("@cache\ndef load():\n    pass\n", ".py")
+
+        load = elements["function:load"]
+        assert (load.start_line, load.end_line) == (1, 3)
+        assert load.content.startswith("@cache")
+
+    def test_crlf_matches_lf(self, analyzer):
+        crlf = PY_BEFORE.replace("\n", "\r\n")
+
+        assert analyzer.analyze_diff("a.py", crlf, PY_BEFORE).changes == []
+
+
+@requires_grammar(".tsx")
+def test_typescript_structure(analyzer):
+    before = (
+        'import { api } from "./api";\n'
+        "export class Store {\n"
+        "  load() { return api.get(); }\n"
+        "}\n"
+        "export const useStore = () => new Store();\n"
+    )
+    after = (
+        'import { api } from "./api";\n'
+        "export class Store {\n"
+        "  load() { return api.get(1); }\n"
+        "}\n"
+        "export const useStore = () => new Store();\n"
+        "export interface Props { id: string }\n"
+    )
+
+    analysis = analyzer.analyze_diff("src/store.tsx", before, after)
+
+    assert summarize(analysis) == [
+        (ChangeType.MODIFY_FUNCTION, "Store.load", 3, 3),
+        (ChangeType.ADD_INTERFACE, "Props", 6, 6),
+    ]
+
+
+@requires_grammar(".go")
+def test_go_methods_attach_to_receiver(analyzer):
+    before = "package main\n\ntype Server struct{}\n\nfunc (s *Server) Run() int { return 1 }\n"
+    after = "package main\n\ntype Server struct{}\n\nfunc (s *Server) Run() int { return 2 }\n"
+
+    analysis = analyzer.analyze_diff("main.go", before, after)
+
+    assert summarize(analysis) == [(ChangeType.MODIFY_FUNCTION, "Server.Run", 5, 5)]
+
+
+@requires_grammar(".rs")
+def test_rust_impl_methods(analyzer):
+    before = "struct S;\n\nimpl S {\n    fn a(&self) {}\n}\n"
+    after = "struct S;\n\nimpl S {\n    fn a(&self) {}\n\n    fn b(&self) {}\n}\n"
+
+    analysis = analyzer.analyze_diff("lib.rs", before, after)
+
+    assert summarize(analysis) == [(ChangeType.ADD_METHOD, "S.b", 6, 6)]
+    assert ".rs" in analyzer.supported_extensions
+
+
+@requires_grammar(".py")
+def test_parse_cache_reuses_baseline(analyzer):
+    parse_cache.clear()
+
+    analyzer.analyze_diff("a.py", PY_BEFORE, PY_AFTER)
+    analyzer.analyze_diff("a.py", PY_BEFORE, PY_AFTER.replace("helper", "other"))
+    SemanticAnalyzer(structural=True).analyze_diff("b.py", PY_BEFORE, PY_AFTER)
+
+    assert parse_cache.misses == 3  # Baseline and two distinct "after" versions
+    assert parse_cache.hits == 3
+
+
+def test_regex_fallback_for_unsupported_language(analyzer):
+    analysis = analyzer.analyze_diff("notes.txt", "a\n", "b\n")
+
+    assert analysis.changes == []
+    assert analysis.total_lines_changed == 2
+
+
+def test_regex_analysis_is_default():
+    analysis = SemanticAnalyzer().analyze_diff("src/service.py", PY_BEFORE, PY_AFTER)
+
+    assert all(c.line_start != 8 for c in analysis.changes)  # No method spans
@@ -0,0 +1,143 @@
+"""
+Tests for the Implementation Plan Cache
+=======================================
+
+Tests core.plan_cache: parse-once snapshots, precomputed counters, stat-based
+invalidation and explicit invalidation from ImplementationPlan.save().
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core.plan_cache import (
+    get_plan_cache_stats,
+    get_plan_snapshot,
+    get_stuck_subtask_ids,
+    reset_plan_cache,
+)
+from implementation_plan import ImplementationPlan, SubtaskStatus
+from progress import (
+    count_subtasks,
+    count_subtasks_detailed,
+    get_next_subtask,
+    get_plan_summary,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_plan_cache()
+    yield
+    reset_plan_cache()
+
+
+def write_plan(spec_dir, statuses):
+    spec_dir.mkdir(parents=True, exist_ok=True)
+    plan = {
+        "feature": "Test",
+        "workflow_type": "feature",
+        "phases": [
+            {
+                "phase": 1,
+                "name": "Phase 1",
+                "depends_on": [],
+                "subtasks": [
+                    {"id": f"s{i}", "description": f"Subtask {i}", "status": status}
+                    for i, status in enumerate(statuses)
+                ],
+            },
+            {
+                "phase": 2,
+                "name": "Phase 2",
+                "depends_on": [1],
+                "subtasks": [{"id": "later", "description": "Later", "status": "pending"}],
+            },
+        ],
+    }
+    (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+
+def test_plan_parsed_once_across_queries(tmp_path):
+    write_plan(tmp_path, ["completed", "in_progress", "pending", "failed"])
+
+    assert count_subtasks(tmp_path) == (1, 5)
+    assert count_subtasks_detailed(tmp_path) == {
+        "completed": 1,
+        "in_progress": 1,
+        "pending": 2,
+        "failed": 1,
+        "total": 5,
+    }
+    assert get_plan_summary(tmp_path)["pending_subtasks"] == 2
+    assert get_next_subtask(tmp_path)["id"] == "s2"
+
+    stats = get_plan_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 3
+
+
+def test_ready_index_respects_phase_dependencies(tmp_path):
+    write_plan(tmp_path, ["completed", "pending"])
+
+    ready = [subtask["id"] for _phase, subtask in get_plan_snapshot(tmp_path).ready]
+
+    assert ready == ["s1"]
+
+
+def test_rewritten_plan_is_reloaded(tmp_path):
+    write_plan(tmp_path, ["pending"])
+    assert count_subtasks(tmp_path) == (0, 2)
+
+    write_plan(tmp_path, ["completed", "completed"])
+
+    assert count_subtasks(tmp_path) == (2, 3)
+    assert get_next_subtask(tmp_path)["id"] == "later"
+
+
+def test_returned_subtasks_do_not_leak_into_cache(tmp_path):
+    write_plan(tmp_path, ["pending"])
+
+    get_next_subtask(tmp_path)["status"] = "completed"
+
+    assert get_next_subtask(tmp_path)["status"] == "pending"
+
+
+def test_missing_and_invalid_files(tmp_path):
+    assert get_plan_snapshot(tmp_path) is None
+    assert get_stuck_subtask_ids(tmp_path) == frozenset()
+
+    (tmp_path / "implementation_plan.json").write_text("{not json")
+
+    assert count_subtasks(tmp_path) == (0, 0)
+    assert get_plan_cache_stats()["size"] == 0
+
+
+def test_stuck_subtasks_reloaded_on_change(tmp_path):
+    write_plan(tmp_path, ["pending", "pending"])
+    history_file = tmp_path / "memory" / "attempt_history.json"
+    history_file.parent.mkdir()
+    history_file.write_text(json.dumps({"stuck_subtasks": []}))
+    assert get_next_subtask(tmp_path)["id"] == "s0"
+
+    history_file.write_text(json.dumps({"stuck_subtasks": [{"subtask_id": "s0"}]}))
+
+    assert get_next_subtask(tmp_path)["id"] == "s1"
+
+
+def test_save_invalidates_cached_plan(tmp_path):
+    write_plan(tmp_path, ["pending"])
+    plan_file = tmp_path / "implementation_plan.json"
+    snapshot = get_plan_snapshot(tmp_path)
+
+    plan = ImplementationPlan.load(plan_file)
+    plan.phases[0].subtasks[0].status = SubtaskStatus.COMPLETED
+    plan.save(plan_file)
+
+    assert get_plan_snapshot(tmp_path) is not snapshot
+    assert count_subtasks(tmp_path) == (1, 2)
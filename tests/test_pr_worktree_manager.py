@@ -26,6 +26,8 @@ pr_worktree_module = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(pr_worktree_module)
 
 PRWorktreeManager = pr_worktree_module.PRWorktreeManager
+PRWorktreePool = pr_worktree_module.PRWorktreePool
+sparse_checkout_dirs = pr_worktree_module.sparse_checkout_dirs
 
 
 @pytest.fixture
@@ -315,3 +317,106 @@ def test_get_worktree_info(temp_git_repo):
 
     # Cleanup
     manager.cleanup_all_worktrees()
+
+
+def _commit_file(repo_dir, rel_path, content):
+    """Commit a file change and return the new HEAD SHA."""
+    target = repo_dir / rel_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content)
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", f"Update {rel_path}"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_pool_reuses_worktree_for_new_head(temp_git_repo):
+    """Test that a released pool worktree is re-pointed at the next head SHA."""
+    repo_dir, first_sha = temp_git_repo
+    second_sha = _commit_file(repo_dir, "src/app.py", "print('v2')\n")
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    pool = PRWorktreePool(manager, ".test-worktree-pool", max_size=1)
+
+    try:
+        first = pool.acquire(first_sha, pr_number=1)
+        assert not (first / "src" / "app.py").exists()
+        (first / "leftover.txt").write_text("from previous review")
+        pool.release(first)
+
+        second = pool.acquire(second_sha, pr_number=2)
+
+        assert second == first
+        assert (second / "src" / "app.py").read_text() == "print('v2')\n"
+        assert not (second / "leftover.txt").exists()
+        assert pool.stats.hits == 1
+        assert pool.stats.misses == 1
+        assert pool.stats.to_dict()["hit_rate"] == 0.5
+        pool.release(second)
+        # Pooled worktrees survive release and manager cleanup
+        manager.cleanup_worktrees()
+        assert second.exists()
+    finally:
+        pool.remove_all()
+
+
+def test_pool_falls_back_when_exhausted(temp_git_repo):
+    """Test that a busy pool hands out a throwaway worktree instead."""
+    repo_dir, commit_sha = temp_git_repo
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    pool = PRWorktreePool(manager, ".test-worktree-pool", max_size=1)
+
+    try:
+        pooled = pool.acquire(commit_sha, pr_number=1)
+        fallback = pool.acquire(commit_sha, pr_number=2)
+
+        assert pool.is_pooled(pooled)
+        assert not pool.is_pooled(fallback)
+        assert "pr-2" in fallback.name
+
+        pool.release(fallback)
+        assert not fallback.exists()
+        pool.release(pooled)
+        assert pooled.exists()
+    finally:
+        pool.remove_all()
+
+
+def test_pool_sparse_checkout(temp_git_repo):
+    """Test sparse checkout limited to the PR's changed directories."""
+    repo_dir, _ = temp_git_repo
+    _commit_file(repo_dir, "src/app.py", "app\n")
+    head_sha = _commit_file(repo_dir, "docs/guide.md", "guide\n")
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    pool = PRWorktreePool(manager, ".test-worktree-pool", max_size=1)
+
+    try:
+        sparse = pool.acquire(head_sha, pr_number=1, sparse_paths=["src/app.py"])
+        assert (sparse / "src" / "app.py").exists()
+        assert (sparse / "test.txt").exists()  # Root files are always included
+        assert not (sparse / "docs").exists()
+        assert manager.count_checked_out_files(sparse) == 2
+        pool.release(sparse)
+
+        full = pool.acquire(head_sha, pr_number=2)
+        assert (full / "docs" / "guide.md").exists()
+        assert manager.count_checked_out_files(full) == 3
+        pool.release(full)
+    finally:
+        pool.remove_all()
+
+
+def test_sparse_checkout_dirs():
+    """Test directory selection for sparse checkout."""
+    assert sparse_checkout_dirs(
+        ["README.md", "src/app.py", "src/lib/util.py", "src/app_test.py"]
+    ) == ["src", "src/lib"]
@@ -0,0 +1,292 @@
+"""
+Tests for the Memory Query Server
+=================================
+
+Tests query_memory's server mode: warm database reuse across requests,
+switching between direct and Graphiti handles, idle reaping, and the
+newline-delimited JSON-RPC protocol. Also tests index-backed keyword search.
+"""
+
+import io
+import json
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+import query_memory
+from query_memory import MemoryQueryServer, WarmHandles, params_to_args
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def has_next(self):
+        return bool(self._rows)
+
+    def get_next(self):
+        return self._rows.pop(0)
+
+    def get_as_df(self):
+        return None
+
+
+class FakeDatabase:
+    opened: list = []
+
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+        FakeDatabase.opened.append(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    # Episodes in the fake graph, served to the keyword index sync queries
+    episodes: list = []
+
+    def __init__(self, db):
+        assert not db.closed
+        self.db = db
+
+    def execute(self, query, parameters=None):
+        if "count(e)" in query:
+            return FakeResult([[len(self.episodes)]])
+        if "IN $uuids" in query:
+            return FakeResult(
+                [
+                    [e["uuid"], e["name"], e["content"], "", "g1", e["created_at"]]
+                    for e in self.episodes
+                    if e["uuid"] in parameters["uuids"]
+                ]
+            )
+        if query.strip().endswith("RETURN e.uuid"):
+            return FakeResult([[e["uuid"]] for e in self.episodes])
+        return FakeResult(
+            [
+                ["uuid-1", "session_001", "2024-01-01T00:00:00", "{}", "desc", "g1"],
+            ]
+        )
+
+
+@pytest.fixture
+def fake_kuzu(monkeypatch):
+    FakeDatabase.opened = []
+    FakeConnection.episodes = []
+    module = types.ModuleType("kuzu")
+    module.Database = FakeDatabase
+    module.Connection = FakeConnection
+    monkeypatch.setitem(sys.modules, "kuzu", module)
+    monkeypatch.setitem(sys.modules, "real_ladybug", None)
+    return module
+
+
+@pytest.fixture
+def server(monkeypatch):
+    server = MemoryQueryServer(max_workers=4, idle_timeout=60, output=io.StringIO())
+    monkeypatch.setattr(query_memory, "_server", server)
+    yield server
+    server.close()
+
+
+def request(method, request_id=1, **params):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+class TestParams:
+    def test_defaults_and_names(self):
+        args = params_to_args("search", {"db_path": "/db", "database": "x", "query": "q"})
+
+        assert args.command == "search"
+        assert args.limit == 20
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"db_path": "/db"},
+            {"db_path": "/db", "database": "x", "bogus": 1},
+            {"db_path": "/db", "database": "x", "limit": "10"},
+            ["not", "an", "object"],
+        ],
+    )
+    def test_invalid_params(self, params):
+        with pytest.raises(ValueError):
+            params_to_args("get-memories", params)
+
+
+class TestWarmHandles:
+    def test_reuses_open_handle(self):
+        handles = WarmHandles()
+        opened = []
+
+        def open_handle():
+            opened.append(object())
+            return opened[-1]
+
+        first = handles.acquire("db", "kuzu", open_handle, lambda h: None)
+        second = handles.acquire("db", "kuzu", open_handle, lambda h: None)
+        handles.release("db")
+        handles.release("db")
+
+        assert first is second
+        assert len(opened) == 1
+
+    def test_switching_kind_waits_for_users_then_closes(self):
+        handles = WarmHandles()
+        closed = []
+        handles.acquire("db", "kuzu", lambda: "raw", closed.append)
+
+        got = []
+        switcher = threading.Thread(
+            target=lambda: got.append(
+                handles.acquire("db", "graphiti", lambda: "client", closed.append)
+            )
+        )
+        switcher.start()
+        switcher.join(timeout=0.2)
+
+        # Still blocked by the in-flight kuzu user
+        assert switcher.is_alive()
+        assert closed == []
+
+        handles.release("db")
+        switcher.join(timeout=5)
+
+        assert got == ["client"]
+        assert closed == ["raw"]
+        assert handles.open_databases() == {"db": "graphiti"}
+
+    def test_reap_idle_and_failed_open(self):
+        handles = WarmHandles(idle_timeout=0)
+        closed = []
+        with handles.lease("db", "kuzu", lambda: "raw", closed.append):
+            assert handles.reap_idle() == 0
+
+        assert handles.reap_idle() == 1
+        assert closed == ["raw"]
+
+        def fail():
+            raise RuntimeError("locked")
+
+        with pytest.raises(RuntimeError):
+            handles.acquire("db", "kuzu", fail, closed.append)
+        assert handles.open_databases() == {}
+
+
+class TestServer:
+    def test_database_stays_warm_across_requests(
+        self, fake_kuzu, server, tmp_path, monkeypatch
+    ):
+        (tmp_path / "memories").mkdir()
+        params = {"db_path": str(tmp_path), "database": "memories"}
+
+        responses = [
+            server.handle_request(request("get-memories", i, **params)) for i in range(3)
+        ]
+
+        assert len(FakeDatabase.opened) == 1
+        assert responses[-1]["latency_ms"] >= 0
+        stats = server.stats()
+        assert stats["commands"]["get-memories"]["count"] == 3
+        assert list(stats["open_databases"].values()) == ["kuzu"]
+
+        # Same output as the one-shot CLI
+        monkeypatch.setattr(query_memory, "_server", None)
+        cli_result = query_memory.cmd_get_memories(params_to_args("get-memories", params))
+        assert responses[-1]["result"] == cli_result
+        assert cli_result["data"]["memories"][0]["session_number"] == 1
+
+    def test_concurrent_requests_share_one_database(self, fake_kuzu, server, tmp_path):
+        (tmp_path / "memories").mkdir()
+        params = {"db_path": str(tmp_path), "database": "memories", "query": "session"}
+
+        futures = [
+            server._executor.submit(server.handle_request, request("search", i, **params))
+            for i in range(16)
+        ]
+        results = [f.result(timeout=10) for f in futures]
+
+        assert all(r["result"]["success"] for r in results)
+        assert sorted(r["id"] for r in results) == list(range(16))
+        assert len(FakeDatabase.opened) == 1
+
+    def test_serve_protocol(self, fake_kuzu, tmp_path, monkeypatch):
+        (tmp_path / "memories").mkdir()
+        lines = [
+            json.dumps(request("get-status", 1, db_path=str(tmp_path), database="memories")),
+            "not json",
+            json.dumps(request("unknown", 2)),
+            json.dumps({"jsonrpc": "2.0", "method": "stats"}),
+        ]
+        output = io.StringIO()
+        server = MemoryQueryServer(output=output)
+        monkeypatch.setattr(query_memory, "_server", server)
+
+        server.serve(io.StringIO("\n".join(lines) + "\n"))
+
+        messages = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert messages[0]["method"] == "ready"
+        by_id = {m.get("id"): m for m in messages[1:]}
+        assert len(messages) == 4  # the stats notification gets no response
+        assert by_id[1]["result"]["data"]["connected"] is True
+        assert by_id[None]["error"]["code"] == query_memory.PARSE_ERROR
+        assert by_id[2]["error"]["code"] == query_memory.METHOD_NOT_FOUND
+        # Databases are closed on shutdown
+        assert len(FakeDatabase.opened) == 1
+        assert FakeDatabase.opened[0].closed
+
+
+class TestKeywordSearch:
+    def test_search_uses_ranked_index_with_paging(self, fake_kuzu, tmp_path):
+        (tmp_path / "memories").mkdir()
+        FakeConnection.episodes = [
+            {
+                "uuid": f"e{i}",
+                "name": f"session_{i:03d}",
+                "content": "fixed flaky retry" + " retry" * i,
+                "created_at": f"2024-01-0{i}T00:00:00",
+            }
+            for i in range(1, 6)
+        ] + [
+            {
+                "uuid": f"other{i}",
+                "name": "codebase_discovery",
+                "content": "unrelated",
+                "created_at": "2024-01-01T00:00:00",
+            }
+            for i in range(5)
+        ]
+        params = {"db_path": str(tmp_path), "database": "memories", "query": "Retry"}
+
+        first = query_memory.cmd_search(params_to_args("search", {**params, "limit": 2}))
+        second = query_memory.cmd_search(
+            params_to_args("search", {**params, "limit": 2, "offset": 2})
+        )
+
+        data = first["data"]
+        assert data["total"] == 5
+        assert [m["id"] for m in data["memories"]] == ["e5", "e4"]
+        assert data["memories"][0]["score"] > data["memories"][1]["score"]
+        assert data["memories"][0]["session_number"] == 5
+        assert [m["id"] for m in second["data"]["memories"]] == ["e3", "e2"]
+        assert (tmp_path / ".memories_episodes_fts.sqlite").exists()
+
+        # Episodes written without indexing are picked up on the next search
+        FakeConnection.episodes.append(
+            {
+                "uuid": "e6",
+                "name": "gotcha",
+                "content": "retry storms",
+                "created_at": "2024-01-06T00:00:00",
+            }
+        )
+        third = query_memory.cmd_search(params_to_args("search", params))
+        assert third["data"]["total"] == 6
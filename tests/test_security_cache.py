@@ -7,7 +7,11 @@ from pathlib import Path
 # Ensure local apps/backend is in path
 sys.path.insert(0, str(Path(__file__).parents[1] / "apps" / "backend"))
 
-from security.profile import get_security_profile, reset_profile_cache
+from security.profile import (
+    get_profile_cache_stats,
+    get_security_profile,
+    reset_profile_cache,
+)
 from project.models import SecurityProfile
 from project.analyzer import ProjectAnalyzer
 
@@ -114,3 +118,59 @@ def test_cache_invalidation_on_file_deletion(mock_project_dir, mock_profile_path
     # 4. Call again - should handle deletion gracefully and fallback to fresh analysis
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile2.get_all_allowed_commands()
+
+def test_cache_keeps_profiles_for_multiple_projects(tmp_path, monkeypatch):
+    import security.profile as profile_module
+
+    reset_profile_cache()
+    calls = []
+
+    def fake_get_or_create_profile(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        return SecurityProfile()
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", fake_get_or_create_profile)
+    worktree_a = tmp_path / "a"
+    worktree_b = tmp_path / "b"
+    worktree_a.mkdir()
+    worktree_b.mkdir()
+
+    # Alternating hook calls must not evict each other's profile
+    for _ in range(3):
+        get_security_profile(worktree_a)
+        get_security_profile(worktree_b)
+
+    assert len(calls) == 2
+    stats = get_profile_cache_stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    import security.profile as profile_module
+
+    reset_profile_cache()
+    calls = []
+
+    def fake_get_or_create_profile(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        return SecurityProfile()
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", fake_get_or_create_profile)
+    monkeypatch.setattr(profile_module, "PROFILE_CACHE_SIZE", 2)
+    dirs = []
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        dirs.append(tmp_path / name)
+
+    get_security_profile(dirs[0])
+    get_security_profile(dirs[1])
+    get_security_profile(dirs[0])  # a is now most recently used
+    get_security_profile(dirs[2])  # evicts b
+
+    calls.clear()
+    get_security_profile(dirs[0])
+    get_security_profile(dirs[1])
+
+    assert calls == [dirs[1].resolve()]
+    assert get_profile_cache_stats()["size"] == 2
@@ -226,6 +226,7 @@ class TestTaskLoggerAnsiIntegration:
             result="Tests completed",
             detail="\x1b[36m$ npm test\x1b[0m\n\x1b[32mPASS\x1b[0m All tests passed"
         )
+        logger.flush()
 
         log_file = tmp_path / "task_logs.json"
         with open(log_file) as f:
@@ -249,6 +250,7 @@ class TestTaskLoggerAnsiIntegration:
             result="\x1b[32mTests passed\x1b[0m",
             detail="Some output"
         )
+        logger.flush()
 
         log_file = tmp_path / "task_logs.json"
         with open(log_file) as f:
@@ -336,3 +338,64 @@ class TestTaskLoggerPublicAPI:
             StreamingLogCapture,
         )
         # If imports succeed, the test passes
+
+
+# ============================================================================
+# Append-only Storage Tests
+# ============================================================================
+
+class TestTaskLoggerSegmentStorage:
+    """Tests for the append-only segment log and its compaction."""
+
+    def test_entries_buffered_in_phase_segment(self, tmp_path):
+        """Entries between compactions go to the phase's JSONL segment."""
+        logger = TaskLogger(tmp_path, emit_markers=False)
+        logger.log("first", print_to_console=False)
+        logger.log("second", print_to_console=False)
+
+        segment = tmp_path / "task_logs.coding.jsonl"
+        assert segment.exists()
+        lines = segment.read_text().splitlines()
+        assert json.loads(lines[-1])["content"] == "second"
+
+        logger.flush()
+        assert not segment.exists()
+        logs = json.loads((tmp_path / "task_logs.json").read_text())
+        contents = [e["content"] for e in logs["phases"]["coding"]["entries"]]
+        assert contents == ["first", "second"]
+
+    def test_load_task_logs_merges_uncompacted_segments(self, tmp_path):
+        """load_task_logs() includes entries not yet compacted."""
+        from task_logger import load_task_logs
+
+        logger = TaskLogger(tmp_path, emit_markers=False)
+        logger.log("first", print_to_console=False)
+        logger.log("second", print_to_console=False)
+
+        logs = load_task_logs(tmp_path)
+        contents = [e["content"] for e in logs["phases"]["coding"]["entries"]]
+        assert contents == ["first", "second"]
+
+    def test_recovers_segments_after_interrupted_run(self, tmp_path):
+        """A new logger picks up segments left by a process that never compacted."""
+        logger = TaskLogger(tmp_path, emit_markers=False)
+        logger.log("first", print_to_console=False)
+        logger.log("second", print_to_console=False)
+        logger.storage._cancel_flush_timer()
+        logger.storage._pending = 0  # simulate a crash before compaction
+
+        recovered = TaskLogger(tmp_path, emit_markers=False)
+        contents = [
+            e["content"] for e in recovered.get_phase_logs(LogPhase.CODING)["entries"]
+        ]
+        assert contents == ["first", "second"]
+
+    def test_phase_start_visible_immediately(self, tmp_path):
+        """get_active_phase() sees a started phase without an explicit flush."""
+        from task_logger import get_active_phase
+
+        logger = TaskLogger(tmp_path, emit_markers=False)
+        logger.log("warm up", print_to_console=False)
+        logger.start_phase(LogPhase.VALIDATION)
+
+        assert get_active_phase(tmp_path) == "validation"